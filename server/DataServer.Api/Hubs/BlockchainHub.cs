@@ -11,6 +11,8 @@ namespace DataServer.Api.Hubs;
 public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog.ILogger logger)
     : Hub
 {
+    public const int MaxBatchSize = 100;
+
     private static readonly JsonSerializerOptions JsonOptions = new()
     {
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
@@ -47,6 +49,12 @@ public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog
 
     public async Task SendMessage(string message)
     {
+        if (message.TrimStart().StartsWith('['))
+        {
+            await HandleBatch(message);
+            return;
+        }
+
         JsonRpcRequest? request;
         try
         {
@@ -55,59 +63,111 @@ public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog
         catch (JsonException ex)
         {
             logger.Warning("Failed to parse JSON-RPC request: {Error}", ex.Message);
-            await SendErrorResponse(JsonRpcError.ParseError(), null);
+            await SendResponse(JsonRpcResponse.Failure(JsonRpcError.ParseError(), null));
             return;
         }
 
-        if (request == null || !request.IsValid())
+        await SendResponse(await HandleRequest(request));
+    }
+
+    private async Task HandleBatch(string message)
+    {
+        List<JsonElement>? elements;
+        try
+        {
+            elements = JsonSerializer.Deserialize<List<JsonElement>>(message, JsonOptions);
+        }
+        catch (JsonException ex)
+        {
+            logger.Warning("Failed to parse JSON-RPC batch: {Error}", ex.Message);
+            await SendResponse(JsonRpcResponse.Failure(JsonRpcError.ParseError(), null));
+            return;
+        }
+
+        if (elements == null || elements.Count == 0)
+        {
+            await SendResponse(JsonRpcResponse.Failure(JsonRpcError.InvalidRequest(), null));
+            return;
+        }
+
+        if (elements.Count > MaxBatchSize)
         {
-            await SendErrorResponse(JsonRpcError.InvalidRequest(), request?.Id);
+            logger.Warning(
+                "Rejected JSON-RPC batch of {Count} requests from {ConnectionId}",
+                elements.Count,
+                Context.ConnectionId
+            );
+            await SendResponse(
+                JsonRpcResponse.Failure(
+                    JsonRpcError.InvalidRequest($"Batch exceeds {MaxBatchSize} requests"),
+                    null
+                )
+            );
             return;
         }
 
-        await HandleRequest(request);
+        var responses = new List<JsonRpcResponse>(elements.Count);
+        foreach (var element in elements)
+        {
+            JsonRpcRequest? request;
+            try
+            {
+                request = element.Deserialize<JsonRpcRequest>(JsonOptions);
+            }
+            catch (JsonException)
+            {
+                responses.Add(JsonRpcResponse.Failure(JsonRpcError.InvalidRequest(), null));
+                continue;
+            }
+
+            responses.Add(await HandleRequest(request));
+        }
+
+        await Clients.Caller.SendAsync(
+            "ReceiveMessage",
+            JsonSerializer.Serialize(responses, JsonOptions)
+        );
     }
 
-    private async Task HandleRequest(JsonRpcRequest request)
+    private async Task<JsonRpcResponse> HandleRequest(JsonRpcRequest? request)
     {
-        switch (request.Method.ToLowerInvariant())
-        {
-            case "subscribe":
-                await HandleSubscribe(request);
-                break;
-            case "unsubscribe":
-                await HandleUnsubscribe(request);
-                break;
-            default:
-                await SendErrorResponse(JsonRpcError.MethodNotFound(), request.Id);
-                break;
+        if (request == null || !request.IsValid())
+        {
+            return JsonRpcResponse.Failure(JsonRpcError.InvalidRequest(), request?.Id);
         }
+
+        return request.Method.ToLowerInvariant() switch
+        {
+            "subscribe" => await HandleSubscribe(request),
+            "unsubscribe" => await HandleUnsubscribe(request),
+            _ => JsonRpcResponse.Failure(JsonRpcError.MethodNotFound(), request.Id),
+        };
     }
 
-    private async Task HandleSubscribe(JsonRpcRequest request)
+    private async Task<JsonRpcResponse> HandleSubscribe(JsonRpcRequest request)
     {
         if (request.Params?.Channel?.ToLowerInvariant() != "trades")
         {
-            await SendErrorResponse(
+            return JsonRpcResponse.Failure(
                 JsonRpcError.InvalidParams("Only 'trades' channel is supported"),
                 request.Id
             );
-            return;
         }
 
         if (string.IsNullOrEmpty(request.Params?.Symbol))
         {
-            await SendErrorResponse(JsonRpcError.InvalidParams("Symbol is required"), request.Id);
-            return;
+            return JsonRpcResponse.Failure(
+                JsonRpcError.InvalidParams("Symbol is required"),
+                request.Id
+            );
         }
 
         if (!request.Params.Symbol.TryParseEnumMember<Symbol>(out var symbol))
         {
-            await SendErrorResponse(
+            return JsonRpcResponse.Failure(
                 JsonRpcError.InvalidParams($"Invalid symbol: {request.Params.Symbol}"),
                 request.Id
             );
-            return;
         }
 
         try
@@ -132,44 +192,44 @@ public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog
                 @event = "subscribed",
             };
 
-            await SendSuccessResponse(result, request.Id);
             logger.Information(
                 "Client {ConnectionId} subscribed to trades for {Symbol}",
                 Context.ConnectionId,
                 request.Params.Symbol
             );
+            return JsonRpcResponse.Success(result, request.Id);
         }
         catch (Exception ex)
         {
             logger.Error(ex, "Failed to subscribe to trades for {Symbol}", request.Params.Symbol);
-            await SendErrorResponse(JsonRpcError.InternalError(ex.Message), request.Id);
+            return JsonRpcResponse.Failure(JsonRpcError.InternalError(ex.Message), request.Id);
         }
     }
 
-    private async Task HandleUnsubscribe(JsonRpcRequest request)
+    private async Task<JsonRpcResponse> HandleUnsubscribe(JsonRpcRequest request)
     {
         if (request.Params?.Channel?.ToLowerInvariant() != "trades")
         {
-            await SendErrorResponse(
+            return JsonRpcResponse.Failure(
                 JsonRpcError.InvalidParams("Only 'trades' channel is supported"),
                 request.Id
             );
-            return;
         }
 
         if (string.IsNullOrEmpty(request.Params?.Symbol))
         {
-            await SendErrorResponse(JsonRpcError.InvalidParams("Symbol is required"), request.Id);
-            return;
+            return JsonRpcResponse.Failure(
+                JsonRpcError.InvalidParams("Symbol is required"),
+                request.Id
+            );
         }
 
         if (!request.Params.Symbol.TryParseEnumMember<Symbol>(out var symbol))
         {
-            await SendErrorResponse(
+            return JsonRpcResponse.Failure(
                 JsonRpcError.InvalidParams($"Invalid symbol: {request.Params.Symbol}"),
                 request.Id
             );
-            return;
         }
 
         try
@@ -189,12 +249,12 @@ public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog
                 @event = "unsubscribed",
             };
 
-            await SendSuccessResponse(result, request.Id);
             logger.Information(
                 "Client {ConnectionId} unsubscribed from trades for {Symbol}",
                 Context.ConnectionId,
                 request.Params.Symbol
             );
+            return JsonRpcResponse.Success(result, request.Id);
         }
         catch (Exception ex)
         {
@@ -203,22 +263,12 @@ public class BlockchainHub(IBlockchainDataService blockchainDataService, Serilog
                 "Failed to unsubscribe from trades for {Symbol}",
                 request.Params.Symbol
             );
-            await SendErrorResponse(JsonRpcError.InternalError(ex.Message), request.Id);
+            return JsonRpcResponse.Failure(JsonRpcError.InternalError(ex.Message), request.Id);
         }
     }
 
-    private async Task SendSuccessResponse(object result, string? id)
-    {
-        var response = JsonRpcResponse.Success(result, id);
-        await Clients.Caller.SendAsync(
-            "ReceiveMessage",
-            JsonSerializer.Serialize(response, JsonOptions)
-        );
-    }
-
-    private async Task SendErrorResponse(JsonRpcError error, string? id)
+    private async Task SendResponse(JsonRpcResponse response)
     {
-        var response = JsonRpcResponse.Failure(error, id);
         await Clients.Caller.SendAsync(
             "ReceiveMessage",
             JsonSerializer.Serialize(response, JsonOptions)
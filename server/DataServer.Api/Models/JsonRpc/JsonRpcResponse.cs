@@ -26,7 +26,8 @@ public record JsonRpcError(
 {
     public static JsonRpcError ParseError() => new(-32700, "Parse error");
 
-    public static JsonRpcError InvalidRequest() => new(-32600, "Invalid Request");
+    public static JsonRpcError InvalidRequest(string? details = null) =>
+        new(-32600, "Invalid Request", details);
 
     public static JsonRpcError MethodNotFound() => new(-32601, "Method not found");
 
@@ -0,0 +1,219 @@
+using System.Text.Json;
+using DataServer.Api.Hubs;
+using DataServer.Application.Services;
+using DataServer.Domain.Blockchain;
+using Microsoft.AspNetCore.SignalR;
+using Moq;
+using Serilog;
+
+namespace DataServer.Tests.Api.Hubs;
+
+public class BlockchainHubTests
+{
+    private readonly Mock<IBlockchainDataService> _mockService;
+    private readonly Mock<ILogger> _mockLogger;
+    private readonly Mock<IGroupManager> _mockGroups;
+    private readonly List<string> _sentMessages = [];
+    private readonly BlockchainHub _hub;
+
+    public BlockchainHubTests()
+    {
+        _mockService = new Mock<IBlockchainDataService>();
+        _mockLogger = new Mock<ILogger>();
+        _mockGroups = new Mock<IGroupManager>();
+
+        var mockContext = new Mock<HubCallerContext>();
+        mockContext.Setup(c => c.ConnectionId).Returns($"connection-{Guid.NewGuid()}");
+
+        var mockCaller = new Mock<ISingleClientProxy>();
+        mockCaller
+            .Setup(c =>
+                c.SendCoreAsync(
+                    "ReceiveMessage",
+                    It.IsAny<object?[]>(),
+                    It.IsAny<CancellationToken>()
+                )
+            )
+            .Callback<string, object?[], CancellationToken>(
+                (_, args, _) => _sentMessages.Add((string)args[0]!)
+            )
+            .Returns(Task.CompletedTask);
+
+        var mockClients = new Mock<IHubCallerClients>();
+        mockClients.Setup(c => c.Caller).Returns(mockCaller.Object);
+
+        _hub = new BlockchainHub(_mockService.Object, _mockLogger.Object)
+        {
+            Context = mockContext.Object,
+            Clients = mockClients.Object,
+            Groups = _mockGroups.Object,
+        };
+    }
+
+    [Fact]
+    public async Task SendMessage_SingleRequest_SendsSingleResponse()
+    {
+        await _hub.SendMessage(Request("subscribe", "ETH-USD", "1"));
+
+        var response = Assert.Single(SentResponses());
+        Assert.Equal(JsonValueKind.Object, response.ValueKind);
+        Assert.Equal("1", response.GetProperty("id").GetString());
+        Assert.Equal("subscribed", Event(response));
+        _mockService.Verify(
+            s => s.SubscribeToTradesAsync(Symbol.EthUsd, It.IsAny<CancellationToken>()),
+            Times.Once
+        );
+    }
+
+    [Fact]
+    public async Task SendMessage_Batch_SendsOneArrayWithAResponsePerRequestInOrder()
+    {
+        await _hub.SendMessage(
+            $"[{Request("subscribe", "ETH-USD", "1")}, {Request("subscribe", "BTC-USD", "2")}]"
+        );
+
+        var responses = Assert.Single(SentResponses()).EnumerateArray().ToList();
+        Assert.Equal(
+            new[] { "1", "2" },
+            responses.Select(r => r.GetProperty("id").GetString())
+        );
+        Assert.All(responses, r => Assert.Equal("subscribed", Event(r)));
+        _mockService.Verify(
+            s => s.SubscribeToTradesAsync(Symbol.EthUsd, It.IsAny<CancellationToken>()),
+            Times.Once
+        );
+        _mockService.Verify(
+            s => s.SubscribeToTradesAsync(Symbol.BtcUsd, It.IsAny<CancellationToken>()),
+            Times.Once
+        );
+    }
+
+    [Fact]
+    public async Task SendMessage_MixedBatch_ReportsEachFailureWithoutStoppingTheRest()
+    {
+        await _hub.SendMessage(
+            "["
+                + Request("subscribe", "ETH-USD", "1")
+                + ", "
+                + Request("subscribe", "DOGE-USD", "2")
+                + ", 42, "
+                + Request("publish", "ETH-USD", "4")
+                + ", "
+                + Request("unsubscribe", "ETH-USD", "5")
+                + "]"
+        );
+
+        var responses = Assert.Single(SentResponses()).EnumerateArray().ToList();
+        Assert.Equal(5, responses.Count);
+        Assert.Equal("subscribed", Event(responses[0]));
+        Assert.Equal(-32602, ErrorCode(responses[1]));
+        Assert.Equal("2", responses[1].GetProperty("id").GetString());
+        Assert.Equal(-32600, ErrorCode(responses[2]));
+        Assert.Equal(JsonValueKind.Null, responses[2].GetProperty("id").ValueKind);
+        Assert.Equal(-32601, ErrorCode(responses[3]));
+        Assert.Equal("unsubscribed", Event(responses[4]));
+    }
+
+    [Fact]
+    public async Task SendMessage_BatchWhereServiceThrows_ReturnsInternalErrorForThatRequestOnly()
+    {
+        _mockService
+            .Setup(s => s.SubscribeToTradesAsync(Symbol.BtcUsd, It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new InvalidOperationException("Upstream unavailable"));
+
+        await _hub.SendMessage(
+            $"[{Request("subscribe", "BTC-USD", "1")}, {Request("subscribe", "ETH-USD", "2")}]"
+        );
+
+        var responses = Assert.Single(SentResponses()).EnumerateArray().ToList();
+        Assert.Equal(-32603, ErrorCode(responses[0]));
+        Assert.Equal("subscribed", Event(responses[1]));
+    }
+
+    [Fact]
+    public async Task SendMessage_MalformedBatch_SendsSingleParseError()
+    {
+        await _hub.SendMessage($"[{Request("subscribe", "ETH-USD", "1")}, {{");
+
+        var response = Assert.Single(SentResponses());
+        Assert.Equal(JsonValueKind.Object, response.ValueKind);
+        Assert.Equal(-32700, ErrorCode(response));
+        _mockService.Verify(
+            s => s.SubscribeToTradesAsync(It.IsAny<Symbol>(), It.IsAny<CancellationToken>()),
+            Times.Never
+        );
+    }
+
+    [Fact]
+    public async Task SendMessage_EmptyBatch_SendsSingleInvalidRequest()
+    {
+        await _hub.SendMessage(" []");
+
+        var response = Assert.Single(SentResponses());
+        Assert.Equal(JsonValueKind.Object, response.ValueKind);
+        Assert.Equal(-32600, ErrorCode(response));
+    }
+
+    [Fact]
+    public async Task SendMessage_OversizedBatch_SendsSingleInvalidRequestWithoutSubscribing()
+    {
+        var requests = Enumerable
+            .Range(1, BlockchainHub.MaxBatchSize + 1)
+            .Select(i => Request("subscribe", "ETH-USD", i.ToString()));
+
+        await _hub.SendMessage($"[{string.Join(", ", requests)}]");
+
+        var response = Assert.Single(SentResponses());
+        Assert.Equal(JsonValueKind.Object, response.ValueKind);
+        Assert.Equal(-32600, ErrorCode(response));
+        _mockService.Verify(
+            s => s.SubscribeToTradesAsync(It.IsAny<Symbol>(), It.IsAny<CancellationToken>()),
+            Times.Never
+        );
+    }
+
+    [Fact]
+    public async Task SendMessage_BatchAtMaxSize_SendsAResponsePerRequest()
+    {
+        var requests = Enumerable
+            .Range(1, BlockchainHub.MaxBatchSize)
+            .Select(i => Request("subscribe", "ETH-USD", i.ToString()));
+
+        await _hub.SendMessage($"[{string.Join(", ", requests)}]");
+
+        var responses = Assert.Single(SentResponses()).EnumerateArray().ToList();
+        Assert.Equal(BlockchainHub.MaxBatchSize, responses.Count);
+        Assert.All(responses, r => Assert.Equal("subscribed", Event(r)));
+    }
+
+    [Fact]
+    public async Task SendMessage_BatchOfObjectsWithoutMethod_ReturnsInvalidRequestForEach()
+    {
+        await _hub.SendMessage("[{\"jsonrpc\": \"2.0\", \"id\": \"1\"}, {\"foo\": 1}]");
+
+        var responses = Assert.Single(SentResponses()).EnumerateArray().ToList();
+        Assert.Equal(2, responses.Count);
+        Assert.All(responses, r => Assert.Equal(-32600, ErrorCode(r)));
+        Assert.Equal("1", responses[0].GetProperty("id").GetString());
+    }
+
+    private static string Request(string method, string symbol, string id) =>
+        JsonSerializer.Serialize(
+            new
+            {
+                jsonrpc = "2.0",
+                method,
+                @params = new { channel = "trades", symbol },
+                id,
+            }
+        );
+
+    private static string? Event(JsonElement response) =>
+        response.GetProperty("result").GetProperty("event").GetString();
+
+    private static int ErrorCode(JsonElement response) =>
+        response.GetProperty("error").GetProperty("code").GetInt32();
+
+    private List<JsonElement> SentResponses() =>
+        _sentMessages.Select(message => JsonDocument.Parse(message).RootElement).ToList();
+}
@@ -0,0 +1,65 @@
+import argparse
+import sys
+
+from . import hot_path, trade_store, wire_protocol  # noqa: F401 - registers the benchmarks
+from .runner import compare, load_results, registered_benchmarks, run_benchmarks, save_results
+
+
+def format_ns(value: float) -> str:
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.2f} ms"
+    if value >= 1_000:
+        return f"{value / 1_000:.2f} us"
+    return f"{value:.0f} ns"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the simulator hot path")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2, help="Warm-up rounds discarded before measuring")
+    parser.add_argument("--round-ms", type=float, default=50.0, help="Target duration of each round")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown of the median that counts as a regression")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = sorted(registered_benchmarks())
+    if args.filter:
+        names = [name for name in names if args.filter in name]
+
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run_benchmarks(names, args.rounds, args.warmup, int(args.round_ms * 1_000_000))
+    for result in results:
+        size = f"  {result.bytes_per_op} B/msg" if result.bytes_per_op is not None else ""
+        print(f"{result.name:<40} median {format_ns(result.median_ns):>10}  "
+              f"min {format_ns(result.min_ns):>10}  stdev {format_ns(result.stdev_ns):>10}  "
+              f"({result.ops_per_sec:,.0f} ops/s){size}")
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    regressions = 0
+    print(f"\nComparison against {args.baseline} (threshold {args.threshold:.0%}):")
+    for comparison in compare(results, load_results(args.baseline), args.threshold):
+        marker = "REGRESSION" if comparison.regressed else "ok"
+        regressions += comparison.regressed
+        print(f"{comparison.name:<40} {format_ns(comparison.baseline_ns):>10} -> "
+              f"{format_ns(comparison.current_ns):>10} ({comparison.change:+.1%}) {marker}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import json
+import random
+import threading
+from contextlib import ExitStack
+
+from websockets.sync.client import connect
+from websockets.sync.server import serve
+
+from blockchain_api.clock import VirtualClock
+from blockchain_api.interval_scheduler import IntervalScheduler
+from blockchain_api.trade_generator import TradeGenerator
+from blockchain_api.websocket_handler import WebSocketHandler
+
+from .runner import benchmark
+
+
+SCHEDULER_BATCH = 1000
+LOOPBACK_BATCH = 500
+
+SUBSCRIBE = json.dumps({"action": "subscribe", "channel": "trades", "symbol": "ETH-USD"})
+SAMPLE_TRADE = {
+    "symbol": "ETH-USD",
+    "timestamp": "2019-08-13T11:30:06.100140Z",
+    "side": "sell",
+    "qty": 8.5e-5,
+    "price": 11252.4,
+    "trade_id": "12884909920",
+}
+
+
+@benchmark("websocket_handler.handle_message")
+def handle_message():
+    handler = WebSocketHandler()
+    return lambda: handler.handle_message(SUBSCRIBE)
+
+
+@benchmark("websocket_handler.format_trade_update")
+def format_trade_update():
+    handler = WebSocketHandler()
+    return lambda: handler.format_trade_update(SAMPLE_TRADE)
+
+
+@benchmark("trade_generator.generate_trade")
+def generate_trade():
+    generator = TradeGenerator("ETH-USD", rng=random.Random(1), clock=VirtualClock())
+    return generator.generate_trade
+
+
+@benchmark("trade_generator.format_trade")
+def format_trade():
+    return lambda: TradeGenerator.format_trade(SAMPLE_TRADE)
+
+
+@benchmark("interval_scheduler.dispatch", ops_per_call=SCHEDULER_BATCH)
+def scheduler_dispatch():
+    def run():
+        done = threading.Event()
+        calls = 0
+
+        def callback():
+            nonlocal calls
+            calls += 1
+            if calls == SCHEDULER_BATCH:
+                done.set()
+
+        scheduler = IntervalScheduler(min_interval=0.0, max_interval=0.0)
+        scheduler.start(callback)
+        done.wait()
+        scheduler.stop()
+
+    return run
+
+
+@benchmark("loopback.send_trade_updates", ops_per_call=LOOPBACK_BATCH)
+def loopback_send_loop():
+    generator = TradeGenerator("ETH-USD", rng=random.Random(1))
+
+    def emit(ws):
+        handler = WebSocketHandler()
+        for request in ws:
+            for _ in range(int(request)):
+                ws.send(handler.format_trade_update(generator.generate_trade()))
+
+    server = serve(emit, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stack = ExitStack()
+    client = stack.enter_context(connect(f"ws://127.0.0.1:{server.socket.getsockname()[1]}"))
+    request = str(LOOPBACK_BATCH)
+
+    def run():
+        client.send(request)
+        for _ in range(LOOPBACK_BATCH):
+            client.recv()
+
+    def teardown():
+        stack.close()
+        server.shutdown()
+        thread.join(timeout=1.0)
+
+    return run, teardown
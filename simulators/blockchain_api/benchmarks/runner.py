@@ -0,0 +1,177 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+
+Prepared = Callable[[], None] | tuple[Callable[[], None], Callable[[], None]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[[], Prepared]
+    ops_per_call: int = 1
+    bytes_per_op: int | None = None
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    rounds: int
+    iterations: int
+    ops_per_call: int
+    min_ns: float
+    median_ns: float
+    mean_ns: float
+    stdev_ns: float
+    bytes_per_op: int | None = None
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1e9 / self.median_ns if self.median_ns else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["ops_per_sec"] = self.ops_per_sec
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ns: float
+    current_ns: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        return (self.current_ns - self.baseline_ns) / self.baseline_ns if self.baseline_ns else 0.0
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, ops_per_call: int = 1, bytes_per_op: int | None = None):
+    def decorator(setup: Callable[[], Prepared]):
+        _registry[name] = Benchmark(name, setup, ops_per_call, bytes_per_op)
+        return setup
+    return decorator
+
+
+def registered_benchmarks() -> dict[str, Benchmark]:
+    return dict(_registry)
+
+
+def _time_calls(func: Callable[[], None], iterations: int) -> int:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    return time.perf_counter_ns() - started
+
+
+def calibrate(func: Callable[[], None], target_round_ns: int = 50_000_000) -> int:
+    iterations = 1
+    while True:
+        elapsed = _time_calls(func, iterations)
+        if elapsed >= target_round_ns / 10 or iterations >= 1_000_000:
+            return max(1, int(iterations * target_round_ns / max(elapsed, 1)))
+        iterations *= 10
+
+
+def run_benchmark(
+    bench: Benchmark,
+    rounds: int = 10,
+    warmup_rounds: int = 2,
+    iterations: int | None = None,
+    target_round_ns: int = 50_000_000,
+) -> BenchmarkResult:
+    prepared = bench.setup()
+    func, teardown = prepared if isinstance(prepared, tuple) else (prepared, None)
+
+    gc_was_enabled = gc.isenabled()
+    try:
+        if iterations is None:
+            iterations = calibrate(func, target_round_ns)
+        gc.disable()
+        for _ in range(warmup_rounds):
+            _time_calls(func, iterations)
+        samples = [
+            _time_calls(func, iterations) / (iterations * bench.ops_per_call)
+            for _ in range(rounds)
+        ]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if teardown is not None:
+            teardown()
+
+    return BenchmarkResult(
+        name=bench.name,
+        rounds=rounds,
+        iterations=iterations,
+        ops_per_call=bench.ops_per_call,
+        min_ns=min(samples),
+        median_ns=statistics.median(samples),
+        mean_ns=statistics.fmean(samples),
+        stdev_ns=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        bytes_per_op=bench.bytes_per_op,
+    )
+
+
+def run_benchmarks(
+    names: list[str] | None = None,
+    rounds: int = 10,
+    warmup_rounds: int = 2,
+    target_round_ns: int = 50_000_000,
+) -> list[BenchmarkResult]:
+    benches = registered_benchmarks()
+    selected = [benches[name] for name in names] if names else list(benches.values())
+    return [run_benchmark(bench, rounds, warmup_rounds, target_round_ns=target_round_ns) for bench in selected]
+
+
+def compare(
+    current: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = 0.10,
+) -> list[Comparison]:
+    baseline_by_name = {result.name: result for result in baseline}
+    comparisons = []
+    for result in current:
+        previous = baseline_by_name.get(result.name)
+        if previous is None:
+            continue
+        comparisons.append(Comparison(
+            name=result.name,
+            baseline_ns=previous.median_ns,
+            current_ns=result.median_ns,
+            regressed=result.median_ns > previous.median_ns * (1.0 + threshold),
+        ))
+    return comparisons
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    document = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    with open(path) as f:
+        document = json.load(f)
+    return [BenchmarkResult.from_dict(result) for result in document["results"]]
@@ -0,0 +1,47 @@
+import random
+
+from blockchain_api.trade_store import SymbolHistory, TradeStore
+
+from .runner import benchmark
+
+
+FULL_STORE_SIZE = TradeStore.DEFAULT_CAPACITY
+PAGE_SIZE = 100
+BASE_MICROS = 1_705_314_645_000_000
+
+
+def _full_history() -> SymbolHistory:
+    history = SymbolHistory("ETH-USD", FULL_STORE_SIZE)
+    for n in range(FULL_STORE_SIZE + FULL_STORE_SIZE // 2):
+        history.append(BASE_MICROS + n * 1000, 2500.0, 0.5, n & 1, n)
+    return history
+
+
+@benchmark("trade_store.record")
+def record():
+    store = TradeStore(capacity_per_symbol=FULL_STORE_SIZE)
+    trade = {
+        "symbol": "ETH-USD",
+        "timestamp": "2024-01-15T10:30:45.123456Z",
+        "side": "buy",
+        "qty": 0.5,
+        "price": 2500.0,
+        "trade_id": "1705314645123456",
+    }
+    return lambda: store.record(trade)
+
+
+@benchmark("trade_store.query_page", ops_per_call=PAGE_SIZE)
+def query_page():
+    history = _full_history()
+    rng = random.Random(1)
+    first = FULL_STORE_SIZE // 2
+    since = [BASE_MICROS + rng.randrange(first, first + FULL_STORE_SIZE) * 1000 for _ in range(1024)]
+    index = 0
+
+    def run():
+        nonlocal index
+        index = (index + 1) % len(since)
+        history.query(since=since[index], limit=PAGE_SIZE)
+
+    return run
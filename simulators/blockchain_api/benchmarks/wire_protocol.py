@@ -0,0 +1,39 @@
+from blockchain_api.wire_protocol import CODECS, msgpack
+
+from .runner import benchmark
+
+
+SAMPLE_UPDATE = {
+    "seqnum": 1234,
+    "event": "updated",
+    "channel": "trades",
+    "symbol": "ETH-USD",
+    "timestamp": "2019-08-13T11:30:06.100140Z",
+    "side": "sell",
+    "qty": 8.5e-5,
+    "price": 11252.4,
+    "trade_id": "12884909920",
+}
+
+
+def _frame_size(frame: str | bytes) -> int:
+    return len(frame.encode() if isinstance(frame, str) else frame)
+
+
+def _register(name: str) -> None:
+    codec = CODECS[name]()
+    frame = codec.encode(SAMPLE_UPDATE)
+    size = _frame_size(frame)
+
+    @benchmark(f"wire_protocol.{name}.encode_trade", bytes_per_op=size)
+    def encode():
+        return lambda: codec.encode(SAMPLE_UPDATE)
+
+    @benchmark(f"wire_protocol.{name}.decode_trade", bytes_per_op=size)
+    def decode():
+        return lambda: codec.decode(frame)
+
+
+for _name in CODECS:
+    if _name != "msgpack" or msgpack is not None:
+        _register(_name)
@@ -1,34 +1,272 @@
-import json
+import os
 import threading
-from flask import Flask
+from flask import Flask, Response, jsonify, request
 from flask_sock import Sock
 
+from blockchain_api.clock import SystemClock
+from blockchain_api.config import ConfigManager, SimulatorConfig
 from blockchain_api.websocket_handler import WebSocketHandler
 from blockchain_api.trade_generator import TradeGenerator
 from blockchain_api.interval_scheduler import IntervalScheduler
+from blockchain_api.scenario import Scenario, ScenarioEngine
+from blockchain_api.impairment import ImpairmentProfile, ImpairmentRegistry
+from blockchain_api.multicast import MulticastFeed, MulticastSettings
+from blockchain_api.rate_limiter import InboundRateLimiter, RateLimitMetrics, RateLimitSettings
+from blockchain_api.shared_feed import SharedTradeFeed
+from blockchain_api.profiling import PROFILE_MODES, Profiler, ProfilerBusyError
+from blockchain_api.trade_store import CursorExpiredError, TradeStore
+from blockchain_api.wire_protocol import codec_for_subprotocol, supported_subprotocols
 
 
 app = Flask(__name__)
+app.config["SOCK_SERVER_OPTIONS"] = {"subprotocols": supported_subprotocols()}
 sock = Sock(app)
+clock = SystemClock()
+scenario_engine = ScenarioEngine(clock)
+impairments = (
+    ImpairmentRegistry.load(os.environ["IMPAIRMENT_FILE"])
+    if os.getenv("IMPAIRMENT_FILE")
+    else ImpairmentRegistry()
+)
+config_manager = ConfigManager(
+    SimulatorConfig(limits=RateLimitSettings.from_env()),
+    path=os.getenv("CONFIG_FILE"),
+)
+rate_limit_metrics = RateLimitMetrics()
+profiler = Profiler(enabled=os.getenv("ENABLE_PROFILING", "").lower() in ("1", "true", "yes"))
+trade_store = TradeStore.from_env()
+multicast_settings = MulticastSettings.from_env()
+multicast_feed = MulticastFeed(scenario_engine, clock, trade_store, config_manager)
+shared_feed = SharedTradeFeed(scenario_engine, clock, trade_store, config_manager)
+
+if os.getenv("SCENARIO_FILE"):
+    scenario_engine.start(Scenario.load(os.environ["SCENARIO_FILE"]))
+
+if multicast_settings.enabled:
+    multicast_feed.start(multicast_settings)
+
+
+@app.get("/trades")
+def get_trades():
+    symbol = request.args.get("symbol")
+    if not symbol:
+        return jsonify({"error": "symbol is required"}), 400
+
+    try:
+        trades, next_cursor = trade_store.query(
+            symbol,
+            since=request.args.get("since"),
+            until=request.args.get("until"),
+            limit=int(request.args.get("limit", 100)),
+            cursor=request.args.get("cursor"),
+        )
+    except CursorExpiredError as e:
+        return jsonify({"error": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"symbol": symbol, "trades": trades, "next_cursor": next_cursor})
+
+
+@app.get("/admin/trade-store")
+def get_trade_store():
+    return jsonify(trade_store.status())
+
+
+@app.get("/admin/shared-feed")
+def get_shared_feed():
+    return jsonify(shared_feed.status())
+
+
+@app.get("/admin/config")
+def get_config():
+    return jsonify(config_manager.status())
+
+
+@app.patch("/admin/config")
+def update_config():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a configuration JSON object"}), 400
+
+    try:
+        config_manager.update(data)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(config_manager.status())
+
+
+@app.post("/admin/config/reload")
+def reload_config():
+    try:
+        config_manager.reload()
+    except (OSError, TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(config_manager.status())
+
+
+@app.get("/admin/scenario")
+def get_scenario():
+    return jsonify(scenario_engine.status())
+
+
+@app.post("/admin/scenario")
+def start_scenario():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a scenario JSON object"}), 400
+
+    try:
+        scenario = Scenario.from_dict(data)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    scenario_engine.start(scenario)
+    return jsonify(scenario_engine.status())
+
+
+@app.delete("/admin/scenario")
+def stop_scenario():
+    scenario_engine.stop()
+    return jsonify(scenario_engine.status())
+
+
+@app.get("/admin/impairments")
+def get_impairments():
+    return jsonify(impairments.status())
+
+
+@app.post("/admin/impairments")
+def register_impairment():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be an impairment profile JSON object"}), 400
+
+    try:
+        profile = ImpairmentProfile.from_dict(data)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    impairments.register(profile)
+    return jsonify(impairments.status()[profile.name])
+
+
+@app.get("/admin/rate-limits")
+def get_rate_limits():
+    return jsonify({
+        "settings": config_manager.current.limits.to_dict(),
+        "metrics": rate_limit_metrics.to_dict(),
+    })
+
+
+@app.get("/admin/multicast")
+def get_multicast():
+    return jsonify(multicast_feed.status())
+
+
+@app.post("/admin/multicast")
+def start_multicast():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a multicast settings JSON object"}), 400
+
+    try:
+        multicast_feed.start(MulticastSettings.from_dict(data))
+    except (TypeError, ValueError, OSError) as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(multicast_feed.status())
+
+
+@app.delete("/admin/multicast")
+def stop_multicast():
+    multicast_feed.stop()
+    return jsonify(multicast_feed.status())
+
+
+@app.post("/admin/profile")
+def run_profile():
+    if not profiler.enabled:
+        return jsonify({"error": "Profiling is disabled; set ENABLE_PROFILING=1 to enable it"}), 404
+
+    mode = request.args.get("mode", "sampling")
+    if mode not in PROFILE_MODES:
+        return jsonify({"error": f"mode must be one of: {', '.join(PROFILE_MODES)}"}), 400
+
+    try:
+        duration = float(request.args.get("duration", 10.0))
+        if mode == "sampling":
+            output = profiler.profile_sampling(
+                duration,
+                interval=float(request.args.get("interval", 0.005)),
+                by_thread=request.args.get("by_thread", "").lower() in ("1", "true", "yes"),
+            )
+            return Response(output, mimetype="text/plain")
+
+        text, raw = profiler.profile_deterministic(
+            duration,
+            sort=request.args.get("sort", "cumulative"),
+            limit=int(request.args.get("limit", 50)),
+        )
+    except ProfilerBusyError as e:
+        return jsonify({"error": str(e)}), 409
+    except (KeyError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    if request.args.get("format") == "pstats":
+        return Response(raw, mimetype="application/octet-stream")
+    return Response(text, mimetype="text/plain")
 
 
 @sock.route("/ws")
 def websocket(ws):
-    handler = WebSocketHandler()
+    handler = WebSocketHandler(
+        rate_limiter=InboundRateLimiter.from_source(lambda: config_manager.current.limits, rate_limit_metrics, clock),
+        codec=codec_for_subprotocol(ws.subprotocol),
+        supports_symbol=lambda symbol: config_manager.current.supports(symbol),
+    )
+    impairment = request.args.get("impairment") or os.getenv("IMPAIRMENT_PROFILE")
+    sender = None
+    if impairments.get(impairment):
+        sender = impairments.create_sender(ws.send, impairment)
+        send = sender.send
+    else:
+        if impairment:
+            print(f"unknown impairment profile '{impairment}', sending unimpaired")
+        send = ws.send
     trade_generators: dict[str, TradeGenerator] = {}
     schedulers: dict[str, IntervalScheduler] = {}
+    shared_tokens: dict[str, int] = {}
     lock = threading.Lock()
+    send_lock = threading.Lock()
 
     def send_trade(symbol: str):
-        if symbol in trade_generators and handler.is_subscribed(symbol):
-            trade = trade_generators[symbol].generate_trade()
-            update = handler.format_trade_update(trade)
+        profiler.call(emit_trade, symbol)
+
+    def emit_trade(symbol: str):
+        config = config_manager.current
+        if symbol in trade_generators and handler.is_subscribed(symbol) and config.supports(symbol):
+            conditions = scenario_engine.conditions(symbol)
+            if conditions.halted:
+                return
+            generator = trade_generators[symbol]
+            model = config.price_model
+            generator.configure(model.volatility, model.min_qty, model.max_qty)
+            trade = generator.generate_trade(price_factor=conditions.price_factor)
+            trade_store.record(trade)
             try:
-                ws.send(update)
+                with send_lock:
+                    send(handler.format_trade_update(trade))
                 print(f"sent: {TradeGenerator.format_trade(trade)}")
             except Exception:
                 pass
 
+    def deliver_shared(trade: dict):
+        try:
+            with send_lock:
+                send(handler.format_trade_update(trade))
+        except Exception:
+            pass
+
     try:
         while True:
             message = ws.receive()
@@ -36,23 +274,37 @@ def websocket(ws):
                 break
 
             print(f"received: {message}")
-            response = handler.handle_message(message)
-            ws.send(response)
-            print(f"sent: {response}")
+            with send_lock:
+                response_data = profiler.call(handler.handle_request, message)
+                send(handler.encode(response_data))
+            print(f"sent: {response_data}")
 
-            response_data = json.loads(response)
             if response_data.get("event") == "subscribed":
                 symbol = response_data.get("symbol")
-                if symbol and symbol not in trade_generators:
+                if symbol and config_manager.current.emission.shared:
+                    with lock:
+                        if symbol not in shared_tokens and symbol not in trade_generators:
+                            shared_tokens[symbol] = shared_feed.subscribe(symbol, deliver_shared)
+                elif symbol and symbol not in trade_generators and symbol not in shared_tokens:
                     with lock:
-                        trade_generators[symbol] = TradeGenerator(symbol)
-                        scheduler = IntervalScheduler(min_interval=0.5, max_interval=3.0)
+                        trade_generators[symbol] = TradeGenerator(
+                            symbol, rng=scenario_engine.random_for(symbol, "trades"), clock=clock
+                        )
+                        scheduler = IntervalScheduler(
+                            rng=scenario_engine.random_for(symbol, "intervals"),
+                            rate_multiplier=lambda s=symbol: scenario_engine.conditions(s).rate_multiplier,
+                            clock=clock,
+                            interval_range=lambda: config_manager.current.emission.interval_range,
+                        )
                         schedulers[symbol] = scheduler
                         scheduler.start(lambda s=symbol: send_trade(s))
 
             elif response_data.get("event") == "unsubscribed":
                 symbol = response_data.get("symbol")
-                if symbol and symbol in schedulers:
+                if symbol and symbol in shared_tokens:
+                    with lock:
+                        shared_feed.unsubscribe(symbol, shared_tokens.pop(symbol))
+                elif symbol and symbol in schedulers:
                     with lock:
                         schedulers[symbol].stop()
                         del schedulers[symbol]
@@ -63,6 +315,10 @@ def websocket(ws):
         with lock:
             for scheduler in schedulers.values():
                 scheduler.stop()
+            for symbol, token in shared_tokens.items():
+                shared_feed.unsubscribe(symbol, token)
+        if sender is not None:
+            sender.close()
 
 
 if __name__ == "__main__":
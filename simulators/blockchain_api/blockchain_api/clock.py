@@ -0,0 +1,95 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    @abstractmethod
+    def time(self) -> float:
+        pass
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        pass
+
+    @abstractmethod
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        pass
+
+
+class SystemClock(Clock):
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout=timeout)
+
+
+class VirtualClock(Clock):
+    POLL_INTERVAL = 0.005
+    SETTLE_TIMEOUT = 1.0
+
+    def __init__(self, start: float = 1_700_000_000.0):
+        self._start = start
+        self._now = start
+        self._condition = threading.Condition()
+        self._sleepers: dict[threading.Thread, float] = {}
+        self._woken: set[threading.Thread] = set()
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now - self._start
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        thread = threading.current_thread()
+        with self._condition:
+            self._woken.discard(thread)
+            deadline = self._now + timeout
+            self._sleepers[thread] = deadline
+            self._condition.notify_all()
+            try:
+                while not event.is_set() and self._now < deadline:
+                    self._condition.wait(timeout=self.POLL_INTERVAL)
+            finally:
+                del self._sleepers[thread]
+                self._woken.add(thread)
+                self._condition.notify_all()
+            return event.is_set()
+
+    def wait_for_sleepers(self, count: int = 1, timeout: float = 1.0) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._sleepers) >= count, timeout=timeout)
+
+    def sleep(self, seconds: float) -> None:
+        self.wait(threading.Event(), seconds)
+
+    def advance(self, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError("Cannot move a clock backwards")
+
+        with self._condition:
+            target = self._now + seconds
+            while True:
+                self._settle()
+                pending = [deadline for deadline in self._sleepers.values() if deadline <= target]
+                if not pending:
+                    break
+                self._now = max(self._now, min(pending))
+                self._condition.notify_all()
+            self._now = target
+            self._condition.notify_all()
+            self._settle()
+
+    def _settle(self) -> None:
+        give_up_at = time.monotonic() + self.SETTLE_TIMEOUT
+        while time.monotonic() < give_up_at:
+            self._woken = {thread for thread in self._woken if thread.is_alive()}
+            due = any(deadline <= self._now for deadline in self._sleepers.values())
+            if not self._woken and not due:
+                return
+            self._condition.wait(timeout=self.POLL_INTERVAL)
@@ -0,0 +1,130 @@
+import json
+import threading
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+from blockchain_api.rate_limiter import RateLimitSettings
+
+
+def _check_fields(cls, data: Any, section: str) -> dict:
+    if not isinstance(data, dict):
+        raise ValueError(f"'{section}' must be an object")
+    unknown = set(data) - {f.name for f in fields(cls)}
+    if unknown:
+        raise ValueError(f"Unknown {section} settings: {', '.join(sorted(unknown))}")
+    return data
+
+
+@dataclass(frozen=True)
+class EmissionSettings:
+    min_interval: float = 0.5
+    max_interval: float = 3.0
+    shared: bool = False
+
+    def __post_init__(self):
+        if self.min_interval < 0 or self.max_interval < 0:
+            raise ValueError("Intervals must be non-negative")
+        if self.min_interval > self.max_interval:
+            raise ValueError("min_interval must be less than or equal to max_interval")
+        if not isinstance(self.shared, bool):
+            raise ValueError("shared must be true or false")
+
+    @property
+    def interval_range(self) -> tuple[float, float]:
+        return self.min_interval, self.max_interval
+
+
+@dataclass(frozen=True)
+class PriceModelSettings:
+    volatility: float = 0.001
+    min_qty: float = 0.0001
+    max_qty: float = 10.0
+
+    def __post_init__(self):
+        if self.volatility < 0:
+            raise ValueError("volatility must be non-negative")
+        if self.min_qty <= 0 or self.min_qty > self.max_qty:
+            raise ValueError("min_qty must be positive and no greater than max_qty")
+
+
+@dataclass(frozen=True)
+class SimulatorConfig:
+    symbols: tuple[str, ...] = ()
+    emission: EmissionSettings = field(default_factory=EmissionSettings)
+    price_model: PriceModelSettings = field(default_factory=PriceModelSettings)
+    limits: RateLimitSettings = field(default_factory=RateLimitSettings)
+
+    SECTIONS = {
+        "emission": EmissionSettings,
+        "price_model": PriceModelSettings,
+        "limits": RateLimitSettings,
+    }
+
+    def supports(self, symbol: str) -> bool:
+        return not self.symbols or symbol in self.symbols
+
+    def merged(self, data: dict[str, Any]) -> "SimulatorConfig":
+        _check_fields(SimulatorConfig, data, "simulator")
+        changes: dict[str, Any] = {}
+        for name, section_cls in self.SECTIONS.items():
+            if name in data:
+                values = _check_fields(section_cls, data[name], name)
+                changes[name] = replace(getattr(self, name), **values)
+
+        if "symbols" in data:
+            symbols = data["symbols"]
+            if not isinstance(symbols, list) or not all(isinstance(s, str) and s for s in symbols):
+                raise ValueError("symbols must be a list of symbol names")
+            changes["symbols"] = tuple(symbols)
+
+        return replace(self, **changes)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], base: "SimulatorConfig | None" = None) -> "SimulatorConfig":
+        return (base if base is not None else cls()).merged(data)
+
+    @classmethod
+    def load(cls, path: str, base: "SimulatorConfig | None" = None) -> "SimulatorConfig":
+        with open(path) as f:
+            return cls.from_dict(json.load(f), base)
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {"symbols": list(self.symbols)}
+        for name in self.SECTIONS:
+            section = getattr(self, name)
+            data[name] = {f.name: getattr(section, f.name) for f in fields(section)}
+        return data
+
+
+class ConfigManager:
+    def __init__(self, config: SimulatorConfig | None = None, path: str | None = None):
+        self._defaults = config if config is not None else SimulatorConfig()
+        self._lock = threading.Lock()
+        self.path = path
+        self.version = 0
+        self._config = self._defaults
+        if path:
+            self._config = SimulatorConfig.load(path, self._defaults)
+
+    @property
+    def current(self) -> SimulatorConfig:
+        return self._config
+
+    def _swap(self, config: SimulatorConfig) -> SimulatorConfig:
+        self._config = config
+        self.version += 1
+        return config
+
+    def update(self, data: dict[str, Any]) -> SimulatorConfig:
+        with self._lock:
+            return self._swap(self._config.merged(data))
+
+    def reload(self) -> SimulatorConfig:
+        if not self.path:
+            raise ValueError("No configuration file to reload; set CONFIG_FILE")
+        with self._lock:
+            return self._swap(SimulatorConfig.load(self.path, self._defaults))
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"version": self.version, "path": self.path, "config": self._config.to_dict()}
@@ -0,0 +1,280 @@
+import heapq
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Callable
+
+
+JITTER_DISTRIBUTIONS = ("uniform", "normal", "exponential")
+
+
+@dataclass(frozen=True)
+class ImpairmentProfile:
+    name: str
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    jitter_distribution: str = "uniform"
+    drop_rate: float = 0.0
+    duplicate_rate: float = 0.0
+    reorder_rate: float = 0.0
+    reorder_window: int = 1
+    reorder_hold_ms: float = 100.0
+    bandwidth_bytes_per_sec: float | None = None
+    seed: int | None = None
+
+    def __post_init__(self):
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency_ms and jitter_ms must be non-negative")
+        if self.jitter_distribution not in JITTER_DISTRIBUTIONS:
+            raise ValueError(f"Unknown jitter distribution: {self.jitter_distribution}")
+        for rate in (self.drop_rate, self.duplicate_rate, self.reorder_rate):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError("Impairment rates must be between 0 and 1")
+        if self.reorder_window < 1:
+            raise ValueError("reorder_window must be at least 1")
+        if self.reorder_hold_ms < 0:
+            raise ValueError("reorder_hold_ms must be non-negative")
+        if self.bandwidth_bytes_per_sec is not None and self.bandwidth_bytes_per_sec <= 0:
+            raise ValueError("bandwidth_bytes_per_sec must be positive")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ImpairmentProfile":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown impairment fields: {', '.join(sorted(unknown))}")
+        if not data.get("name"):
+            raise ValueError("Impairment profile requires a name")
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+DEFAULT_PROFILES = (
+    ImpairmentProfile("wan", latency_ms=50.0, jitter_ms=10.0, jitter_distribution="normal"),
+    ImpairmentProfile("lossy", latency_ms=20.0, jitter_ms=5.0, drop_rate=0.05),
+    ImpairmentProfile(
+        "congested",
+        latency_ms=100.0,
+        jitter_ms=50.0,
+        jitter_distribution="exponential",
+        duplicate_rate=0.01,
+        reorder_rate=0.05,
+        reorder_window=4,
+        bandwidth_bytes_per_sec=64 * 1024,
+    ),
+)
+
+
+class ImpairmentCounters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.messages = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.duplicated = 0
+        self.reordered = 0
+        self.bytes_delivered = 0
+        self.delay_ms_total = 0.0
+        self.delay_ms_max = 0.0
+        self.throttled_ms_total = 0.0
+
+    def record(self, **deltas) -> None:
+        with self._lock:
+            for name, value in deltas.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def record_delay(self, delay_ms: float, throttled_ms: float) -> None:
+        with self._lock:
+            self.delay_ms_total += delay_ms
+            self.delay_ms_max = max(self.delay_ms_max, delay_ms)
+            self.throttled_ms_total += throttled_ms
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            delayed = self.messages - self.dropped
+            return {
+                "connections": self.connections,
+                "messages": self.messages,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "duplicated": self.duplicated,
+                "reordered": self.reordered,
+                "bytes_delivered": self.bytes_delivered,
+                "delay_ms_mean": self.delay_ms_total / delayed if delayed else 0.0,
+                "delay_ms_max": self.delay_ms_max,
+                "throttled_ms_total": self.throttled_ms_total,
+            }
+
+
+class ImpairedSender:
+    def __init__(
+        self,
+        send: Callable[[str | bytes], None],
+        profile: ImpairmentProfile,
+        counters: ImpairmentCounters | None = None,
+    ):
+        self.profile = profile
+        self.counters = counters if counters is not None else ImpairmentCounters()
+        self._send = send
+        self._rng = random.Random(profile.seed)
+        self._condition = threading.Condition()
+        self._queue: list[tuple[float, int, str | bytes]] = []
+        self._held: list[list] = []
+        self._order = 0
+        self._link_free_at = 0.0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.counters.record(connections=1)
+        self._thread.start()
+
+    def _jitter_ms(self) -> float:
+        jitter = self.profile.jitter_ms
+        if jitter == 0:
+            return 0.0
+        if self.profile.jitter_distribution == "normal":
+            return max(0.0, self._rng.gauss(0.0, jitter))
+        if self.profile.jitter_distribution == "exponential":
+            return self._rng.expovariate(1.0 / jitter)
+        return self._rng.uniform(0.0, jitter)
+
+    def _schedule(self, message: str | bytes, now: float) -> float:
+        delay = (self.profile.latency_ms + self._jitter_ms()) / 1000.0
+        due = now + delay
+        throttled = 0.0
+
+        bandwidth = self.profile.bandwidth_bytes_per_sec
+        if bandwidth is not None:
+            size = len(message.encode() if isinstance(message, str) else message)
+            start = max(due, self._link_free_at)
+            throttled = start - due
+            due = start + size / bandwidth
+            self._link_free_at = due
+
+        self.counters.record_delay((due - now) * 1000.0, throttled * 1000.0)
+        return due
+
+    def _push(self, due: float, message: str | bytes) -> None:
+        self._order += 1
+        heapq.heappush(self._queue, (due, self._order, message))
+
+    def send(self, message: str | bytes) -> None:
+        rng = self._rng
+        profile = self.profile
+
+        with self._condition:
+            if self._closed:
+                return
+
+            self.counters.record(messages=1)
+            if rng.random() < profile.drop_rate:
+                self.counters.record(dropped=1)
+                return
+
+            due = self._schedule(message, time.monotonic())
+
+            released = []
+            for held in self._held:
+                held[0] -= 1
+                if held[0] <= 0:
+                    released.append(held)
+            for held in released:
+                self._held.remove(held)
+
+            if rng.random() < profile.reorder_rate:
+                self.counters.record(reordered=1)
+                deadline = due + profile.reorder_hold_ms / 1000.0
+                self._held.append([rng.randint(1, profile.reorder_window), message, deadline])
+            else:
+                self._push(due, message)
+
+            for _, held_message, _ in released:
+                self._push(due, held_message)
+
+            if rng.random() < profile.duplicate_rate:
+                self.counters.record(duplicated=1)
+                self._push(due, message)
+
+            self._condition.notify()
+
+    # A held message is released by later sends, or once reorder_hold_ms has
+    # passed since it was due, so one sent just before the connection goes
+    # quiet (often a subscribe reply) is not stuck until the next trade.
+    def _release_expired(self, now: float) -> None:
+        expired = [held for held in self._held if held[2] <= now]
+        for held in expired:
+            self._held.remove(held)
+            self._push(held[2], held[1])
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._held.clear()
+            self._condition.notify()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    self._release_expired(now)
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    wakeups = [held[2] for held in self._held]
+                    if self._queue:
+                        wakeups.append(self._queue[0][0])
+                    self._condition.wait(timeout=min(wakeups) - now if wakeups else None)
+                if self._closed:
+                    return
+                _, _, message = heapq.heappop(self._queue)
+
+            try:
+                self._send(message)
+            except Exception:
+                continue
+            size = len(message.encode() if isinstance(message, str) else message)
+            self.counters.record(delivered=1, bytes_delivered=size)
+
+
+class ImpairmentRegistry:
+    def __init__(self, profiles=DEFAULT_PROFILES):
+        self._lock = threading.Lock()
+        self._profiles: dict[str, ImpairmentProfile] = {}
+        self._counters: dict[str, ImpairmentCounters] = {}
+        for profile in profiles:
+            self.register(profile)
+
+    @classmethod
+    def load(cls, path: str) -> "ImpairmentRegistry":
+        with open(path) as f:
+            data = json.load(f)
+        return cls(ImpairmentProfile.from_dict(profile) for profile in data["profiles"])
+
+    def register(self, profile: ImpairmentProfile) -> None:
+        with self._lock:
+            self._profiles[profile.name] = profile
+            # Live senders keep the counters they were created with, so a
+            # re-registered profile carries on counting into the same ones.
+            self._counters.setdefault(profile.name, ImpairmentCounters())
+
+    def get(self, name: str | None) -> ImpairmentProfile | None:
+        if not name:
+            return None
+        return self._profiles.get(name)
+
+    def create_sender(self, send: Callable[[str | bytes], None], name: str) -> ImpairedSender:
+        with self._lock:
+            return ImpairedSender(send, self._profiles[name], self._counters[name])
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                name: {"profile": profile.to_dict(), "counters": self._counters[name].to_dict()}
+                for name, profile in self._profiles.items()
+            }
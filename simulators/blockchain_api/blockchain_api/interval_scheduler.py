@@ -2,9 +2,19 @@ import random
 import threading
 from typing import Callable
 
+from blockchain_api.clock import Clock, SystemClock
+
 
 class IntervalScheduler:
-    def __init__(self, min_interval: float = 0.1, max_interval: float = 1.0):
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        max_interval: float = 1.0,
+        rng: random.Random | None = None,
+        rate_multiplier: Callable[[], float] | None = None,
+        clock: Clock | None = None,
+        interval_range: Callable[[], tuple[float, float]] | None = None,
+    ):
         if min_interval < 0 or max_interval < 0:
             raise ValueError("Intervals must be non-negative")
         if min_interval > max_interval:
@@ -12,6 +22,10 @@ class IntervalScheduler:
 
         self.min_interval = min_interval
         self.max_interval = max_interval
+        self._rng = rng if rng is not None else random.Random()
+        self._rate_multiplier = rate_multiplier
+        self._interval_range = interval_range
+        self._clock = clock if clock is not None else SystemClock()
         self._running = False
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
@@ -21,7 +35,16 @@ class IntervalScheduler:
         return self._running
 
     def get_random_interval(self) -> float:
-        return random.uniform(self.min_interval, self.max_interval)
+        if self._interval_range is not None:
+            min_interval, max_interval = self._interval_range()
+        else:
+            min_interval, max_interval = self.min_interval, self.max_interval
+        interval = self._rng.uniform(min_interval, max_interval)
+        if self._rate_multiplier is not None:
+            multiplier = self._rate_multiplier()
+            if multiplier > 0:
+                interval /= multiplier
+        return interval
 
     def start(self, callback: Callable[[], None]) -> None:
         if self._running:
@@ -45,7 +68,7 @@ class IntervalScheduler:
     def _run(self, callback: Callable[[], None]) -> None:
         while not self._stop_event.is_set():
             interval = self.get_random_interval()
-            if self._stop_event.wait(timeout=interval):
+            if self._clock.wait(self._stop_event, interval):
                 break
             if not self._stop_event.is_set():
                 callback()
@@ -0,0 +1,232 @@
+import ipaddress
+import os
+import socket
+import threading
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from blockchain_api.clock import Clock, SystemClock
+from blockchain_api.config import ConfigManager
+from blockchain_api.interval_scheduler import IntervalScheduler
+from blockchain_api.scenario import ScenarioEngine
+from blockchain_api.trade_generator import TradeGenerator
+from blockchain_api.trade_store import TradeStore
+from blockchain_api.wire_protocol import StructCodec
+
+
+DEFAULT_GROUP = "239.255.0.1"
+DEFAULT_PORT = 30001
+
+
+@dataclass(frozen=True)
+class MulticastSettings:
+    group: str = DEFAULT_GROUP
+    port: int = DEFAULT_PORT
+    interface: str = "127.0.0.1"
+    ttl: int = 0
+    symbols: tuple[str, ...] = ()
+    rate: float | None = None
+
+    def __post_init__(self):
+        if not ipaddress.ip_address(self.group).is_multicast:
+            raise ValueError(f"'{self.group}' is not a multicast address")
+        if not 0 < self.port < 65536:
+            raise ValueError("port must be between 1 and 65535")
+        if not 0 <= self.ttl <= 255:
+            raise ValueError("ttl must be between 0 and 255")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        too_long = [symbol for symbol in self.symbols if not StructCodec().supports_symbol(symbol)]
+        if too_long:
+            raise ValueError(f"Symbols too long for the packed trade layout: {', '.join(too_long)}")
+        object.__setattr__(self, "symbols", tuple(self.symbols))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.symbols)
+
+    @classmethod
+    def from_env(cls) -> "MulticastSettings":
+        symbols = os.getenv("MULTICAST_SYMBOLS", "")
+        rate = os.getenv("MULTICAST_RATE")
+        return cls(
+            group=os.getenv("MULTICAST_GROUP", cls.group),
+            port=int(os.getenv("MULTICAST_PORT", cls.port)),
+            interface=os.getenv("MULTICAST_INTERFACE", cls.interface),
+            ttl=int(os.getenv("MULTICAST_TTL", cls.ttl)),
+            symbols=tuple(s.strip() for s in symbols.split(",") if s.strip()),
+            rate=float(rate) if rate else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MulticastSettings":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown multicast settings: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["symbols"] = list(self.symbols)
+        return data
+
+
+class MulticastPublisher:
+    def __init__(self, group: str, port: int, interface: str = "127.0.0.1", ttl: int = 0):
+        self.group = group
+        self.port = port
+        self._codec = StructCodec()
+        self._lock = threading.Lock()
+        self._seqnum = 0
+        self.sent = 0
+        self.bytes_sent = 0
+        self.errors = 0
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+        self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+
+    @classmethod
+    def from_settings(cls, settings: MulticastSettings) -> "MulticastPublisher":
+        return cls(settings.group, settings.port, settings.interface, settings.ttl)
+
+    def publish(self, trade: dict[str, Any]) -> None:
+        with self._lock:
+            try:
+                datagram = self._codec.encode({
+                    "seqnum": self._seqnum,
+                    "event": "updated",
+                    "channel": "trades",
+                    **trade,
+                })
+            except (KeyError, ValueError):
+                self.errors += 1
+                return
+            self._seqnum += 1
+            try:
+                self._socket.sendto(datagram, (self.group, self.port))
+            except OSError:
+                self.errors += 1
+                return
+            self.sent += 1
+            self.bytes_sent += len(datagram)
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def to_dict(self) -> dict:
+        return {
+            "next_seqnum": self._seqnum,
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "errors": self.errors,
+        }
+
+
+class MulticastFeed:
+    MIN_TICK = 0.001
+
+    def __init__(
+        self,
+        scenario_engine: ScenarioEngine | None = None,
+        clock: Clock | None = None,
+        trade_store: TradeStore | None = None,
+        config: ConfigManager | None = None,
+    ):
+        self._scenario_engine = scenario_engine if scenario_engine is not None else ScenarioEngine(clock)
+        self._clock = clock if clock is not None else SystemClock()
+        self._trade_store = trade_store
+        self._config = config if config is not None else ConfigManager()
+        self._lock = threading.Lock()
+        self._settings: MulticastSettings | None = None
+        self._publisher: MulticastPublisher | None = None
+        self._generators: dict[str, TradeGenerator] = {}
+        self._schedulers: dict[str, IntervalScheduler] = {}
+        self._owed: dict[str, tuple[float, float]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._publisher is not None
+
+    def start(self, settings: MulticastSettings) -> None:
+        if not settings.enabled:
+            raise ValueError("At least one symbol is required to start the multicast feed")
+
+        self.stop()
+        with self._lock:
+            self._settings = settings
+            self._publisher = MulticastPublisher.from_settings(settings)
+            for symbol in settings.symbols:
+                self._generators[symbol] = TradeGenerator(
+                    symbol, rng=self._scenario_engine.random_for(symbol, "trades"), clock=self._clock
+                )
+                if settings.rate is not None:
+                    tick = max(1.0 / settings.rate, self.MIN_TICK)
+                    scheduler = IntervalScheduler(min_interval=tick, max_interval=tick, clock=self._clock)
+                    self._owed[symbol] = (self._clock.monotonic(), 0.0)
+                    callback = lambda s=symbol: self._emit_due(s)
+                else:
+                    scheduler = IntervalScheduler(
+                        rng=self._scenario_engine.random_for(symbol, "intervals"),
+                        rate_multiplier=lambda s=symbol: self._scenario_engine.conditions(s).rate_multiplier,
+                        clock=self._clock,
+                        interval_range=lambda: self._config.current.emission.interval_range,
+                    )
+                    callback = lambda s=symbol: self._emit_trade(s)
+                self._schedulers[symbol] = scheduler
+                scheduler.start(callback)
+
+    def stop(self) -> None:
+        with self._lock:
+            for scheduler in self._schedulers.values():
+                scheduler.stop()
+            self._schedulers.clear()
+            self._generators.clear()
+            self._owed.clear()
+            if self._publisher is not None:
+                self._publisher.close()
+            self._publisher = None
+            self._settings = None
+
+    def _emit_trade(self, symbol: str, count: int = 1) -> None:
+        publisher = self._publisher
+        generator = self._generators.get(symbol)
+        if publisher is None or generator is None:
+            return
+
+        conditions = self._scenario_engine.conditions(symbol)
+        if conditions.halted:
+            return
+        model = self._config.current.price_model
+        generator.configure(model.volatility, model.min_qty, model.max_qty)
+        for _ in range(count):
+            trade = generator.generate_trade(price_factor=conditions.price_factor)
+            if self._trade_store is not None:
+                self._trade_store.record(trade)
+            publisher.publish(trade)
+
+    # Fixed-rate feeds emit however many trades are owed since the last tick, so
+    # the configured rate holds even when a tick is slower than 1 / rate.
+    def _emit_due(self, symbol: str) -> None:
+        settings = self._settings
+        if settings is None or symbol not in self._owed:
+            return
+
+        last, owed = self._owed[symbol]
+        now = self._clock.monotonic()
+        owed += (now - last) * settings.rate * self._scenario_engine.conditions(symbol).rate_multiplier
+        count = int(owed)
+        self._owed[symbol] = (now, owed - count)
+        self._emit_trade(symbol, count)
+
+    def status(self) -> dict:
+        with self._lock:
+            if self._publisher is None:
+                return {"active": False}
+            return {
+                "active": True,
+                "settings": self._settings.to_dict(),
+                "publisher": self._publisher.to_dict(),
+            }
@@ -0,0 +1,210 @@
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable
+
+
+PROFILE_MODES = ("deterministic", "sampling")
+
+
+class ProfilerBusyError(RuntimeError):
+    pass
+
+
+class ProfilerDisabledError(RuntimeError):
+    pass
+
+
+# From Python 3.12 cProfile hooks sys.monitoring, which covers every thread
+# and admits one profiler per process, so a session enables one profile for
+# its whole window. Earlier versions hook only the calling thread, so each
+# thread gets its own profile, enabled around each call. A profile that cannot
+# be enabled because another tool holds the hook leaves the call unprofiled.
+PROCESS_WIDE = sys.version_info >= (3, 12)
+
+
+class _DeterministicSession:
+    def __init__(self, process_wide: bool = PROCESS_WIDE):
+        self._condition = threading.Condition()
+        self._profiles: dict[int, cProfile.Profile] = {}
+        self._shared = cProfile.Profile() if process_wide else None
+        self._in_flight = 0
+        self._closed = False
+
+    def start(self) -> None:
+        if self._shared is None:
+            return
+        try:
+            self._shared.enable()
+        except ValueError as e:
+            raise ProfilerBusyError(f"Another profiling tool is already active: {e}") from None
+        self._profiles[threading.get_ident()] = self._shared
+
+    def call(self, func: Callable[..., Any], *args) -> Any:
+        if self._shared is not None:
+            return func(*args)
+
+        ident = threading.get_ident()
+        with self._condition:
+            profile = None
+            if not self._closed:
+                profile = self._profiles.get(ident)
+                if profile is None:
+                    profile = self._profiles[ident] = cProfile.Profile()
+                self._in_flight += 1
+        if profile is None:
+            return func(*args)
+
+        try:
+            try:
+                profile.enable()
+            except ValueError:
+                return func(*args)
+            try:
+                return func(*args)
+            finally:
+                profile.disable()
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        if self._shared is not None:
+            self._shared.disable()
+        with self._condition:
+            self._closed = True
+            return self._condition.wait_for(lambda: self._in_flight == 0, timeout=timeout)
+
+    def stats(self) -> pstats.Stats | None:
+        with self._condition:
+            profiles = list(self._profiles.values())
+
+        stats = None
+        for profile in profiles:
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile, stream=io.StringIO())
+            else:
+                stats.add(profile)
+        return stats
+
+
+class _SamplingSession:
+    def __init__(self, interval: float, by_thread: bool, exclude: set[int]):
+        self.interval = interval
+        self.by_thread = by_thread
+        self.exclude = exclude
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=1.0)
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(timeout=self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident or ident in self.exclude:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(self._frame_label(frame))
+                    frame = frame.f_back
+                if self.by_thread:
+                    labels.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    MAX_DURATION = 60.0
+    MIN_INTERVAL = 0.001
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._session: _DeterministicSession | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._lock.locked()
+
+    def call(self, func: Callable[..., Any], *args) -> Any:
+        session = self._session
+        if session is None:
+            return func(*args)
+        return session.call(func, *args)
+
+    def _acquire(self) -> None:
+        if not self.enabled:
+            raise ProfilerDisabledError("Profiling is disabled")
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+
+    def _clamp_duration(self, duration: float) -> float:
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        return min(duration, self.MAX_DURATION)
+
+    def profile_deterministic(self, duration: float, sort: str = "cumulative", limit: int = 50) -> tuple[str, bytes]:
+        duration = self._clamp_duration(duration)
+        self._acquire()
+        try:
+            session = _DeterministicSession()
+            session.start()
+        except ProfilerBusyError:
+            self._lock.release()
+            raise
+        try:
+            self._session = session
+            time.sleep(duration)
+        finally:
+            self._session = None
+            session.drain()
+            self._lock.release()
+
+        stats = session.stats()
+        if stats is None:
+            return "No profiled calls were made during the profile window\n", marshal.dumps({})
+
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue(), marshal.dumps(stats.stats)
+
+    def profile_sampling(self, duration: float, interval: float = 0.005, by_thread: bool = False) -> str:
+        duration = self._clamp_duration(duration)
+        interval = max(interval, self.MIN_INTERVAL)
+        self._acquire()
+        try:
+            session = _SamplingSession(interval, by_thread, exclude={threading.get_ident()})
+            session.start()
+            time.sleep(duration)
+            session.stop()
+        finally:
+            self._lock.release()
+        return session.collapsed()
@@ -0,0 +1,154 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+from blockchain_api.clock import Clock, SystemClock
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    rate: float = 10.0
+    burst: float = 20.0
+
+    def __post_init__(self):
+        if self.rate < 0 or self.burst < 0:
+            raise ValueError("rate and burst must be non-negative")
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @classmethod
+    def from_env(cls) -> "RateLimitSettings":
+        return cls(
+            rate=float(os.getenv("INBOUND_RATE_LIMIT", cls.rate)),
+            burst=float(os.getenv("INBOUND_BURST", cls.burst)),
+        )
+
+    def to_dict(self) -> dict:
+        return {"rate": self.rate, "burst": self.burst}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Clock | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock if clock is not None else SystemClock()
+        self._tokens = capacity
+        self._updated = self._clock.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def configure(self, rate: float, capacity: float, refill: bool = False) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._refill()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity if refill else min(self._tokens, capacity)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+
+class RateLimitMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.throttled_connections = 0
+        self.requests = 0
+        self.throttled = 0
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def record_request(self, allowed: bool, first_throttle: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if not allowed:
+                self.throttled += 1
+            if first_throttle:
+                self.throttled_connections += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "connections": self.connections,
+                "throttled_connections": self.throttled_connections,
+                "requests": self.requests,
+                "throttled": self.throttled,
+            }
+
+
+class InboundRateLimiter:
+    def __init__(self, bucket: TokenBucket, metrics: RateLimitMetrics | None = None):
+        self.bucket = bucket
+        self.metrics = metrics if metrics is not None else RateLimitMetrics()
+        self.throttled = 0
+        self._source: Callable[[], RateLimitSettings] | None = None
+        self._applied: RateLimitSettings | None = None
+        self.metrics.record_connection()
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: RateLimitSettings,
+        metrics: RateLimitMetrics | None = None,
+        clock: Clock | None = None,
+    ) -> "InboundRateLimiter | None":
+        if not settings.enabled:
+            return None
+        return cls(TokenBucket(settings.rate, max(1.0, settings.burst), clock), metrics)
+
+    @classmethod
+    def from_source(
+        cls,
+        source: Callable[[], RateLimitSettings],
+        metrics: RateLimitMetrics | None = None,
+        clock: Clock | None = None,
+    ) -> "InboundRateLimiter":
+        settings = source()
+        limiter = cls(TokenBucket(settings.rate or 1.0, max(1.0, settings.burst), clock), metrics)
+        limiter._source = source
+        limiter._applied = settings
+        return limiter
+
+    def _apply(self, settings: RateLimitSettings) -> bool:
+        if settings is not self._applied:
+            if settings.enabled:
+                self.bucket.configure(settings.rate, max(1.0, settings.burst), refill=not self._applied.enabled)
+            self._applied = settings
+        return settings.enabled
+
+    def allow(self) -> bool:
+        if self._source is not None and not self._apply(self._source()):
+            self.metrics.record_request(True, first_throttle=False)
+            return True
+
+        allowed = self.bucket.try_acquire()
+        if not allowed:
+            self.throttled += 1
+        self.metrics.record_request(allowed, first_throttle=not allowed and self.throttled == 1)
+        return allowed
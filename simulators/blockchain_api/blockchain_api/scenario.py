@@ -0,0 +1,182 @@
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+
+from blockchain_api.clock import Clock, SystemClock
+
+
+EVENT_TYPES = ("rate", "price", "halt")
+ALL_SYMBOLS = "*"
+
+
+@dataclass(frozen=True)
+class ScenarioEvent:
+    at: float
+    type: str
+    duration: float = 0.0
+    multiplier: float = 1.0
+    change: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScenarioEvent":
+        event_type = data.get("type")
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown scenario event type: {event_type}")
+
+        event = cls(
+            at=float(data.get("at", 0.0)),
+            type=event_type,
+            duration=float(data.get("duration", 0.0)),
+            multiplier=float(data.get("multiplier", 1.0)),
+            change=float(data.get("change", 0.0)),
+        )
+
+        if event.at < 0 or event.duration < 0:
+            raise ValueError("Scenario event times must be non-negative")
+        if event.type == "rate" and event.multiplier <= 0:
+            raise ValueError("Rate multiplier must be positive")
+        if event.type == "price" and event.change <= -1.0:
+            raise ValueError("Price change must be greater than -100%")
+        return event
+
+    @property
+    def end(self) -> float:
+        return self.at + self.duration
+
+
+@dataclass(frozen=True)
+class MarketConditions:
+    rate_multiplier: float = 1.0
+    price_factor: float = 1.0
+    halted: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "rate_multiplier": self.rate_multiplier,
+            "price_factor": self.price_factor,
+            "halted": self.halted,
+        }
+
+
+NORMAL_CONDITIONS = MarketConditions()
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    seed: int | None = None
+    timeline: dict[str, tuple[ScenarioEvent, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Scenario":
+        symbols = data.get("symbols")
+        if not isinstance(symbols, dict) or not symbols:
+            raise ValueError("Scenario must define events for at least one symbol")
+
+        timeline = {}
+        for symbol, events in symbols.items():
+            if not isinstance(events, list):
+                raise ValueError(f"Events for '{symbol}' must be a list")
+            parsed = [ScenarioEvent.from_dict(event) for event in events]
+            timeline[symbol] = tuple(sorted(parsed, key=lambda e: e.at))
+
+        seed = data.get("seed")
+        return cls(
+            name=str(data.get("name", "unnamed")),
+            seed=int(seed) if seed is not None else None,
+            timeline=timeline,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Scenario":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    @property
+    def duration(self) -> float:
+        return max(
+            (event.end for events in self.timeline.values() for event in events),
+            default=0.0,
+        )
+
+    def events_for(self, symbol: str) -> list[ScenarioEvent]:
+        events = list(self.timeline.get(symbol, ()))
+        events.extend(self.timeline.get(ALL_SYMBOLS, ()))
+        return events
+
+    def conditions_at(self, symbol: str, elapsed: float) -> MarketConditions:
+        rate_multiplier = 1.0
+        price_factor = 1.0
+        halted = False
+
+        for event in self.events_for(symbol):
+            if elapsed < event.at:
+                continue
+            active = elapsed < event.end
+            if event.type == "rate" and active:
+                rate_multiplier *= event.multiplier
+            elif event.type == "halt" and active:
+                halted = True
+            elif event.type == "price":
+                progress = 1.0 if event.duration == 0 else min(1.0, (elapsed - event.at) / event.duration)
+                price_factor *= 1.0 + event.change * progress
+
+        return MarketConditions(rate_multiplier, price_factor, halted)
+
+
+class ScenarioEngine:
+    def __init__(self, clock: Clock | None = None):
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._scenario: Scenario | None = None
+        self._started_at = 0.0
+
+    @property
+    def is_active(self) -> bool:
+        return self._scenario is not None
+
+    def start(self, scenario: Scenario) -> None:
+        with self._lock:
+            self._scenario = scenario
+            self._started_at = self._clock.monotonic()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._scenario = None
+
+    def elapsed(self) -> float:
+        if self._scenario is None:
+            return 0.0
+        return self._clock.monotonic() - self._started_at
+
+    def conditions(self, symbol: str) -> MarketConditions:
+        scenario = self._scenario
+        if scenario is None:
+            return NORMAL_CONDITIONS
+        return scenario.conditions_at(symbol, self._clock.monotonic() - self._started_at)
+
+    def random_for(self, symbol: str, purpose: str) -> random.Random:
+        scenario = self._scenario
+        if scenario is None or scenario.seed is None:
+            return random.Random()
+        return random.Random(f"{scenario.seed}:{symbol}:{purpose}")
+
+    def status(self) -> dict:
+        scenario = self._scenario
+        if scenario is None:
+            return {"active": False}
+
+        elapsed = self.elapsed()
+        return {
+            "active": True,
+            "name": scenario.name,
+            "seed": scenario.seed,
+            "elapsed": round(elapsed, 3),
+            "duration": scenario.duration,
+            "finished": elapsed >= scenario.duration,
+            "symbols": {
+                symbol: scenario.conditions_at(symbol, elapsed).to_dict()
+                for symbol in scenario.timeline
+            },
+        }
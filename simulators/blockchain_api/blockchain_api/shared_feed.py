@@ -0,0 +1,182 @@
+import itertools
+import queue
+import threading
+from typing import Callable
+
+from blockchain_api.clock import Clock, SystemClock
+from blockchain_api.config import ConfigManager
+from blockchain_api.interval_scheduler import IntervalScheduler
+from blockchain_api.scenario import ScenarioEngine
+from blockchain_api.trade_generator import TradeGenerator
+from blockchain_api.trade_store import TradeStore
+
+
+# Delivers to one subscriber on a thread of its own, so a slow socket only
+# backs up its own queue. Trades arriving while the queue is full are dropped
+# and counted; only the symbol's scheduler thread offers trades, so `dropped`
+# has a single writer.
+class _Subscriber:
+    def __init__(self, deliver: Callable[[dict], None], max_pending: int):
+        self._deliver = deliver
+        self._pending: queue.Queue[dict | None] = queue.Queue(max_pending)
+        self._closed = False
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="shared-feed-subscriber", daemon=True)
+        self._thread.start()
+
+    def offer(self, trade: dict) -> bool:
+        try:
+            self._pending.put_nowait(trade)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            trade = self._pending.get()
+            if trade is None or self._closed:
+                return
+            try:
+                self._deliver(trade)
+            except Exception:
+                pass
+
+    # Without drain, trades still queued are discarded; with it, they are
+    # delivered before the thread exits.
+    def close(self, drain: bool = False) -> None:
+        self._closed = not drain
+        try:
+            self._pending.put(None, block=drain, timeout=1.0)
+        except queue.Full:
+            pass
+
+    def join(self, timeout: float = 1.0) -> None:
+        self._thread.join(timeout)
+
+
+# One generator and scheduler per symbol, shared by every connection
+# subscribed to it, so all subscribers see the same trades (same trade_id)
+# instead of each connection getting a stream of its own. The scheduler thread
+# only queues each trade for the subscribers; status() reports, per symbol, the
+# deliveries lost because a subscriber fell more than max_pending trades
+# behind, including those of subscribers that have since left.
+class SharedTradeFeed:
+    DEFAULT_MAX_PENDING = 1000
+
+    def __init__(
+        self,
+        scenario_engine: ScenarioEngine | None = None,
+        clock: Clock | None = None,
+        trade_store: TradeStore | None = None,
+        config: ConfigManager | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self._scenario_engine = scenario_engine if scenario_engine is not None else ScenarioEngine(clock)
+        self._clock = clock if clock is not None else SystemClock()
+        self._trade_store = trade_store
+        self._config = config if config is not None else ConfigManager()
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self._subscribers: dict[str, dict[int, _Subscriber]] = {}
+        self._generators: dict[str, TradeGenerator] = {}
+        self._schedulers: dict[str, IntervalScheduler] = {}
+        self._departed_dropped: dict[str, int] = {}
+
+    @property
+    def dropped(self) -> int:
+        return sum(entry["dropped"] for entry in self.status().values())
+
+    def subscriber_count(self, symbol: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(symbol, {}))
+
+    def status(self) -> dict:
+        with self._lock:
+            status = {}
+            for symbol in sorted(self._subscribers.keys() | self._departed_dropped.keys()):
+                subscribers = self._subscribers.get(symbol, {}).values()
+                status[symbol] = {
+                    "subscribers": len(subscribers),
+                    "dropped": self._departed_dropped.get(symbol, 0) + sum(s.dropped for s in subscribers),
+                }
+            return status
+
+    def subscribe(self, symbol: str, deliver: Callable[[dict], None]) -> int:
+        with self._lock:
+            token = next(self._tokens)
+            self._subscribers.setdefault(symbol, {})[token] = _Subscriber(deliver, self._max_pending)
+            if symbol in self._schedulers:
+                return token
+            self._generators[symbol] = TradeGenerator(
+                symbol, rng=self._scenario_engine.random_for(symbol, "trades"), clock=self._clock
+            )
+            scheduler = IntervalScheduler(
+                rng=self._scenario_engine.random_for(symbol, "intervals"),
+                rate_multiplier=lambda: self._scenario_engine.conditions(symbol).rate_multiplier,
+                clock=self._clock,
+                interval_range=lambda: self._config.current.emission.interval_range,
+            )
+            self._schedulers[symbol] = scheduler
+            # Started under the lock so a concurrent unsubscribe cannot pop
+            # the scheduler before it runs and leave its thread behind.
+            scheduler.start(lambda: self.emit(symbol))
+        return token
+
+    def unsubscribe(self, symbol: str, token: int) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(symbol, {})
+            subscriber = subscribers.pop(token, None)
+            if subscriber is not None:
+                subscriber.close()
+                self._add_departed(symbol, subscriber)
+            if subscribers:
+                return
+            self._subscribers.pop(symbol, None)
+            self._generators.pop(symbol, None)
+            scheduler = self._schedulers.pop(symbol, None)
+        # Stopped outside the lock: the scheduler thread may be waiting on it
+        # in emit().
+        if scheduler is not None:
+            scheduler.stop()
+
+    def emit(self, symbol: str) -> None:
+        config = self._config.current
+        conditions = self._scenario_engine.conditions(symbol)
+        if conditions.halted or not config.supports(symbol):
+            return
+        with self._lock:
+            generator = self._generators.get(symbol)
+            if generator is None:
+                return
+            model = config.price_model
+            generator.configure(model.volatility, model.min_qty, model.max_qty)
+            trade = generator.generate_trade(price_factor=conditions.price_factor)
+            subscribers = list(self._subscribers.get(symbol, {}).values())
+        if self._trade_store is not None:
+            self._trade_store.record(trade)
+        for subscriber in subscribers:
+            subscriber.offer(trade)
+
+    def stop(self) -> None:
+        with self._lock:
+            schedulers = list(self._schedulers.values())
+            subscribers = [subscriber for tokens in self._subscribers.values() for subscriber in tokens.values()]
+            for symbol, tokens in self._subscribers.items():
+                for subscriber in tokens.values():
+                    self._add_departed(symbol, subscriber)
+            self._schedulers.clear()
+            self._generators.clear()
+            self._subscribers.clear()
+        for scheduler in schedulers:
+            scheduler.stop()
+        for subscriber in subscribers:
+            subscriber.close(drain=True)
+        for subscriber in subscribers:
+            subscriber.join()
+
+    # Called with the lock held.
+    def _add_departed(self, symbol: str, subscriber: _Subscriber) -> None:
+        if subscriber.dropped:
+            self._departed_dropped[symbol] = self._departed_dropped.get(symbol, 0) + subscriber.dropped
@@ -1,19 +1,55 @@
+import math
 import random
 from datetime import datetime, timezone
 
+from blockchain_api.clock import Clock, SystemClock
+
 
 class TradeGenerator:
-    def __init__(self, symbol: str):
+    MIN_PRICE = 0.01
+
+    def __init__(
+        self,
+        symbol: str,
+        rng: random.Random | None = None,
+        volatility: float = 0.001,
+        clock: Clock | None = None,
+        min_qty: float = 0.0001,
+        max_qty: float = 10.0,
+    ):
         self.symbol = symbol
+        self.configure(volatility, min_qty, max_qty)
+        self._rng = rng if rng is not None else random.Random()
+        self._clock = clock if clock is not None else SystemClock()
         self._trade_counter = 0
+        self._reference_price = self._rng.uniform(100.0, 100000.0)
+
+    def configure(self, volatility: float, min_qty: float, max_qty: float) -> None:
+        if volatility < 0:
+            raise ValueError("volatility must be non-negative")
+        if min_qty <= 0 or min_qty > max_qty:
+            raise ValueError("min_qty must be positive and no greater than max_qty")
+
+        self.volatility = volatility
+        self.min_qty = min_qty
+        self.max_qty = max_qty
+
+    @property
+    def reference_price(self) -> float:
+        return self._reference_price
+
+    def _next_price(self, price_factor: float) -> float:
+        self._reference_price *= math.exp(self._rng.gauss(0.0, self.volatility))
+        return max(self.MIN_PRICE, round(self._reference_price * price_factor, 2))
 
-    def generate_trade(self) -> dict:
+    def generate_trade(self, price_factor: float = 1.0) -> dict:
         self._trade_counter += 1
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        side = random.choice(["buy", "sell"])
-        qty = round(random.uniform(0.0001, 10.0), 8)
-        price = round(random.uniform(100.0, 100000.0), 2)
-        trade_id = str(int(datetime.now(timezone.utc).timestamp() * 1000000) + self._trade_counter)
+        now = self._clock.time()
+        timestamp = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        side = self._rng.choice(["buy", "sell"])
+        qty = round(self._rng.uniform(self.min_qty, self.max_qty), 8)
+        price = self._next_price(price_factor)
+        trade_id = str(int(now * 1000000) + self._trade_counter)
 
         return {
             "symbol": self.symbol,
@@ -0,0 +1,185 @@
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Any
+
+from blockchain_api.wire_protocol import SIDES, micros_to_timestamp, timestamp_to_micros
+
+
+class CursorExpiredError(ValueError):
+    pass
+
+
+class SymbolHistory:
+    def __init__(self, symbol: str, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.symbol = symbol
+        self.capacity = capacity
+        self.total = 0
+        self._start = 0
+        self._last_timestamp = 0
+        self._timestamps = array("q")
+        self._prices = array("d")
+        self._quantities = array("d")
+        self._trade_ids = array("Q")
+        self._sides = array("B")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def first_id(self) -> int:
+        return self.total - len(self)
+
+    def append(self, timestamp: int, price: float, qty: float, side: int, trade_id: int) -> None:
+        with self._lock:
+            # Trades generated on different threads can arrive a few microseconds
+            # out of order; clamping keeps the timestamp column sorted for bisect.
+            timestamp = max(timestamp, self._last_timestamp)
+            self._last_timestamp = timestamp
+
+            if len(self._timestamps) < self.capacity:
+                self._timestamps.append(timestamp)
+                self._prices.append(price)
+                self._quantities.append(qty)
+                self._trade_ids.append(trade_id)
+                self._sides.append(side)
+            else:
+                i = self._start
+                self._timestamps[i] = timestamp
+                self._prices[i] = price
+                self._quantities[i] = qty
+                self._trade_ids[i] = trade_id
+                self._sides[i] = side
+                self._start = (i + 1) % self.capacity
+            self.total += 1
+
+    def _search(self, timestamp: int) -> int:
+        timestamps = self._timestamps
+        size = len(timestamps)
+        start = self._start
+        if start == 0:
+            return bisect_left(timestamps, timestamp)
+        if timestamp <= timestamps[size - 1]:
+            return bisect_left(timestamps, timestamp, start, size) - start
+        return size - start + bisect_left(timestamps, timestamp, 0, start)
+
+    def _row(self, position: int) -> dict[str, Any]:
+        i = (self._start + position) % self.capacity
+        return {
+            "symbol": self.symbol,
+            "timestamp": micros_to_timestamp(self._timestamps[i]),
+            "side": SIDES[self._sides[i]],
+            "qty": self._quantities[i],
+            "price": self._prices[i],
+            "trade_id": str(self._trade_ids[i]),
+        }
+
+    def query(
+        self,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int = 100,
+        cursor: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        with self._lock:
+            first_id = self.first_id
+            low = self._search(since) if since is not None else 0
+            if cursor is not None:
+                if cursor < first_id:
+                    raise CursorExpiredError("Cursor refers to trades that have been evicted from the history")
+                low = max(low, cursor - first_id)
+            high = self._search(until) if until is not None else len(self)
+            end = min(high, low + limit)
+
+            rows = [self._row(position) for position in range(low, end)]
+            return rows, first_id + end if end < high else None
+
+    def status(self) -> dict:
+        with self._lock:
+            size = len(self)
+            status = {"count": size, "total": self.total, "capacity": self.capacity}
+            if size:
+                status["oldest"] = micros_to_timestamp(self._timestamps[self._start])
+                status["newest"] = micros_to_timestamp(self._last_timestamp)
+            return status
+
+
+# Subscribers choose the symbols, and with no configured symbol list any
+# symbol is accepted, so at most max_symbols get a history; trades for symbols
+# beyond that are not kept.
+class TradeStore:
+    DEFAULT_CAPACITY = 1_000_000
+    DEFAULT_MAX_SYMBOLS = 100
+    MAX_LIMIT = 1000
+
+    def __init__(self, capacity_per_symbol: int = DEFAULT_CAPACITY, max_symbols: int = DEFAULT_MAX_SYMBOLS):
+        if capacity_per_symbol < 1:
+            raise ValueError("capacity_per_symbol must be at least 1")
+        if max_symbols < 1:
+            raise ValueError("max_symbols must be at least 1")
+
+        self.capacity_per_symbol = capacity_per_symbol
+        self.max_symbols = max_symbols
+        self._histories: dict[str, SymbolHistory] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "TradeStore":
+        return cls(
+            int(os.getenv("TRADE_HISTORY_SIZE", cls.DEFAULT_CAPACITY)),
+            int(os.getenv("TRADE_HISTORY_SYMBOLS", cls.DEFAULT_MAX_SYMBOLS)),
+        )
+
+    def _history(self, symbol: str) -> SymbolHistory | None:
+        history = self._histories.get(symbol)
+        if history is None:
+            with self._lock:
+                history = self._histories.get(symbol)
+                if history is None and len(self._histories) < self.max_symbols:
+                    history = self._histories[symbol] = SymbolHistory(symbol, self.capacity_per_symbol)
+        return history
+
+    def record(self, trade: dict[str, Any]) -> None:
+        history = self._history(trade["symbol"])
+        if history is None:
+            return
+        history.append(
+            timestamp_to_micros(trade["timestamp"]),
+            trade["price"],
+            trade["qty"],
+            SIDES.index(trade["side"]),
+            int(trade["trade_id"]),
+        )
+
+    def query(
+        self,
+        symbol: str,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        history = self._histories.get(symbol)
+        if history is None:
+            return [], None
+
+        rows, next_id = history.query(
+            since=timestamp_to_micros(since) if since else None,
+            until=timestamp_to_micros(until) if until else None,
+            limit=min(limit, self.MAX_LIMIT),
+            cursor=int(cursor) if cursor else None,
+        )
+        return rows, str(next_id) if next_id is not None else None
+
+    def status(self) -> dict:
+        with self._lock:
+            histories = list(self._histories.values())
+        return {history.symbol: history.status() for history in histories}
@@ -1,18 +1,38 @@
 import json
-from typing import Any
+from typing import Any, Callable
+
+from blockchain_api.rate_limiter import InboundRateLimiter
+from blockchain_api.wire_protocol import Codec, JsonCodec
 
 
 class WebSocketHandler:
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter: InboundRateLimiter | None = None,
+        codec: Codec | None = None,
+        supports_symbol: Callable[[str], bool] | None = None,
+    ):
         self._seqnum = 0
         self._subscribed_symbols: set[str] = set()
+        self._rate_limiter = rate_limiter
+        self._codec = codec if codec is not None else JsonCodec()
+        self._supports_symbol = supports_symbol
 
     def _next_seqnum(self) -> int:
         seqnum = self._seqnum
         self._seqnum += 1
         return seqnum
 
-    def handle_message(self, message: str) -> str:
+    def encode(self, response: dict[str, Any]) -> str | bytes:
+        return self._codec.encode(response)
+
+    def handle_message(self, message: str) -> str | bytes:
+        return self.encode(self.handle_request(message))
+
+    def handle_request(self, message: str) -> dict[str, Any]:
+        if self._rate_limiter is not None and not self._rate_limiter.allow():
+            return self._create_rejected_response("Rate limit exceeded")
+
         try:
             data = json.loads(message)
         except json.JSONDecodeError:
@@ -32,36 +52,41 @@ class WebSocketHandler:
             return self._create_rejected_response("Missing symbol field")
 
         if action == "subscribe":
+            if self._supports_symbol is not None and not self._supports_symbol(symbol):
+                return self._create_rejected_response(f"Symbol '{symbol}' is not supported")
+            if not self._codec.supports_symbol(symbol):
+                return self._create_rejected_response(
+                    f"Symbol '{symbol}' cannot be sent with the {self._codec.name} wire protocol")
             return self._handle_subscribe(symbol)
         elif action == "unsubscribe":
             return self._handle_unsubscribe(symbol)
         else:
             return self._create_rejected_response(f"Unknown action: {action}")
 
-    def _handle_subscribe(self, symbol: str) -> str:
+    def _handle_subscribe(self, symbol: str) -> dict[str, Any]:
         self._subscribed_symbols.add(symbol)
-        return json.dumps({
+        return {
             "seqnum": self._next_seqnum(),
             "event": "subscribed",
             "channel": "trades",
             "symbol": symbol
-        })
+        }
 
-    def _handle_unsubscribe(self, symbol: str) -> str:
+    def _handle_unsubscribe(self, symbol: str) -> dict[str, Any]:
         self._subscribed_symbols.discard(symbol)
-        return json.dumps({
+        return {
             "seqnum": self._next_seqnum(),
             "event": "unsubscribed",
             "channel": "trades",
             "symbol": symbol
-        })
+        }
 
-    def _create_rejected_response(self, text: str) -> str:
-        return json.dumps({
+    def _create_rejected_response(self, text: str) -> dict[str, Any]:
+        return {
             "seqnum": self._next_seqnum(),
             "event": "rejected",
             "text": text
-        })
+        }
 
     def is_subscribed(self, symbol: str) -> bool:
         return symbol in self._subscribed_symbols
@@ -69,8 +94,8 @@ class WebSocketHandler:
     def get_subscribed_symbols(self) -> list[str]:
         return list(self._subscribed_symbols)
 
-    def format_trade_update(self, trade: dict[str, Any]) -> str:
-        return json.dumps({
+    def format_trade_update(self, trade: dict[str, Any]) -> str | bytes:
+        return self.encode({
             "seqnum": self._next_seqnum(),
             "event": "updated",
             "channel": "trades",
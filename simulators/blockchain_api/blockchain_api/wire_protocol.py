@@ -0,0 +1,153 @@
+import json
+import struct
+from datetime import datetime, timezone
+from functools import lru_cache
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+MSGPACK_SUBPROTOCOL = "blockchain.msgpack.v1"
+STRUCT_SUBPROTOCOL = "blockchain.struct.v1"
+
+# message type, seqnum, timestamp (epoch microseconds), price, qty, trade_id, side, symbol.
+# The client packages share feed_client.decoding's copy, which is tested against this one.
+TRADE_STRUCT = struct.Struct("<BQqddQB16s")
+TRADE_MESSAGE_TYPE = 1
+SIDES = ("buy", "sell")
+SYMBOL_SIZE = 16
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# Trades within the same second share everything up to the fraction, so the
+# expensive datetime work is cached per second.
+@lru_cache(maxsize=1024)
+def _seconds_from_prefix(prefix: str) -> int:
+    delta = datetime.fromisoformat(prefix).replace(tzinfo=timezone.utc) - _EPOCH
+    return delta.days * 86400 + delta.seconds
+
+
+@lru_cache(maxsize=1024)
+def _prefix_from_seconds(seconds: int) -> str:
+    return f"{datetime.fromtimestamp(seconds, timezone.utc):%Y-%m-%dT%H:%M:%S}"
+
+
+def timestamp_to_micros(timestamp: str) -> int:
+    if len(timestamp) == 27 and timestamp[19] == "." and timestamp[26] == "Z":
+        return _seconds_from_prefix(timestamp[:19]) * 1_000_000 + int(timestamp[20:26])
+
+    moment = datetime.fromisoformat(timestamp[:-1] if timestamp.endswith("Z") else timestamp)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def micros_to_timestamp(micros: int) -> str:
+    seconds, fraction = divmod(micros, 1_000_000)
+    return f"{_prefix_from_seconds(seconds)}.{fraction:06d}Z"
+
+
+class JsonCodec:
+    name = "json"
+    subprotocol = None
+
+    def supports_symbol(self, symbol: str) -> bool:
+        return True
+
+    def encode(self, message: dict) -> str:
+        return json.dumps(message)
+
+    def decode(self, frame: str | bytes) -> dict:
+        return json.loads(frame)
+
+
+class MsgPackCodec:
+    name = "msgpack"
+    subprotocol = MSGPACK_SUBPROTOCOL
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("The msgpack package is required for the msgpack wire protocol")
+
+    def supports_symbol(self, symbol: str) -> bool:
+        return True
+
+    def encode(self, message: dict) -> bytes:
+        return msgpack.packb(message)
+
+    def decode(self, frame: str | bytes) -> dict:
+        if isinstance(frame, str):
+            return json.loads(frame)
+        return msgpack.unpackb(frame)
+
+
+class StructCodec:
+    name = "struct"
+    subprotocol = STRUCT_SUBPROTOCOL
+
+    def supports_symbol(self, symbol: str) -> bool:
+        return len(symbol.encode()) <= SYMBOL_SIZE
+
+    def encode(self, message: dict) -> str | bytes:
+        if message.get("event") != "updated":
+            return json.dumps(message)
+
+        symbol = message["symbol"].encode()
+        if len(symbol) > SYMBOL_SIZE:
+            raise ValueError(f"Symbol '{message['symbol']}' does not fit the packed trade layout")
+
+        return TRADE_STRUCT.pack(
+            TRADE_MESSAGE_TYPE,
+            message["seqnum"],
+            timestamp_to_micros(message["timestamp"]),
+            message["price"],
+            message["qty"],
+            int(message["trade_id"]),
+            SIDES.index(message["side"]),
+            symbol,
+        )
+
+    def decode(self, frame: str | bytes) -> dict:
+        if isinstance(frame, str):
+            return json.loads(frame)
+
+        _, seqnum, micros, price, qty, trade_id, side, symbol = TRADE_STRUCT.unpack(frame)
+        return {
+            "seqnum": seqnum,
+            "event": "updated",
+            "channel": "trades",
+            "symbol": symbol.rstrip(b"\0").decode(),
+            "timestamp": micros_to_timestamp(micros),
+            "side": SIDES[side],
+            "qty": qty,
+            "price": price,
+            "trade_id": str(trade_id),
+        }
+
+
+Codec = JsonCodec | MsgPackCodec | StructCodec
+CODECS = {codec.name: codec for codec in (JsonCodec, MsgPackCodec, StructCodec)}
+
+
+def supported_subprotocols() -> list[str]:
+    subprotocols = [STRUCT_SUBPROTOCOL]
+    if msgpack is not None:
+        subprotocols.insert(0, MSGPACK_SUBPROTOCOL)
+    return subprotocols
+
+
+def codec_for_name(name: str) -> Codec:
+    if name not in CODECS:
+        raise ValueError(f"Unknown wire protocol '{name}', expected one of: {', '.join(CODECS)}")
+    return CODECS[name]()
+
+
+def codec_for_subprotocol(subprotocol: str | None) -> Codec:
+    for codec in CODECS.values():
+        if codec.subprotocol == subprotocol:
+            return codec()
+    return JsonCodec()
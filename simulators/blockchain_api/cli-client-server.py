@@ -1,16 +1,37 @@
+import argparse
 import asyncio
 import json
 import sys
-import websockets
+import time
 import os
 from dotenv import load_dotenv
 from disconnect_controls import *
+from feed_client import (
+    BackoffPolicy,
+    Dashboard,
+    DashboardState,
+    MultiplexedClient,
+    NdjsonWriter,
+    ReconnectingClient,
+    SymbolRouter,
+    add_record_arguments,
+    assign_symbols,
+    decode_frame,
+    format_summary,
+    latency_ms,
+    recorder_from_args,
+    save_histogram,
+)
+from feed_client.analytics import TradeAnalytics, add_analytics_arguments, analytics_from_args
+from feed_client.decoding import BACKEND as JSON_BACKEND
+from blockchain_api.wire_protocol import codec_for_name, codec_for_subprotocol
 
 
 load_dotenv()
 
-SYMBOLS = ["ETH-USD", "BTC-USD"]
+SYMBOLS = os.getenv("SYMBOLS", "ETH-USD,BTC-USD").split(",")
 WEBSOCKET_URL = os.getenv("WEBSOCKET_URL")
+WIRE_PROTOCOL = os.getenv("WIRE_PROTOCOL", "json")
 
 
 def print_separator():
@@ -20,7 +41,7 @@ def print_separator():
 def print_json(data: dict, label: str = "Response"):
     print_separator()
     print(f"[{label}]")
-    print(json.dumps(data, indent=2))
+    print(json.dumps(data, indent=2, default=dict))
 
 
 def create_subscribe_request(symbol: str) -> dict:
@@ -31,19 +52,20 @@ def create_unsubscribe_request(symbol: str) -> dict:
     return {"action": "unsubscribe", "channel": "trades", "symbol": symbol}
 
 
+def connect_options(protocol: str = WIRE_PROTOCOL) -> dict:
+    codec = codec_for_name(protocol)
+    return {"subprotocols": [codec.subprotocol]} if codec.subprotocol else {}
+
+
 class WebSocketDisconnectController(DisconnectController):
-    def __init__(self, websocket, symbol: str):
+    def __init__(self, client: ReconnectingClient):
         super().__init__()
-        self.ws = websocket
-        self.symbol = symbol
+        self.client = client
 
     async def on_graceful_disconnect(self):
         print("\n[Graceful Disconnect] Sending unsubscribe and closing connection...")
         try:
-            unsubscribe_request = create_unsubscribe_request(self.symbol)
-            await self.ws.send(json.dumps(unsubscribe_request))
-            await asyncio.sleep(0.5)
-            await self.ws.close()
+            await self.client.close()
             print("[Graceful Disconnect] Connection closed cleanly")
         except Exception as e:
             print(f"[Graceful Disconnect] Error: {e}")
@@ -51,7 +73,7 @@ class WebSocketDisconnectController(DisconnectController):
     async def on_abrupt_disconnect(self):
         print("\n[Abrupt Disconnect] Terminating connection immediately...")
         try:
-            self.ws.transport.abort()
+            self.client.abort()
             print("[Abrupt Disconnect] Connection terminated")
         except Exception as e:
             print(f"[Abrupt Disconnect] Error: {e}")
@@ -59,124 +81,255 @@ class WebSocketDisconnectController(DisconnectController):
     async def on_temporary_drop(self, delay_seconds: int):
         print(f"\n[Temporary Drop] Dropping connection for {delay_seconds} seconds...")
         try:
-            self.ws.transport.abort()
+            self.client.drop(pause=delay_seconds, reason=f"temporary drop ({delay_seconds}s)")
             print("[Temporary Drop] Connection dropped")
         except Exception as e:
             print(f"[Temporary Drop] Error: {e}")
 
     async def on_reconnect(self):
-        pass
+        print("\n[Reconnect] Re-establishing connection...")
+        if await self.client.wait_connected():
+            print(f"[Reconnect] Resubscribed to {', '.join(sorted(self.client.subscriptions))}")
 
 
-async def connect_and_subscribe_with_controls(symbol: str):
-    should_connect = True
+# Packed trades decode to lazy views and the negotiated codec handles the rest.
+def frame_decoder(lazy: bool = False):
+    def decoder_for(subprotocol: str | None):
+        decode = codec_for_subprotocol(subprotocol).decode
+        return lambda frame: decode_frame(frame, fallback=decode, lazy=lazy)
+    return decoder_for
 
-    while should_connect:
-        should_connect = False
-        request = create_subscribe_request(symbol)
-        print_json(request, "Sending Request")
 
-        try:
-            ws = await websockets.connect(WEBSOCKET_URL)
-            await ws.send(json.dumps(request))
+def create_client(symbols: list[str], on_message, on_state, on_outage) -> ReconnectingClient:
+    return ReconnectingClient(
+        WEBSOCKET_URL,
+        symbols,
+        on_message=on_message,
+        policy=BackoffPolicy.from_env(),
+        decoder_for=frame_decoder(),
+        on_state=on_state,
+        on_outage=on_outage,
+        **connect_options(),
+    )
 
-            print(f"\nConnected to {WEBSOCKET_URL}")
-            print(f"Subscribed to trades for {symbol}")
-            print("Listening for trade updates...")
-            print_separator()
 
-            controller = WebSocketDisconnectController(ws, symbol)
-            controller.input_handler.show_commands()
+async def run_client(client: ReconnectingClient):
+    try:
+        await client.run()
+    except ConnectionError as e:
+        print(f"\nError: Could not connect to {WEBSOCKET_URL}: {e}")
+        print("Make sure the Flask server is running with 'flask run'")
 
-            async def receive_messages():
-                try:
-                    while controller._running:
-                        try:
-                            message = await asyncio.wait_for(
-                                controller.ws.recv(), timeout=0.5
-                            )
-                            data = json.loads(message)
-                            if not controller.is_print_paused():
-                                print_json(data, "Trade Update")
-                        except asyncio.TimeoutError:
-                            continue
-                        except websockets.exceptions.ConnectionClosed:
-                            if controller._running and not controller.is_print_paused():
-                                print("\n[Connection lost]")
-                            break
-                except Exception as e:
-                    if controller._running and not controller.is_print_paused():
-                        print(f"\n[Receive error] {e}")
-
-            async def handle_input():
-                while controller._running:
-                    user_input = await asyncio.to_thread(
-                        lambda: input() if sys.stdin.isatty() else ""
-                    )
-                    if user_input:
-                        mode = DisconnectMode.from_key(user_input.strip())
-                        if mode:
-                            await controller.handle_command(mode)
-                            if not controller._running:
-                                break
-                        else:
-                            print(f"Unknown command: {user_input}")
-                            controller.input_handler.show_commands()
-
-            await asyncio.gather(receive_messages(), handle_input())
-
-            if controller._should_reconnect:
-                print("\n[Reconnect] Re-establishing connection...")
-                should_connect = True
-
-        except websockets.exceptions.ConnectionClosed:
-            print("\nConnection closed by server")
-        except ConnectionRefusedError:
-            print(f"\nError: Could not connect to {WEBSOCKET_URL}")
-            print("Make sure the Flask server is running with 'flask run'")
-        except KeyboardInterrupt:
-            print("\n\nDisconnected by user")
+
+async def connect_and_subscribe_with_controls(symbol: str):
+    print_json(create_subscribe_request(symbol), "Sending Request")
+    controller = None
+
+    def printing() -> bool:
+        return controller is None or not controller.is_print_paused()
+
+    def on_message(data: dict):
+        if printing():
+            print_json(data, "Trade Update")
+
+    def on_state(state: str):
+        if printing():
+            print(f"\n[Connection] {state}")
+
+    def on_outage(report):
+        if printing():
+            print(f"\n[Reconnect] {report.format()}")
+
+    client = create_client([symbol], on_message, on_state, on_outage)
+    runner = asyncio.create_task(run_client(client))
+
+    # Stopping the controller wakes an input loop that is waiting for a key.
+    runner.add_done_callback(lambda _: controller is not None and controller.stop())
+
+    async def handle_input():
+        while controller._running and not client.closed:
+            key = await controller.input_handler.next_key()
+            if key is None or client.closed:
+                break
+            mode = DisconnectMode.from_key(key)
+            if mode:
+                await controller.handle_command(mode)
+                if not controller._running:
+                    break
+            else:
+                print(f"Unknown command: {key}")
+                controller.input_handler.show_commands()
+
+    try:
+        while not client.closed:
+            controller = WebSocketDisconnectController(client)
+            print("Listening for trade updates...")
+            controller.input_handler.show_commands()
+            await handle_input()
+            if not controller._should_reconnect:
+                break
+            await controller.on_reconnect()
+    except KeyboardInterrupt:
+        print("\n\nDisconnected by user")
+    finally:
+        if not client.closed:
+            await client.close()
+        await runner
 
 
 async def connect_and_subscribe(symbol: str):
-    request = create_subscribe_request(symbol)
-    print_json(request, "Sending Request")
+    print_json(create_subscribe_request(symbol), "Sending Request")
+    print("Listening for trade updates... (Press Ctrl+C to stop)")
+
+    client = create_client(
+        [symbol],
+        on_message=lambda data: print_json(data, "Trade Update"),
+        on_state=lambda state: print(f"\n[Connection] {state}"),
+        on_outage=lambda report: print(f"\n[Reconnect] {report.format()}"),
+    )
+    try:
+        await run_client(client)
+    except KeyboardInterrupt:
+        print("\n\nDisconnected by user")
+
+
+async def connect_and_subscribe_dashboard(symbols: list[str]):
+    state = DashboardState(symbols)
+    dashboard = Dashboard(state, title=f"Blockchain API live view - {WEBSOCKET_URL}")
+    client = create_client(
+        symbols,
+        on_message=state.observe,
+        on_state=state.set_connection,
+        on_outage=lambda report: state.note(report.format()),
+    )
+    runner = asyncio.create_task(run_client(client))
 
     try:
-        async with websockets.connect(WEBSOCKET_URL) as ws:
-            await ws.send(json.dumps(request))
-
-            print(f"\nConnected to {WEBSOCKET_URL}")
-            print(f"Subscribed to trades for {symbol}")
-            print("Listening for trade updates... (Press Ctrl+C to stop)")
-            print_separator()
-
-            while True:
-                message = await ws.recv()
-                data = json.loads(message)
-                print_json(data, "Trade Update")
-
-    except websockets.exceptions.ConnectionClosed:
-        print("\nConnection closed by server")
-    except ConnectionRefusedError:
-        print(f"\nError: Could not connect to {WEBSOCKET_URL}")
-        print("Make sure the Flask server is running with 'flask run'")
+        while not client.closed:
+            controller = WebSocketDisconnectController(client)
+            await dashboard.run(controller)
+            if not controller._should_reconnect:
+                break
+            await controller.on_reconnect()
     except KeyboardInterrupt:
         print("\n\nDisconnected by user")
+    finally:
+        if not client.closed:
+            await client.close()
+        await runner
+
+
+async def report_stats(client: MultiplexedClient, interval: float, analytics: TradeAnalytics | None = None):
+    while True:
+        await asyncio.sleep(interval)
+        print(MultiplexedClient.format(client.snapshot()), file=sys.stderr, flush=True)
+        if analytics is not None:
+            print(TradeAnalytics.format(analytics.snapshot()), file=sys.stderr, flush=True)
+
+
+async def run_headless(args: argparse.Namespace):
+    writer = NdjsonWriter(args.output) if args.output else None
+    recorder = recorder_from_args(args)
+    bars = NdjsonWriter(args.bars_output) if args.bars_output else None
+    analytics = analytics_from_args(args, on_bar=(lambda bar: bars.write(bar.to_dict())) if bars is not None else None)
+
+    def handle_message(message: dict):
+        if writer is not None:
+            writer.write(message)
+        if recorder is not None:
+            recorder.record(message)
+        if analytics is not None:
+            analytics.record(message)
+
+    codec = codec_for_name(args.protocol)
+    # Without --output or recording only the latency and symbol of each trade
+    # are read, which lazy views do cheaper than the stdlib parser (not orjson).
+    lazy = writer is None and recorder is None and analytics is None and JSON_BACKEND == "json"
+    client = MultiplexedClient(
+        args.url,
+        assign_symbols(args.symbols, args.connections, args.symbols_per_connection),
+        router=SymbolRouter(default=handle_message),
+        subprotocols=[codec.subprotocol] if codec.subprotocol else None,
+        decoder_for=frame_decoder(lazy),
+        latency_ms=latency_ms,
+        window=args.window,
+    )
+    print(f"Connecting {args.connections} connection(s) to {args.url} ({codec.name})", file=sys.stderr, flush=True)
+
+    reporter = asyncio.create_task(report_stats(client, args.stats_interval, analytics if args.analytics else None))
+    try:
+        await client.run(args.duration or None)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        reporter.cancel()
+        if writer is not None:
+            writer.close()
+        if recorder is not None:
+            recorder.close()
+        if analytics is not None:
+            analytics.flush()
+        if bars is not None:
+            bars.close()
+
+    total = client.total
+    elapsed = time.monotonic() - total.started
+    print(f"\n{total.messages} messages ({total.trades} trades) on {client.connected} connection(s) in "
+          f"{elapsed:.1f}s, {total.messages / elapsed if elapsed > 0 else 0.0:.1f} msg/s", file=sys.stderr)
+    print(format_summary(total.histogram.summary()), file=sys.stderr)
+    for index, error in client.errors.items():
+        print(f"Connection {index} failed: {error}", file=sys.stderr)
+    if writer is not None:
+        print(f"{writer.lines} lines written to {writer.path}", file=sys.stderr)
+    if recorder is not None:
+        print(f"{recorder.written} trades recorded to {len(recorder.files)} file(s) in {recorder.directory}"
+              f"{f' ({recorder.dropped} dropped)' if recorder.dropped else ''}", file=sys.stderr)
+        if recorder.failed:
+            print(f"{recorder.failed} trades failed to write: {recorder.last_error}", file=sys.stderr)
+    if args.analytics:
+        print(TradeAnalytics.format(analytics.snapshot()), file=sys.stderr)
+    if bars is not None:
+        print(f"{bars.lines} OHLCV bars written to {bars.path}", file=sys.stderr)
+    if args.histogram_output:
+        save_histogram(args.histogram_output, total.histogram, label=args.label)
+        print(f"Latency histogram written to {args.histogram_output}", file=sys.stderr)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Blockchain API WebSocket test client")
+    parser.add_argument("--headless", action="store_true",
+                        help="Consume without the menu, printing rolling stats instead of every message")
+    parser.add_argument("--url", default=WEBSOCKET_URL)
+    parser.add_argument("--symbols", type=lambda value: [s.strip() for s in value.split(",") if s.strip()],
+                        default=SYMBOLS, help="Comma-separated symbols to subscribe to")
+    parser.add_argument("--connections", type=int, default=1, help="Connections to open on one event loop")
+    parser.add_argument("--symbols-per-connection", type=int, default=None,
+                        help="Symbols each connection subscribes to (default: all of --symbols)")
+    parser.add_argument("--protocol", choices=["json", "msgpack", "struct"], default=WIRE_PROTOCOL)
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to run for (0 runs until Ctrl+C)")
+    parser.add_argument("--output", help="Write every message as NDJSON to this file ('-' for stdout)")
+    add_record_arguments(parser)
+    add_analytics_arguments(parser)
+    parser.add_argument("--histogram-output", help="Write the run's latency histogram to this JSON file")
+    parser.add_argument("--label", default="direct", help="Name for this run in histogram comparisons")
+    parser.add_argument("--stats-interval", type=float, default=1.0, help="Seconds between stats lines")
+    parser.add_argument("--window", type=float, default=5.0, help="Seconds of history in the throughput rate")
+    return parser.parse_args(argv)
 
 
 def select_symbol() -> str:
     print("\nAvailable symbols:")
     for i, symbol in enumerate(SYMBOLS, 1):
         print(f"  {i}. {symbol}")
+    choices = " or ".join(str(i) for i in range(1, len(SYMBOLS) + 1)) if len(SYMBOLS) <= 2 else f"1-{len(SYMBOLS)}"
 
     while True:
         try:
-            choice = input("\nSelect a symbol (1 or 2): ").strip()
+            choice = input(f"\nSelect a symbol ({choices}): ").strip()
             index = int(choice) - 1
             if 0 <= index < len(SYMBOLS):
                 return SYMBOLS[index]
-            print("Invalid choice. Please enter 1 or 2.")
+            print(f"Invalid choice. Please enter {choices}.")
         except ValueError:
             print("Invalid input. Please enter a number.")
 
@@ -185,16 +338,25 @@ def show_menu() -> str:
     print("\nOptions:")
     print("  1. Subscribe to trades (with disconnect controls)")
     print("  2. Subscribe to trades (simple mode)")
-    print("  3|q. Exit")
+    print("  3. Live dashboard (all symbols, with disconnect controls)")
+    print("  4|q. Exit")
 
     while True:
-        choice = input("\nSelect an option (1-3): ").strip()
-        if choice in ["1", "2", "3", "q"]:
+        choice = input("\nSelect an option (1-4): ").strip()
+        if choice in ["1", "2", "3", "4", "q"]:
             return choice
-        print("Invalid choice. Please enter 1, 2, 3 or q.")
+        print("Invalid choice. Please enter 1, 2, 3, 4 or q.")
 
 
 def main():
+    args = parse_args()
+    if args.headless:
+        try:
+            asyncio.run(run_headless(args))
+        except KeyboardInterrupt:
+            pass
+        return
+
     print("=" * 60)
     print("  Blockchain API WebSocket Test Client (Server)")
     print("=" * 60)
@@ -212,7 +374,10 @@ def main():
             print(f"\nYou selected: {symbol}")
             input("Press Enter to connect and subscribe...")
             asyncio.run(connect_and_subscribe(symbol))
-        elif choice == "3" or choice == "q":
+        elif choice == "3":
+            input(f"Press Enter to open the live view for {', '.join(SYMBOLS)}...")
+            asyncio.run(connect_and_subscribe_dashboard(SYMBOLS))
+        elif choice == "4" or choice == "q":
             print("\nGoodbye!")
             break
 
@@ -1,9 +1,10 @@
 import pytest
 import json
-import time
+from blockchain_api.clock import VirtualClock
 from blockchain_api.websocket_handler import WebSocketHandler
 from blockchain_api.trade_generator import TradeGenerator
 from blockchain_api.interval_scheduler import IntervalScheduler
+from blockchain_api.wire_protocol import MSGPACK_SUBPROTOCOL, STRUCT_SUBPROTOCOL, MsgPackCodec
 
 
 class TestAppIntegration:
@@ -87,8 +88,9 @@ class TestAppIntegration:
         assert btc_update["symbol"] == "BTC-USD"
 
     def test_scheduler_with_trade_generator(self):
-        generator = TradeGenerator("ETH-USD")
-        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02)
+        clock = VirtualClock()
+        generator = TradeGenerator("ETH-USD", clock=clock)
+        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02, clock=clock)
         
         trades_received = []
         
@@ -97,12 +99,299 @@ class TestAppIntegration:
             trades_received.append(trade)
         
         scheduler.start(on_trade)
-        time.sleep(0.1)
+        clock.wait_for_sleepers()
+        clock.advance(0.1)
         scheduler.stop()
         
-        assert len(trades_received) >= 1
+        assert len(trades_received) >= 5
+        timestamps = [trade["timestamp"] for trade in trades_received]
+        assert timestamps == sorted(timestamps)
         for trade in trades_received:
             assert trade["symbol"] == "ETH-USD"
             assert "timestamp" in trade
             assert "price" in trade
             assert "qty" in trade
+
+
+class TestScenarioAdminEndpoint:
+    @pytest.fixture
+    def client(self):
+        from blockchain_api.app import app, scenario_engine
+        scenario_engine.stop()
+        yield app.test_client()
+        scenario_engine.stop()
+
+    def test_get_scenario_when_inactive(self, client):
+        response = client.get("/admin/scenario")
+        assert response.status_code == 200
+        assert response.get_json() == {"active": False}
+
+    def test_post_scenario_starts_it(self, client):
+        response = client.post("/admin/scenario", json={
+            "name": "spike",
+            "seed": 1,
+            "symbols": {"ETH-USD": [{"at": 0, "type": "rate", "multiplier": 10, "duration": 60}]},
+        })
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["active"] is True
+        assert data["name"] == "spike"
+        assert data["symbols"]["ETH-USD"]["rate_multiplier"] == 10.0
+
+    def test_post_invalid_scenario_returns_400(self, client):
+        response = client.post("/admin/scenario", json={"symbols": {"ETH-USD": [{"type": "bogus"}]}})
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+
+    def test_delete_scenario_stops_it(self, client):
+        client.post("/admin/scenario", json={"symbols": {"ETH-USD": [{"at": 0, "type": "halt", "duration": 5}]}})
+        response = client.delete("/admin/scenario")
+        assert response.get_json() == {"active": False}
+
+
+class TestImpairmentAdminEndpoint:
+    @pytest.fixture
+    def client(self):
+        from blockchain_api.app import app
+        return app.test_client()
+
+    def test_get_impairments_lists_profiles_with_counters(self, client):
+        data = client.get("/admin/impairments").get_json()
+        assert "wan" in data
+        assert "counters" in data["wan"]
+        assert data["wan"]["profile"]["latency_ms"] == 50.0
+
+    def test_post_impairment_registers_profile(self, client):
+        response = client.post("/admin/impairments", json={"name": "test-profile", "drop_rate": 0.5})
+        assert response.status_code == 200
+        assert response.get_json()["profile"]["drop_rate"] == 0.5
+
+    def test_post_invalid_impairment_returns_400(self, client):
+        response = client.post("/admin/impairments", json={"name": "bad", "drop_rate": 2})
+        assert response.status_code == 400
+
+
+class TestRateLimitAdminEndpoint:
+    def test_get_rate_limits_reports_settings_and_metrics(self):
+        from blockchain_api.app import app
+        data = app.test_client().get("/admin/rate-limits").get_json()
+        assert data["settings"]["rate"] > 0
+        assert "throttled" in data["metrics"]
+
+
+class TestSharedFeedAdminEndpoint:
+    def test_get_shared_feed_reports_status(self, monkeypatch):
+        from blockchain_api import app as app_module
+        from blockchain_api.shared_feed import SharedTradeFeed
+
+        feed = SharedTradeFeed(clock=VirtualClock())
+        monkeypatch.setattr(app_module, "shared_feed", feed)
+        feed.subscribe("ETH-USD", lambda trade: None)
+        try:
+            data = app_module.app.test_client().get("/admin/shared-feed").get_json()
+        finally:
+            feed.stop()
+        assert data == {"ETH-USD": {"subscribers": 1, "dropped": 0}}
+
+
+class TestProfileAdminEndpoint:
+    @pytest.fixture
+    def app_module(self):
+        from blockchain_api import app as app_module
+        enabled = app_module.profiler.enabled
+        yield app_module
+        app_module.profiler.enabled = enabled
+
+    def test_profile_disabled_by_default(self, app_module):
+        app_module.profiler.enabled = False
+        response = app_module.app.test_client().post("/admin/profile?duration=0.01")
+        assert response.status_code == 404
+
+    def test_profile_rejects_unknown_mode(self, app_module):
+        app_module.profiler.enabled = True
+        response = app_module.app.test_client().post("/admin/profile?mode=magic")
+        assert response.status_code == 400
+
+    def test_sampling_profile_returns_text(self, app_module):
+        app_module.profiler.enabled = True
+        response = app_module.app.test_client().post("/admin/profile?mode=sampling&duration=0.05")
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+
+    def test_deterministic_profile_returns_pstats_dump(self, app_module):
+        app_module.profiler.enabled = True
+        response = app_module.app.test_client().post("/admin/profile?mode=deterministic&duration=0.01&format=pstats")
+        assert response.status_code == 200
+        assert response.mimetype == "application/octet-stream"
+
+
+@pytest.fixture
+def server_url():
+    import threading
+    from werkzeug.serving import make_server
+    from blockchain_api.app import app
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"ws://127.0.0.1:{server.server_port}/ws"
+    server.shutdown()
+    thread.join(timeout=1.0)
+
+
+class TestSubprotocolNegotiation:
+    def subscribe(self, url, subprotocols=None):
+        from websockets.sync.client import connect
+
+        with connect(url, subprotocols=subprotocols) as ws:
+            ws.send(json.dumps({"action": "subscribe", "channel": "trades", "symbol": "ETH-USD"}))
+            return ws.subprotocol, ws.recv(timeout=2.0)
+
+    def test_json_is_default(self, server_url):
+        subprotocol, frame = self.subscribe(server_url)
+        assert subprotocol is None
+        assert json.loads(frame)["event"] == "subscribed"
+
+    def test_msgpack_negotiated(self, server_url):
+        subprotocol, frame = self.subscribe(server_url, [MSGPACK_SUBPROTOCOL])
+        assert subprotocol == MSGPACK_SUBPROTOCOL
+        assert isinstance(frame, bytes)
+        assert MsgPackCodec().decode(frame)["event"] == "subscribed"
+
+    def test_struct_negotiated(self, server_url):
+        subprotocol, frame = self.subscribe(server_url, [STRUCT_SUBPROTOCOL])
+        assert subprotocol == STRUCT_SUBPROTOCOL
+        assert json.loads(frame)["event"] == "subscribed"
+
+
+class TestMulticastAdminEndpoint:
+    @pytest.fixture
+    def client(self):
+        from blockchain_api.app import app, multicast_feed
+        multicast_feed.stop()
+        yield app.test_client()
+        multicast_feed.stop()
+
+    def test_get_multicast_when_inactive(self, client):
+        assert client.get("/admin/multicast").get_json() == {"active": False}
+
+    def test_post_multicast_starts_feed(self, client):
+        response = client.post("/admin/multicast", json={"port": 31999, "symbols": ["ETH-USD"], "rate": 5})
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["active"] is True
+        assert data["settings"]["rate"] == 5
+
+    def test_post_invalid_settings_returns_400(self, client):
+        response = client.post("/admin/multicast", json={"group": "10.0.0.1", "symbols": ["ETH-USD"]})
+        assert response.status_code == 400
+
+    def test_delete_multicast_stops_feed(self, client):
+        client.post("/admin/multicast", json={"port": 31999, "symbols": ["ETH-USD"]})
+        assert client.delete("/admin/multicast").get_json() == {"active": False}
+
+
+class TestTradeHistoryEndpoint:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        from blockchain_api import app as app_module
+        from blockchain_api.trade_store import TradeStore
+
+        store = TradeStore(capacity_per_symbol=100)
+        generator = TradeGenerator("ETH-USD", clock=VirtualClock())
+        for _ in range(5):
+            store.record(generator.generate_trade())
+        monkeypatch.setattr(app_module, "trade_store", store)
+        return app_module.app.test_client()
+
+    def test_requires_symbol(self, client):
+        assert client.get("/trades").status_code == 400
+
+    def test_returns_trades_and_cursor(self, client):
+        data = client.get("/trades?symbol=ETH-USD&limit=3").get_json()
+        assert len(data["trades"]) == 3
+        assert data["trades"][0]["symbol"] == "ETH-USD"
+
+        data = client.get(f"/trades?symbol=ETH-USD&limit=3&cursor={data['next_cursor']}").get_json()
+        assert len(data["trades"]) == 2
+        assert data["next_cursor"] is None
+
+    def test_invalid_since_returns_400(self, client):
+        assert client.get("/trades?symbol=ETH-USD&since=bogus").status_code == 400
+
+    def test_evicted_cursor_returns_410(self, client):
+        from blockchain_api import app as app_module
+        _, cursor = app_module.trade_store.query("ETH-USD", limit=1)
+        generator = TradeGenerator("ETH-USD", clock=VirtualClock())
+        for _ in range(100):
+            app_module.trade_store.record(generator.generate_trade())
+        assert client.get(f"/trades?symbol=ETH-USD&cursor={cursor}").status_code == 410
+
+    def test_trade_store_status(self, client):
+        data = client.get("/admin/trade-store").get_json()
+        assert data["ETH-USD"]["count"] == 5
+
+
+class TestConfigAdminEndpoint:
+    @pytest.fixture
+    def app_module(self, monkeypatch):
+        from blockchain_api import app as app_module
+        from blockchain_api.config import ConfigManager
+        monkeypatch.setattr(app_module, "config_manager", ConfigManager())
+        return app_module
+
+    def test_get_config(self, app_module):
+        data = app_module.app.test_client().get("/admin/config").get_json()
+        assert data["version"] == 0
+        assert data["config"]["emission"] == {"min_interval": 0.5, "max_interval": 3.0, "shared": False}
+
+    def test_patch_config_updates_sections(self, app_module):
+        response = app_module.app.test_client().patch("/admin/config", json={
+            "symbols": ["ETH-USD"],
+            "emission": {"min_interval": 0.1, "max_interval": 0.2},
+        })
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["version"] == 1
+        assert data["config"]["symbols"] == ["ETH-USD"]
+        assert app_module.config_manager.current.emission.interval_range == (0.1, 0.2)
+
+    def test_patch_invalid_config_returns_400(self, app_module):
+        response = app_module.app.test_client().patch("/admin/config", json={"limits": {"rate": -1}})
+        assert response.status_code == 400
+        assert app_module.config_manager.version == 0
+
+    def test_reload_without_file_returns_400(self, app_module):
+        assert app_module.app.test_client().post("/admin/config/reload").status_code == 400
+
+    def test_reload_rereads_file(self, app_module, monkeypatch, tmp_path):
+        from blockchain_api.config import ConfigManager
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"symbols": ["ETH-USD"]}))
+        monkeypatch.setattr(app_module, "config_manager", ConfigManager(path=str(path)))
+
+        path.write_text(json.dumps({"symbols": ["BTC-USD"]}))
+        data = app_module.app.test_client().post("/admin/config/reload").get_json()
+        assert data["config"]["symbols"] == ["BTC-USD"]
+
+    def test_changes_apply_to_live_connections(self, app_module, server_url):
+        from websockets.sync.client import connect
+
+        app_module.config_manager.update({"emission": {"min_interval": 0.01, "max_interval": 0.02}})
+        with connect(server_url) as ws:
+            ws.send(json.dumps({"action": "subscribe", "channel": "trades", "symbol": "ETH-USD"}))
+            assert json.loads(ws.recv(timeout=2.0))["event"] == "subscribed"
+            assert json.loads(ws.recv(timeout=2.0))["event"] == "updated"
+
+            app_module.config_manager.update({"price_model": {"min_qty": 5.0, "max_qty": 5.0}})
+            quantities = [json.loads(ws.recv(timeout=2.0))["qty"] for _ in range(5)]
+            assert quantities[-1] == 5.0
+
+            app_module.config_manager.update({"symbols": ["BTC-USD"]})
+            ws.send(json.dumps({"action": "subscribe", "channel": "trades", "symbol": "ETH-USD"}))
+            event = json.loads(ws.recv(timeout=2.0))
+            while event["event"] == "updated":
+                event = json.loads(ws.recv(timeout=2.0))
+            assert event == {"seqnum": event["seqnum"], "event": "rejected", "text": "Symbol 'ETH-USD' is not supported"}
+            with pytest.raises(TimeoutError):
+                ws.recv(timeout=0.2)
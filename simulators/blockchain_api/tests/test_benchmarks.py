@@ -0,0 +1,91 @@
+import pytest
+from benchmarks import hot_path, trade_store, wire_protocol
+from benchmarks.runner import (
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    load_results,
+    registered_benchmarks,
+    run_benchmark,
+    save_results,
+)
+
+
+def make_result(name: str, median_ns: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        rounds=3,
+        iterations=10,
+        ops_per_call=1,
+        min_ns=median_ns,
+        median_ns=median_ns,
+        mean_ns=median_ns,
+        stdev_ns=0.0,
+    )
+
+
+class TestRunBenchmark:
+    def test_measures_per_operation_time(self):
+        calls = []
+        bench = Benchmark("append", lambda: lambda: calls.append(1), ops_per_call=2)
+        result = run_benchmark(bench, rounds=3, warmup_rounds=1, iterations=5)
+        assert len(calls) == 20
+        assert result.rounds == 3
+        assert result.iterations == 5
+        assert result.min_ns <= result.median_ns
+        assert result.ops_per_sec > 0
+
+    def test_calibrates_iterations(self):
+        bench = Benchmark("noop", lambda: lambda: None)
+        result = run_benchmark(bench, rounds=2, warmup_rounds=0, target_round_ns=1_000_000)
+        assert result.iterations > 1
+
+    def test_calls_teardown(self):
+        torn_down = []
+        bench = Benchmark("with-teardown", lambda: (lambda: None, lambda: torn_down.append(True)))
+        run_benchmark(bench, rounds=1, warmup_rounds=0, iterations=1)
+        assert torn_down == [True]
+
+    def test_hot_path_benchmarks_are_registered(self):
+        names = registered_benchmarks()
+        assert "websocket_handler.handle_message" in names
+        assert "websocket_handler.format_trade_update" in names
+        assert "trade_generator.generate_trade" in names
+        assert "trade_generator.format_trade" in names
+        assert "interval_scheduler.dispatch" in names
+        assert "loopback.send_trade_updates" in names
+        assert "trade_store.record" in names
+        assert "trade_store.query_page" in names
+
+    def test_wire_protocol_benchmarks_report_message_size(self):
+        names = registered_benchmarks()
+        for protocol in ("json", "msgpack", "struct"):
+            assert names[f"wire_protocol.{protocol}.encode_trade"].bytes_per_op > 0
+            assert names[f"wire_protocol.{protocol}.decode_trade"].bytes_per_op > 0
+
+    @pytest.mark.parametrize("name", sorted(registered_benchmarks()))
+    def test_hot_path_benchmarks_run(self, name):
+        result = run_benchmark(registered_benchmarks()[name], rounds=1, warmup_rounds=0, iterations=1)
+        assert result.median_ns > 0
+
+
+class TestCompare:
+    def test_flags_slowdown_beyond_threshold(self):
+        comparisons = compare([make_result("a", 120.0)], [make_result("a", 100.0)], threshold=0.1)
+        assert comparisons[0].regressed is True
+        assert comparisons[0].change == pytest.approx(0.2)
+
+    def test_within_threshold_is_not_regression(self):
+        comparisons = compare([make_result("a", 105.0)], [make_result("a", 100.0)], threshold=0.1)
+        assert comparisons[0].regressed is False
+
+    def test_ignores_benchmarks_missing_from_baseline(self):
+        assert compare([make_result("new", 100.0)], [make_result("old", 100.0)]) == []
+
+
+class TestResultFiles:
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "results.json"
+        results = [make_result("a", 100.0), make_result("b", 200.0)]
+        save_results(results, str(path))
+        assert load_results(str(path)) == results
@@ -0,0 +1,90 @@
+import pytest
+import threading
+import time
+from blockchain_api.clock import Clock, SystemClock, VirtualClock
+
+
+class TestSystemClock:
+    def test_clock_is_abstract(self):
+        with pytest.raises(TypeError):
+            Clock()
+
+    def test_time_tracks_wall_clock(self):
+        clock = SystemClock()
+        assert abs(clock.time() - time.time()) < 1.0
+
+    def test_wait_returns_true_when_event_set(self):
+        event = threading.Event()
+        event.set()
+        assert SystemClock().wait(event, 1.0) is True
+
+    def test_wait_times_out(self):
+        assert SystemClock().wait(threading.Event(), 0.01) is False
+
+
+class TestVirtualClock:
+    def test_starts_at_given_time(self):
+        clock = VirtualClock(start=1000.0)
+        assert clock.time() == 1000.0
+        assert clock.monotonic() == 0.0
+
+    def test_advance_moves_time(self):
+        clock = VirtualClock(start=1000.0)
+        clock.advance(2.5)
+        assert clock.time() == 1002.5
+        assert clock.monotonic() == 2.5
+
+    def test_advance_rejects_negative(self):
+        with pytest.raises(ValueError):
+            VirtualClock().advance(-1)
+
+    def test_wait_returns_when_deadline_reached(self):
+        clock = VirtualClock()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(clock.wait(threading.Event(), 10.0)))
+        thread.start()
+        assert clock.wait_for_sleepers()
+        clock.advance(10.0)
+        thread.join(timeout=1.0)
+        assert results == [False]
+
+    def test_wait_does_not_return_before_deadline(self):
+        clock = VirtualClock()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(clock.wait(threading.Event(), 10.0)), daemon=True)
+        thread.start()
+        assert clock.wait_for_sleepers()
+        clock.advance(5.0)
+        assert results == []
+        clock.advance(5.0)
+        thread.join(timeout=1.0)
+        assert results == [False]
+
+    def test_wait_returns_true_when_event_set(self):
+        clock = VirtualClock()
+        event = threading.Event()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(clock.wait(event, 10.0)))
+        thread.start()
+        event.set()
+        thread.join(timeout=1.0)
+        assert results == [True]
+
+    def test_wait_for_sleepers_times_out(self):
+        assert VirtualClock().wait_for_sleepers(timeout=0.01) is False
+
+    def test_advance_steps_through_each_deadline(self):
+        clock = VirtualClock()
+        seen = []
+
+        def sleeper():
+            for _ in range(3):
+                clock.sleep(1.0)
+                seen.append(clock.monotonic())
+
+        thread = threading.Thread(target=sleeper)
+        thread.start()
+        assert clock.wait_for_sleepers()
+        clock.advance(10.0)
+        thread.join(timeout=1.0)
+        assert seen == [1.0, 2.0, 3.0]
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+from blockchain_api.config import ConfigManager, EmissionSettings, PriceModelSettings, SimulatorConfig
+from blockchain_api.rate_limiter import RateLimitSettings
+
+
+class TestSettingsValidation:
+    def test_emission_rejects_inverted_range(self):
+        with pytest.raises(ValueError):
+            EmissionSettings(min_interval=2.0, max_interval=1.0)
+
+    def test_emission_rejects_non_boolean_shared(self):
+        with pytest.raises(ValueError):
+            EmissionSettings(shared="yes")
+
+    def test_price_model_rejects_non_positive_qty(self):
+        with pytest.raises(ValueError):
+            PriceModelSettings(min_qty=0)
+
+    def test_price_model_rejects_negative_volatility(self):
+        with pytest.raises(ValueError):
+            PriceModelSettings(volatility=-0.1)
+
+
+class TestSimulatorConfig:
+    def test_defaults_match_previous_constants(self):
+        config = SimulatorConfig()
+        assert config.emission.interval_range == (0.5, 3.0)
+        assert config.price_model == PriceModelSettings(volatility=0.001, min_qty=0.0001, max_qty=10.0)
+
+    def test_empty_symbol_set_supports_everything(self):
+        assert SimulatorConfig().supports("DOGE-USD")
+
+    def test_symbol_set_restricts_support(self):
+        config = SimulatorConfig(symbols=("ETH-USD",))
+        assert config.supports("ETH-USD")
+        assert not config.supports("BTC-USD")
+
+    def test_merged_keeps_unspecified_values(self):
+        config = SimulatorConfig().merged({"emission": {"max_interval": 1.0}, "limits": {"rate": 50}})
+        assert config.emission == EmissionSettings(min_interval=0.5, max_interval=1.0)
+        assert config.limits == RateLimitSettings(rate=50, burst=20)
+        assert config.price_model == PriceModelSettings()
+
+    def test_merged_validates_the_combined_section(self):
+        with pytest.raises(ValueError):
+            SimulatorConfig().merged({"emission": {"min_interval": 5.0}})
+
+    @pytest.mark.parametrize("data", [
+        {"bogus": 1},
+        {"emission": {"bogus": 1}},
+        {"emission": 1.0},
+        {"symbols": "ETH-USD"},
+        {"symbols": [""]},
+    ])
+    def test_merged_rejects_invalid_input(self, data):
+        with pytest.raises(ValueError):
+            SimulatorConfig().merged(data)
+
+    def test_to_dict_round_trips(self):
+        config = SimulatorConfig(symbols=("ETH-USD",), emission=EmissionSettings(0.1, 0.2))
+        assert SimulatorConfig.from_dict(config.to_dict()) == config
+
+    def test_load(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"symbols": ["ETH-USD"], "price_model": {"volatility": 0.01}}))
+        config = SimulatorConfig.load(str(path))
+        assert config.symbols == ("ETH-USD",)
+        assert config.price_model.volatility == 0.01
+
+
+class TestConfigManager:
+    def test_update_swaps_config_and_bumps_version(self):
+        manager = ConfigManager()
+        before = manager.current
+        manager.update({"emission": {"min_interval": 0.1, "max_interval": 0.2}})
+        assert manager.current.emission.interval_range == (0.1, 0.2)
+        assert manager.current is not before
+        assert manager.version == 1
+
+    def test_failed_update_leaves_config_unchanged(self):
+        manager = ConfigManager()
+        before = manager.current
+        with pytest.raises(ValueError):
+            manager.update({"emission": {"min_interval": -1}})
+        assert manager.current is before
+        assert manager.version == 0
+
+    def test_loads_file_over_defaults(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"emission": {"max_interval": 1.0}}))
+        manager = ConfigManager(SimulatorConfig(limits=RateLimitSettings(rate=5)), path=str(path))
+        assert manager.current.emission.max_interval == 1.0
+        assert manager.current.limits.rate == 5
+
+    def test_reload_rereads_file(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"symbols": ["ETH-USD"]}))
+        manager = ConfigManager(path=str(path))
+        manager.update({"emission": {"max_interval": 1.0}})
+
+        path.write_text(json.dumps({"symbols": ["BTC-USD"]}))
+        manager.reload()
+        assert manager.current.symbols == ("BTC-USD",)
+        assert manager.current.emission.max_interval == 3.0
+        assert manager.version == 2
+
+    def test_reload_without_file_raises(self):
+        with pytest.raises(ValueError):
+            ConfigManager().reload()
+
+    def test_status(self):
+        status = ConfigManager().status()
+        assert status["version"] == 0
+        assert status["config"]["emission"] == {"min_interval": 0.5, "max_interval": 3.0, "shared": False}
@@ -0,0 +1,195 @@
+import pytest
+import json
+import time
+from blockchain_api.impairment import (
+    ImpairmentProfile,
+    ImpairmentCounters,
+    ImpairedSender,
+    ImpairmentRegistry,
+)
+
+
+def wait_for(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestImpairmentProfile:
+    def test_defaults_are_unimpaired(self):
+        profile = ImpairmentProfile("clean")
+        assert profile.latency_ms == 0.0
+        assert profile.drop_rate == 0.0
+        assert profile.bandwidth_bytes_per_sec is None
+
+    def test_rejects_invalid_rate(self):
+        with pytest.raises(ValueError):
+            ImpairmentProfile("bad", drop_rate=1.5)
+
+    def test_rejects_unknown_distribution(self):
+        with pytest.raises(ValueError):
+            ImpairmentProfile("bad", jitter_distribution="pareto")
+
+    def test_from_dict_rejects_unknown_fields(self):
+        with pytest.raises(ValueError):
+            ImpairmentProfile.from_dict({"name": "bad", "latency": 5})
+
+    def test_from_dict_requires_name(self):
+        with pytest.raises(ValueError):
+            ImpairmentProfile.from_dict({"latency_ms": 5})
+
+    def test_to_dict_round_trips(self):
+        profile = ImpairmentProfile("wan", latency_ms=50.0, jitter_ms=10.0, jitter_distribution="normal")
+        assert ImpairmentProfile.from_dict(profile.to_dict()) == profile
+
+
+class TestImpairedSender:
+    def test_unimpaired_profile_delivers_in_order(self):
+        sent = []
+        sender = ImpairedSender(sent.append, ImpairmentProfile("clean"))
+        for i in range(20):
+            sender.send(str(i))
+        assert wait_for(lambda: len(sent) == 20)
+        sender.close()
+        assert sent == [str(i) for i in range(20)]
+        assert sender.counters.to_dict()["delivered"] == 20
+
+    def test_latency_delays_delivery(self):
+        sent = []
+        sender = ImpairedSender(sent.append, ImpairmentProfile("slow", latency_ms=50.0))
+        start = time.monotonic()
+        sender.send("a")
+        assert wait_for(lambda: sent == ["a"])
+        sender.close()
+        assert time.monotonic() - start >= 0.05
+        assert sender.counters.to_dict()["delay_ms_mean"] == pytest.approx(50.0)
+
+    def test_drop_rate_drops_messages(self):
+        sent = []
+        sender = ImpairedSender(sent.append, ImpairmentProfile("blackhole", drop_rate=1.0))
+        for i in range(10):
+            sender.send(str(i))
+        sender.close()
+        assert sent == []
+        assert sender.counters.to_dict()["dropped"] == 10
+
+    def test_duplicate_rate_duplicates_messages(self):
+        sent = []
+        sender = ImpairedSender(sent.append, ImpairmentProfile("echo", duplicate_rate=1.0))
+        sender.send("a")
+        assert wait_for(lambda: len(sent) == 2)
+        sender.close()
+        assert sent == ["a", "a"]
+        assert sender.counters.to_dict()["duplicated"] == 1
+
+    def test_reorder_stays_within_window(self):
+        sent = []
+        profile = ImpairmentProfile("shuffle", reorder_rate=0.3, reorder_window=3, seed=5)
+        sender = ImpairedSender(sent.append, profile)
+        for i in range(50):
+            sender.send(str(i))
+        assert wait_for(lambda: len(sent) == 50 - len(sender._held))
+        sender.close()
+        order = [int(message) for message in sent]
+        assert order != sorted(order)
+        assert len(set(order)) == len(order)
+        for position, message in enumerate(order):
+            assert all(later >= message - 3 for later in order[position:])
+
+    def test_reordered_messages_are_counted(self):
+        sender = ImpairedSender(lambda m: None, ImpairmentProfile("shuffle", reorder_rate=1.0, reorder_window=3, seed=1))
+        for i in range(5):
+            sender.send(str(i))
+        sender.close()
+        assert sender.counters.to_dict()["reordered"] == 5
+
+    def test_held_messages_are_released_when_idle(self):
+        sent = []
+        profile = ImpairmentProfile("shuffle", reorder_rate=1.0, reorder_window=3, reorder_hold_ms=20, seed=1)
+        sender = ImpairedSender(sent.append, profile)
+        sender.send("reply")
+        assert wait_for(lambda: sent == ["reply"])
+        assert sender._held == []
+        sender.close()
+
+    def test_bandwidth_cap_throttles(self):
+        sent = []
+        profile = ImpairmentProfile("narrow", bandwidth_bytes_per_sec=1000)
+        sender = ImpairedSender(sent.append, profile)
+        start = time.monotonic()
+        sender.send("x" * 50)
+        sender.send("x" * 50)
+        assert wait_for(lambda: len(sent) == 2)
+        sender.close()
+        assert time.monotonic() - start >= 0.1
+        assert sender.counters.to_dict()["throttled_ms_total"] > 0
+
+    def test_send_errors_are_not_counted_as_delivered(self):
+        def failing_send(message):
+            raise ConnectionError("closed")
+
+        sender = ImpairedSender(failing_send, ImpairmentProfile("clean"))
+        sender.send("a")
+        time.sleep(0.02)
+        sender.close()
+        assert sender.counters.to_dict()["delivered"] == 0
+
+    def test_send_after_close_is_ignored(self):
+        sent = []
+        sender = ImpairedSender(sent.append, ImpairmentProfile("clean"))
+        sender.close()
+        sender.send("a")
+        assert sent == []
+
+
+class TestImpairmentRegistry:
+    def test_default_profiles_registered(self):
+        registry = ImpairmentRegistry()
+        assert registry.get("wan") is not None
+        assert registry.get("lossy") is not None
+        assert registry.get(None) is None
+        assert registry.get("missing") is None
+
+    def test_counters_shared_per_profile(self):
+        registry = ImpairmentRegistry([ImpairmentProfile("clean")])
+        first = registry.create_sender(lambda m: None, "clean")
+        second = registry.create_sender(lambda m: None, "clean")
+        first.send("a")
+        second.send("b")
+        first.close()
+        second.close()
+        counters = registry.status()["clean"]["counters"]
+        assert counters["connections"] == 2
+        assert counters["messages"] == 2
+
+    def test_re_registering_keeps_live_counters(self):
+        registry = ImpairmentRegistry([ImpairmentProfile("clean")])
+        sender = registry.create_sender(lambda m: None, "clean")
+        registry.register(ImpairmentProfile("clean", latency_ms=5))
+        sender.send("a")
+        sender.close()
+        status = registry.status()["clean"]
+        assert status["profile"]["latency_ms"] == 5
+        assert status["counters"]["messages"] == 1
+
+    def test_load_reads_profiles_file(self, tmp_path):
+        path = tmp_path / "impairments.json"
+        path.write_text(json.dumps({"profiles": [{"name": "custom", "latency_ms": 5}]}))
+        registry = ImpairmentRegistry.load(str(path))
+        assert registry.get("custom").latency_ms == 5
+        assert registry.get("wan") is None
+
+
+class TestImpairmentCounters:
+    def test_delay_statistics(self):
+        counters = ImpairmentCounters()
+        counters.record(messages=2)
+        counters.record_delay(10.0, 0.0)
+        counters.record_delay(30.0, 5.0)
+        data = counters.to_dict()
+        assert data["delay_ms_mean"] == 20.0
+        assert data["delay_ms_max"] == 30.0
+        assert data["throttled_ms_total"] == 5.0
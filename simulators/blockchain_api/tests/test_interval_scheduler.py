@@ -1,7 +1,8 @@
 import pytest
-import time
+import random
 import threading
 from unittest.mock import Mock, patch
+from blockchain_api.clock import VirtualClock
 from blockchain_api.interval_scheduler import IntervalScheduler
 
 
@@ -30,31 +31,67 @@ class TestIntervalScheduler:
             interval = scheduler.get_random_interval()
             assert 0.5 <= interval <= 1.5
 
+    def test_get_random_interval_divided_by_rate_multiplier(self):
+        scheduler = IntervalScheduler(min_interval=1.0, max_interval=1.0, rate_multiplier=lambda: 10.0)
+        assert scheduler.get_random_interval() == pytest.approx(0.1)
+
+    def test_get_random_interval_ignores_non_positive_multiplier(self):
+        scheduler = IntervalScheduler(min_interval=1.0, max_interval=1.0, rate_multiplier=lambda: 0.0)
+        assert scheduler.get_random_interval() == 1.0
+
+    def test_get_random_interval_reads_live_interval_range(self):
+        intervals = [(1.0, 1.0)]
+        scheduler = IntervalScheduler(interval_range=lambda: intervals[0])
+        assert scheduler.get_random_interval() == 1.0
+        intervals[0] = (0.25, 0.25)
+        assert scheduler.get_random_interval() == 0.25
+
+    def test_get_random_interval_is_repeatable_with_seeded_rng(self):
+        first = IntervalScheduler(rng=random.Random(3))
+        second = IntervalScheduler(rng=random.Random(3))
+        assert [first.get_random_interval() for _ in range(5)] == [second.get_random_interval() for _ in range(5)]
+
     def test_start_calls_callback(self):
         callback = Mock()
-        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02)
+        clock = VirtualClock()
+        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02, clock=clock)
         
         scheduler.start(callback)
-        time.sleep(0.1)
+        clock.wait_for_sleepers()
+        clock.advance(0.1)
         scheduler.stop()
         
-        assert callback.call_count >= 1
+        assert 5 <= callback.call_count <= 10
 
     def test_stop_stops_scheduler(self):
         callback = Mock()
-        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02)
+        clock = VirtualClock()
+        scheduler = IntervalScheduler(min_interval=0.01, max_interval=0.02, clock=clock)
         
         scheduler.start(callback)
-        time.sleep(0.05)
+        clock.wait_for_sleepers()
+        clock.advance(0.05)
         scheduler.stop()
         
         call_count_after_stop = callback.call_count
-        time.sleep(0.05)
+        clock.advance(0.05)
         
         assert callback.call_count == call_count_after_stop
 
+    def test_hours_of_virtual_time_run_deterministically(self):
+        callback = Mock()
+        clock = VirtualClock()
+        scheduler = IntervalScheduler(min_interval=1.0, max_interval=1.0, clock=clock)
+        
+        scheduler.start(callback)
+        clock.wait_for_sleepers()
+        clock.advance(3600.0)
+        scheduler.stop()
+        
+        assert callback.call_count == 3600
+
     def test_is_running_property(self):
-        scheduler = IntervalScheduler(min_interval=0.1, max_interval=0.2)
+        scheduler = IntervalScheduler(min_interval=0.1, max_interval=0.2, clock=VirtualClock())
         
         assert scheduler.is_running is False
         
@@ -62,7 +99,6 @@ class TestIntervalScheduler:
         assert scheduler.is_running is True
         
         scheduler.stop()
-        time.sleep(0.05)
         assert scheduler.is_running is False
 
     def test_start_when_already_running_does_nothing(self):
@@ -0,0 +1,157 @@
+import socket
+
+import pytest
+from blockchain_api.clock import VirtualClock
+from blockchain_api.multicast import MulticastFeed, MulticastPublisher, MulticastSettings
+from blockchain_api.wire_protocol import StructCodec
+
+
+GROUP = "239.255.0.1"
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("", 0))
+    sock.setsockopt(
+        socket.IPPROTO_IP,
+        socket.IP_ADD_MEMBERSHIP,
+        socket.inet_aton(GROUP) + socket.inet_aton("127.0.0.1"),
+    )
+    sock.settimeout(2.0)
+    yield sock
+    sock.close()
+
+
+def receive(sock, count):
+    codec = StructCodec()
+    return [codec.decode(sock.recv(1024)) for _ in range(count)]
+
+
+TRADE = {
+    "symbol": "ETH-USD",
+    "timestamp": "2024-01-15T10:30:45.123456Z",
+    "side": "buy",
+    "qty": 0.5,
+    "price": 2500.25,
+    "trade_id": "1705314645123456",
+}
+
+
+class TestMulticastSettings:
+    def test_defaults_are_disabled(self):
+        settings = MulticastSettings()
+        assert settings.enabled is False
+        assert settings.group == GROUP
+
+    def test_rejects_non_multicast_group(self):
+        with pytest.raises(ValueError):
+            MulticastSettings(group="127.0.0.1")
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            MulticastSettings(rate=0)
+
+    def test_from_env_reads_values(self, monkeypatch):
+        monkeypatch.setenv("MULTICAST_SYMBOLS", "ETH-USD, BTC-USD")
+        monkeypatch.setenv("MULTICAST_PORT", "31000")
+        monkeypatch.setenv("MULTICAST_RATE", "1000")
+        settings = MulticastSettings.from_env()
+        assert settings.symbols == ("ETH-USD", "BTC-USD")
+        assert settings.port == 31000
+        assert settings.rate == 1000.0
+        assert settings.enabled is True
+
+    def test_rejects_symbols_too_long_for_the_layout(self):
+        with pytest.raises(ValueError, match="A-VERY-LONG-SYMBOL-NAME"):
+            MulticastSettings.from_dict({"symbols": ["ETH-USD", "A-VERY-LONG-SYMBOL-NAME"]})
+
+    def test_from_dict_rejects_unknown_fields(self):
+        with pytest.raises(ValueError):
+            MulticastSettings.from_dict({"symbols": ["ETH-USD"], "bogus": 1})
+
+    def test_round_trip(self):
+        settings = MulticastSettings(symbols=("ETH-USD",), rate=50.0)
+        assert MulticastSettings.from_dict(settings.to_dict()) == settings
+
+
+class TestMulticastPublisher:
+    def test_publishes_struct_datagrams_with_sequence_numbers(self, receiver):
+        publisher = MulticastPublisher(GROUP, receiver.getsockname()[1])
+        try:
+            for _ in range(3):
+                publisher.publish(TRADE)
+            messages = receive(receiver, 3)
+        finally:
+            publisher.close()
+
+        assert [m["seqnum"] for m in messages] == [0, 1, 2]
+        assert messages[0] == {"seqnum": 0, "event": "updated", "channel": "trades", **TRADE}
+        assert publisher.to_dict()["sent"] == 3
+        assert publisher.to_dict()["bytes_sent"] == 3 * len(StructCodec().encode(messages[0]))
+
+    def test_counts_trades_that_cannot_be_encoded(self, receiver):
+        publisher = MulticastPublisher(GROUP, receiver.getsockname()[1])
+        try:
+            publisher.publish({**TRADE, "symbol": "A-VERY-LONG-SYMBOL-NAME"})
+            publisher.publish(TRADE)
+            messages = receive(receiver, 1)
+        finally:
+            publisher.close()
+
+        assert messages[0]["seqnum"] == 0
+        assert publisher.to_dict() == {"next_seqnum": 1, "sent": 1, "bytes_sent": len(StructCodec().encode(messages[0])),
+                                       "errors": 1}
+
+
+class TestMulticastFeed:
+    def test_requires_symbols(self):
+        with pytest.raises(ValueError):
+            MulticastFeed().start(MulticastSettings())
+
+    def test_publishes_at_fixed_rate(self, receiver):
+        clock = VirtualClock()
+        feed = MulticastFeed(clock=clock)
+        feed.start(MulticastSettings(port=receiver.getsockname()[1], symbols=("ETH-USD",), rate=8))
+        try:
+            assert clock.wait_for_sleepers()
+            clock.advance(1.0)
+            messages = receive(receiver, 8)
+        finally:
+            feed.stop()
+
+        assert [m["seqnum"] for m in messages] == list(range(8))
+        assert feed.status()["active"] is False
+        assert all(m["symbol"] == "ETH-USD" for m in messages)
+
+    def test_catches_up_when_rate_exceeds_tick_rate(self, receiver):
+        clock = VirtualClock()
+        feed = MulticastFeed(clock=clock)
+        feed.start(MulticastSettings(port=receiver.getsockname()[1], symbols=("ETH-USD",), rate=4000))
+        try:
+            assert clock.wait_for_sleepers()
+            clock.advance(0.01)
+            messages = receive(receiver, 39)
+            receiver.settimeout(0.1)
+            with pytest.raises(socket.timeout):
+                while True:
+                    messages.append(StructCodec().decode(receiver.recv(1024)))
+        finally:
+            feed.stop()
+
+        assert 39 <= len(messages) <= 41
+        assert [m["seqnum"] for m in messages] == list(range(len(messages)))
+
+    def test_status(self, receiver):
+        feed = MulticastFeed(clock=VirtualClock())
+        assert feed.status() == {"active": False}
+
+        feed.start(MulticastSettings(port=receiver.getsockname()[1], symbols=("ETH-USD",)))
+        status = feed.status()
+        feed.stop()
+
+        assert status["active"] is True
+        assert status["settings"]["symbols"] == ["ETH-USD"]
+        assert status["publisher"]["sent"] == 0
+        assert feed.status() == {"active": False}
@@ -0,0 +1,137 @@
+import pytest
+import cProfile
+import marshal
+import threading
+import time
+from blockchain_api import profiling
+from blockchain_api.profiling import Profiler, ProfilerBusyError, ProfilerDisabledError
+
+
+def busy_work():
+    return sum(i * i for i in range(200))
+
+
+def slow_work():
+    time.sleep(0.005)
+    return busy_work()
+
+
+# Admits one enabled profile at a time, like cProfile on Python 3.12+.
+class ExclusiveProfile(cProfile.Profile):
+    lock = threading.Lock()
+    active = None
+
+    def enable(self):
+        with ExclusiveProfile.lock:
+            if ExclusiveProfile.active not in (None, self):
+                raise ValueError("Another profiling tool is already active")
+            ExclusiveProfile.active = self
+        super().enable()
+
+    def disable(self):
+        super().disable()
+        with ExclusiveProfile.lock:
+            if ExclusiveProfile.active is self:
+                ExclusiveProfile.active = None
+
+
+class Worker:
+    def __init__(self, profiler: Profiler, name: str = "worker-thread", work=busy_work):
+        self._profiler = profiler
+        self._work = work
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.calls = 0
+        self.errors = []
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                assert self._profiler.call(self._work) == busy_work()
+                self.calls += 1
+            except Exception as e:
+                self.errors.append(e)
+            time.sleep(0.001)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+
+class TestProfiler:
+    def test_disabled_by_default(self):
+        profiler = Profiler()
+        with pytest.raises(ProfilerDisabledError):
+            profiler.profile_sampling(0.01)
+
+    def test_call_passes_through_when_not_profiling(self):
+        profiler = Profiler(enabled=True)
+        assert profiler.call(lambda x: x + 1, 1) == 2
+
+    def test_rejects_non_positive_duration(self):
+        with pytest.raises(ValueError):
+            Profiler(enabled=True).profile_sampling(0)
+
+    def test_deterministic_profile_captures_calls_from_other_threads(self):
+        profiler = Profiler(enabled=True)
+        with Worker(profiler):
+            text, raw = profiler.profile_deterministic(0.1)
+        assert "busy_work" in text
+        assert any(key[2] == "busy_work" for key in marshal.loads(raw))
+
+    def test_deterministic_profile_with_many_threads(self, monkeypatch):
+        monkeypatch.setattr(profiling.cProfile, "Profile", ExclusiveProfile)
+        profiler = Profiler(enabled=True)
+        workers = [Worker(profiler, name=f"worker-{i}", work=slow_work) for i in range(4)]
+        for worker in workers:
+            worker.__enter__()
+        try:
+            text, _ = profiler.profile_deterministic(0.2)
+        finally:
+            for worker in workers:
+                worker.__exit__()
+        assert [worker.errors for worker in workers] == [[]] * 4
+        assert all(worker.calls for worker in workers)
+        assert "busy_work" in text
+
+    def test_falls_back_when_another_profiler_is_active(self, monkeypatch):
+        monkeypatch.setattr(profiling.cProfile, "Profile", ExclusiveProfile)
+        other = ExclusiveProfile()
+        other.enable()
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiling._DeterministicSession(process_wide=True).start()
+            session = profiling._DeterministicSession(process_wide=False)
+            assert session.call(busy_work) == busy_work()
+        finally:
+            other.disable()
+
+    def test_deterministic_profile_without_calls(self):
+        text, raw = Profiler(enabled=True).profile_deterministic(0.01)
+        assert "No profiled calls" in text
+        assert marshal.loads(raw) == {}
+
+    def test_sampling_profile_returns_collapsed_stacks_for_all_threads(self):
+        profiler = Profiler(enabled=True)
+        with Worker(profiler):
+            output = profiler.profile_sampling(0.1, interval=0.002, by_thread=True)
+        lines = output.splitlines()
+        assert lines
+        assert any(line.startswith("worker-thread;") for line in lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+
+    def test_concurrent_profiles_are_rejected(self):
+        profiler = Profiler(enabled=True)
+        thread = threading.Thread(target=profiler.profile_sampling, args=(0.2,))
+        thread.start()
+        time.sleep(0.05)
+        with pytest.raises(ProfilerBusyError):
+            profiler.profile_deterministic(0.01)
+        thread.join()
+        assert profiler.is_running is False
@@ -0,0 +1,97 @@
+import pytest
+from blockchain_api.clock import VirtualClock
+from blockchain_api.rate_limiter import (
+    RateLimitSettings,
+    TokenBucket,
+    RateLimitMetrics,
+    InboundRateLimiter,
+)
+
+
+class TestTokenBucket:
+    def test_init_raises_if_rate_not_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=5)
+
+    def test_init_raises_if_capacity_below_one(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0.5)
+
+    def test_allows_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3, clock=VirtualClock())
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_refills_at_rate(self):
+        clock = VirtualClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        bucket.try_acquire()
+        bucket.try_acquire()
+        assert bucket.try_acquire() is False
+        clock.advance(0.5)
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    def test_refill_is_capped_at_capacity(self):
+        clock = VirtualClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        clock.advance(100.0)
+        assert bucket.tokens == 2
+
+
+    def test_configure_changes_rate_and_caps_tokens(self):
+        clock = VirtualClock()
+        bucket = TokenBucket(rate=1, capacity=10, clock=clock)
+        bucket.configure(rate=4, capacity=2)
+        assert bucket.tokens == 2
+        bucket.try_acquire()
+        bucket.try_acquire()
+        clock.advance(0.25)
+        assert bucket.tokens == pytest.approx(1.0)
+
+    def test_configure_with_refill(self):
+        bucket = TokenBucket(rate=1, capacity=1, clock=VirtualClock())
+        bucket.try_acquire()
+        bucket.configure(rate=1, capacity=5, refill=True)
+        assert bucket.tokens == 5
+
+
+class TestRateLimitSettings:
+    def test_from_env_reads_values(self, monkeypatch):
+        monkeypatch.setenv("INBOUND_RATE_LIMIT", "5")
+        monkeypatch.setenv("INBOUND_BURST", "7")
+        settings = RateLimitSettings.from_env()
+        assert settings.rate == 5.0
+        assert settings.burst == 7.0
+
+    def test_zero_rate_disables_limiter(self):
+        assert InboundRateLimiter.from_settings(RateLimitSettings(rate=0)) is None
+
+    def test_rejects_negative_values(self):
+        with pytest.raises(ValueError):
+            RateLimitSettings(rate=-1)
+
+
+class TestInboundRateLimiter:
+    def test_records_requests_and_throttles(self):
+        metrics = RateLimitMetrics()
+        limiter = InboundRateLimiter(TokenBucket(rate=1, capacity=2, clock=VirtualClock()), metrics)
+        results = [limiter.allow() for _ in range(5)]
+        assert results == [True, True, False, False, False]
+        assert limiter.throttled == 3
+        assert metrics.to_dict() == {
+            "connections": 1,
+            "throttled_connections": 1,
+            "requests": 5,
+            "throttled": 3,
+        }
+
+    def test_from_source_applies_live_settings(self):
+        settings = [RateLimitSettings(rate=1, burst=1)]
+        limiter = InboundRateLimiter.from_source(lambda: settings[0], clock=VirtualClock())
+        assert [limiter.allow() for _ in range(2)] == [True, False]
+
+        settings[0] = RateLimitSettings(rate=0)
+        assert all(limiter.allow() for _ in range(5))
+
+        settings[0] = RateLimitSettings(rate=1, burst=3)
+        assert [limiter.allow() for _ in range(4)] == [True, True, True, False]
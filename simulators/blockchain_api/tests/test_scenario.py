@@ -0,0 +1,126 @@
+import pytest
+import json
+from blockchain_api.clock import VirtualClock
+from blockchain_api.scenario import Scenario, ScenarioEngine, ScenarioEvent, MarketConditions
+
+
+FLASH_CRASH = {
+    "name": "flash-crash",
+    "seed": 7,
+    "symbols": {
+        "BTC-USD": [
+            {"at": 10, "type": "rate", "multiplier": 10, "duration": 30},
+            {"at": 20, "type": "price", "change": -0.2, "duration": 2},
+            {"at": 25, "type": "halt", "duration": 10},
+        ],
+        "*": [
+            {"at": 50, "type": "rate", "multiplier": 2, "duration": 5},
+        ],
+    },
+}
+
+
+class TestScenarioEvent:
+    def test_from_dict_parses_fields(self):
+        event = ScenarioEvent.from_dict({"at": 5, "type": "rate", "multiplier": 10, "duration": 30})
+        assert event.at == 5.0
+        assert event.type == "rate"
+        assert event.multiplier == 10.0
+        assert event.end == 35.0
+
+    def test_from_dict_rejects_unknown_type(self):
+        with pytest.raises(ValueError):
+            ScenarioEvent.from_dict({"at": 0, "type": "explode"})
+
+    def test_from_dict_rejects_negative_times(self):
+        with pytest.raises(ValueError):
+            ScenarioEvent.from_dict({"at": -1, "type": "halt", "duration": 1})
+
+    def test_from_dict_rejects_non_positive_multiplier(self):
+        with pytest.raises(ValueError):
+            ScenarioEvent.from_dict({"at": 0, "type": "rate", "multiplier": 0})
+
+    def test_from_dict_rejects_total_price_loss(self):
+        with pytest.raises(ValueError):
+            ScenarioEvent.from_dict({"at": 0, "type": "price", "change": -1.0})
+
+
+class TestScenario:
+    def test_from_dict_requires_symbols(self):
+        with pytest.raises(ValueError):
+            Scenario.from_dict({"name": "empty"})
+
+    def test_from_dict_sorts_events(self):
+        scenario = Scenario.from_dict({"symbols": {"ETH-USD": [
+            {"at": 10, "type": "halt", "duration": 1},
+            {"at": 1, "type": "halt", "duration": 1},
+        ]}})
+        assert [e.at for e in scenario.timeline["ETH-USD"]] == [1.0, 10.0]
+
+    def test_load_reads_json_file(self, tmp_path):
+        path = tmp_path / "scenario.json"
+        path.write_text(json.dumps(FLASH_CRASH))
+        scenario = Scenario.load(str(path))
+        assert scenario.name == "flash-crash"
+        assert scenario.seed == 7
+
+    def test_duration_is_latest_event_end(self):
+        assert Scenario.from_dict(FLASH_CRASH).duration == 55.0
+
+    def test_conditions_before_first_event_are_normal(self):
+        scenario = Scenario.from_dict(FLASH_CRASH)
+        assert scenario.conditions_at("BTC-USD", 5) == MarketConditions()
+
+    def test_rate_multiplier_applies_for_duration(self):
+        scenario = Scenario.from_dict(FLASH_CRASH)
+        assert scenario.conditions_at("BTC-USD", 15).rate_multiplier == 10.0
+        assert scenario.conditions_at("BTC-USD", 41).rate_multiplier == 1.0
+
+    def test_price_change_ramps_and_persists(self):
+        scenario = Scenario.from_dict(FLASH_CRASH)
+        assert scenario.conditions_at("BTC-USD", 21).price_factor == pytest.approx(0.9)
+        assert scenario.conditions_at("BTC-USD", 22).price_factor == pytest.approx(0.8)
+        assert scenario.conditions_at("BTC-USD", 100).price_factor == pytest.approx(0.8)
+
+    def test_halt_applies_for_duration(self):
+        scenario = Scenario.from_dict(FLASH_CRASH)
+        assert scenario.conditions_at("BTC-USD", 30).halted is True
+        assert scenario.conditions_at("BTC-USD", 36).halted is False
+
+    def test_wildcard_events_apply_to_every_symbol(self):
+        scenario = Scenario.from_dict(FLASH_CRASH)
+        assert scenario.conditions_at("ETH-USD", 52).rate_multiplier == 2.0
+        assert scenario.conditions_at("ETH-USD", 15).rate_multiplier == 1.0
+
+
+class TestScenarioEngine:
+    def test_inactive_engine_returns_normal_conditions(self):
+        engine = ScenarioEngine()
+        assert engine.is_active is False
+        assert engine.conditions("BTC-USD") == MarketConditions()
+        assert engine.status() == {"active": False}
+
+    def test_conditions_follow_elapsed_time(self):
+        clock = VirtualClock()
+        engine = ScenarioEngine(clock)
+        engine.start(Scenario.from_dict(FLASH_CRASH))
+        clock.advance(30.0)
+        assert engine.conditions("BTC-USD").halted is True
+        status = engine.status()
+        assert status["active"] is True
+        assert status["elapsed"] == 30.0
+        assert status["symbols"]["BTC-USD"]["halted"] is True
+
+    def test_stop_clears_scenario(self):
+        engine = ScenarioEngine()
+        engine.start(Scenario.from_dict(FLASH_CRASH))
+        engine.stop()
+        assert engine.is_active is False
+
+    def test_random_for_is_repeatable_with_seed(self):
+        engine = ScenarioEngine()
+        engine.start(Scenario.from_dict(FLASH_CRASH))
+        first = [engine.random_for("BTC-USD", "trades").random() for _ in range(3)]
+        second = [engine.random_for("BTC-USD", "trades").random() for _ in range(3)]
+        assert first == second
+        assert engine.random_for("ETH-USD", "trades").random() != first[0]
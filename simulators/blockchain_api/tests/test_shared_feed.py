@@ -0,0 +1,151 @@
+import threading
+import time
+
+from blockchain_api.clock import VirtualClock
+from blockchain_api.config import ConfigManager, SimulatorConfig
+from blockchain_api.shared_feed import SharedTradeFeed
+from blockchain_api.trade_store import TradeStore
+
+
+def blocked_until(release: threading.Event, received: list):
+    def deliver(trade):
+        release.wait()
+        received.append(trade)
+    return deliver
+
+
+class TestSharedTradeFeed:
+    def test_subscribers_receive_the_same_trades(self):
+        feed = SharedTradeFeed(clock=VirtualClock())
+        first, second = [], []
+        feed.subscribe("ETH-USD", first.append)
+        feed.subscribe("ETH-USD", second.append)
+        try:
+            feed.emit("ETH-USD")
+            feed.emit("ETH-USD")
+        finally:
+            feed.stop()
+
+        assert len(first) == 2
+        assert first == second
+        assert first[0]["trade_id"] != first[1]["trade_id"]
+
+    def test_symbols_are_independent(self):
+        feed = SharedTradeFeed(clock=VirtualClock())
+        eth, btc = [], []
+        feed.subscribe("ETH-USD", eth.append)
+        feed.subscribe("BTC-USD", btc.append)
+        try:
+            feed.emit("ETH-USD")
+        finally:
+            feed.stop()
+
+        assert len(eth) == 1
+        assert btc == []
+
+    def test_scheduler_emits_to_every_subscriber(self):
+        clock = VirtualClock()
+        config = ConfigManager(SimulatorConfig())
+        config.update({"emission": {"min_interval": 1.0, "max_interval": 1.0}})
+        feed = SharedTradeFeed(clock=clock, config=config)
+        first, second = [], []
+        feed.subscribe("ETH-USD", first.append)
+        feed.subscribe("ETH-USD", second.append)
+        try:
+            assert clock.wait_for_sleepers()
+            clock.advance(1.0)
+            assert clock.wait_for_sleepers()
+        finally:
+            feed.stop()
+
+        assert len(first) == 1
+        assert first == second
+
+    def test_last_unsubscribe_stops_the_symbol(self):
+        feed = SharedTradeFeed(clock=VirtualClock())
+        received = []
+        first = feed.subscribe("ETH-USD", received.append)
+        second = feed.subscribe("ETH-USD", received.append)
+        feed.unsubscribe("ETH-USD", first)
+        assert feed.subscriber_count("ETH-USD") == 1
+        feed.unsubscribe("ETH-USD", second)
+        assert feed.subscriber_count("ETH-USD") == 0
+
+        feed.emit("ETH-USD")
+        assert received == []
+
+    def test_records_each_trade_once(self):
+        store = TradeStore()
+        feed = SharedTradeFeed(clock=VirtualClock(), trade_store=store)
+        feed.subscribe("ETH-USD", lambda trade: None)
+        feed.subscribe("ETH-USD", lambda trade: None)
+        try:
+            feed.emit("ETH-USD")
+        finally:
+            feed.stop()
+
+        trades, _ = store.query("ETH-USD")
+        assert len(trades) == 1
+
+    def test_slow_subscriber_does_not_hold_up_the_others(self):
+        feed = SharedTradeFeed(clock=VirtualClock(), max_pending=1)
+        release = threading.Event()
+        slow, fast = [], []
+        feed.subscribe("ETH-USD", blocked_until(release, slow))
+        feed.subscribe("ETH-USD", fast.append)
+        try:
+            for _ in range(3):
+                feed.emit("ETH-USD")
+                time.sleep(0.01)
+            deadline = time.monotonic() + 1.0
+            while len(fast) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(fast) == 3
+            assert slow == []
+            assert feed.dropped == 1
+        finally:
+            release.set()
+            feed.stop()
+
+        assert slow == fast[:2]
+
+    def test_status_reports_subscribers_and_drops_per_symbol(self):
+        feed = SharedTradeFeed(clock=VirtualClock(), max_pending=1)
+        release = threading.Event()
+        token = feed.subscribe("ETH-USD", blocked_until(release, []))
+        feed.subscribe("ETH-USD", lambda trade: None)
+        feed.subscribe("BTC-USD", lambda trade: None)
+        try:
+            for _ in range(3):
+                feed.emit("ETH-USD")
+                time.sleep(0.01)
+            assert feed.status() == {
+                "BTC-USD": {"subscribers": 1, "dropped": 0},
+                "ETH-USD": {"subscribers": 2, "dropped": 1},
+            }
+
+            feed.unsubscribe("ETH-USD", token)
+            assert feed.status()["ETH-USD"] == {"subscribers": 1, "dropped": 1}
+        finally:
+            release.set()
+            feed.stop()
+
+        assert feed.status()["ETH-USD"] == {"subscribers": 0, "dropped": 1}
+
+    def test_unsubscribed_connection_gets_no_queued_trades(self):
+        feed = SharedTradeFeed(clock=VirtualClock())
+        release = threading.Event()
+        received = []
+        token = feed.subscribe("ETH-USD", blocked_until(release, received))
+        feed.subscribe("ETH-USD", lambda trade: None)
+        try:
+            feed.emit("ETH-USD")
+            feed.emit("ETH-USD")
+            time.sleep(0.01)
+            feed.unsubscribe("ETH-USD", token)
+            release.set()
+            time.sleep(0.05)
+        finally:
+            feed.stop()
+
+        assert len(received) == 1
@@ -1,5 +1,7 @@
 import pytest
+import random
 from datetime import datetime, timezone
+from blockchain_api.clock import VirtualClock
 from blockchain_api.trade_generator import TradeGenerator
 
 
@@ -81,3 +83,52 @@ class TestTradeGenerator:
         assert len(trades) == 10
         for trade in trades:
             assert trade["symbol"] == "ETH-USD"
+
+    def test_generate_trade_is_repeatable_with_seeded_rng(self):
+        first = TradeGenerator("ETH-USD", rng=random.Random(1))
+        second = TradeGenerator("ETH-USD", rng=random.Random(1))
+        for _ in range(10):
+            a, b = first.generate_trade(), second.generate_trade()
+            assert (a["side"], a["qty"], a["price"]) == (b["side"], b["qty"], b["price"])
+
+    def test_generate_trade_applies_price_factor(self):
+        generator = TradeGenerator("ETH-USD", rng=random.Random(1), volatility=0.0)
+        reference = generator.reference_price
+        trade = generator.generate_trade(price_factor=0.8)
+        assert trade["price"] == pytest.approx(reference * 0.8, abs=0.01)
+
+    def test_init_raises_if_negative_volatility(self):
+        with pytest.raises(ValueError):
+            TradeGenerator("ETH-USD", volatility=-0.1)
+
+    def test_generate_trade_respects_qty_range(self):
+        generator = TradeGenerator("ETH-USD", min_qty=1.0, max_qty=2.0)
+        for _ in range(50):
+            assert 1.0 <= generator.generate_trade()["qty"] <= 2.0
+
+    def test_configure_changes_price_model(self):
+        generator = TradeGenerator("ETH-USD")
+        generator.configure(volatility=0.0, min_qty=5.0, max_qty=5.0)
+        reference = generator.reference_price
+        trade = generator.generate_trade()
+        assert trade["qty"] == 5.0
+        assert generator.reference_price == reference
+
+    def test_configure_rejects_invalid_qty_range(self):
+        with pytest.raises(ValueError):
+            TradeGenerator("ETH-USD").configure(volatility=0.001, min_qty=2.0, max_qty=1.0)
+
+    def test_generate_trade_uses_injected_clock(self):
+        clock = VirtualClock(start=1565695806.10014)
+        generator = TradeGenerator("ETH-USD", clock=clock)
+        trade = generator.generate_trade()
+        assert trade["timestamp"] == "2019-08-13T11:30:06.100140Z"
+        assert trade["trade_id"] == str(int(1565695806.10014 * 1000000) + 1)
+
+    def test_trade_ids_follow_virtual_time(self):
+        clock = VirtualClock()
+        generator = TradeGenerator("ETH-USD", clock=clock)
+        first = int(generator.generate_trade()["trade_id"])
+        clock.advance(1.0)
+        second = int(generator.generate_trade()["trade_id"])
+        assert second - first == 1000001
@@ -0,0 +1,153 @@
+import pytest
+from blockchain_api.trade_store import CursorExpiredError, SymbolHistory, TradeStore
+from blockchain_api.wire_protocol import micros_to_timestamp
+
+
+BASE = 1_705_314_645_000_000
+
+
+def trade(n: int, symbol: str = "ETH-USD") -> dict:
+    return {
+        "symbol": symbol,
+        "timestamp": micros_to_timestamp(BASE + n * 1000),
+        "side": "buy" if n % 2 == 0 else "sell",
+        "qty": 0.5,
+        "price": 2500.0 + n,
+        "trade_id": str(BASE + n),
+    }
+
+
+def fill(store: TradeStore, count: int, symbol: str = "ETH-USD") -> None:
+    for n in range(count):
+        store.record(trade(n, symbol))
+
+
+class TestSymbolHistory:
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            SymbolHistory("ETH-USD", 0)
+
+    def test_evicts_oldest_when_full(self):
+        history = SymbolHistory("ETH-USD", capacity=3)
+        for n in range(5):
+            history.append(BASE + n, 1.0, 1.0, 0, n)
+
+        rows, _ = history.query()
+        assert len(history) == 3
+        assert history.first_id == 2
+        assert [row["trade_id"] for row in rows] == ["2", "3", "4"]
+
+    @pytest.mark.parametrize("appended", [5, 7, 8, 10])
+    def test_search_across_wrapped_buffer(self, appended):
+        history = SymbolHistory("ETH-USD", capacity=5)
+        for n in range(appended):
+            history.append(BASE + n * 10, 1.0, 1.0, 0, n)
+
+        oldest = appended - 5
+        for n in range(oldest, appended):
+            rows, _ = history.query(since=BASE + n * 10 - 5, limit=1)
+            assert rows[0]["trade_id"] == str(n)
+
+    def test_clamps_out_of_order_timestamps(self):
+        history = SymbolHistory("ETH-USD", capacity=10)
+        history.append(BASE + 10, 1.0, 1.0, 0, 1)
+        history.append(BASE + 5, 1.0, 1.0, 0, 2)
+
+        rows, _ = history.query(since=BASE + 10)
+        assert [row["trade_id"] for row in rows] == ["1", "2"]
+
+
+class TestTradeStore:
+    def test_round_trips_trades(self):
+        store = TradeStore(capacity_per_symbol=10)
+        store.record(trade(0))
+        rows, next_cursor = store.query("ETH-USD")
+        assert rows == [trade(0)]
+        assert next_cursor is None
+
+    def test_unknown_symbol_is_empty(self):
+        assert TradeStore().query("DOGE-USD") == ([], None)
+
+    def test_symbols_are_kept_separately(self):
+        store = TradeStore(capacity_per_symbol=10)
+        fill(store, 3, "ETH-USD")
+        fill(store, 2, "BTC-USD")
+        assert len(store.query("ETH-USD")[0]) == 3
+        assert len(store.query("BTC-USD")[0]) == 2
+
+    def test_stops_adding_symbols_at_the_cap(self):
+        store = TradeStore(capacity_per_symbol=10, max_symbols=2)
+        for symbol in ("ETH-USD", "BTC-USD", "SOL-USD"):
+            fill(store, 2, symbol)
+        assert sorted(store.status()) == ["BTC-USD", "ETH-USD"]
+        assert store.query("SOL-USD") == ([], None)
+        fill(store, 1, "ETH-USD")
+        assert store.status()["ETH-USD"]["total"] == 3
+
+    def test_since_is_inclusive_and_until_exclusive(self):
+        store = TradeStore(capacity_per_symbol=100)
+        fill(store, 10)
+        rows, _ = store.query("ETH-USD", since=trade(3)["timestamp"], until=trade(6)["timestamp"])
+        assert [row["trade_id"] for row in rows] == [trade(n)["trade_id"] for n in (3, 4, 5)]
+
+    def test_cursor_pagination_returns_every_trade_once(self):
+        store = TradeStore(capacity_per_symbol=100)
+        fill(store, 25)
+
+        pages = []
+        cursor = None
+        while True:
+            rows, cursor = store.query("ETH-USD", limit=10, cursor=cursor)
+            pages.append(rows)
+            if cursor is None:
+                break
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert [row["trade_id"] for page in pages for row in page] == [trade(n)["trade_id"] for n in range(25)]
+
+    def test_cursor_respects_until(self):
+        store = TradeStore(capacity_per_symbol=100)
+        fill(store, 25)
+        until = trade(15)["timestamp"]
+        rows, cursor = store.query("ETH-USD", until=until, limit=10)
+        rows, cursor = store.query("ETH-USD", until=until, limit=10, cursor=cursor)
+        assert len(rows) == 5
+        assert cursor is None
+
+    def test_evicted_cursor_raises(self):
+        store = TradeStore(capacity_per_symbol=10)
+        fill(store, 10)
+        _, cursor = store.query("ETH-USD", limit=2)
+        fill(store, 10)
+        with pytest.raises(CursorExpiredError):
+            store.query("ETH-USD", cursor=cursor)
+
+    def test_limit_is_capped(self):
+        store = TradeStore(capacity_per_symbol=TradeStore.MAX_LIMIT + 10)
+        fill(store, TradeStore.MAX_LIMIT + 10)
+        rows, cursor = store.query("ETH-USD", limit=10_000)
+        assert len(rows) == TradeStore.MAX_LIMIT
+        assert cursor is not None
+
+    def test_rejects_invalid_limit(self):
+        with pytest.raises(ValueError):
+            TradeStore().query("ETH-USD", limit=0)
+
+    def test_rejects_invalid_timestamp(self):
+        store = TradeStore()
+        fill(store, 1)
+        with pytest.raises(ValueError):
+            store.query("ETH-USD", since="yesterday")
+
+    def test_from_env_reads_capacity(self, monkeypatch):
+        monkeypatch.setenv("TRADE_HISTORY_SIZE", "500")
+        assert TradeStore.from_env().capacity_per_symbol == 500
+
+    def test_status(self):
+        store = TradeStore(capacity_per_symbol=5)
+        fill(store, 7)
+        status = store.status()["ETH-USD"]
+        assert status["count"] == 5
+        assert status["total"] == 7
+        assert status["oldest"] == trade(2)["timestamp"]
+        assert status["newest"] == trade(6)["timestamp"]
@@ -2,6 +2,7 @@ import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
 from blockchain_api.websocket_handler import WebSocketHandler
+from blockchain_api.wire_protocol import MsgPackCodec, StructCodec
 
 
 class TestWebSocketHandler:
@@ -186,3 +187,65 @@ class TestWebSocketHandler:
         assert update_data["price"] == 11252.4
         assert update_data["trade_id"] == "12884909920"
         assert "seqnum" in update_data
+
+    def test_rate_limited_request_rejected(self):
+        limiter = Mock()
+        limiter.allow.return_value = False
+        handler = WebSocketHandler(rate_limiter=limiter)
+
+        response = handler.handle_message(json.dumps({
+            "action": "subscribe",
+            "channel": "trades",
+            "symbol": "ETH-USD"
+        }))
+        response_data = json.loads(response)
+
+        assert response_data["event"] == "rejected"
+        assert response_data["text"] == "Rate limit exceeded"
+        assert handler.is_subscribed("ETH-USD") is False
+
+    def test_handle_request_returns_response_dict(self):
+        handler = WebSocketHandler()
+        response = handler.handle_request(json.dumps({
+            "action": "subscribe",
+            "channel": "trades",
+            "symbol": "ETH-USD"
+        }))
+
+        assert response["event"] == "subscribed"
+        assert response["symbol"] == "ETH-USD"
+
+    def test_responses_use_codec(self):
+        handler = WebSocketHandler(codec=MsgPackCodec())
+        response = handler.handle_message(json.dumps({
+            "action": "subscribe",
+            "channel": "trades",
+            "symbol": "ETH-USD"
+        }))
+
+        assert isinstance(response, bytes)
+        assert MsgPackCodec().decode(response)["event"] == "subscribed"
+
+    def test_subscribe_to_unsupported_symbol_rejected(self):
+        handler = WebSocketHandler(supports_symbol=lambda symbol: symbol == "ETH-USD")
+        response = json.loads(handler.handle_message(json.dumps({
+            "action": "subscribe",
+            "channel": "trades",
+            "symbol": "DOGE-USD"
+        })))
+
+        assert response["event"] == "rejected"
+        assert response["text"] == "Symbol 'DOGE-USD' is not supported"
+        assert not handler.is_subscribed("DOGE-USD")
+
+    def test_subscribe_to_symbol_the_codec_cannot_encode_rejected(self):
+        handler = WebSocketHandler(codec=StructCodec())
+        response = json.loads(handler.handle_message(json.dumps({
+            "action": "subscribe",
+            "channel": "trades",
+            "symbol": "VERY-LONG-SYMBOL-USD"
+        })))
+
+        assert response["event"] == "rejected"
+        assert response["text"] == "Symbol 'VERY-LONG-SYMBOL-USD' cannot be sent with the struct wire protocol"
+        assert not handler.is_subscribed("VERY-LONG-SYMBOL-USD")
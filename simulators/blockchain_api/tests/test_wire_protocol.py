@@ -0,0 +1,112 @@
+import pytest
+import json
+from blockchain_api.wire_protocol import (
+    MSGPACK_SUBPROTOCOL,
+    STRUCT_SUBPROTOCOL,
+    TRADE_STRUCT,
+    JsonCodec,
+    MsgPackCodec,
+    StructCodec,
+    codec_for_name,
+    codec_for_subprotocol,
+    micros_to_timestamp,
+    supported_subprotocols,
+    timestamp_to_micros,
+)
+
+
+UPDATE = {
+    "seqnum": 7,
+    "event": "updated",
+    "channel": "trades",
+    "symbol": "ETH-USD",
+    "timestamp": "2019-08-13T11:30:06.100140Z",
+    "side": "sell",
+    "qty": 8.5e-5,
+    "price": 11252.4,
+    "trade_id": "12884909920",
+}
+SUBSCRIBED = {"seqnum": 0, "event": "subscribed", "channel": "trades", "symbol": "ETH-USD"}
+REJECTED = {"seqnum": 1, "event": "rejected", "text": "Channel 'l2' is not supported"}
+
+
+class TestTimestampConversion:
+    def test_timestamp_to_micros(self):
+        assert timestamp_to_micros("2019-08-13T11:30:06.100140Z") == 1565695806100140
+
+    def test_timestamp_to_micros_without_fraction(self):
+        assert timestamp_to_micros("2019-08-13T11:30:06Z") == 1565695806000000
+
+    def test_micros_to_timestamp(self):
+        assert micros_to_timestamp(1565695806100140) == "2019-08-13T11:30:06.100140Z"
+
+    def test_round_trip(self):
+        for timestamp in ("2024-01-15T10:30:45.123456Z", "2024-01-15T10:30:45.000001Z"):
+            assert micros_to_timestamp(timestamp_to_micros(timestamp)) == timestamp
+
+
+class TestJsonCodec:
+    def test_encodes_text(self):
+        frame = JsonCodec().encode(UPDATE)
+        assert isinstance(frame, str)
+        assert json.loads(frame) == UPDATE
+
+
+class TestMsgPackCodec:
+    @pytest.mark.parametrize("message", [UPDATE, SUBSCRIBED, REJECTED])
+    def test_round_trip(self, message):
+        codec = MsgPackCodec()
+        frame = codec.encode(message)
+        assert isinstance(frame, bytes)
+        assert codec.decode(frame) == message
+
+    def test_smaller_than_json(self):
+        assert len(MsgPackCodec().encode(UPDATE)) < len(JsonCodec().encode(UPDATE))
+
+
+class TestStructCodec:
+    def test_trade_uses_fixed_layout(self):
+        frame = StructCodec().encode(UPDATE)
+        assert isinstance(frame, bytes)
+        assert len(frame) == TRADE_STRUCT.size
+
+    def test_trade_round_trip(self):
+        codec = StructCodec()
+        assert codec.decode(codec.encode(UPDATE)) == UPDATE
+
+    @pytest.mark.parametrize("message", [SUBSCRIBED, REJECTED])
+    def test_control_messages_stay_json(self, message):
+        codec = StructCodec()
+        frame = codec.encode(message)
+        assert isinstance(frame, str)
+        assert codec.decode(frame) == message
+
+    def test_rejects_symbol_too_long_for_layout(self):
+        with pytest.raises(ValueError):
+            StructCodec().encode({**UPDATE, "symbol": "A-VERY-LONG-SYMBOL-NAME"})
+
+    def test_supports_symbols_that_fit_the_layout(self):
+        codec = StructCodec()
+        assert codec.supports_symbol("ETH-USD")
+        assert codec.supports_symbol("A" * 16)
+        assert not codec.supports_symbol("A-VERY-LONG-SYMBOL-NAME")
+        assert JsonCodec().supports_symbol("A-VERY-LONG-SYMBOL-NAME")
+
+
+class TestCodecSelection:
+    def test_codec_for_name(self):
+        assert isinstance(codec_for_name("json"), JsonCodec)
+        assert isinstance(codec_for_name("msgpack"), MsgPackCodec)
+        assert isinstance(codec_for_name("struct"), StructCodec)
+
+    def test_codec_for_unknown_name_raises(self):
+        with pytest.raises(ValueError):
+            codec_for_name("xml")
+
+    def test_codec_for_subprotocol(self):
+        assert isinstance(codec_for_subprotocol(MSGPACK_SUBPROTOCOL), MsgPackCodec)
+        assert isinstance(codec_for_subprotocol(STRUCT_SUBPROTOCOL), StructCodec)
+        assert isinstance(codec_for_subprotocol(None), JsonCodec)
+
+    def test_supported_subprotocols(self):
+        assert supported_subprotocols() == [MSGPACK_SUBPROTOCOL, STRUCT_SUBPROTOCOL]
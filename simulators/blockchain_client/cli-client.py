@@ -1,18 +1,39 @@
+import argparse
 import asyncio
 import json
-import logging
 import os
-import sys
+import statistics
+import threading
+import time
 import datetime
+from collections.abc import Mapping
 
 from dotenv import load_dotenv
-from signalrcore.hub_connection_builder import HubConnectionBuilder
 from disconnect_controls import *
+from feed_client import (
+    BackoffPolicy,
+    ContinuityTracker,
+    Dashboard,
+    DashboardState,
+    HubRpcClient,
+    JsonRpcError,
+    NdjsonWriter,
+    RollingStats,
+    add_record_arguments,
+    build_hub_connection,
+    decode_frame,
+    format_summary,
+    latency_ms,
+    recorder_from_args,
+    save_histogram,
+)
+from feed_client.analytics import TradeAnalytics, add_analytics_arguments, analytics_from_args
 
 load_dotenv()
 
-SYMBOLS = ["ETH-USD", "BTC-USD"]
+SYMBOLS = os.getenv("SYMBOLS", "ETH-USD,BTC-USD").split(",")
 SIGNALR_URL = os.getenv("SIGNALR_URL")
+BATCH_SIZE = int(os.getenv("JSONRPC_BATCH_SIZE", "0")) or None
 BLOCKCHAIN_URL = f"{SIGNALR_URL}/blockchain"
 
 
@@ -20,10 +41,12 @@ def print_separator():
     print("\n" + "=" * 60 + "\n")
 
 
+# Messages are printed whole, so they are parsed in full, with orjson when it
+# is installed.
 def try_parse_json(value: any) -> any:
     if isinstance(value, str):
         try:
-            return json.loads(value)
+            return decode_frame(value)
         except json.JSONDecodeError:
             return value
     return value
@@ -37,14 +60,14 @@ def print_json(data: any, label: str = "Response") -> None:
         parsed_items = [try_parse_json(item) for item in data]
         for item in parsed_items:
             print(
-                json.dumps(item, indent=2) if isinstance(item, (dict, list)) else item
+                json.dumps(item, indent=2, default=dict) if isinstance(item, (Mapping, list)) else item
             )
         return
 
     # non-list data: try parse once
     parsed = try_parse_json(data)
-    if isinstance(parsed, (dict, list)):
-        print(json.dumps(parsed, indent=2))
+    if isinstance(parsed, (Mapping, list)):
+        print(json.dumps(parsed, indent=2, default=dict))
     else:
         print(parsed)
 
@@ -53,44 +76,25 @@ def select_symbol() -> str:
     print("\nAvailable symbols:")
     for i, symbol in enumerate(SYMBOLS, 1):
         print(f"  {i}. {symbol}")
+    choices = " or ".join(str(i) for i in range(1, len(SYMBOLS) + 1)) if len(SYMBOLS) <= 2 else f"1-{len(SYMBOLS)}"
 
     while True:
         try:
-            choice = input("\nSelect a symbol (1 or 2): ").strip()
+            choice = input(f"\nSelect a symbol ({choices}): ").strip()
             index = int(choice) - 1
             if 0 <= index < len(SYMBOLS):
                 return SYMBOLS[index]
-            print("Invalid choice. Please enter 1 or 2.")
+            print(f"Invalid choice. Please enter {choices}.")
         except ValueError:
             print("Invalid input. Please enter a number.")
 
 
-def create_subscribe_request(symbol: str) -> str:
-    request = {
-        "jsonrpc": "2.0",
-        "method": "subscribe",
-        "params": {"channel": "trades", "symbol": symbol},
-        "id": "1",
-    }
-    return json.dumps(request)
-
-
-def create_unsubscribe_request(symbol: str) -> str:
-    request = {
-        "jsonrpc": "2.0",
-        "method": "unsubscribe",
-        "params": {"channel": "trades", "symbol": symbol},
-        "id": "2",
-    }
-    return json.dumps(request)
-
-
-def create_malformed_request() -> str:
+def create_malformed_request(request_id: str) -> str:
     request = {
         "jsonrpc": "2.0",
         "method": "subscribe",
         "params": {"channel": "invalid_channel", "symbol": "INVALID-SYMBOL"},
-        "id": "bad-request",
+        "id": request_id,
     }
     return json.dumps(request)
 
@@ -105,6 +109,12 @@ def on_message_received(message):
     print_json(message, "Message Received")
 
 
+def on_request_sent(message: str):
+    if _current_controller and _current_controller.is_print_paused():
+        return
+    print_json(message, "Sending Request")
+
+
 def on_error(error):
     print(f"[Error] {error}")
 
@@ -117,43 +127,120 @@ def on_open():
     print("[Connection Opened]")
 
 
-def build_hub_connection():
-    hub_connection = (
-        HubConnectionBuilder()
-        .with_url(BLOCKCHAIN_URL)
-        .configure_logging(logging_level=logging.CRITICAL)
-        .with_automatic_reconnect(
-            {
-                "type": "raw",
-                "keep_alive_interval": 10,
-                "reconnect_interval": 5,
-                "max_attempts": 5,
-            }
-        )
-        .build()
+def parse_hub_message(message) -> list[dict]:
+    items = message if isinstance(message, list) else [message]
+    return [parsed for parsed in map(try_parse_json, items) if isinstance(parsed, Mapping)]
+
+
+class LatencyMonitor:
+    def __init__(self, window: float = 5.0, recorder=None, analytics: TradeAnalytics | None = None):
+        self.stats = RollingStats(window)
+        self.recorder = recorder
+        self.analytics = analytics
+        self._lock = threading.Lock()
+
+    def on_message(self, message):
+        received_at = time.time()
+        with self._lock:
+            for parsed in parse_hub_message(message):
+                self.stats.record(latency_ms(parsed, received_at))
+                if self.recorder is not None:
+                    self.recorder.record(parsed, received_at)
+                if self.analytics is not None:
+                    self.analytics.record(parsed, received_at)
+
+    def report(self, analytics: bool = False) -> str:
+        with self._lock:
+            report = RollingStats.format(self.stats.snapshot())
+            if analytics and self.analytics is not None:
+                report += "\n" + TradeAnalytics.format(self.analytics.snapshot())
+            return report
+
+
+def print_state(state: str) -> None:
+    print(f"[Connection] {state}")
+
+
+def print_outage(report) -> None:
+    print(f"[Reconnect] {report.format()}")
+
+
+def report_failures(label: str, symbols: list[str], results: list) -> None:
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, BaseException):
+            print(f"[{label}] {symbol}: {result}")
+
+
+# Hands the decoded items on, so the message is only parsed once.
+def track_continuity(on_message, continuity: ContinuityTracker, on_outage=print_outage):
+    def handle(message):
+        items = [try_parse_json(item) for item in (message if isinstance(message, list) else [message])]
+        for parsed in items:
+            if isinstance(parsed, Mapping):
+                report = continuity.observe(parsed)
+                if report is not None:
+                    on_outage(report)
+        on_message(items)
+
+    return handle
+
+
+# After an unexpected close the client restarts the hub with jittered backoff
+# and resubscribes to everything it was subscribed to.
+def create_client(
+    url: str = BLOCKCHAIN_URL,
+    on_message=on_message_received,
+    continuity: ContinuityTracker | None = None,
+    on_state=print_state,
+    on_outage=print_outage,
+    on_request=None,
+    on_open=on_open,
+    on_close=on_close,
+    batch_size: int | None = BATCH_SIZE,
+) -> HubRpcClient:
+    hub_connection = build_hub_connection(url, on_error=on_error)
+    if continuity is not None:
+        on_message = track_continuity(on_message, continuity, on_outage)
+
+    def on_disconnect():
+        if continuity is not None:
+            continuity.connection_lost("connection lost")
+        on_state("connection lost, reconnecting")
+
+    def on_reconnect(attempts: int):
+        if continuity is not None:
+            continuity.connection_restored(attempts)
+        on_state(f"reconnected after {attempts} attempt(s), resubscribing")
+
+    return HubRpcClient(
+        hub_connection,
+        on_message=on_message,
+        on_open=on_open,
+        on_close=on_close,
+        on_reconnect=on_reconnect,
+        on_request=on_request,
+        on_state=on_state,
+        on_disconnect=on_disconnect,
+        policy=BackoffPolicy.from_env(),
+        batch_size=batch_size,
     )
-    hub_connection.on_open(on_open)
-    hub_connection.on_close(on_close)
-    hub_connection.on_error(on_error)
-    hub_connection.on("ReceiveMessage", on_message_received)
-    return hub_connection
 
 
 class SignalRDisconnectController(DisconnectController):
-    def __init__(self, hub_connection, symbol: str):
+    def __init__(self, client: HubRpcClient, symbols: list[str], continuity: ContinuityTracker | None = None):
         super().__init__()
-        self.hub = hub_connection
-        self.symbol = symbol
+        self.client = client
+        self.hub = client.hub
+        self.symbols = symbols
+        self.continuity = continuity
 
     async def on_graceful_disconnect(self):
         print("[Graceful Disconnect] Unsubscribing and closing connection...")
         try:
-            unsubscribe_request = create_unsubscribe_request(self.symbol)
-            self.hub.send("SendMessage", [unsubscribe_request])
-            await asyncio.sleep(1.0)
-            if self.hub.transport and self.hub.transport.state == 1:
+            report_failures("Graceful Disconnect", self.symbols, await self.client.unsubscribe_all(self.symbols))
+            if self.hub.transport and self.hub.transport.is_connected():
                 print("[Graceful Disconnect] connection not closed by host - closing hub connection manually")
-                self.hub.transport.stop()
+                await self.client.stop()
             else:
                 print("[Graceful Disconnect] Connection closed cleanly")
         except Exception as e:
@@ -162,43 +249,49 @@ class SignalRDisconnectController(DisconnectController):
     async def on_abrupt_disconnect(self):
         print("[Abrupt Disconnect] Terminating connection immediately...")
         try:
-            if self.hub.transport:
-                self.hub.transport.stop()
+            self.client.abort()
         except Exception as e:
             print(f"[Abrupt Disconnect] Error: {e}")
 
     async def on_temporary_drop(self, delay_seconds: int):
         print(f"[Temporary Drop] Dropping connection for {delay_seconds} seconds...")
+        if self.continuity is not None:
+            self.continuity.connection_lost(f"temporary drop ({delay_seconds}s)")
         try:
             if self.hub.transport:
-                self.hub.stop()
+                await self.client.stop()
             print("[Temporary Drop] Connection dropped")
         except Exception as e:
             print(f"[Temporary Drop] Error: {e}")
 
     async def on_reconnect(self):
-        pass
+        print(f"[Reconnect] Resubscribing to {', '.join(self.symbols)}")
+        if self.continuity is not None:
+            self.continuity.connection_restored()
+        report_failures("Reconnect", self.symbols, await self.client.subscribe_all(self.symbols))
 
 
 async def connect_and_subscribe_with_controls(symbol: str):
     global _current_controller
     should_connect = True
+    continuity = ContinuityTracker(track_gaps=False)
+    controller = None
 
     while should_connect:
         should_connect = False
-        hub_connection = build_hub_connection()
-        controller = SignalRDisconnectController(hub_connection, symbol)
+        reconnecting = controller is not None and controller._should_reconnect
+        client = create_client(continuity=continuity, on_request=on_request_sent)
+        controller = SignalRDisconnectController(client, [symbol], continuity)
         _current_controller = controller
 
         try:
-            hub_connection.start()
             print(f"Connecting to {BLOCKCHAIN_URL}...")
+            await client.start()
 
-            await asyncio.sleep(1)
-
-            subscribe_request = create_subscribe_request(symbol)
-            print_json(subscribe_request, "Sending Subscribe Request")
-            hub_connection.send("SendMessage", [subscribe_request])
+            if reconnecting:
+                await controller.on_reconnect()
+            else:
+                await client.subscribe(symbol)
 
             print(f"Subscribed to trades for {symbol}")
             print("Listening for trade updates...")
@@ -207,18 +300,70 @@ async def connect_and_subscribe_with_controls(symbol: str):
             controller.input_handler.show_commands()
 
             while controller._running:
-                user_input = await asyncio.to_thread(
-                    lambda: input() if sys.stdin.isatty() else ""
-                )
-                if user_input:
-                    mode = DisconnectMode.from_key(user_input.strip())
-                    if mode:
-                        await controller.handle_command(mode)
-                        if not controller._running:
-                            break
-                    else:
-                        print(f"Unknown command: {user_input}")
-                        controller.input_handler.show_commands()
+                key = await controller.input_handler.next_key()
+                if key is None:
+                    break
+                mode = DisconnectMode.from_key(key)
+                if mode:
+                    await controller.handle_command(mode)
+                    if not controller._running:
+                        break
+                else:
+                    print(f"Unknown command: {key}")
+                    controller.input_handler.show_commands()
+
+            if controller._should_reconnect:
+                print("\n[Reconnect] Re-establishing connection...")
+                should_connect = True
+
+        except KeyboardInterrupt:
+            print("\nInterrupted by user, performing graceful disconnect...")
+            await controller.on_graceful_disconnect()
+        except Exception as e:
+            print(f"\nError: {e}")
+            print(f"Make sure the server is running at {BLOCKCHAIN_URL}")
+            await client.stop()
+
+
+async def connect_and_subscribe_dashboard(symbols: list[str]):
+    # Relayed trades carry the DataServer's upstream seqnum, which spans symbols
+    # this client may not subscribe to, so gaps are not meaningful here.
+    state = DashboardState(symbols, track_gaps=False)
+    dashboard = Dashboard(state, title=f"DataServer live view - {BLOCKCHAIN_URL}")
+    continuity = ContinuityTracker(track_gaps=False)
+    should_connect = True
+    controller = None
+
+    def on_message(message):
+        received_at = time.time()
+        for parsed in parse_hub_message(message):
+            state.observe(parsed, received_at)
+
+    while should_connect:
+        should_connect = False
+        state.set_connection("connecting")
+        reconnecting = controller is not None and controller._should_reconnect
+        client = create_client(
+            on_message=on_message,
+            continuity=continuity,
+            on_state=state.set_connection,
+            on_outage=lambda report: state.note(report.format()),
+            on_open=lambda: state.set_connection("connected"),
+            on_close=lambda: state.set_connection("disconnected"),
+        )
+        client.hub.on_error(lambda error: state.set_connection(f"error: {error}"))
+        controller = SignalRDisconnectController(client, symbols, continuity)
+
+        try:
+            await client.start()
+            if reconnecting:
+                await controller.on_reconnect()
+            else:
+                for symbol, result in zip(symbols, await client.subscribe_all(symbols)):
+                    if isinstance(result, BaseException):
+                        state.note(f"subscribe {symbol} failed: {result}")
+
+            await dashboard.run(controller)
 
             if controller._should_reconnect:
                 print("\n[Reconnect] Re-establishing connection...")
@@ -230,21 +375,16 @@ async def connect_and_subscribe_with_controls(symbol: str):
         except Exception as e:
             print(f"\nError: {e}")
             print(f"Make sure the server is running at {BLOCKCHAIN_URL}")
-            hub_connection.stop()
+            await client.stop()
 
 
 async def connect_and_subscribe(symbol: str):
-    hub_connection = build_hub_connection()
+    client = create_client(continuity=ContinuityTracker(track_gaps=False), on_request=on_request_sent)
 
     try:
-        hub_connection.start()
         print(f"\nConnecting to {BLOCKCHAIN_URL}...")
-
-        await asyncio.sleep(1)
-
-        subscribe_request = create_subscribe_request(symbol)
-        print_json(subscribe_request, "Sending Subscribe Request")
-        hub_connection.send("SendMessage", [subscribe_request])
+        await client.start()
+        await client.subscribe(symbol)
 
         print(f"Subscribed to trades for {symbol}")
         print("Listening for trade updates... (Press Ctrl+C to stop)")
@@ -255,39 +395,176 @@ async def connect_and_subscribe(symbol: str):
 
     except KeyboardInterrupt:
         print("Unsubscribing and disconnecting...")
-        unsubscribe_request = create_unsubscribe_request(symbol)
-        hub_connection.send("SendMessage", [unsubscribe_request])
-        await asyncio.sleep(0.5)
-        hub_connection.stop()
+        try:
+            await client.unsubscribe(symbol)
+        finally:
+            await client.stop()
         print("Disconnected by user")
     except Exception as e:
         print(f"\nError: {e}")
         print(f"Make sure the server is running at {BLOCKCHAIN_URL}")
-        hub_connection.stop()
+        await client.stop()
 
 
 async def send_malformed_request():
-    hub_connection = build_hub_connection()
+    client = create_client()
 
     try:
-        hub_connection.start()
         print(f"\nConnecting to {BLOCKCHAIN_URL}...")
+        await client.start()
 
-        await asyncio.sleep(1)
-
-        malformed_request = create_malformed_request()
+        malformed_request = create_malformed_request(client.next_id())
         print_json(malformed_request, "Sending Malformed Request")
-        hub_connection.send("SendMessage", [malformed_request])
-
-        await asyncio.sleep(2)
+        try:
+            await client.request(malformed_request)
+            print("Malformed request was unexpectedly accepted")
+        except JsonRpcError:
+            pass
 
-        hub_connection.stop()
+        await client.stop()
         print("Disconnected after receiving error response")
 
     except Exception as e:
         print(f"\nError: {e}")
         print(f"Make sure the server is running at {BLOCKCHAIN_URL}")
-        hub_connection.stop()
+        await client.stop()
+
+
+async def run_latency(args: argparse.Namespace):
+    url = f"{args.url}/blockchain"
+    recorder = recorder_from_args(args)
+    bars = NdjsonWriter(args.bars_output) if args.bars_output else None
+    analytics = analytics_from_args(args, on_bar=(lambda bar: bars.write(bar.to_dict())) if bars is not None else None)
+    monitor = LatencyMonitor(args.window, recorder, analytics)
+    continuity = ContinuityTracker(track_gaps=False)
+    client = create_client(url, on_message=monitor.on_message, continuity=continuity, batch_size=args.batch_size)
+
+    try:
+        print(f"Connecting to {url}...")
+        await client.start()
+        started = time.perf_counter()
+        report_failures("Subscribe", args.symbols, await client.subscribe_all(args.symbols))
+        print(f"Subscribed to {', '.join(args.symbols)} in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+        async with asyncio.timeout(args.duration or None):
+            while True:
+                await asyncio.sleep(args.stats_interval)
+                print(monitor.report(args.analytics), flush=True)
+    except (TimeoutError, KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    except Exception as e:
+        print(f"\nError: {e}")
+        print(f"Make sure the server is running at {url}")
+    finally:
+        try:
+            await client.unsubscribe_all(list(client.subscriptions))
+        except Exception:
+            pass
+        await client.stop()
+        if recorder is not None:
+            recorder.close()
+        if analytics is not None:
+            analytics.flush()
+        if bars is not None:
+            bars.close()
+
+    histogram = monitor.stats.histogram
+    print(f"\n{monitor.stats.messages} messages ({monitor.stats.trades} trades)")
+    outages = continuity.summary()
+    if outages["outages"]:
+        print(f"{outages['outages']} reconnect(s), ~{outages['estimated_lost']} trades lost, "
+              f"{outages['duplicates']} duplicate(s)")
+    print(format_summary(histogram.summary()))
+    if recorder is not None:
+        print(f"{recorder.written} trades recorded to {len(recorder.files)} file(s) in {recorder.directory}")
+    if args.analytics:
+        print(TradeAnalytics.format(analytics.snapshot()))
+    if bars is not None:
+        print(f"{bars.lines} OHLCV bars written to {bars.path}")
+    if args.histogram_output:
+        save_histogram(args.histogram_output, histogram, label=args.label)
+        print(f"Latency histogram written to {args.histogram_output}")
+
+
+async def subscribe_sequential(client: HubRpcClient, symbols: list[str]) -> list:
+    results = []
+    for symbol in symbols:
+        try:
+            results.append(await client.subscribe(symbol))
+        except (JsonRpcError, ConnectionError, TimeoutError) as e:
+            results.append(e)
+    return results
+
+
+SUBSCRIBE_STRATEGIES = {
+    "sequential": subscribe_sequential,
+    "pipelined": lambda client, symbols: asyncio.gather(*(client.subscribe(symbol) for symbol in symbols),
+                                                        return_exceptions=True),
+    "batch": lambda client, symbols: client.subscribe_batch(symbols),
+}
+
+
+def format_subscribe_bench(timings: dict[str, list[float]], errors: dict[str, int]) -> str:
+    lines = [f"{'strategy':<12}{'min_ms':>10}{'median_ms':>12}{'max_ms':>10}{'errors':>8}"]
+    for strategy, values in timings.items():
+        lines.append(f"{strategy:<12}{min(values):>10.1f}{statistics.median(values):>12.1f}"
+                     f"{max(values):>10.1f}{errors[strategy]:>8}")
+    return "\n".join(lines)
+
+
+# Each round opens a fresh hub connection and times connect-to-fully-
+# subscribed. Symbols are repeated to reach --count requests; every request
+# is unsubscribed again before the connection closes, so the DataServer's
+# per-symbol reference counts end where they started.
+async def run_subscribe_bench(args: argparse.Namespace):
+    url = f"{args.url}/blockchain"
+    symbols = [args.symbols[index % len(args.symbols)] for index in range(args.count or len(args.symbols))]
+    timings: dict[str, list[float]] = {strategy: [] for strategy in SUBSCRIBE_STRATEGIES}
+    errors = dict.fromkeys(SUBSCRIBE_STRATEGIES, 0)
+    print(f"Subscribing to {len(symbols)} symbol(s) at {url}, {args.rounds} round(s) per strategy")
+
+    for _ in range(args.rounds):
+        for strategy, subscribe in SUBSCRIBE_STRATEGIES.items():
+            client = HubRpcClient(build_hub_connection(url, on_error=on_error), batch_size=args.batch_size or 100)
+            started = time.perf_counter()
+            try:
+                await client.start()
+                results = await subscribe(client, symbols)
+                timings[strategy].append((time.perf_counter() - started) * 1000)
+                errors[strategy] += sum(isinstance(result, BaseException) for result in results)
+                await client.unsubscribe_batch(symbols)
+            except Exception as e:
+                print(f"\nError: {e}")
+                print(f"Make sure the server is running at {url}")
+                return
+            finally:
+                await client.stop()
+
+    print(format_subscribe_bench(timings, errors))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Blockchain API SignalR test client")
+    parser.add_argument("--latency", action="store_true",
+                        help="Measure end-to-end trade latency without the menu")
+    parser.add_argument("--subscribe-bench", action="store_true",
+                        help="Compare connect-to-subscribed time for sequential, pipelined and batch requests")
+    parser.add_argument("--url", default=SIGNALR_URL, help="DataServer SignalR base URL")
+    parser.add_argument("--symbols", type=lambda value: [s.strip() for s in value.split(",") if s.strip()],
+                        default=SYMBOLS, help="Comma-separated symbols to subscribe to")
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to run for (0 runs until Ctrl+C)")
+    add_record_arguments(parser)
+    add_analytics_arguments(parser)
+    parser.add_argument("--histogram-output", help="Write the run's latency histogram to this JSON file")
+    parser.add_argument("--label", default="relayed", help="Name for this run in histogram comparisons")
+    parser.add_argument("--stats-interval", type=float, default=1.0, help="Seconds between latency reports")
+    parser.add_argument("--window", type=float, default=5.0, help="Seconds of history in the throughput rate")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Send subscriptions as JSON-RPC batches of up to this many requests")
+    parser.add_argument("--count", type=int, default=0,
+                        help="Requests per benchmark round, repeating --symbols (default: one per symbol)")
+    parser.add_argument("--rounds", type=int, default=5, help="Benchmark rounds per strategy")
+    return parser.parse_args(argv)
 
 
 def show_menu() -> str:
@@ -295,16 +572,25 @@ def show_menu() -> str:
     print("  1. Subscribe to trades (with disconnect controls)")
     print("  2. Subscribe to trades (simple mode)")
     print("  3. Send malformed request (test error handling)")
-    print("  4|q. Exit")
+    print("  4. Live dashboard (all symbols, with disconnect controls)")
+    print("  5|q. Exit")
 
     while True:
-        choice = input("\nSelect an option (1-4): ").strip()
-        if choice in ["1", "2", "3", "4", "q"]:
+        choice = input("\nSelect an option (1-5): ").strip()
+        if choice in ["1", "2", "3", "4", "5", "q"]:
             return choice
-        print("Invalid choice. Please enter 1, 2, 3, 4 or q.")
+        print("Invalid choice. Please enter 1, 2, 3, 4, 5 or q.")
 
 
 def main():
+    args = parse_args()
+    if args.latency:
+        asyncio.run(run_latency(args))
+        return
+    if args.subscribe_bench:
+        asyncio.run(run_subscribe_bench(args))
+        return
+
     print("=" * 60)
     print("  Blockchain API SignalR Test Client")
     print("=" * 60)
@@ -325,7 +611,10 @@ def main():
         elif choice == "3":
             input("Press Enter to send a malformed request...\n")
             asyncio.run(send_malformed_request())
-        elif choice == "4" or choice == "q":
+        elif choice == "4":
+            input(f"Press Enter to open the live view for {', '.join(SYMBOLS)}...\n")
+            asyncio.run(connect_and_subscribe_dashboard(SYMBOLS))
+        elif choice == "5" or choice == "q":
             print("\nGoodbye!")
             break
 
@@ -1,5 +1,16 @@
 from .modes import DisconnectMode
+from .stdin_reader import StdinReader
 from .input_handler import InputHandler
 from .controller import DisconnectController
+from .scenario import DisconnectRecord, DisconnectScenario, DisconnectStep, ScenarioRunner
 
-__all__ = ["DisconnectMode", "InputHandler", "DisconnectController"]
+__all__ = [
+    "DisconnectMode",
+    "StdinReader",
+    "InputHandler",
+    "DisconnectController",
+    "DisconnectRecord",
+    "DisconnectScenario",
+    "DisconnectStep",
+    "ScenarioRunner",
+]
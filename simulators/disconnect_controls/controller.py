@@ -15,6 +15,9 @@ class DisconnectController(ABC):
     def is_print_paused(self) -> bool:
         return self._print_paused
 
+    def is_running(self) -> bool:
+        return self._running
+
     @abstractmethod
     async def on_graceful_disconnect(self):
         pass
@@ -33,6 +36,7 @@ class DisconnectController(ABC):
 
     def stop(self):
         self._running = False
+        self.input_handler.close()
 
     async def handle_command(self, mode: DisconnectMode):
         if mode == DisconnectMode.QUIT:
@@ -67,7 +71,7 @@ class DisconnectController(ABC):
     async def run_input_loop(self):
         self.input_handler.show_commands()
         while self._running:
-            mode = await self.input_handler.check_for_command()
-            if mode:
-                await self.handle_command(mode)
-            await asyncio.sleep(0.1)
+            mode = await self.input_handler.next_command()
+            if mode is None:
+                break
+            await self.handle_command(mode)
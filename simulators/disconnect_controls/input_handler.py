@@ -1,6 +1,6 @@
-import sys
 import asyncio
 from .modes import DisconnectMode
+from .stdin_reader import StdinReader, shared_reader
 
 
 class InputHandler:
@@ -8,8 +8,12 @@ class InputHandler:
     MIN_DELAY = 1
     MAX_DELAY = 120
 
-    def __init__(self):
-        pass
+    # Every handler in a process reads through one shared StdinReader, and
+    # each gets its own copy of every command key.
+    def __init__(self, reader: StdinReader | None = None):
+        self.reader = reader
+        self._keys: asyncio.Queue | None = None
+        self._closed = False
 
     def show_commands(self):
         print("\nCommands:")
@@ -42,15 +46,13 @@ class InputHandler:
         except ValueError:
             return self.DEFAULT_DELAY
 
-    async def _read_input_async(self) -> str:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._read_line)
+    def _reader(self) -> StdinReader:
+        if self.reader is None:
+            self.reader = shared_reader()
+        return self.reader
 
-    def _read_line(self) -> str:
-        try:
-            return input()
-        except EOFError:
-            return "\x1b"
+    async def _read_input_async(self) -> str:
+        return await self._reader().read_line()
 
     async def get_confirmation(self, mode: DisconnectMode) -> tuple[bool, int | None]:
         prompt = self.format_confirmation_prompt(mode)
@@ -68,30 +70,42 @@ class InputHandler:
 
         return (True, None)
 
-    async def check_for_command(self) -> DisconnectMode | None:
-        if sys.stdin in asyncio.get_event_loop()._selector._fd_to_key:
-            return None
-
-        try:
-            loop = asyncio.get_event_loop()
-            key = await asyncio.wait_for(
-                loop.run_in_executor(None, self._read_single_char), timeout=0.1
-            )
-            if key:
-                return DisconnectMode.from_key(key)
-        except asyncio.TimeoutError:
-            pass
-        except Exception:
-            pass
+    def _subscribe(self) -> asyncio.Queue:
+        if self._keys is None:
+            self._keys = self._reader().subscribe()
+        return self._keys
 
+    # Waits for the next key without polling. Returns None once close() is
+    # called, which is how a stopped controller's input loop is woken.
+    async def next_key(self) -> str | None:
+        if self._closed:
+            return None
+        keys = self._subscribe()
+        if keys.empty():
+            self._reader().deliver()
+        return await keys.get()
+
+    async def next_command(self) -> DisconnectMode | None:
+        while (key := await self.next_key()) is not None:
+            mode = DisconnectMode.from_key(key)
+            if mode:
+                return mode
         return None
 
-    def _read_single_char(self) -> str:
+    async def check_for_command(self) -> DisconnectMode | None:
+        if self._closed:
+            return None
+        keys = self._subscribe()
+        if keys.empty():
+            self._reader().deliver()
         try:
-            import select
+            key = keys.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        return DisconnectMode.from_key(key) if key else None
 
-            if select.select([sys.stdin], [], [], 0)[0]:
-                return sys.stdin.read(1)
-        except Exception:
-            pass
-        return ""
+    def close(self):
+        self._closed = True
+        if self._keys is not None:
+            self._reader().unsubscribe(self._keys)
+            self._keys.put_nowait(None)
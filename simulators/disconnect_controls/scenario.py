@@ -0,0 +1,234 @@
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+from .controller import DisconnectController
+from .input_handler import InputHandler
+from .modes import DisconnectMode
+
+
+MODES = {
+    "graceful": DisconnectMode.GRACEFUL,
+    "abrupt": DisconnectMode.ABRUPT,
+    "temporary": DisconnectMode.TEMPORARY,
+}
+ALL_CONNECTIONS = "all"
+
+
+# "all", a percentage such as "20%", or a number of connections.
+def parse_connections(value) -> tuple[float | None, int | None]:
+    if value == ALL_CONNECTIONS:
+        return 1.0, None
+    if isinstance(value, str) and value.endswith("%"):
+        share = float(value[:-1]) / 100.0
+        if not 0 < share <= 1:
+            raise ValueError(f"Connection share must be between 0% and 100%: {value}")
+        return share, None
+    count = int(value)
+    if count < 1:
+        raise ValueError(f"Connection count must be positive: {value}")
+    return None, count
+
+
+@dataclass(frozen=True)
+class DisconnectStep:
+    at: float
+    mode: DisconnectMode
+    share: float | None = 1.0
+    count: int | None = None
+    delay: int = InputHandler.DEFAULT_DELAY
+    spread: float = 0.0
+    reconnect: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DisconnectStep":
+        mode = MODES.get(data.get("mode"))
+        if mode is None:
+            raise ValueError(f"Unknown disconnect mode: {data.get('mode')}")
+        share, count = parse_connections(data.get("connections", ALL_CONNECTIONS))
+        step = cls(
+            at=float(data.get("at", 0.0)),
+            mode=mode,
+            share=share,
+            count=count,
+            delay=int(data.get("delay", InputHandler.DEFAULT_DELAY)),
+            spread=float(data.get("spread", 0.0)),
+            reconnect=bool(data.get("reconnect", True)),
+        )
+        if step.at < 0 or step.spread < 0:
+            raise ValueError("Disconnect step times must be non-negative")
+        if not InputHandler.MIN_DELAY <= step.delay <= InputHandler.MAX_DELAY:
+            raise ValueError(f"Delay must be {InputHandler.MIN_DELAY}-{InputHandler.MAX_DELAY} seconds")
+        return step
+
+    # Command-line form AT:MODE[:CONNECTIONS[:DELAY]], e.g. 30:abrupt:20%.
+    @classmethod
+    def parse(cls, text: str) -> "DisconnectStep":
+        parts = text.split(":")
+        if not 2 <= len(parts) <= 4:
+            raise ValueError(f"Expected AT:MODE[:CONNECTIONS[:DELAY]], got {text!r}")
+        data = {"at": parts[0], "mode": parts[1]}
+        if len(parts) > 2:
+            data["connections"] = parts[2]
+        if len(parts) > 3:
+            data["delay"] = parts[3]
+        return cls.from_dict(data)
+
+    def targets(self, available: int) -> int:
+        if self.count is not None:
+            return min(self.count, available)
+        return round(available * self.share)
+
+    @property
+    def end(self) -> float:
+        return self.at + self.spread + (self.delay if self.mode == DisconnectMode.TEMPORARY else 0.0)
+
+
+@dataclass(frozen=True)
+class DisconnectScenario:
+    name: str
+    seed: int | None = None
+    steps: tuple[DisconnectStep, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DisconnectScenario":
+        steps = data.get("steps")
+        if not isinstance(steps, list) or not steps:
+            raise ValueError("Disconnect scenario must define at least one step")
+        seed = data.get("seed")
+        return cls(
+            name=str(data.get("name", "unnamed")),
+            seed=int(seed) if seed is not None else None,
+            steps=tuple(sorted((DisconnectStep.from_dict(step) for step in steps), key=lambda s: s.at)),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "DisconnectScenario":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    @property
+    def duration(self) -> float:
+        return max((step.end for step in self.steps), default=0.0)
+
+
+# Times are seconds since the scenario started; durations of the disconnect
+# and reconnect hooks are in milliseconds. down_s runs from issuing the
+# disconnect until the reconnect hook returned.
+@dataclass(frozen=True)
+class DisconnectRecord:
+    connection: int
+    step: int
+    mode: str
+    at: float
+    disconnect_ms: float | None = None
+    reconnect_ms: float | None = None
+    reconnected_at: float | None = None
+    down_s: float | None = None
+    error: str | None = None
+
+    @property
+    def reconnected(self) -> bool:
+        return self.reconnected_at is not None
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "reconnected": self.reconnected}
+
+
+# Drives a schedule of disconnects against many controllers at once, calling
+# their hooks directly rather than through the keyboard. Each step picks its
+# connections at random from those not already down, so overlapping steps
+# never hit a connection twice. A connection dropped with reconnect=false
+# stays down for the rest of the run. Reconnects still outstanding `settle`
+# seconds after the scenario's duration (the end of its last spread or
+# temporary drop) are cancelled and recorded as timed out.
+class ScenarioRunner:
+    def __init__(
+        self,
+        controllers: list[DisconnectController],
+        scenario: DisconnectScenario,
+        settle: float = 30.0,
+        on_record: Callable[[DisconnectRecord], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.controllers = controllers
+        self.scenario = scenario
+        self.settle = settle
+        self.on_record = on_record
+        self._clock = clock
+        self._busy: set[int] = set()
+        self._gone: set[int] = set()
+        self.records: list[DisconnectRecord] = []
+        self.skipped = 0
+        self._started = 0.0
+
+    def _random_for(self, step_index: int) -> random.Random:
+        if self.scenario.seed is None:
+            return random.Random()
+        return random.Random(f"{self.scenario.seed}:{step_index}")
+
+    def _elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def _record(self, record: DisconnectRecord) -> None:
+        self.records.append(record)
+        if self.on_record is not None:
+            self.on_record(record)
+
+    async def run(self) -> list[DisconnectRecord]:
+        self._started = self._clock()
+        tasks: list[asyncio.Task] = []
+        for index, step in enumerate(self.scenario.steps):
+            await asyncio.sleep(max(0.0, step.at - self._elapsed()))
+            available = [i for i in range(len(self.controllers)) if i not in self._busy and i not in self._gone]
+            wanted = step.targets(len(self.controllers) - len(self._gone))
+            rng = self._random_for(index)
+            chosen = rng.sample(available, min(wanted, len(available)))
+            self.skipped += wanted - len(chosen)
+            for connection in chosen:
+                self._busy.add(connection)
+                offset = rng.uniform(0.0, step.spread) if step.spread else 0.0
+                tasks.append(asyncio.create_task(self._run_target(connection, index, step, offset)))
+
+        if tasks:
+            deadline = self._started + self.scenario.duration + self.settle
+            _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - self._clock()))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return self.records
+
+    async def _run_target(self, connection: int, index: int, step: DisconnectStep, offset: float) -> None:
+        controller = self.controllers[connection]
+        if offset:
+            await asyncio.sleep(offset)
+        issued = self._clock()
+        timings: dict = {}
+        try:
+            if step.mode == DisconnectMode.GRACEFUL:
+                await controller.on_graceful_disconnect()
+            elif step.mode == DisconnectMode.ABRUPT:
+                await controller.on_abrupt_disconnect()
+            else:
+                await controller.on_temporary_drop(step.delay)
+            timings["disconnect_ms"] = (self._clock() - issued) * 1000.0
+            if step.reconnect:
+                if step.mode == DisconnectMode.TEMPORARY:
+                    await asyncio.sleep(max(0.0, issued + step.delay - self._clock()))
+                started = self._clock()
+                await controller.on_reconnect()
+                now = self._clock()
+                timings.update(reconnect_ms=(now - started) * 1000.0, reconnected_at=now - self._started,
+                               down_s=now - issued)
+        except asyncio.CancelledError:
+            timings["error"] = "timed out"
+        except Exception as e:
+            timings["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            self._busy.discard(connection)
+            if not step.reconnect or "error" in timings:
+                self._gone.add(connection)
+        self._record(DisconnectRecord(connection, index, step.mode.name.lower(), issued - self._started, **timings))
@@ -0,0 +1,212 @@
+import asyncio
+import atexit
+import codecs
+import os
+import sys
+import threading
+from collections import deque
+from typing import TextIO
+
+try:
+    import termios
+    import tty
+except ImportError:  # pragma: no cover - not available on Windows
+    termios = None
+    tty = None
+
+
+ESCAPE = "\x1b"
+BACKSPACES = ("\x7f", "\b")
+
+
+# One reader per process delivers stdin to every subscriber. stdin is
+# registered with the event loop's reader API only while someone is waiting
+# for input, so there is no polling and no executor thread when idle.
+#
+# On a terminal, stdin is switched to cbreak mode and each key is delivered
+# as it is pressed; line reads (confirmation prompts) are edited and echoed
+# here. From a pipe, input arrives a line at a time and each non-blank line
+# is one key. Where the loop cannot watch stdin (a regular file, or a loop
+# without add_reader) a daemon thread blocks on it instead.
+class StdinReader:
+    def __init__(self, stream: TextIO | None = None):
+        self._stream = stream if stream is not None else sys.stdin
+        self._fd = self._stream.fileno()
+        self.interactive = termios is not None and os.isatty(self._fd)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._subscribers: list[asyncio.Queue] = []
+        self._line: asyncio.Future | None = None
+        self._line_buffer: list[str] = []
+        self._line_lock: asyncio.Lock | None = None
+        self._pending = ""
+        self._units: deque[str] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._watching = False
+        self._thread: threading.Thread | None = None
+        self._saved_attrs = None
+        self.eof = False
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.append(queue)
+        self._start()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+        self._release()
+
+    # Returns the line without its newline, or ESCAPE when the user pressed
+    # Escape or stdin is closed. Keys typed meanwhile go to the line only.
+    async def read_line(self) -> str:
+        if self._line_lock is None:
+            self._line_lock = asyncio.Lock()
+        async with self._line_lock:
+            self._line = asyncio.get_running_loop().create_future()
+            self._line_buffer = []
+            self._start()
+            try:
+                self.deliver()
+                if self.eof and not self._line.done():
+                    self._line.set_result(ESCAPE)
+                return await self._line
+            finally:
+                self._line = None
+                self._release()
+
+    # Input is queued in units (keys on a terminal, lines from a pipe) and
+    # handed out on demand: to a pending line read first, otherwise to the
+    # subscribers once one of them has drained its queue. Piped input that
+    # arrives in one read, such as "t\n30\n", then reaches the confirmation
+    # prompt instead of being taken for more commands.
+    def feed(self, text: str) -> None:
+        if self.interactive:
+            self._units.extend(text)
+        else:
+            self._pending += text
+            while "\n" in self._pending:
+                line, self._pending = self._pending.split("\n", 1)
+                self._units.append(line.rstrip("\r"))
+        self.deliver()
+
+    def deliver(self) -> None:
+        units = self._units
+        while units:
+            line = self._line
+            if line is not None and not line.done():
+                unit = units.popleft()
+                if self.interactive:
+                    self._edit_line(line, unit)
+                else:
+                    line.set_result(unit)
+            elif any(queue.empty() for queue in self._subscribers):
+                key = units.popleft().strip()
+                if key:
+                    self._publish(key)
+            else:
+                return
+
+    def _edit_line(self, line: asyncio.Future, char: str) -> None:
+        if char in ("\r", "\n"):
+            self._echo("\n")
+            line.set_result("".join(self._line_buffer))
+        elif char == ESCAPE:
+            line.set_result(ESCAPE)
+        elif char in BACKSPACES:
+            if self._line_buffer:
+                self._line_buffer.pop()
+                self._echo("\b \b")
+        elif char.isprintable():
+            self._line_buffer.append(char)
+            self._echo(char)
+
+    def _echo(self, text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def _publish(self, key: str) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait(key)
+
+    def _end_of_input(self) -> None:
+        self.eof = True
+        if self._pending:
+            self.feed("\n")
+        if self._line is not None and not self._line.done():
+            self._line.set_result(ESCAPE)
+        self._stop_watching()
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not data:
+            self._end_of_input()
+            return
+        self.feed(self._decoder.decode(data))
+
+    def _read_blocking(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except OSError:
+                data = b""
+            if loop.is_closed():
+                return
+            if not data:
+                loop.call_soon_threadsafe(self._end_of_input)
+                return
+            loop.call_soon_threadsafe(self.feed, self._decoder.decode(data))
+
+    def _start(self) -> None:
+        if self._watching or self.eof:
+            return
+        self._loop = asyncio.get_running_loop()
+        if self.interactive:
+            self._saved_attrs = termios.tcgetattr(self._fd)
+            # cbreak rather than raw keeps Ctrl+C working, and TCSANOW keeps
+            # keys typed before the switch.
+            tty.setcbreak(self._fd, termios.TCSANOW)
+            atexit.register(self._restore_terminal)
+        if self._thread is None:
+            try:
+                self._loop.add_reader(self._fd, self._on_readable)
+            except (NotImplementedError, PermissionError, ValueError):
+                # The thread outlives the watch: it cannot be interrupted
+                # while blocked, so it keeps feeding until end of input.
+                self._thread = threading.Thread(target=self._read_blocking, args=(self._loop,), daemon=True)
+                self._thread.start()
+        self._watching = True
+
+    def _release(self) -> None:
+        if not self._subscribers and self._line is None:
+            self._stop_watching()
+
+    def _stop_watching(self) -> None:
+        if not self._watching:
+            return
+        self._watching = False
+        if self._thread is None and self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        self._restore_terminal()
+
+    def _restore_terminal(self) -> None:
+        if self._saved_attrs is not None:
+            atexit.unregister(self._restore_terminal)
+            try:
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attrs)
+            except termios.error:
+                pass
+            self._saved_attrs = None
+
+
+_shared: StdinReader | None = None
+
+
+def shared_reader() -> StdinReader:
+    global _shared
+    if _shared is None:
+        _shared = StdinReader()
+    return _shared
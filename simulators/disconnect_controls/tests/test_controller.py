@@ -50,6 +50,12 @@ class TestDisconnectController:
         controller.stop()
         assert controller._running is False
 
+    def test_is_running_reflects_stop(self):
+        controller = ConcreteDisconnectController()
+        assert controller.is_running() is True
+        controller.stop()
+        assert controller.is_running() is False
+
 
 class TestDisconnectControllerAsync:
     @pytest.mark.asyncio
@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+import pytest
+
+from disconnect_controls.controller import DisconnectController
+from disconnect_controls.modes import DisconnectMode
+from disconnect_controls.scenario import DisconnectScenario, DisconnectStep, ScenarioRunner
+
+
+class FakeController(DisconnectController):
+    def __init__(self, reconnect_delay: float = 0.0, fail: bool = False):
+        super().__init__()
+        self.reconnect_delay = reconnect_delay
+        self.fail = fail
+        self.events = []
+
+    async def on_graceful_disconnect(self):
+        self.events.append("graceful")
+
+    async def on_abrupt_disconnect(self):
+        self.events.append("abrupt")
+
+    async def on_temporary_drop(self, delay_seconds: int):
+        self.events.append(f"temporary {delay_seconds}")
+
+    async def on_reconnect(self):
+        await asyncio.sleep(self.reconnect_delay)
+        if self.fail:
+            raise ConnectionError("refused")
+        self.events.append("reconnect")
+
+
+def scenario(*steps: dict, seed: int | None = 1) -> DisconnectScenario:
+    return DisconnectScenario.from_dict({"name": "test", "seed": seed, "steps": list(steps)})
+
+
+class TestDisconnectStep:
+    @pytest.mark.parametrize("connections, available, expected", [
+        ("all", 10, 10), ("20%", 10, 2), ("25%", 3, 1), (4, 10, 4), ("4", 2, 2),
+    ])
+    def test_targets(self, connections, available, expected):
+        step = DisconnectStep.from_dict({"at": 1, "mode": "abrupt", "connections": connections})
+        assert step.targets(available) == expected
+
+    def test_command_line_form(self):
+        step = DisconnectStep.parse("60:temporary:all:5")
+        assert (step.at, step.mode, step.share, step.delay) == (60.0, DisconnectMode.TEMPORARY, 1.0, 5)
+        assert step.end == 65.0
+
+    @pytest.mark.parametrize("data", [
+        {"mode": "quit"},
+        {"mode": "abrupt", "connections": "150%"},
+        {"mode": "abrupt", "connections": 0},
+        {"mode": "abrupt", "at": -1},
+        {"mode": "temporary", "delay": 0},
+    ])
+    def test_rejects_invalid_steps(self, data):
+        with pytest.raises(ValueError):
+            DisconnectStep.from_dict(data)
+
+    def test_rejects_malformed_command_line(self):
+        with pytest.raises(ValueError):
+            DisconnectStep.parse("30")
+
+
+class TestDisconnectScenario:
+    def test_load_sorts_steps(self, tmp_path):
+        path = tmp_path / "storm.json"
+        path.write_text(json.dumps({"name": "storm", "steps": [
+            {"at": 60, "mode": "temporary", "delay": 5}, {"at": 30, "mode": "abrupt", "connections": "20%"}]}))
+        loaded = DisconnectScenario.load(str(path))
+        assert [step.at for step in loaded.steps] == [30.0, 60.0]
+        assert loaded.duration == 65.0
+
+    def test_requires_steps(self):
+        with pytest.raises(ValueError):
+            DisconnectScenario.from_dict({"name": "empty", "steps": []})
+
+
+class TestScenarioRunner:
+    @pytest.mark.asyncio
+    async def test_drops_a_share_and_records_timings(self):
+        controllers = [FakeController(reconnect_delay=0.01) for _ in range(10)]
+        records = await ScenarioRunner(controllers, scenario({"at": 0, "mode": "abrupt", "connections": "20%"})).run()
+        assert len(records) == 2
+        for record in records:
+            assert controllers[record.connection].events == ["abrupt", "reconnect"]
+            assert record.reconnected and record.error is None
+            assert record.reconnect_ms >= 10.0
+            assert record.down_s >= record.reconnect_ms / 1000.0
+
+    @pytest.mark.asyncio
+    async def test_seed_picks_the_same_connections(self):
+        picks = []
+        for _ in range(2):
+            controllers = [FakeController() for _ in range(20)]
+            records = await ScenarioRunner(controllers, scenario({"at": 0, "mode": "abrupt", "connections": 5})).run()
+            picks.append(sorted(record.connection for record in records))
+        assert picks[0] == picks[1]
+
+    @pytest.mark.asyncio
+    async def test_temporary_drop_waits_for_the_delay(self):
+        controllers = [FakeController()]
+        records = await ScenarioRunner(controllers, scenario({"at": 0, "mode": "temporary", "delay": 1})).run()
+        assert controllers[0].events == ["temporary 1", "reconnect"]
+        assert records[0].down_s >= 1.0
+
+    @pytest.mark.asyncio
+    async def test_settle_counts_from_the_end_of_a_temporary_drop(self):
+        controllers = [FakeController()]
+        runner = ScenarioRunner(controllers, scenario({"at": 0, "mode": "temporary", "delay": 2}), settle=1.0)
+        records = await runner.run()
+        assert records[0].reconnected and records[0].error is None
+
+    @pytest.mark.asyncio
+    async def test_overlapping_steps_skip_connections_already_down(self):
+        controllers = [FakeController(reconnect_delay=0.2) for _ in range(4)]
+        runner = ScenarioRunner(controllers, scenario(
+            {"at": 0, "mode": "abrupt", "connections": 3},
+            {"at": 0.05, "mode": "graceful", "connections": "all"},
+        ))
+        records = await runner.run()
+        assert len(records) == 4
+        assert runner.skipped == 3
+        assert all(len(controller.events) == 2 for controller in controllers)
+
+    @pytest.mark.asyncio
+    async def test_connections_without_reconnect_stay_down(self):
+        controllers = [FakeController() for _ in range(3)]
+        runner = ScenarioRunner(controllers, scenario(
+            {"at": 0, "mode": "graceful", "connections": 1, "reconnect": False},
+            {"at": 0.01, "mode": "abrupt", "connections": "all"},
+        ))
+        records = await runner.run()
+        assert not records[0].reconnected and records[0].error is None
+        assert [record.step for record in records].count(1) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_and_slow_reconnects(self):
+        controllers = [FakeController(fail=True), FakeController(reconnect_delay=10.0)]
+        recorded = []
+        runner = ScenarioRunner(controllers, scenario({"at": 0, "mode": "abrupt"}), settle=0.1, on_record=recorded.append)
+        records = await runner.run()
+        errors = {record.connection: record.error for record in records}
+        assert errors == {0: "ConnectionError: refused", 1: "timed out"}
+        assert recorded == records
+        assert not any(record.reconnected for record in records)
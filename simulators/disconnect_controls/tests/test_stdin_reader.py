@@ -0,0 +1,147 @@
+import asyncio
+import os
+import termios
+
+import pytest
+
+from disconnect_controls.controller import DisconnectController
+from disconnect_controls.input_handler import InputHandler
+from disconnect_controls.modes import DisconnectMode
+from disconnect_controls.stdin_reader import ESCAPE, StdinReader
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(read_fd, "r")
+    yield stream, write_fd
+    stream.close()
+    try:
+        os.close(write_fd)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def terminal():
+    master, slave = os.openpty()
+    stream = os.fdopen(slave, "r")
+    yield stream, master
+    stream.close()
+    os.close(master)
+
+
+class RecordingController(DisconnectController):
+    def __init__(self, reader):
+        super().__init__()
+        self.input_handler = InputHandler(reader)
+        self.commands = []
+
+    async def handle_command(self, mode):
+        self.commands.append(mode)
+
+    async def on_graceful_disconnect(self):
+        pass
+
+    async def on_abrupt_disconnect(self):
+        pass
+
+    async def on_temporary_drop(self, delay_seconds: int):
+        pass
+
+    async def on_reconnect(self):
+        pass
+
+
+class TestPipedInput:
+    @pytest.mark.asyncio
+    async def test_each_line_is_a_key_for_every_handler(self, pipe):
+        stream, write_fd = pipe
+        reader = StdinReader(stream)
+        first, second = InputHandler(reader), InputHandler(reader)
+        waiting = asyncio.gather(first.next_command(), second.next_command())
+        await asyncio.sleep(0)
+        os.write(write_fd, b"\n x \ng\n")
+        assert await asyncio.wait_for(waiting, 1) == [DisconnectMode.GRACEFUL, DisconnectMode.GRACEFUL]
+
+    @pytest.mark.asyncio
+    async def test_line_reads_take_input_ahead_of_keys(self, pipe):
+        stream, write_fd = pipe
+        reader = StdinReader(stream)
+        handler = InputHandler(reader)
+        handler._subscribe()
+        os.write(write_fd, b"t\n30\n")
+        assert await asyncio.wait_for(handler.next_key(), 1) == "t"
+        assert await asyncio.wait_for(handler.get_confirmation(DisconnectMode.TEMPORARY), 1) == (True, 30)
+        assert await handler.check_for_command() is None
+
+    @pytest.mark.asyncio
+    async def test_end_of_input_cancels_confirmation(self, pipe):
+        stream, write_fd = pipe
+        reader = StdinReader(stream)
+        os.close(write_fd)
+        assert await asyncio.wait_for(reader.read_line(), 1) == ESCAPE
+        assert reader.eof
+        assert await reader.read_line() == ESCAPE
+
+    @pytest.mark.asyncio
+    async def test_stdin_is_only_watched_while_needed(self, pipe):
+        stream, _ = pipe
+        reader = StdinReader(stream)
+        handler = InputHandler(reader)
+        handler._subscribe()
+        assert reader._watching
+        handler.close()
+        assert not reader._watching
+        assert await handler.next_key() is None
+
+
+class TestTerminalInput:
+    @pytest.mark.asyncio
+    async def test_keys_arrive_without_enter(self, terminal):
+        stream, master = terminal
+        reader = StdinReader(stream)
+        assert reader.interactive
+        handler = InputHandler(reader)
+        handler._subscribe()
+        os.write(master, b"a")
+        assert await asyncio.wait_for(handler.next_command(), 1) == DisconnectMode.ABRUPT
+
+    @pytest.mark.asyncio
+    async def test_line_editing_and_escape(self, terminal, capsys):
+        stream, master = terminal
+        reader = StdinReader(stream)
+        line = asyncio.create_task(reader.read_line())
+        await asyncio.sleep(0)
+        os.write(master, b"12\x7f5\r")
+        assert await asyncio.wait_for(line, 1) == "15"
+        assert capsys.readouterr().out == "12\b \b5\n"
+        line = asyncio.create_task(reader.read_line())
+        await asyncio.sleep(0)
+        os.write(master, b"9\x1b")
+        assert await asyncio.wait_for(line, 1) == ESCAPE
+
+    @pytest.mark.asyncio
+    async def test_terminal_mode_is_restored(self, terminal):
+        stream, _ = terminal
+        before = termios.tcgetattr(stream.fileno())
+        reader = StdinReader(stream)
+        handler = InputHandler(reader)
+        handler._subscribe()
+        assert not termios.tcgetattr(stream.fileno())[3] & termios.ICANON
+        handler.close()
+        assert termios.tcgetattr(stream.fileno()) == before
+
+
+class TestInputLoop:
+    @pytest.mark.asyncio
+    async def test_stop_wakes_the_input_loop(self, pipe, capsys):
+        stream, write_fd = pipe
+        controller = RecordingController(StdinReader(stream))
+        loop_task = asyncio.create_task(controller.run_input_loop())
+        await asyncio.sleep(0)
+        os.write(write_fd, b"q\n")
+        await asyncio.sleep(0.05)
+        assert controller.commands == [DisconnectMode.QUIT]
+        controller.stop()
+        await asyncio.wait_for(loop_task, 1)
@@ -0,0 +1,42 @@
+from .dashboard import Dashboard, DashboardState
+from .decoding import PackedTradeView, TradeView, decode_frame
+from .histogram import LatencyHistogram, format_summary, load_histogram, save_histogram
+from .hub_client import HubRpcClient, JsonRpcError, build_hub_connection, jsonrpc_batch, jsonrpc_request
+from .latency import latency_ms, timestamp_to_micros, trade_payload
+from .multiplex import MultiplexedClient, SymbolRouter, assign_symbols
+from .output import NdjsonWriter
+from .reconnect import BackoffPolicy, ContinuityTracker, OutageReport, ReconnectingClient
+from .recorder import TradeRecorder, add_record_arguments, recorder_from_args
+from .stats import RollingStats
+
+__all__ = [
+    "BackoffPolicy",
+    "ContinuityTracker",
+    "Dashboard",
+    "DashboardState",
+    "HubRpcClient",
+    "JsonRpcError",
+    "LatencyHistogram",
+    "MultiplexedClient",
+    "NdjsonWriter",
+    "OutageReport",
+    "PackedTradeView",
+    "ReconnectingClient",
+    "RollingStats",
+    "SymbolRouter",
+    "TradeRecorder",
+    "TradeView",
+    "add_record_arguments",
+    "assign_symbols",
+    "build_hub_connection",
+    "decode_frame",
+    "format_summary",
+    "jsonrpc_batch",
+    "jsonrpc_request",
+    "latency_ms",
+    "load_histogram",
+    "recorder_from_args",
+    "save_histogram",
+    "timestamp_to_micros",
+    "trade_payload",
+]
@@ -0,0 +1,293 @@
+import argparse
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from .decoding import PackedTradeView
+from .latency import timestamp_to_micros, trade_payload
+
+
+@dataclass(frozen=True)
+class Bar:
+    symbol: str
+    start: float
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    vwap: float
+    trades: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _OpenBar:
+    __slots__ = ("bucket", "open", "high", "low", "close", "volume", "notional", "trades")
+
+    def __init__(self, bucket: int, price: float):
+        self.bucket = bucket
+        self.open = self.high = self.low = self.close = price
+        self.volume = self.notional = 0.0
+        self.trades = 0
+
+
+# Time-based sliding window over one symbol's trades. Trades sit in a ring
+# buffer with running sums that are updated as they enter and leave, and the
+# window's high and low come from monotonic deques, so each trade costs O(1)
+# amortized however long the window is.
+class SymbolWindow:
+    def __init__(self, symbol: str, window: float):
+        self.symbol = symbol
+        self.window = window
+        self._trades: deque[tuple[float, float, float, float]] = deque()
+        self._highs: deque[tuple[float, float]] = deque()
+        self._lows: deque[tuple[float, float]] = deque()
+        self.volume = 0.0
+        self.notional = 0.0
+        self.squared_returns = 0.0
+        self.last_price: float | None = None
+        self.first_at: float | None = None
+        self.last_at = -math.inf
+
+    def add(self, at: float, price: float, qty: float) -> None:
+        # Event time never runs backwards within a window.
+        at = max(at, self.last_at)
+        squared_return = math.log(price / self.last_price) ** 2 if self.last_price else 0.0
+        self._trades.append((at, price, qty, squared_return))
+        self.volume += qty
+        self.notional += price * qty
+        self.squared_returns += squared_return
+        highs = self._highs
+        while highs and highs[-1][1] <= price:
+            highs.pop()
+        highs.append((at, price))
+        lows = self._lows
+        while lows and lows[-1][1] >= price:
+            lows.pop()
+        lows.append((at, price))
+        self.last_price = price
+        self.last_at = at
+        if self.first_at is None:
+            self.first_at = at
+        self.evict(at)
+
+    def evict(self, now: float) -> None:
+        cutoff = now - self.window
+        trades = self._trades
+        while trades and trades[0][0] <= cutoff:
+            _, price, qty, squared_return = trades.popleft()
+            self.volume -= qty
+            self.notional -= price * qty
+            self.squared_returns -= squared_return
+        if not trades:
+            # Restart the running sums from zero so rounding error cannot build up.
+            self.volume = self.notional = self.squared_returns = 0.0
+        while self._highs and self._highs[0][0] <= cutoff:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] <= cutoff:
+            self._lows.popleft()
+
+    def snapshot(self) -> dict[str, Any]:
+        trades = self._trades
+        # Until a full window has passed the rate is over the time since the first trade.
+        span = min(self.window, self.last_at - self.first_at) if self.first_at is not None else 0.0
+        snapshot = {"trades": len(trades), "rate": len(trades) / span if span > 0 else 0.0, "volume": self.volume}
+        if trades:
+            snapshot.update({
+                "vwap": self.notional / self.volume if self.volume > 0 else trades[-1][1],
+                "open": trades[0][1],
+                "high": self._highs[0][1],
+                "low": self._lows[0][1],
+                "close": trades[-1][1],
+                "volatility": math.sqrt(max(self.squared_returns, 0.0)),
+            })
+        return snapshot
+
+
+def trade_time(trade: Mapping[str, Any], received_at: float) -> float:
+    if isinstance(trade, PackedTradeView):
+        return trade.timestamp_micros / 1_000_000
+    timestamp = trade.get("timestamp")
+    return timestamp_to_micros(timestamp) / 1_000_000 if timestamp is not None else received_at
+
+
+# Rolling per-symbol VWAP, OHLC, volume, trade count and realized volatility
+# (square root of the summed squared log returns) over the last `window`
+# seconds, plus OHLCV bars of `bar_interval` seconds. Windows and bars follow
+# the trades' own timestamps, so client clock skew and delivery jitter do not
+# move trades between bars.
+class TradeAnalytics:
+    def __init__(
+        self,
+        window: float = 60.0,
+        bar_interval: float = 1.0,
+        max_bars: int = 10_000,
+        on_bar: Callable[[Bar], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if bar_interval <= 0:
+            raise ValueError("bar_interval must be positive")
+        if max_bars < 1:
+            raise ValueError("max_bars must be at least 1")
+        self.window = window
+        self.bar_interval = bar_interval
+        self.on_bar = on_bar
+        self._clock = clock
+        self._windows: dict[str, SymbolWindow] = {}
+        self._bars: dict[str, _OpenBar] = {}
+        self.bars: deque[Bar] = deque(maxlen=max_bars)
+        self.trades = 0
+        self.skipped = 0
+        self.feed_time = -math.inf
+
+    def record(self, message: Mapping[str, Any], received_at: float | None = None) -> None:
+        trade = trade_payload(message)
+        if trade is None:
+            return
+        symbol, price, qty = trade.get("symbol"), trade.get("price"), trade.get("qty")
+        if symbol is None or not price or price <= 0 or qty is None:
+            self.skipped += 1
+            return
+        at = trade_time(trade, received_at if received_at is not None else self._clock())
+        if at > self.feed_time:
+            self.feed_time = at
+        self.trades += 1
+
+        window = self._windows.get(symbol)
+        if window is None:
+            window = self._windows[symbol] = SymbolWindow(symbol, self.window)
+        window.add(at, price, qty)
+
+        bucket = int(at // self.bar_interval)
+        bar = self._bars.get(symbol)
+        if bar is None or bucket > bar.bucket:
+            if bar is not None:
+                self._close_bar(symbol, bar)
+            bar = self._bars[symbol] = _OpenBar(bucket, price)
+        if price > bar.high:
+            bar.high = price
+        elif price < bar.low:
+            bar.low = price
+        bar.close = price
+        bar.volume += qty
+        bar.notional += price * qty
+        bar.trades += 1
+
+    def _close_bar(self, symbol: str, bar: _OpenBar) -> None:
+        closed = Bar(
+            symbol=symbol,
+            start=bar.bucket * self.bar_interval,
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+            vwap=bar.notional / bar.volume if bar.volume > 0 else bar.close,
+            trades=bar.trades,
+        )
+        self.bars.append(closed)
+        if self.on_bar is not None:
+            self.on_bar(closed)
+
+    # Closes bars whose interval has passed and ages the windows of quiet
+    # symbols, measured against the latest trade time seen on any symbol.
+    def flush(self) -> None:
+        bucket = int(self.feed_time // self.bar_interval) if self.feed_time > -math.inf else None
+        for symbol, bar in list(self._bars.items()):
+            if bucket is not None and bar.bucket < bucket:
+                self._close_bar(symbol, bar)
+                del self._bars[symbol]
+        for window in self._windows.values():
+            window.evict(self.feed_time)
+
+    def snapshot(self) -> dict[str, Any]:
+        self.flush()
+        return {
+            "window_s": self.window,
+            "trades": self.trades,
+            "skipped": self.skipped,
+            "symbols": {symbol: window.snapshot() for symbol, window in sorted(self._windows.items())},
+        }
+
+    @staticmethod
+    def format(snapshot: dict[str, Any]) -> str:
+        lines = []
+        for symbol, stats in snapshot["symbols"].items():
+            line = f"  {symbol:<10} {stats['trades']:>7} trades {stats['rate']:>9.1f}/s  vol {stats['volume']:>12.4f}"
+            if stats["trades"]:
+                line += (f"  vwap {stats['vwap']:.4f}  o {stats['open']:.4f} h {stats['high']:.4f} "
+                         f"l {stats['low']:.4f} c {stats['close']:.4f}  rv {stats['volatility']:.4%}")
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def add_analytics_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--analytics", action="store_true",
+                        help="Print rolling VWAP, OHLC, volume and volatility per symbol with each stats line")
+    parser.add_argument("--analytics-window", type=float, default=60.0,
+                        help="Seconds of trades behind the rolling analytics")
+    parser.add_argument("--bar-interval", type=float, default=1.0, help="Seconds per OHLCV bar")
+    parser.add_argument("--bars-output", help="Write completed OHLCV bars as NDJSON to this file")
+
+
+def analytics_from_args(args: argparse.Namespace, on_bar: Callable[[Bar], None] | None = None) -> TradeAnalytics | None:
+    if not args.analytics and not args.bars_output:
+        return None
+    return TradeAnalytics(args.analytics_window, args.bar_interval, on_bar=on_bar)
+
+
+def synthetic_trades(count: int, symbols: list[str], rate: float, seed: int = 1) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    prices = {symbol: 100.0 * (index + 1) for index, symbol in enumerate(symbols)}
+    started = 1_700_000_000.0
+    trades = []
+    for index in range(count):
+        symbol = symbols[index % len(symbols)]
+        prices[symbol] *= math.exp(rng.gauss(0.0, 0.001))
+        at = started + index / rate
+        trades.append({
+            "seqnum": index, "event": "updated", "channel": "trades", "symbol": symbol,
+            "timestamp": f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(at))}.{int(at % 1 * 1e6):06d}Z",
+            "side": "buy", "qty": rng.uniform(0.0001, 10.0), "price": prices[symbol], "trade_id": str(index),
+        })
+    return trades
+
+
+def measure_throughput(analytics: TradeAnalytics, trades: list[dict[str, Any]]) -> float:
+    started = time.perf_counter()
+    for trade in trades:
+        analytics.record(trade, 0.0)
+    return len(trades) / (time.perf_counter() - started)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure how many trades per second the analytics stage sustains")
+    parser.add_argument("--trades", type=int, default=200_000, help="Synthetic trades to feed through")
+    parser.add_argument("--symbols", type=int, default=4, help="Symbols the trades are spread across")
+    parser.add_argument("--rate", type=float, default=10_000.0, help="Feed rate (trades/s) the timestamps follow")
+    parser.add_argument("--window", type=float, default=60.0, help="Seconds of trades behind the rolling analytics")
+    parser.add_argument("--bar-interval", type=float, default=1.0, help="Seconds per OHLCV bar")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    symbols = [f"SYM{index}-USD" for index in range(args.symbols)]
+    trades = synthetic_trades(args.trades, symbols, args.rate)
+    analytics = TradeAnalytics(args.window, args.bar_interval)
+    throughput = measure_throughput(analytics, trades)
+    print(TradeAnalytics.format(analytics.snapshot()))
+    print(f"{args.trades} trades in {args.trades / throughput:.2f}s: {throughput:,.0f} trades/s "
+          f"({1e6 / throughput:.2f}us per trade), {len(analytics.bars)} bars")
+
+
+if __name__ == "__main__":
+    main()
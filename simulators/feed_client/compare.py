@@ -0,0 +1,36 @@
+import argparse
+
+from .histogram import PERCENTILES, LatencyHistogram, load_histogram
+
+
+def format_comparison(runs: list[tuple[str, LatencyHistogram]]) -> str:
+    width = max(12, *(len(label) + 2 for label, _ in runs))
+    lines = [f"{'latency_ms':<10}" + "".join(f"{label:>{width}}" for label, _ in runs)]
+    summaries = [histogram.summary() for _, histogram in runs]
+    for name in ["count", "min", "mean", *PERCENTILES, "max"]:
+        cells = []
+        for summary in summaries:
+            value = summary.get(name)
+            if value is None:
+                cells.append(f"{'-':>{width}}")
+            elif name == "count":
+                cells.append(f"{value:>{width}}")
+            else:
+                cells.append(f"{value:>{width}.3f}")
+        lines.append(f"{name:<10}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare latency histograms exported by the test clients")
+    parser.add_argument("files", nargs="+", help="Histogram files written with --histogram-output")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    print(format_comparison([load_histogram(path) for path in args.files]))
+
+
+if __name__ == "__main__":
+    main()
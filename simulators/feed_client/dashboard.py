@@ -0,0 +1,213 @@
+import asyncio
+import locale
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+try:
+    import curses
+except ImportError:  # pragma: no cover - not available on Windows
+    curses = None
+
+from disconnect_controls import DisconnectController, DisconnectMode
+
+from .latency import latency_ms, trade_payload
+from .stats import RollingStats
+
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: list[float]) -> str:
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_CHARS[len(SPARK_CHARS) // 2] * len(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low)
+    return "".join(SPARK_CHARS[round((value - low) * scale)] for value in values)
+
+
+class SymbolView:
+    def __init__(self, symbol: str, window: float, history: int, clock: Callable[[], float]):
+        self.symbol = symbol
+        self.stats = RollingStats(window, clock)
+        self.last_price: float | None = None
+        self.last_side: str | None = None
+        self.prices: deque[float] = deque(maxlen=history)
+
+
+# Receive paths only update these aggregates; the dashboard samples them at its
+# own frame rate, so drawing cost does not grow with the message rate.
+class DashboardState:
+    def __init__(
+        self,
+        symbols: list[str],
+        track_gaps: bool = True,
+        window: float = 2.0,
+        history: int = 40,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.track_gaps = track_gaps
+        self._window = window
+        self._history = history
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.total = RollingStats(window, clock)
+        self.symbols: dict[str, SymbolView] = {}
+        for symbol in symbols:
+            self._view(symbol)
+        self.connection = "connecting"
+        self.events: deque[str] = deque(maxlen=3)
+        self.expected_seqnum: int | None = None
+        self.gaps = 0
+        self.missing = 0
+
+    def _view(self, symbol: str) -> SymbolView:
+        view = self.symbols.get(symbol)
+        if view is None:
+            view = self.symbols[symbol] = SymbolView(symbol, self._window, self._history, self._clock)
+        return view
+
+    def set_connection(self, state: str) -> None:
+        with self._lock:
+            self.connection = state
+
+    def note(self, event: str) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def _observe_seqnum(self, seqnum: Any) -> None:
+        if not isinstance(seqnum, int):
+            return
+        expected = self.expected_seqnum
+        if expected is not None and seqnum > expected:
+            self.gaps += 1
+            self.missing += seqnum - expected
+        self.expected_seqnum = seqnum + 1
+
+    def observe(self, message: dict[str, Any], received_at: float | None = None) -> None:
+        received_at = received_at if received_at is not None else time.time()
+        with self._lock:
+            if self.track_gaps:
+                self._observe_seqnum(message.get("seqnum"))
+
+            trade = trade_payload(message)
+            if trade is None:
+                self.total.record()
+                self.events.append(self._describe(message))
+                return
+
+            latency = latency_ms(message, received_at)
+            self.total.record(latency)
+            view = self._view(trade.get("symbol", "?"))
+            view.stats.record(latency)
+            view.last_price = trade.get("price")
+            view.last_side = trade.get("side")
+
+    @staticmethod
+    def _describe(message: dict[str, Any]) -> str:
+        body = message.get("result") or message.get("params") or message
+        if "error" in message:
+            return f"error: {message['error']}"
+        parts = [str(body[key]) for key in ("event", "symbol", "message") if key in body]
+        return " ".join(parts) if parts else str(message.get("method", message))[:60]
+
+    def render(self, width: int = 80) -> list[str]:
+        with self._lock:
+            total = self.total.snapshot()
+            latency = total["latency_ms"]
+            lines = [
+                f"Connection: {self.connection}",
+                f"Messages: {total['messages']}  Rate: {total['msgs_per_sec']:.1f} msg/s"
+                + (f"  Latency p50={latency['p50']:.2f}ms p99={latency['p99']:.2f}ms" if latency["count"] else ""),
+                (f"Seqnum gaps: {self.gaps} ({self.missing} missing)" if self.track_gaps
+                 else "Seqnum gaps: not tracked"),
+                "",
+                f"{'Symbol':<10} {'Last':>14} {'Side':<5} {'Trades':>9} {'Trades/s':>10}  Price",
+            ]
+            spark_width = max(0, width - 54)
+            for symbol, view in self.symbols.items():
+                snapshot = view.stats.snapshot()
+                if view.last_price is not None:
+                    view.prices.append(view.last_price)
+                price = f"{view.last_price:.2f}" if view.last_price is not None else "-"
+                history = list(view.prices)[-spark_width:] if spark_width else []
+                lines.append(
+                    f"{symbol:<10} {price:>14} {view.last_side or '-':<5} {snapshot['trades']:>9} "
+                    f"{snapshot['msgs_per_sec']:>10.1f}  {sparkline(history)}"
+                )
+            lines.append("")
+            lines.extend(f"> {event}" for event in self.events)
+        return [line[:width] for line in lines]
+
+
+class Dashboard:
+    COMMANDS = "[g] graceful  [a] abrupt  [t] temporary drop  [q] quit"
+
+    def __init__(self, state: DashboardState, title: str = "", fps: float = 10.0):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.state = state
+        self.title = title
+        self.frame_interval = 1.0 / fps
+        self._screen = None
+
+    def _start(self) -> None:
+        locale.setlocale(locale.LC_ALL, "")
+        self._screen = curses.initscr()
+        curses.noecho()
+        curses.cbreak()
+        curses.curs_set(0)
+        self._screen.nodelay(True)
+
+    def _stop(self) -> None:
+        if self._screen is None:
+            return
+        self._screen.nodelay(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.curs_set(1)
+        curses.endwin()
+        self._screen = None
+
+    def _draw(self) -> None:
+        height, width = self._screen.getmaxyx()
+        if width < 2:
+            return
+        lines = [self.title, *self.state.render(width - 1), "", self.COMMANDS]
+        self._screen.erase()
+        for row, line in enumerate(lines[:height]):
+            self._screen.addnstr(row, 0, line, width - 1)
+        self._screen.refresh()
+
+    def _read_keys(self) -> str:
+        keys = []
+        while (key := self._screen.getch()) != -1:
+            if 0 <= key < 256:
+                keys.append(chr(key))
+        return "".join(keys)
+
+    async def run(self, controller: DisconnectController) -> None:
+        if curses is None:
+            raise ValueError("The live dashboard requires the curses module")
+
+        self._start()
+        try:
+            while controller.is_running():
+                self._draw()
+                for key in self._read_keys():
+                    mode = DisconnectMode.from_key(key)
+                    if mode is None:
+                        continue
+                    # Confirmation prompts and disconnect messages use the
+                    # normal terminal, so the dashboard steps aside for them.
+                    self._stop()
+                    await controller.handle_command(mode)
+                    if controller.is_running():
+                        self._start()
+                    break
+                await asyncio.sleep(self.frame_interval)
+        finally:
+            self._stop()
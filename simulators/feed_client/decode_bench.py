@@ -0,0 +1,138 @@
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+from .decoding import (
+    JSON_BACKENDS,
+    SIDES,
+    TRADE_MESSAGE_TYPE,
+    TRADE_STRUCT,
+    TradeView,
+    _prefix_from_seconds,
+    decode_frame,
+    loads_for,
+    orjson,
+)
+from .latency import latency_ms, timestamp_to_micros, trade_payload
+
+
+SAMPLE_TRADE = {
+    "seqnum": 1234,
+    "event": "updated",
+    "channel": "trades",
+    "symbol": "ETH-USD",
+    "timestamp": "2019-08-13T11:30:06.100140Z",
+    "side": "sell",
+    "qty": 8.5e-5,
+    "price": 11252.4,
+    "trade_id": "12884909920",
+}
+FIELDS = ("symbol", "seqnum", "timestamp", "side", "qty", "price")
+
+# The simulator's JSON frame, the DataServer's trades.update notification and
+# the simulator's packed struct frame.
+FRAMES: dict[str, str | bytes] = {
+    "direct": json.dumps(SAMPLE_TRADE),
+    "relayed": json.dumps({
+        "jsonrpc": "2.0",
+        "method": "trades.update",
+        "params": {**{key: value for key, value in SAMPLE_TRADE.items() if key != "trade_id"},
+                   "timestamp": "2019-08-13T11:30:06.1001400+00:00", "tradeId": 12884909920},
+    }, separators=(",", ":")),
+    "packed": TRADE_STRUCT.pack(TRADE_MESSAGE_TYPE, 1234, timestamp_to_micros(SAMPLE_TRADE["timestamp"]),
+                                11252.4, 8.5e-5, 12884909920, SIDES.index("sell"), b"ETH-USD"),
+}
+
+
+# What a full decode of a packed frame costs: every field unpacked and the
+# timestamp formatted, as the simulator's struct codec does.
+def unpack_trade(frame: bytes) -> dict[str, Any]:
+    _, seqnum, micros, price, qty, trade_id, side, symbol = TRADE_STRUCT.unpack(frame)
+    seconds, fraction = divmod(micros, 1_000_000)
+    return {
+        "seqnum": seqnum,
+        "event": "updated",
+        "channel": "trades",
+        "symbol": symbol.rstrip(b"\0").decode(),
+        "timestamp": f"{_prefix_from_seconds(seconds)}.{fraction:06d}Z",
+        "side": SIDES[side],
+        "qty": qty,
+        "price": price,
+        "trade_id": str(trade_id),
+    }
+
+
+def decoders_for(frame: str | bytes) -> dict[str, Callable[[str | bytes], Any]]:
+    if isinstance(frame, bytes):
+        return {"unpack": unpack_trade, "view": decode_frame}
+    decoders = {backend: loads_for(backend) for backend in JSON_BACKENDS if backend != "orjson" or orjson}
+    decoders["view"] = TradeView
+    return decoders
+
+
+def trade_fields(message: Any) -> tuple:
+    trade = trade_payload(message)
+    return tuple(trade.get(field) for field in FIELDS)
+
+
+# Decoding alone, decoding plus the latency computation the clients run on
+# every trade, and decoding plus reading the fields a recorder or dashboard
+# would use.
+WORKLOADS: dict[str, Callable[[Callable, str | bytes], Callable[[], Any]]] = {
+    "decode": lambda decode, frame: lambda: decode(frame),
+    "latency": lambda decode, frame: lambda: latency_ms(decode(frame), 1_565_695_806.2),
+    "fields": lambda decode, frame: lambda: trade_fields(decode(frame)),
+}
+
+
+def time_per_call(func: Callable[[], Any], iterations: int, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter_ns() - started) / iterations)
+    return statistics.median(samples)
+
+
+def run_decode_bench(iterations: int = 20_000, rounds: int = 5) -> list[dict[str, Any]]:
+    results = []
+    for shape, frame in FRAMES.items():
+        for name, decode in decoders_for(frame).items():
+            row = {"frame": shape, "decoder": name, "bytes": len(frame)}
+            for workload, prepare in WORKLOADS.items():
+                row[f"{workload}_ns"] = time_per_call(prepare(decode, frame), iterations, rounds)
+            results.append(row)
+    return results
+
+
+def format_decode_bench(results: list[dict[str, Any]]) -> str:
+    lines = [f"{'frame':<10}{'decoder':<10}{'bytes':>7}" + "".join(f"{name + '_ns':>13}" for name in WORKLOADS)]
+    for row in results:
+        lines.append(f"{row['frame']:<10}{row['decoder']:<10}{row['bytes']:>7}"
+                     + "".join(f"{row[name + '_ns']:>13.0f}" for name in WORKLOADS))
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the decode cost per message of the client decoders")
+    parser.add_argument("--iterations", type=int, default=20_000, help="Messages decoded per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement; the median is reported")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    results = run_decode_bench(args.iterations, args.rounds)
+    print(format_decode_bench(results))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import json
+import re
+import struct
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+JSON_BACKENDS = ("orjson", "json")
+BACKEND = "orjson" if orjson is not None else "json"
+
+# The blockchain.struct.v1 trade layout, shared by every client package:
+# message type, seqnum, timestamp (epoch microseconds), price, qty, trade_id,
+# side, symbol. The simulator runs without the client packages installed, so
+# blockchain_api.wire_protocol keeps the producer's copy; test_decoding checks
+# that the two agree.
+TRADE_STRUCT = struct.Struct("<BQqddQB16s")
+TRADE_MESSAGE_TYPE = 1
+SIDES = ("buy", "sell")
+_FIELD_OFFSETS = {
+    "seqnum": (struct.Struct("<Q"), 1),
+    "price": (struct.Struct("<d"), 17),
+    "qty": (struct.Struct("<d"), 25),
+    "trade_id": (struct.Struct("<Q"), 33),
+}
+_TIMESTAMP = struct.Struct("<q")
+_PACKED_KEYS = ("seqnum", "event", "channel", "symbol", "timestamp", "side", "qty", "price", "trade_id")
+
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCALAR = re.compile(r"[^,}\]\s]+")
+_STRUCTURE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_NESTING = re.compile(r"[{}\[\]]")
+_LITERALS = {"true": True, "false": False, "null": None}
+_MISSING = object()
+
+
+def loads_for(backend: str) -> Callable[[str | bytes], Any]:
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{backend}', expected one of: {', '.join(JSON_BACKENDS)}")
+    if backend == "orjson":
+        if orjson is None:
+            raise ValueError("The orjson backend requires orjson")
+        return orjson.loads
+    return json.loads
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+# catching the stdlib exception whichever backend is in use.
+loads = loads_for(BACKEND)
+
+
+def _closing(text: str, start: int, end: int) -> int:
+    depth = 0
+    for match in _STRUCTURE.finditer(text, start, end):
+        token = match.group()
+        if token in "{[":
+            depth += 1
+        elif token in "}]":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError("Unterminated JSON object")
+
+
+# Read-only mapping over one JSON object that only parses the fields looked
+# up. Only the object's own keys match: keys inside nested objects and
+# arrays, or after the object closes, are skipped. Nothing is cached, so read
+# each field once. Iterating, len() or to_dict() parse the object whole.
+class TradeView(Mapping):
+    __slots__ = ("_text", "_start", "_end", "_parsed")
+
+    def __init__(self, frame: str | bytes, start: int = 0, end: int | None = None):
+        self._text = frame.decode() if isinstance(frame, bytes) else frame
+        self._start = start
+        self._end = len(self._text) if end is None else end
+        self._parsed: dict[str, Any] | None = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._parsed is not None:
+            return self._parsed.get(key, default)
+        start = self._find_key(f'"{key}"')
+        if start == -1:
+            return default
+        return self._value(start)
+
+    # Returns the position of the key's value, or -1. In the flat trade shapes
+    # nothing nests before the key, so its first occurrence is taken without
+    # walking the object; otherwise the object's tokens are walked and only
+    # keys at its own level match.
+    def _find_key(self, needle: str) -> int:
+        text, start, end = self._text, self._start, self._end
+        position = text.find(needle, start, end)
+        if position == -1:
+            return -1
+        if not _NESTING.search(text, start + 1, position):
+            value = self._after_colon(position + len(needle))
+            if value != -1:
+                return value
+
+        depth = 0
+        for match in _STRUCTURE.finditer(text, start, end):
+            token = match.group()
+            if token in "{[":
+                depth += 1
+            elif token in "}]":
+                depth -= 1
+                if depth == 0:
+                    return -1
+            elif depth == 1 and token == needle:
+                value = self._after_colon(match.end())
+                if value != -1:
+                    return value
+        return -1
+
+    def _after_colon(self, position: int) -> int:
+        text, end = self._text, self._end
+        while position < end and text[position] == " ":
+            position += 1
+        if position >= end or text[position] != ":":
+            return -1
+        position += 1
+        while position < end and text[position] == " ":
+            position += 1
+        return position
+
+    def _value(self, start: int) -> Any:
+        text = self._text
+        first = text[start]
+        if first == '"':
+            close = text.find('"', start + 1)
+            value = text[start + 1:close]
+            if "\\" not in value:
+                return value
+            return json.loads(_STRING.match(text, start).group())
+        if first == "{":
+            return TradeView(text, start, self._end)
+        if first == "[":
+            return loads(text[start:_closing(text, start, self._end)])
+        token = _SCALAR.match(text, start).group()
+        if token in _LITERALS:
+            return _LITERALS[token]
+        return float(token) if "." in token or "e" in token or "E" in token else int(token)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def _source(self) -> str:
+        if self._start == 0 and self._end == len(self._text):
+            return self._text
+        return self._text[self._start:_closing(self._text, self._start, self._end)]
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._parsed is None:
+            self._parsed = loads(self._source())
+        return self._parsed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"TradeView({self._source()!r})"
+
+
+@lru_cache(maxsize=1024)
+def _prefix_from_seconds(seconds: int) -> str:
+    return f"{datetime.fromtimestamp(seconds, timezone.utc):%Y-%m-%dT%H:%M:%S}"
+
+
+# Read-only mapping over a packed trade frame that unpacks each field from its
+# offset when it is looked up. timestamp_micros is available without
+# formatting the timestamp string.
+class PackedTradeView(Mapping):
+    __slots__ = ("_frame",)
+
+    def __init__(self, frame: bytes):
+        if not is_packed_trade(frame):
+            raise ValueError("Not a packed trade frame")
+        self._frame = frame
+
+    @property
+    def timestamp_micros(self) -> int:
+        return _TIMESTAMP.unpack_from(self._frame, 9)[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_OFFSETS:
+            layout, offset = _FIELD_OFFSETS[key]
+            value = layout.unpack_from(self._frame, offset)[0]
+            return str(value) if key == "trade_id" else value
+        if key == "symbol":
+            return self._frame[42:58].rstrip(b"\0").decode()
+        if key == "side":
+            return SIDES[self._frame[41]]
+        if key == "timestamp":
+            seconds, fraction = divmod(self.timestamp_micros, 1_000_000)
+            return f"{_prefix_from_seconds(seconds)}.{fraction:06d}Z"
+        if key == "event":
+            return "updated"
+        if key == "channel":
+            return "trades"
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _PACKED_KEYS
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: self.get(key) for key in _PACKED_KEYS}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PACKED_KEYS)
+
+    def __len__(self) -> int:
+        return len(_PACKED_KEYS)
+
+
+def is_packed_trade(frame: bytes) -> bool:
+    return len(frame) == TRADE_STRUCT.size and frame[0] == TRADE_MESSAGE_TYPE
+
+
+# Packed trade frames always become views, since most consumers read the
+# timestamp and a few fields, and formatting the timestamp is what costs.
+# Text frames become TradeView only with lazy set, which pays off for
+# consumers that read a few fields and decode with the stdlib; see
+# decode_bench for the numbers.
+def decode_frame(
+    frame: str | bytes,
+    fallback: Callable[[str | bytes], Any] | None = None,
+    lazy: bool = False,
+) -> Any:
+    if isinstance(frame, bytes) and is_packed_trade(frame):
+        return PackedTradeView(frame)
+    if lazy and isinstance(frame, str) and frame.startswith("{") and (
+            '"updated"' in frame or '"trades.update"' in frame):
+        return TradeView(frame)
+    return (fallback or loads)(frame)
@@ -0,0 +1,137 @@
+import json
+import math
+from array import array
+from typing import Any
+
+
+PERCENTILES = {"p50": 0.50, "p90": 0.90, "p99": 0.99, "p999": 0.999}
+
+
+# Buckets grow geometrically by (1 + precision), so every recorded value is
+# reported within that relative error while memory stays fixed no matter how
+# many samples are recorded.
+class LatencyHistogram:
+    def __init__(self, lowest: float = 0.001, highest: float = 3_600_000.0, precision: float = 0.01):
+        if lowest <= 0 or highest <= lowest:
+            raise ValueError("lowest must be positive and less than highest")
+        if not 0 < precision < 1:
+            raise ValueError("precision must be between 0 and 1")
+
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+        self._scale = 1.0 / math.log1p(precision)
+        self._buckets = array("Q", bytes(8 * (self._index(highest) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        return int(math.log(value / self.lowest) * self._scale)
+
+    def _upper_bound(self, index: int) -> float:
+        return self.lowest * (1.0 + self.precision) ** (index + 1)
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def record(self, value: float) -> None:
+        self._buckets[min(self._index(value), len(self._buckets) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        last = len(self._buckets) - 1
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                if index == last:
+                    return self.max
+                return min(max(self._upper_bound(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        summary = {"count": self.count, "min": self.min, "mean": self.total / self.count}
+        summary.update({name: self.percentile(fraction) for name, fraction in PERCENTILES.items()})
+        summary["max"] = self.max
+        return summary
+
+    def _check_compatible(self, other: "LatencyHistogram") -> None:
+        if (other.lowest, other.highest, other.precision) != (self.lowest, self.highest, self.precision):
+            raise ValueError("Histograms have different bucket layouts")
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self._check_compatible(other)
+        for index, count in enumerate(other._buckets):
+            if count:
+                self._buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self._buckets = array("Q", bytes(8 * len(self._buckets)))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {
+            "lowest": self.lowest,
+            "highest": self.highest,
+            "precision": self.precision,
+            "count": self.count,
+            "total": self.total,
+            "buckets": [[index, count] for index, count in enumerate(self._buckets) if count],
+        }
+        if self.count:
+            data["min"] = self.min
+            data["max"] = self.max
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data["lowest"], data["highest"], data["precision"])
+        for index, count in data["buckets"]:
+            if not 0 <= index < histogram.bucket_count:
+                raise ValueError(f"Bucket index {index} is out of range")
+            histogram._buckets[index] = count
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data.get("min", math.inf)
+        histogram.max = data.get("max", -math.inf)
+        return histogram
+
+
+def format_summary(summary: dict) -> str:
+    if not summary["count"]:
+        return "latency_ms: no samples"
+    return (f"latency_ms: p50={summary['p50']:.3f} p90={summary['p90']:.3f} p99={summary['p99']:.3f} "
+            f"p999={summary['p999']:.3f} max={summary['max']:.3f} (n={summary['count']})")
+
+
+def save_histogram(path: str, histogram: LatencyHistogram, label: str | None = None) -> None:
+    with open(path, "w") as f:
+        json.dump({"label": label, "latency_ms": histogram.to_dict()}, f)
+
+
+def load_histogram(path: str) -> tuple[str, LatencyHistogram]:
+    with open(path) as f:
+        data = json.load(f)
+    return data.get("label") or str(path), LatencyHistogram.from_dict(data["latency_ms"])
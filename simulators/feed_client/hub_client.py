@@ -0,0 +1,353 @@
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import random
+import socket
+import uuid
+from typing import Any, Callable
+
+try:
+    from signalrcore.hub_connection_builder import HubConnectionBuilder
+except ImportError:  # pragma: no cover - optional dependency
+    HubConnectionBuilder = None
+
+from .decoding import loads
+from .reconnect import BackoffPolicy
+
+
+class JsonRpcError(Exception):
+    def __init__(self, error: dict[str, Any]):
+        self.code = error.get("code")
+        self.data = error.get("data")
+        message = error.get("message", "JSON-RPC error")
+        super().__init__(f"{message} ({self.code})" + (f": {self.data}" if self.data else ""))
+
+
+def jsonrpc_request(method: str, params: dict[str, Any] | None, request_id: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+
+
+def jsonrpc_batch(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    if not requests:
+        raise ValueError("A JSON-RPC batch needs at least one request")
+    ids = [str(request["id"]) for request in requests]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Request ids in a JSON-RPC batch must be unique")
+    return list(requests)
+
+
+def subscription_params(symbol: str, channel: str = "trades") -> dict[str, str]:
+    return {"channel": channel, "symbol": symbol}
+
+
+# signalrcore's own automatic reconnect is left off; HubRpcClient reconnects
+# instead when given a BackoffPolicy.
+def build_hub_connection(url: str, on_error: Callable[[Any], None] | None = None,
+                         logging_level: int = logging.CRITICAL):
+    if HubConnectionBuilder is None:
+        raise ValueError("SignalR connections require signalrcore")
+    hub_connection = HubConnectionBuilder().with_url(url).configure_logging(logging_level=logging_level).build()
+    if on_error is not None:
+        hub_connection.on_error(on_error)
+    return hub_connection
+
+
+# signalrcore calls back on its own threads. Callbacks only hand work to the
+# event loop that started the client, so pending requests are only touched
+# from that loop. Reconnects are driven from here too: signalrcore's own
+# automatic reconnect gives up after the first failed retry.
+class HubRpcClient:
+    def __init__(
+        self,
+        hub_connection,
+        on_message: Callable[[Any], None] | None = None,
+        on_open: Callable[[], None] | None = None,
+        on_close: Callable[[], None] | None = None,
+        on_reconnect: Callable[[int], None] | None = None,
+        on_request: Callable[[str], None] | None = None,
+        on_state: Callable[[str], None] | None = None,
+        on_disconnect: Callable[[], None] | None = None,
+        policy: BackoffPolicy | None = None,
+        rng: random.Random | None = None,
+        request_timeout: float = 10.0,
+        batch_size: int | None = None,
+        target: str = "SendMessage",
+        event: str = "ReceiveMessage",
+    ):
+        self.hub = hub_connection
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.request_timeout = request_timeout
+        self.batch_size = batch_size
+        self.target = target
+        self.subscriptions: dict[str, str] = {}
+        self._on_message = on_message
+        self._on_open = on_open
+        self._on_close = on_close
+        self._on_reconnect = on_reconnect
+        self._on_request = on_request
+        self._on_state = on_state
+        self._on_disconnect = on_disconnect
+        self.policy = policy
+        self._rng = rng if rng is not None else random.Random()
+        self._prefix = uuid.uuid4().hex[:8]
+        self._ids = itertools.count(1)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._opened: asyncio.Event | None = None
+        self._stopping = False
+        self._reconnecting: asyncio.Task | None = None
+        self.reconnects = 0
+        self.resubscribe_errors: list[BaseException] = []
+
+        hub_connection.on_open(self._handle_open)
+        hub_connection.on_close(self._handle_close)
+        hub_connection.on(event, self._handle_message)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def next_id(self) -> str:
+        return f"{self._prefix}-{next(self._ids)}"
+
+    @property
+    def reconnecting(self) -> bool:
+        return self._reconnecting is not None
+
+    async def _open(self, timeout: float) -> None:
+        self._opened = asyncio.Event()
+        await asyncio.to_thread(self.hub.start)
+        try:
+            await asyncio.wait_for(self._opened.wait(), timeout)
+        except TimeoutError:
+            raise ConnectionError(f"Hub connection did not open within {timeout}s") from None
+
+    async def start(self, timeout: float = 10.0) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        await self._open(timeout)
+
+    # signalrcore closes its socket without waking the thread blocked reading
+    # it, then joins that thread, so stopping an idle connection would wait
+    # for the server's next frame. Shutting the socket down first ends the
+    # read straight away and the hub sees an ordinary close.
+    def _shutdown_socket(self) -> None:
+        sock = getattr(getattr(self.hub.transport, "_client", None), "sock", None)
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+        self._shutdown_socket()
+        await asyncio.to_thread(self.hub.stop)
+        self._fail_pending(ConnectionError("Hub connection stopped"))
+
+    def abort(self) -> None:
+        self._stopping = True
+        self._shutdown_socket()
+        if self.hub.transport:
+            self.hub.transport.stop()
+
+    def _call_soon(self, callback: Callable, *args) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(callback, *args)
+
+    def _handle_open(self) -> None:
+        if self._on_open is not None:
+            self._on_open()
+        if self._opened is not None:
+            self._call_soon(self._opened.set)
+
+    def _handle_close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+        self._call_soon(self._closed)
+
+    def _closed(self) -> None:
+        self._fail_pending(ConnectionError("Hub connection closed"))
+        if self._stopping or self._reconnecting is not None:
+            return
+        if self._on_disconnect is not None:
+            self._on_disconnect()
+        if self.policy is None:
+            return
+        self._reconnecting = asyncio.ensure_future(self._reconnect())
+
+    def _state(self, state: str) -> None:
+        if self._on_state is not None:
+            self._on_state(state)
+
+    async def _reconnect(self) -> None:
+        attempt = 0
+        try:
+            while not self._stopping:
+                try:
+                    await self._open(self.request_timeout)
+                except Exception as e:
+                    attempt += 1
+                    if self.policy.max_attempts is not None and attempt >= self.policy.max_attempts:
+                        self._state(f"gave up after {attempt} attempt(s): {e}")
+                        return
+                    delay = self.policy.delay(attempt - 1, self._rng)
+                    self._state(f"reconnect failed ({type(e).__name__}); retrying in {delay:.2f}s (attempt {attempt})")
+                    await asyncio.sleep(delay)
+                    continue
+                self.reconnects += 1
+                if self._on_reconnect is not None:
+                    self._on_reconnect(attempt + 1)
+                if self.subscriptions:
+                    await self._resubscribe()
+                return
+        finally:
+            self._reconnecting = None
+
+    # Trade notifications carry neither "result" nor "error", so most frames
+    # are passed on without being parsed here. A batch is answered with one
+    # JSON array holding a response per request.
+    def _handle_message(self, message: Any) -> None:
+        responses = []
+        for item in message if isinstance(message, list) else [message]:
+            if isinstance(item, str) and ('"result"' in item or '"error"' in item):
+                try:
+                    item = loads(item)
+                except json.JSONDecodeError:
+                    continue
+            for response in item if isinstance(item, list) else [item]:
+                if isinstance(response, dict) and "id" in response and ("result" in response or "error" in response):
+                    responses.append(response)
+        if responses:
+            self._call_soon(self._resolve, responses)
+        if self._on_message is not None:
+            self._on_message(message)
+
+    def _resolve(self, responses: list[dict[str, Any]]) -> None:
+        for response in responses:
+            future = self._pending.pop(str(response["id"]), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _send(self, request_ids: list[str], message: str) -> list[asyncio.Future]:
+        for request_id in request_ids:
+            if request_id in self._pending:
+                raise ValueError(f"Request id '{request_id}' is already pending")
+        if self._on_request is not None:
+            self._on_request(message)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in request_ids]
+        self._pending.update(zip(request_ids, futures))
+        try:
+            self.hub.send(self.target, [message])
+        except Exception:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+            raise
+        return futures
+
+    def send(self, message: str) -> asyncio.Future:
+        return self._send([str(json.loads(message)["id"])], message)[0]
+
+    def send_batch(self, requests: list[dict[str, Any]]) -> list[asyncio.Future]:
+        batch = jsonrpc_batch(requests)
+        return self._send([str(request["id"]) for request in batch], json.dumps(batch))
+
+    async def request(self, message: str, timeout: float | None = None) -> Any:
+        request_id = str(json.loads(message)["id"])
+        future = self.send(message)
+        try:
+            response = await asyncio.wait_for(future, timeout or self.request_timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        if response.get("error"):
+            raise JsonRpcError(response["error"])
+        return response.get("result")
+
+    # Results come back in request order whatever order the server answers
+    # in; a failed element is returned as its JsonRpcError rather than raised.
+    async def request_batch(self, requests: list[dict[str, Any]], timeout: float | None = None) -> list[Any]:
+        request_ids = [str(request["id"]) for request in requests]
+        futures = self.send_batch(requests)
+        try:
+            responses = await asyncio.wait_for(asyncio.gather(*futures), timeout or self.request_timeout)
+        finally:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+        return [JsonRpcError(response["error"]) if response.get("error") else response.get("result")
+                for response in responses]
+
+    async def call(self, method: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> Any:
+        return await self.request(json.dumps(jsonrpc_request(method, params, self.next_id())), timeout)
+
+    async def subscribe(self, symbol: str, channel: str = "trades") -> Any:
+        result = await self.call("subscribe", subscription_params(symbol, channel))
+        self.subscriptions[symbol] = channel
+        return result
+
+    async def unsubscribe(self, symbol: str, channel: str = "trades") -> Any:
+        self.subscriptions.pop(symbol, None)
+        return await self.call("unsubscribe", subscription_params(symbol, channel))
+
+    async def _call_batches(self, method: str, symbols: list[str], channel: str) -> list[Any]:
+        size = self.batch_size or max(len(symbols), 1)
+        results = []
+        for start in range(0, len(symbols), size):
+            chunk = symbols[start:start + size]
+            requests = [jsonrpc_request(method, subscription_params(symbol, channel), self.next_id())
+                        for symbol in chunk]
+            try:
+                results.extend(await self.request_batch(requests))
+            except (ConnectionError, TimeoutError) as e:
+                results.extend([e] * len(chunk))
+        return results
+
+    async def subscribe_batch(self, symbols: list[str], channel: str = "trades") -> list[Any]:
+        results = await self._call_batches("subscribe", symbols, channel)
+        for symbol, result in zip(symbols, results):
+            if not isinstance(result, BaseException):
+                self.subscriptions[symbol] = channel
+        return results
+
+    async def unsubscribe_batch(self, symbols: list[str], channel: str = "trades") -> list[Any]:
+        for symbol in symbols:
+            self.subscriptions.pop(symbol, None)
+        return await self._call_batches("unsubscribe", symbols, channel)
+
+    # Without a batch size, requests are sent back to back and their responses
+    # awaited together, so subscribing to many symbols costs about one round
+    # trip but still one hub invocation per symbol. With one, they go out as
+    # JSON-RPC batches of up to batch_size requests.
+    async def subscribe_all(self, symbols: list[str], channel: str = "trades") -> list[Any]:
+        if self.batch_size is not None:
+            return await self.subscribe_batch(symbols, channel)
+        return await asyncio.gather(*(self.subscribe(symbol, channel) for symbol in symbols), return_exceptions=True)
+
+    async def unsubscribe_all(self, symbols: list[str], channel: str = "trades") -> list[Any]:
+        if self.batch_size is not None:
+            return await self.unsubscribe_batch(symbols, channel)
+        return await asyncio.gather(*(self.unsubscribe(symbol, channel) for symbol in symbols),
+                                    return_exceptions=True)
+
+    async def _resubscribe(self) -> None:
+        if self.batch_size is not None:
+            results = []
+            for channel in set(self.subscriptions.values()):
+                symbols = [symbol for symbol, subscribed in self.subscriptions.items() if subscribed == channel]
+                results.extend(await self.subscribe_batch(symbols, channel))
+        else:
+            results = await asyncio.gather(
+                *(self.subscribe(symbol, channel) for symbol, channel in list(self.subscriptions.items())),
+                return_exceptions=True,
+            )
+        self.resubscribe_errors = [result for result in results if isinstance(result, BaseException)]
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+from .decoding import PackedTradeView
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_UTC_SUFFIXES = ("Z", "+00:00")
+
+
+@lru_cache(maxsize=1024)
+def _epoch_seconds(prefix: str) -> int:
+    delta = datetime.fromisoformat(prefix).replace(tzinfo=timezone.utc) - _EPOCH
+    return delta.days * 86400 + delta.seconds
+
+
+# Handles the simulator's "...SS.ffffffZ" and the DataServer's "...SS.fffffff+00:00"
+# without building a datetime per trade; anything else goes through fromisoformat.
+def timestamp_to_micros(timestamp: str) -> int:
+    if len(timestamp) > 20 and timestamp[19] == ".":
+        for suffix in _UTC_SUFFIXES:
+            if timestamp.endswith(suffix):
+                fraction = timestamp[20:-len(suffix)]
+                if fraction.isdigit():
+                    return _epoch_seconds(timestamp[:19]) * 1_000_000 + int(fraction[:6].ljust(6, "0"))
+                break
+
+    moment = datetime.fromisoformat(timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def trade_payload(message: dict[str, Any]) -> dict[str, Any] | None:
+    if message.get("method") == "trades.update":
+        return message.get("params")
+    if message.get("event") == "updated":
+        return message
+    return None
+
+
+def latency_ms(message: dict[str, Any], received_at: float) -> float | None:
+    trade = trade_payload(message)
+    if trade is None:
+        return None
+    # Packed trade views carry the timestamp unformatted.
+    if isinstance(trade, PackedTradeView):
+        return received_at * 1000.0 - trade.timestamp_micros / 1000.0
+    timestamp = trade.get("timestamp")
+    if timestamp is None:
+        return None
+    return received_at * 1000.0 - timestamp_to_micros(timestamp) / 1000.0
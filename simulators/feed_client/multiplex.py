@@ -0,0 +1,145 @@
+import asyncio
+import json
+import time
+from typing import Any, Callable
+
+import websockets
+
+from .decoding import decode_frame
+from .stats import RollingStats
+
+
+Handler = Callable[[dict[str, Any]], None]
+Decoder = Callable[[str | bytes], dict[str, Any]]
+
+
+def assign_symbols(symbols: list[str], connections: int, per_connection: int | None = None) -> list[list[str]]:
+    if connections < 1:
+        raise ValueError("connections must be at least 1")
+    if not symbols:
+        raise ValueError("At least one symbol is required")
+
+    per_connection = len(symbols) if per_connection is None else min(per_connection, len(symbols))
+    if per_connection < 1:
+        raise ValueError("per_connection must be at least 1")
+    return [
+        [symbols[(index * per_connection + offset) % len(symbols)] for offset in range(per_connection)]
+        for index in range(connections)
+    ]
+
+
+class SymbolRouter:
+    def __init__(self, default: Handler | None = None):
+        self._handlers: dict[str, list[Handler]] = {}
+        self._default = default
+
+    def add_handler(self, symbol: str, handler: Handler) -> None:
+        self._handlers.setdefault(symbol, []).append(handler)
+
+    def route(self, message: dict[str, Any]) -> None:
+        handlers = self._handlers.get(message.get("symbol"))
+        if handlers:
+            for handler in handlers:
+                handler(message)
+        elif self._default is not None:
+            self._default(message)
+
+
+class MultiplexedClient:
+    MAX_CONNECTION_ROWS = 20
+
+    def __init__(
+        self,
+        url: str,
+        assignments: list[list[str]],
+        router: SymbolRouter | None = None,
+        subprotocols: list[str] | None = None,
+        decoder_for: Callable[[str | None], Decoder] = lambda subprotocol: decode_frame,
+        latency_ms: Callable[[dict[str, Any], float], float | None] | None = None,
+        window: float = 5.0,
+    ):
+        self.url = url
+        self.assignments = assignments
+        self.router = router if router is not None else SymbolRouter()
+        self._subprotocols = subprotocols
+        self._decoder_for = decoder_for
+        self._latency_ms = latency_ms
+        self._window = window
+        self.total = RollingStats(window)
+        self.connections = [RollingStats(window) for _ in assignments]
+        self.symbols: dict[str, RollingStats] = {}
+        self.errors: dict[int, str] = {}
+        self.connected = 0
+
+    def _symbol_stats(self, symbol: str) -> RollingStats:
+        stats = self.symbols.get(symbol)
+        if stats is None:
+            stats = self.symbols[symbol] = RollingStats(self._window)
+        return stats
+
+    async def _run_connection(self, index: int, symbols: list[str]) -> None:
+        options = {"subprotocols": self._subprotocols} if self._subprotocols else {}
+        try:
+            async with websockets.connect(self.url, close_timeout=1, **options) as ws:
+                self.connected += 1
+                decode = self._decoder_for(ws.subprotocol)
+                for symbol in symbols:
+                    await ws.send(json.dumps({"action": "subscribe", "channel": "trades", "symbol": symbol}))
+
+                connection_stats = self.connections[index]
+                async for frame in ws:
+                    received_at = time.time()
+                    message = decode(frame)
+                    latency = None
+                    if self._latency_ms is not None and message.get("event") == "updated":
+                        latency = self._latency_ms(message, received_at)
+
+                    self.total.record(latency)
+                    connection_stats.record()
+                    symbol = message.get("symbol")
+                    if symbol is not None:
+                        self._symbol_stats(symbol).record(latency)
+                    self.router.route(message)
+        except Exception as e:
+            self.errors[index] = f"{type(e).__name__}: {e}"
+
+    async def run(self, duration: float | None = None) -> None:
+        tasks = [
+            asyncio.create_task(self._run_connection(index, symbols))
+            for index, symbols in enumerate(self.assignments)
+        ]
+        try:
+            async with asyncio.timeout(duration):
+                await asyncio.gather(*tasks)
+        except TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> dict:
+        return {
+            "total": self.total.snapshot(),
+            "connections": {index: stats.snapshot() for index, stats in enumerate(self.connections)},
+            "symbols": {symbol: stats.snapshot() for symbol, stats in sorted(self.symbols.items())},
+            "errors": dict(self.errors),
+        }
+
+    @staticmethod
+    def format(snapshot: dict) -> str:
+        lines = [RollingStats.format(snapshot["total"])]
+        connections = snapshot["connections"]
+        if len(connections) > MultiplexedClient.MAX_CONNECTION_ROWS:
+            rates = sorted(stats["msgs_per_sec"] for stats in connections.values())
+            lines.append(f"  {len(rates)} connections: min={rates[0]:.1f} median={rates[len(rates) // 2]:.1f} "
+                         f"max={rates[-1]:.1f} msg/s")
+        elif len(connections) > 1:
+            for index, stats in connections.items():
+                lines.append(f"  conn {index:<4} {stats['messages']:>10} msgs {stats['msgs_per_sec']:>10.1f} msg/s")
+        if len(snapshot["symbols"]) > 1:
+            for symbol, stats in snapshot["symbols"].items():
+                lines.append(f"  {symbol:<9} {stats['messages']:>10} msgs {stats['msgs_per_sec']:>10.1f} msg/s")
+        for index, error in snapshot["errors"].items():
+            lines.append(f"  conn {index} failed: {error}")
+        return "\n".join(lines)
@@ -0,0 +1,39 @@
+import json
+import sys
+from typing import Any
+
+
+class NdjsonWriter:
+    DEFAULT_BUFFER_SIZE = 1 << 20
+
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.path = path
+        self.lines = 0
+        if path == "-":
+            self._file = sys.stdout.buffer
+            self._owns_file = False
+        else:
+            self._file = open(path, "wb", buffering=buffer_size)
+            self._owns_file = True
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.write_line(json.dumps(record, separators=(",", ":"), default=dict))
+
+    def write_line(self, line: str) -> None:
+        self._file.write(line.encode())
+        self._file.write(b"\n")
+        self.lines += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,373 @@
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+import websockets
+
+from .decoding import decode_frame
+from .latency import trade_payload
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    initial_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+    max_attempts: int | None = None
+
+    def __post_init__(self):
+        if self.initial_delay < 0 or self.max_delay < self.initial_delay:
+            raise ValueError("initial_delay must be non-negative and no greater than max_delay")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    @classmethod
+    def from_env(cls) -> "BackoffPolicy":
+        max_attempts = os.getenv("RECONNECT_MAX_ATTEMPTS")
+        return cls(
+            initial_delay=float(os.getenv("RECONNECT_INITIAL_DELAY", cls.initial_delay)),
+            multiplier=float(os.getenv("RECONNECT_MULTIPLIER", cls.multiplier)),
+            max_delay=float(os.getenv("RECONNECT_MAX_DELAY", cls.max_delay)),
+            jitter=float(os.getenv("RECONNECT_JITTER", cls.jitter)),
+            max_attempts=int(max_attempts) if max_attempts else None,
+        )
+
+    # Jitter takes up to `jitter` of the delay off at random, so clients that
+    # lost the same server do not all retry in lockstep.
+    def delay(self, attempt: int, rng: random.Random | None = None) -> float:
+        delay = min(self.initial_delay * self.multiplier ** attempt, self.max_delay)
+        return delay * (1.0 - self.jitter * (rng or random).random())
+
+    def schedule(self, attempts: int, rng: random.Random | None = None) -> list[float]:
+        return [self.delay(attempt, rng) for attempt in range(attempts)]
+
+
+@dataclass(frozen=True)
+class OutageReport:
+    number: int
+    reason: str
+    attempts: int
+    downtime_s: float
+    time_to_recover_s: float
+    missing: int
+    estimated_lost: int
+    duplicates: int
+    sequence: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format(self) -> str:
+        if self.sequence == "continued":
+            lost = f"{self.missing} missing"
+        elif self.sequence == "restarted":
+            lost = f"{self.estimated_lost} estimated lost (sequence restarted)"
+        else:
+            lost = f"{self.estimated_lost} estimated lost"
+        return (f"Outage {self.number}: {self.reason}; reconnected after {self.attempts} attempt(s), "
+                f"down {self.downtime_s:.2f}s, recovered in {self.time_to_recover_s:.2f}s, "
+                f"{lost}, {self.duplicates} duplicate(s)")
+
+
+class ContinuityTracker:
+    def __init__(self, clock: Callable[[], float] = time.monotonic, track_gaps: bool = True):
+        self._clock = clock
+        self.track_gaps = track_gaps
+        self.expected_seqnum: int | None = None
+        self.gaps = 0
+        self.missing = 0
+        self.duplicates = 0
+        self.reports: list[OutageReport] = []
+        self._last_trade_ids: dict[str, int] = {}
+        self._last_message_at: float | None = None
+        self._last_trade_at: float | None = None
+        self._epoch_started_at = clock()
+        self._epoch_trades = 0
+        self._outage: dict[str, Any] | None = None
+
+    @property
+    def in_outage(self) -> bool:
+        return self._outage is not None
+
+    def _trade_rate(self) -> float:
+        if self._last_trade_at is None or self._epoch_trades < 2:
+            return 0.0
+        elapsed = self._last_trade_at - self._epoch_started_at
+        return self._epoch_trades / elapsed if elapsed > 0 else 0.0
+
+    def connection_lost(self, reason: str, now: float | None = None) -> None:
+        if self._outage is not None:
+            return
+        now = now if now is not None else self._clock()
+        self._outage = {
+            "reason": reason,
+            "lost_at": now,
+            "last_trade_at": self._last_trade_at if self._last_trade_at is not None else now,
+            "rate": self._trade_rate(),
+            "restored_at": None,
+            "attempts": 0,
+            "sequence": "not tracked",
+            "missing": 0,
+            "duplicates": 0,
+        }
+
+    def connection_restored(self, attempts: int = 1, now: float | None = None) -> None:
+        now = now if now is not None else self._clock()
+        if self._outage is None:
+            # Some transports only report the reconnect, so the outage is
+            # taken to have started with the last message received.
+            self.connection_lost("connection lost", self._last_message_at if self._last_message_at else now)
+        self._outage["restored_at"] = now
+        self._outage["attempts"] = attempts
+        self._epoch_started_at = now
+        self._epoch_trades = 0
+
+    def _observe_seqnum(self, seqnum: Any) -> None:
+        if not isinstance(seqnum, int):
+            return
+        expected = self.expected_seqnum
+        outage = self._outage
+        if outage is not None and outage["restored_at"] is not None and outage["sequence"] == "not tracked":
+            if expected is not None and seqnum >= expected:
+                outage["sequence"] = "continued"
+                outage["missing"] = seqnum - expected
+            else:
+                outage["sequence"] = "restarted"
+        elif expected is not None and seqnum > expected:
+            self.gaps += 1
+            self.missing += seqnum - expected
+        self.expected_seqnum = seqnum + 1
+
+    def _observe_trade_id(self, trade: dict[str, Any]) -> None:
+        trade_id = trade.get("trade_id", trade.get("tradeId"))
+        symbol = trade.get("symbol")
+        try:
+            trade_id = int(trade_id)
+        except (TypeError, ValueError):
+            return
+        last = self._last_trade_ids.get(symbol)
+        if last is not None and trade_id <= last:
+            self.duplicates += 1
+            if self._outage is not None:
+                self._outage["duplicates"] += 1
+            return
+        self._last_trade_ids[symbol] = trade_id
+
+    def observe(self, message: dict[str, Any], now: float | None = None) -> OutageReport | None:
+        now = now if now is not None else self._clock()
+        self._last_message_at = now
+        trade = trade_payload(message)
+        if self.track_gaps:
+            self._observe_seqnum(message.get("seqnum", trade.get("seqnum") if trade else None))
+        if trade is None:
+            return None
+
+        self._observe_trade_id(trade)
+        self._last_trade_at = now
+        self._epoch_trades += 1
+
+        outage = self._outage
+        if outage is None or outage["restored_at"] is None:
+            return None
+        return self._close_outage(outage, now)
+
+    def _close_outage(self, outage: dict[str, Any], now: float) -> OutageReport:
+        # Trades expected between the last trade before the outage and the
+        # first one after it, at the rate seen before the outage.
+        estimated = max(0, round(outage["rate"] * (now - outage["last_trade_at"])) - 1)
+        report = OutageReport(
+            number=len(self.reports) + 1,
+            reason=outage["reason"],
+            attempts=outage["attempts"],
+            downtime_s=outage["restored_at"] - outage["lost_at"],
+            time_to_recover_s=now - outage["lost_at"],
+            missing=outage["missing"],
+            estimated_lost=outage["missing"] if outage["sequence"] == "continued" else estimated,
+            duplicates=outage["duplicates"],
+            sequence=outage["sequence"],
+        )
+        self.reports.append(report)
+        self._outage = None
+        return report
+
+    def summary(self) -> dict:
+        return {
+            "outages": len(self.reports),
+            "gaps": self.gaps,
+            "missing": self.missing,
+            "duplicates": self.duplicates,
+            "estimated_lost": sum(report.estimated_lost for report in self.reports),
+            "time_to_recover_s": [report.time_to_recover_s for report in self.reports],
+        }
+
+
+def subscription_request(action: str, symbol: str) -> str:
+    return json.dumps({"action": action, "channel": "trades", "symbol": symbol})
+
+
+class ReconnectingClient:
+    def __init__(
+        self,
+        url: str,
+        symbols: list[str],
+        on_message: Callable[[dict[str, Any]], None] | None = None,
+        policy: BackoffPolicy | None = None,
+        subprotocols: list[str] | None = None,
+        decoder_for: Callable[[str | None], Callable[[str | bytes], dict[str, Any]]] = lambda subprotocol: decode_frame,
+        on_state: Callable[[str], None] | None = None,
+        on_outage: Callable[[OutageReport], None] | None = None,
+        rng: random.Random | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.url = url
+        self.subscriptions = set(symbols)
+        self.policy = policy if policy is not None else BackoffPolicy()
+        self.continuity = ContinuityTracker(clock)
+        self._on_message = on_message
+        self._on_state = on_state
+        self._on_outage = on_outage
+        self._subprotocols = subprotocols
+        self._decoder_for = decoder_for
+        self._rng = rng if rng is not None else random.Random()
+        self._clock = clock
+        self._ws = None
+        self._resume_at: float | None = None
+        self._drop_reason: str | None = None
+        self._connected = asyncio.Event()
+        self._closed = asyncio.Event()
+        self.connects = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def _state(self, state: str) -> None:
+        if self._on_state is not None:
+            self._on_state(state)
+
+    async def _sleep(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._closed.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+
+    async def _connect(self):
+        options = {"subprotocols": self._subprotocols} if self._subprotocols else {}
+        attempt = 0
+        while not self.closed:
+            if self._resume_at is not None:
+                await self._sleep(self._resume_at - self._clock())
+                self._resume_at = None
+                continue
+            try:
+                return await websockets.connect(self.url, close_timeout=1, **options), attempt + 1
+            except (OSError, TimeoutError, websockets.exceptions.InvalidHandshake) as e:
+                if self.policy.max_attempts is not None and attempt + 1 >= self.policy.max_attempts:
+                    raise ConnectionError(f"Gave up after {attempt + 1} attempt(s): {e}") from e
+                delay = self.policy.delay(attempt, self._rng)
+                attempt += 1
+                self._state(f"connect failed ({type(e).__name__}); retrying in {delay:.2f}s (attempt {attempt})")
+                await self._sleep(delay)
+        return None, attempt
+
+    async def run(self) -> None:
+        try:
+            await self._run()
+        finally:
+            self._closed.set()
+
+    async def _run(self) -> None:
+        while not self.closed:
+            ws, attempts = await self._connect()
+            if ws is None:
+                break
+
+            self._ws = ws
+            self.connects += 1
+            if self.continuity.in_outage:
+                self.continuity.connection_restored(attempts)
+            reason = "connection closed"
+            try:
+                decode = self._decoder_for(ws.subprotocol)
+                for symbol in sorted(self.subscriptions):
+                    await ws.send(subscription_request("subscribe", symbol))
+                self._connected.set()
+                self._state(f"connected, subscribed to {', '.join(sorted(self.subscriptions))}")
+
+                async for frame in ws:
+                    message = decode(frame)
+                    report = self.continuity.observe(message)
+                    if self._on_message is not None:
+                        self._on_message(message)
+                    if report is not None and self._on_outage is not None:
+                        self._on_outage(report)
+                reason = f"closed by server (code {ws.close_code})"
+            except websockets.exceptions.ConnectionClosed as e:
+                reason = f"closed by server (code {e.rcvd.code})" if e.rcvd is not None else "connection lost"
+            except OSError as e:
+                reason = f"connection lost ({e})"
+            finally:
+                self._connected.clear()
+                self._ws = None
+
+            if self.closed:
+                break
+            reason = self._drop_reason or reason
+            self._drop_reason = None
+            self.continuity.connection_lost(reason)
+            self._state(reason)
+
+    async def wait_connected(self) -> bool:
+        waiters = [asyncio.ensure_future(self._connected.wait()), asyncio.ensure_future(self._closed.wait())]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return self.connected
+
+    async def subscribe(self, symbol: str) -> None:
+        self.subscriptions.add(symbol)
+        if self._ws is not None:
+            await self._ws.send(subscription_request("subscribe", symbol))
+
+    async def unsubscribe(self, symbol: str) -> None:
+        self.subscriptions.discard(symbol)
+        if self._ws is not None:
+            await self._ws.send(subscription_request("unsubscribe", symbol))
+
+    def drop(self, pause: float = 0.0, reason: str = "dropped by client") -> None:
+        self._resume_at = self._clock() + pause
+        self._drop_reason = reason
+        if self._ws is not None:
+            self._ws.transport.abort()
+
+    def abort(self) -> None:
+        self._closed.set()
+        if self._ws is not None:
+            self._ws.transport.abort()
+
+    async def close(self) -> None:
+        self._closed.set()
+        ws = self._ws
+        if ws is None:
+            return
+        try:
+            for symbol in sorted(self.subscriptions):
+                await ws.send(subscription_request("unsubscribe", symbol))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        await ws.close()
@@ -0,0 +1,315 @@
+import argparse
+import csv
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+from .latency import trade_payload
+
+
+COLUMNS = ("symbol", "seqnum", "timestamp", "side", "qty", "price", "trade_id", "received_at")
+
+Row = tuple[Any, ...]
+
+
+def trade_row(message: dict[str, Any], received_at: float) -> Row | None:
+    trade = trade_payload(message)
+    if trade is None:
+        return None
+    trade_id = trade.get("trade_id", trade.get("tradeId"))
+    return (
+        trade.get("symbol"),
+        trade.get("seqnum"),
+        trade.get("timestamp"),
+        trade.get("side"),
+        trade.get("qty"),
+        trade.get("price"),
+        None if trade_id is None else str(trade_id),
+        received_at,
+    )
+
+
+class TradeSink(ABC):
+    extension = ""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @abstractmethod
+    def write_batch(self, rows: list[Row]) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    def size(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+
+class SqliteSink(TradeSink):
+    extension = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS trades (symbol TEXT, seqnum INTEGER, timestamp TEXT, side TEXT, "
+            "qty REAL, price REAL, trade_id TEXT, received_at REAL)"
+        )
+        self._insert = f"INSERT INTO trades VALUES ({', '.join('?' for _ in COLUMNS)})"
+
+    def write_batch(self, rows: list[Row]) -> None:
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def size(self) -> int:
+        wal = self.path + "-wal"
+        return super().size() + (os.path.getsize(wal) if os.path.exists(wal) else 0)
+
+
+class CsvSink(TradeSink):
+    extension = "csv"
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20):
+        super().__init__(path)
+        self._file = open(path, "w", newline="", buffering=buffer_size)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write_batch(self, rows: list[Row]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def size(self) -> int:
+        return self._file.tell()
+
+
+class ParquetSink(TradeSink):
+    extension = "parquet"
+
+    def __init__(self, path: str):
+        if pyarrow is None:
+            raise ValueError("Parquet output requires pyarrow")
+        super().__init__(path)
+        self._schema = pyarrow.schema([
+            ("symbol", pyarrow.string()),
+            ("seqnum", pyarrow.int64()),
+            ("timestamp", pyarrow.string()),
+            ("side", pyarrow.string()),
+            ("qty", pyarrow.float64()),
+            ("price", pyarrow.float64()),
+            ("trade_id", pyarrow.string()),
+            ("received_at", pyarrow.float64()),
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    # Each batch becomes one row group, built column by column.
+    def write_batch(self, rows: list[Row]) -> None:
+        columns = [list(column) for column in zip(*rows)]
+        self._writer.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(column, type=field.type) for column, field in zip(columns, self._schema)],
+            schema=self._schema,
+        ))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+SINKS: dict[str, type[TradeSink]] = {
+    "sqlite": SqliteSink,
+    "csv": CsvSink,
+    "parquet": ParquetSink,
+}
+
+
+# Trades are appended to an in-memory batch on the receive path; full batches
+# are handed to a writer thread, so a slow disk drops whole batches (counted in
+# `dropped`) instead of stalling the socket. A batch the sink fails to write is
+# counted in `failed`, with the error kept in `last_error`, and the writer
+# carries on with the next one.
+class TradeRecorder:
+    def __init__(
+        self,
+        directory: str,
+        format: str = "sqlite",
+        prefix: str = "trades",
+        batch_size: int = 10_000,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        max_seconds: float | None = None,
+        max_pending_batches: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if format not in SINKS:
+            raise ValueError(f"Unknown recording format '{format}'. Supported: {', '.join(SINKS)}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if format == "parquet" and pyarrow is None:
+            raise ValueError("Parquet output requires pyarrow")
+
+        self.directory = directory
+        self.format = format
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self._clock = clock
+        self._batch: list[Row] = []
+        self._lock = threading.Lock()
+        self._pending: queue.Queue[list[Row] | None] = queue.Queue(max_pending_batches)
+        self._sink: TradeSink | None = None
+        self._opened_at = 0.0
+        self.files: list[str] = []
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: str | None = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="trade-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, message: dict[str, Any], received_at: float | None = None) -> None:
+        row = trade_row(message, received_at if received_at is not None else time.time())
+        if row is None:
+            return
+        with self._lock:
+            self._batch.append(row)
+            self.recorded += 1
+            if len(self._batch) < self.batch_size:
+                return
+            batch, self._batch = self._batch, []
+        self._hand_off(batch)
+
+    def _hand_off(self, batch: list[Row]) -> None:
+        try:
+            self._pending.put_nowait(batch)
+        except queue.Full:
+            self.dropped += len(batch)
+
+    def _take_partial(self) -> list[Row]:
+        with self._lock:
+            batch, self._batch = self._batch, []
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = self._pending.get(timeout=self.flush_interval)
+            except queue.Empty:
+                batch = self._take_partial()
+            if batch is None:
+                break
+            if batch:
+                self._write(batch)
+
+        for batch in (*self._drain(), self._take_partial()):
+            if batch:
+                self._write(batch)
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def _drain(self) -> list[list[Row]]:
+        batches = []
+        while True:
+            try:
+                batch = self._pending.get_nowait()
+            except queue.Empty:
+                return batches
+            if batch is not None:
+                batches.append(batch)
+
+    def _should_rotate(self) -> bool:
+        sink = self._sink
+        if sink is None:
+            return True
+        if self.max_seconds is not None and self._clock() - self._opened_at >= self.max_seconds:
+            return True
+        return self.max_bytes is not None and sink.size() >= self.max_bytes
+
+    def _write(self, batch: list[Row]) -> None:
+        try:
+            if self._should_rotate():
+                self._rotate()
+            self._sink.write_batch(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            self.last_error = f"{type(e).__name__}: {e}"
+            return
+        self.written += len(batch)
+
+    def _rotate(self) -> None:
+        if self._sink is not None:
+            sink, self._sink = self._sink, None
+            sink.close()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(
+            self.directory, f"{self.prefix}-{stamp}-{len(self.files):04d}.{SINKS[self.format].extension}"
+        )
+        self._sink = SINKS[self.format](path)
+        self._opened_at = self._clock()
+        self.files.append(path)
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self._pending.put(None)
+        self._thread.join()
+
+    def status(self) -> dict:
+        return {
+            "format": self.format,
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_error": self.last_error,
+            "files": list(self.files),
+        }
+
+    def __enter__(self) -> "TradeRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def add_record_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--record", metavar="DIR", help="Record received trades to files in this directory")
+    parser.add_argument("--record-format", choices=list(SINKS), default="sqlite")
+    parser.add_argument("--rotate-mb", type=float, default=0.0, help="Start a new recording file after this size")
+    parser.add_argument("--rotate-seconds", type=float, default=0.0,
+                        help="Start a new recording file after this many seconds")
+
+
+def recorder_from_args(args: argparse.Namespace) -> TradeRecorder | None:
+    if not args.record:
+        return None
+    return TradeRecorder(
+        args.record,
+        format=args.record_format,
+        max_bytes=int(args.rotate_mb * 1024 * 1024) if args.rotate_mb else None,
+        max_seconds=args.rotate_seconds or None,
+    )
@@ -0,0 +1,264 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable
+
+from .decoding import decode_frame
+from .histogram import LatencyHistogram, format_summary, save_histogram
+from .hub_client import HubRpcClient, build_hub_connection
+from .latency import trade_payload
+from .reconnect import ReconnectingClient
+
+
+DEFAULT_DIRECT_URL = "ws://localhost:5000/ws"
+DEFAULT_HUB_URL = "http://localhost:5181"
+
+
+def trade_key(trade: dict[str, Any]) -> str | None:
+    trade_id = trade.get("trade_id", trade.get("tradeId"))
+    return None if trade_id is None else str(trade_id)
+
+
+# Joins the direct and relayed copies of each trade by trade id. Whichever
+# copy arrives first waits in an insertion-ordered map for at most `window`
+# seconds, so memory is bounded by the trade rate times the window (and by
+# max_pending). Trades seen on the direct stream before the relay delivered
+# anything for that symbol are not counted as drops: the relay may not have
+# been subscribed yet.
+class TradeJoiner:
+    def __init__(
+        self,
+        window: float = 5.0,
+        max_pending: int = 100_000,
+        histogram: LatencyHistogram | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.window = window
+        self.max_pending = max_pending
+        self.histogram = histogram if histogram is not None else LatencyHistogram()
+        self._clock = clock
+        self._direct: OrderedDict[str, tuple[float, str, int]] = OrderedDict()
+        self._relayed: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._matched: OrderedDict[str, float] = OrderedDict()
+        self._direct_order: dict[str, int] = {}
+        self._relayed_order: dict[str, int] = {}
+        self._live_from: dict[str, float] = {}
+        self.matched = 0
+        self.dropped = 0
+        self.unmatched_relayed = 0
+        self.duplicates_direct = 0
+        self.duplicates_relayed = 0
+        self.reordered = 0
+        self.relayed_first = 0
+        self.evicted = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._direct) + len(self._relayed)
+
+    def direct(self, trade_id: str, symbol: str, at: float | None = None) -> None:
+        at = at if at is not None else self._clock()
+        self.expire(at)
+        if trade_id in self._direct or trade_id in self._matched:
+            self.duplicates_direct += 1
+            return
+        order = self._direct_order[symbol] = self._direct_order.get(symbol, 0) + 1
+        relayed = self._relayed.pop(trade_id, None)
+        if relayed is not None:
+            self.relayed_first += 1
+            self._match(trade_id, symbol, order, at, relayed[0])
+            return
+        self._direct[trade_id] = (at, symbol, order)
+        self._bound(self._direct)
+
+    def relayed(self, trade_id: str, symbol: str, at: float | None = None) -> None:
+        at = at if at is not None else self._clock()
+        self.expire(at)
+        if trade_id in self._relayed or trade_id in self._matched:
+            self.duplicates_relayed += 1
+            return
+        direct = self._direct.pop(trade_id, None)
+        if direct is None:
+            self._relayed[trade_id] = (at, symbol)
+            self._bound(self._relayed)
+            return
+        self._match(trade_id, symbol, direct[2], direct[0], at)
+
+    # Reordering is judged against the direct stream: a relayed trade is
+    # reordered if the relay already delivered one that arrived directly
+    # after it.
+    def _match(self, trade_id: str, symbol: str, order: int, direct_at: float, relayed_at: float) -> None:
+        self.matched += 1
+        self.histogram.record((relayed_at - direct_at) * 1000.0)
+        if order < self._relayed_order.get(symbol, 0):
+            self.reordered += 1
+        else:
+            self._relayed_order[symbol] = order
+        self._live_from.setdefault(symbol, min(direct_at, relayed_at))
+        self._matched[trade_id] = max(direct_at, relayed_at)
+
+    def _bound(self, pending: OrderedDict) -> None:
+        while len(pending) > self.max_pending:
+            pending.popitem(last=False)
+            self.evicted += 1
+
+    def _live(self, symbol: str, at: float) -> bool:
+        live_from = self._live_from.get(symbol)
+        return live_from is not None and at >= live_from
+
+    def expire(self, now: float | None = None) -> None:
+        cutoff = (now if now is not None else self._clock()) - self.window
+        while self._direct and next(iter(self._direct.values()))[0] < cutoff:
+            _, (at, symbol, _) = self._direct.popitem(last=False)
+            if self._live(symbol, at):
+                self.dropped += 1
+        while self._relayed and next(iter(self._relayed.values()))[0] < cutoff:
+            _, (at, symbol) = self._relayed.popitem(last=False)
+            if self._live(symbol, at):
+                self.unmatched_relayed += 1
+        while self._matched and next(iter(self._matched.values())) < cutoff:
+            self._matched.popitem(last=False)
+
+    def summary(self) -> dict:
+        expected = self.matched + self.dropped
+        return {
+            "matched": self.matched,
+            "dropped": self.dropped,
+            "drop_rate": self.dropped / expected if expected else 0.0,
+            "unmatched_relayed": self.unmatched_relayed,
+            "duplicates_direct": self.duplicates_direct,
+            "duplicates_relayed": self.duplicates_relayed,
+            "reordered": self.reordered,
+            "relayed_first": self.relayed_first,
+            "evicted": self.evicted,
+            "pending": self.pending,
+            "added_ms": self.histogram.summary(),
+        }
+
+    @staticmethod
+    def format(summary: dict) -> str:
+        added = summary["added_ms"]
+        headline = (f"Relay overhead: p50={added['p50']:.3f}ms p99={added['p99']:.3f}ms"
+                    if added["count"] else "Relay overhead: no matched trades")
+        return "\n".join([
+            headline,
+            f"matched={summary['matched']} dropped={summary['dropped']} ({summary['drop_rate']:.2%}) "
+            f"unmatched_relayed={summary['unmatched_relayed']} reordered={summary['reordered']} "
+            f"duplicates={summary['duplicates_direct']}/{summary['duplicates_relayed']} (direct/relayed) "
+            f"relayed_first={summary['relayed_first']} evicted={summary['evicted']} pending={summary['pending']}",
+        ])
+
+
+async def run_relay_overhead(
+    joiner: TradeJoiner,
+    direct_url: str,
+    hub_url: str,
+    symbols: list[str],
+    duration: float = 0.0,
+    interval: float = 5.0,
+    on_report: Callable[[dict], None] | None = None,
+    connect: Callable[[str], Any] = build_hub_connection,
+) -> None:
+    loop = asyncio.get_running_loop()
+
+    def on_direct(message: dict[str, Any]) -> None:
+        trade = trade_payload(message)
+        key = trade_key(trade) if trade is not None else None
+        if key is not None:
+            joiner.direct(key, trade["symbol"])
+
+    # Runs on signalrcore's receive thread: only the arrival time is taken
+    # here, the join itself happens on the event loop.
+    def on_relayed(message: Any) -> None:
+        at = time.monotonic()
+        for item in message if isinstance(message, list) else [message]:
+            if isinstance(item, str) and "trades.update" in item:
+                try:
+                    item = decode_frame(item)
+                except json.JSONDecodeError:
+                    continue
+            trade = trade_payload(item) if isinstance(item, Mapping) else None
+            key = trade_key(trade) if trade is not None else None
+            if key is not None:
+                loop.call_soon_threadsafe(joiner.relayed, key, trade["symbol"], at)
+
+    direct = ReconnectingClient(direct_url, symbols, on_message=on_direct)
+    direct_task = asyncio.create_task(direct.run())
+    hub = HubRpcClient(connect(f"{hub_url}/blockchain"), on_message=on_relayed)
+    try:
+        if not await direct.wait_connected():
+            raise ConnectionError(f"Could not connect to {direct_url}")
+        await hub.start()
+        for symbol, result in zip(symbols, await hub.subscribe_all(symbols)):
+            if isinstance(result, BaseException):
+                raise ConnectionError(f"Relay subscription to {symbol} failed: {result}")
+
+        async with asyncio.timeout(duration or None):
+            while True:
+                await asyncio.sleep(interval)
+                joiner.expire()
+                if on_report is not None:
+                    on_report(joiner.summary())
+    except (TimeoutError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            await hub.unsubscribe_all(list(hub.subscriptions))
+        except Exception:
+            pass
+        await hub.stop()
+        await direct.close()
+        await asyncio.gather(direct_task, return_exceptions=True)
+        joiner.expire()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure the latency the DataServer adds by joining direct and relayed trades on trade id")
+    parser.add_argument("--direct-url", default=DEFAULT_DIRECT_URL, help="Simulator WebSocket endpoint")
+    parser.add_argument("--hub-url", default=DEFAULT_HUB_URL, help="DataServer base URL")
+    parser.add_argument("--symbols", type=lambda value: [s.strip() for s in value.split(",") if s.strip()],
+                        default=["ETH-USD"], help="Comma-separated symbols to subscribe to on both paths")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run for (0 runs until Ctrl+C)")
+    parser.add_argument("--window", type=float, default=5.0,
+                        help="Seconds a trade waits for its other copy before it counts as dropped")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between progress reports")
+    parser.add_argument("--histogram-output", help="Write the added-latency histogram to this JSON file")
+    parser.add_argument("--output", help="Write the JSON summary to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    print(f"Joining {args.direct_url} and {args.hub_url}/blockchain on trade id for {', '.join(args.symbols)}")
+    joiner = TradeJoiner(args.window)
+    try:
+        asyncio.run(run_relay_overhead(
+            joiner, args.direct_url, args.hub_url, args.symbols, args.duration, args.interval,
+            on_report=lambda summary: print(TradeJoiner.format(summary), flush=True),
+        ))
+    except KeyboardInterrupt:
+        pass
+
+    summary = joiner.summary()
+    print()
+    print(TradeJoiner.format(summary))
+    print(format_summary(joiner.histogram.summary()))
+    if args.histogram_output:
+        save_histogram(args.histogram_output, joiner.histogram, label="relay-overhead")
+        print(f"Added-latency histogram written to {args.histogram_output}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
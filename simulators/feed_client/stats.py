@@ -0,0 +1,62 @@
+import time
+from collections import deque
+from typing import Callable
+
+from .histogram import LatencyHistogram
+
+
+class RollingStats:
+    def __init__(self, window: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        if window <= 0:
+            raise ValueError("window must be positive")
+
+        self.window = window
+        self._clock = clock
+        self.started = clock()
+        self.messages = 0
+        self.trades = 0
+        self._marks: deque[tuple[float, int]] = deque([(self.started, 0)])
+        self.histogram = LatencyHistogram()
+        self._interval = LatencyHistogram()
+
+    def record(self, latency_ms: float | None = None) -> None:
+        self.messages += 1
+        if latency_ms is not None:
+            self.trades += 1
+            self.histogram.record(latency_ms)
+            self._interval.record(latency_ms)
+
+    def snapshot(self) -> dict:
+        now = self._clock()
+        marks = self._marks
+        marks.append((now, self.messages))
+        while len(marks) > 2 and now - marks[1][0] >= self.window:
+            marks.popleft()
+
+        since, messages = marks[0]
+        interval = self._interval
+
+        snapshot = {
+            "elapsed_s": now - self.started,
+            "messages": self.messages,
+            "trades": self.trades,
+            "msgs_per_sec": (self.messages - messages) / (now - since) if now > since else 0.0,
+            "latency_ms": {"count": interval.count},
+        }
+        if interval.count:
+            snapshot["latency_ms"].update({
+                "p50": interval.percentile(0.50),
+                "p99": interval.percentile(0.99),
+                "max": interval.max,
+            })
+            interval.reset()
+        return snapshot
+
+    @staticmethod
+    def format(snapshot: dict) -> str:
+        line = (f"[{snapshot['elapsed_s']:8.1f}s] {snapshot['messages']:>10} msgs "
+                f"{snapshot['msgs_per_sec']:>10.1f} msg/s")
+        latency = snapshot["latency_ms"]
+        if latency["count"]:
+            line += f"  latency p50={latency['p50']:.2f}ms p99={latency['p99']:.2f}ms max={latency['max']:.2f}ms"
+        return line
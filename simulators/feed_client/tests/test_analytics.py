@@ -0,0 +1,149 @@
+import argparse
+import json
+import math
+
+import pytest
+
+from feed_client.analytics import (
+    SymbolWindow,
+    TradeAnalytics,
+    add_analytics_arguments,
+    analytics_from_args,
+    measure_throughput,
+    synthetic_trades,
+)
+from feed_client.decode_bench import FRAMES
+from feed_client.decoding import PackedTradeView
+
+
+def trade(at: float, price: float, qty: float = 1.0, symbol: str = "ETH-USD") -> dict:
+    seconds, fraction = divmod(round(at * 1_000_000), 1_000_000)
+    return {"seqnum": 1, "event": "updated", "channel": "trades", "symbol": symbol,
+            "timestamp": f"2026-01-01T00:00:{seconds:02d}.{fraction:06d}Z", "side": "buy",
+            "qty": qty, "price": price, "trade_id": "1"}
+
+
+EPOCH = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+
+
+class TestSymbolWindow:
+    def test_running_sums_follow_the_window(self):
+        window = SymbolWindow("ETH-USD", window=10.0)
+        window.add(0.0, 100.0, 1.0)
+        window.add(5.0, 110.0, 3.0)
+        snapshot = window.snapshot()
+        assert snapshot["vwap"] == pytest.approx((100.0 + 330.0) / 4.0)
+        assert (snapshot["open"], snapshot["high"], snapshot["low"], snapshot["close"]) == (100.0, 110.0, 100.0, 110.0)
+        assert snapshot["volatility"] == pytest.approx(abs(math.log(1.1)))
+
+        window.add(12.0, 105.0, 1.0)
+        snapshot = window.snapshot()
+        assert snapshot["trades"] == 2
+        assert snapshot["volume"] == pytest.approx(4.0)
+        assert (snapshot["open"], snapshot["high"], snapshot["low"]) == (110.0, 110.0, 105.0)
+        assert snapshot["volatility"] == pytest.approx(math.hypot(math.log(1.1), math.log(105 / 110)))
+
+    def test_high_and_low_match_a_full_scan(self):
+        window = SymbolWindow("ETH-USD", window=3.0)
+        prices = [100, 103, 101, 99, 104, 102, 98, 100, 105, 97, 101]
+        for second, price in enumerate(prices):
+            window.add(float(second), float(price), 1.0)
+            in_window = prices[max(0, second - 2):second + 1]
+            snapshot = window.snapshot()
+            assert (snapshot["high"], snapshot["low"]) == (max(in_window), min(in_window))
+
+    def test_out_of_order_trades_do_not_move_time_backwards(self):
+        window = SymbolWindow("ETH-USD", window=1.0)
+        window.add(5.0, 100.0, 1.0)
+        window.add(4.0, 101.0, 1.0)
+        assert window.snapshot()["trades"] == 2
+
+    def test_empty_window_resets_sums(self):
+        window = SymbolWindow("ETH-USD", window=1.0)
+        window.add(0.0, 100.0, 0.1)
+        window.evict(5.0)
+        assert window.snapshot() == {"trades": 0, "rate": 0.0, "volume": 0.0}
+
+
+class TestTradeAnalytics:
+    def test_closes_bars_on_interval_boundaries(self):
+        bars = []
+        analytics = TradeAnalytics(window=60.0, bar_interval=1.0, on_bar=bars.append)
+        analytics.record(trade(0.1, 100.0, 1.0))
+        analytics.record(trade(0.5, 102.0, 1.0))
+        analytics.record(trade(0.9, 99.0, 2.0))
+        analytics.record(trade(1.2, 101.0, 1.0))
+
+        assert len(bars) == 1
+        bar = bars[0]
+        assert bar.start == EPOCH
+        assert (bar.open, bar.high, bar.low, bar.close, bar.trades) == (100.0, 102.0, 99.0, 99.0, 3)
+        assert bar.volume == 4.0
+        assert bar.vwap == pytest.approx((100 + 102 + 198) / 4)
+
+    def test_flush_closes_quiet_symbols(self):
+        analytics = TradeAnalytics(window=60.0, bar_interval=1.0)
+        analytics.record(trade(0.1, 100.0, symbol="BTC-USD"))
+        analytics.record(trade(2.5, 50.0, symbol="ETH-USD"))
+        analytics.flush()
+        assert [bar.symbol for bar in analytics.bars] == ["BTC-USD"]
+
+    def test_snapshot_ages_quiet_windows_by_feed_time(self):
+        analytics = TradeAnalytics(window=5.0)
+        analytics.record(trade(0.0, 100.0, symbol="BTC-USD"))
+        analytics.record(trade(30.0, 50.0, symbol="ETH-USD"))
+        snapshot = analytics.snapshot()
+        assert snapshot["symbols"]["BTC-USD"]["trades"] == 0
+        assert snapshot["symbols"]["ETH-USD"]["trades"] == 1
+
+    def test_relayed_notifications_and_packed_frames(self):
+        analytics = TradeAnalytics()
+        analytics.record({"jsonrpc": "2.0", "method": "trades.update", "params": {
+            **trade(0.0, 100.0), "timestamp": "2026-01-01T00:00:00.0000000+00:00"}})
+        analytics.record(PackedTradeView(FRAMES["packed"]))
+        analytics.record({"event": "subscribed", "symbol": "ETH-USD"})
+        analytics.record(trade(1.0, 0.0))
+        snapshot = analytics.snapshot()
+        assert snapshot["trades"] == 2
+        assert snapshot["skipped"] == 1
+        assert set(snapshot["symbols"]) == {"ETH-USD"}
+
+    def test_format(self):
+        analytics = TradeAnalytics()
+        analytics.record(trade(0.0, 100.0))
+        analytics.record(trade(1.0, 101.0))
+        line = TradeAnalytics.format(analytics.snapshot())
+        assert "ETH-USD" in line and "vwap 100.5000" in line
+
+    def test_bars_serialize(self):
+        analytics = TradeAnalytics(bar_interval=1.0)
+        analytics.record(trade(0.0, 100.0))
+        analytics.record(trade(1.0, 101.0))
+        assert json.loads(json.dumps(analytics.bars[0].to_dict()))["open"] == 100.0
+
+    @pytest.mark.parametrize("kwargs", [{"window": 0}, {"bar_interval": -1}, {"max_bars": 0}])
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            TradeAnalytics(**kwargs)
+
+    def test_short_and_long_windows(self):
+        trades = synthetic_trades(2_000, ["A", "B"], rate=1_000.0)
+        short = TradeAnalytics(window=0.01)
+        long = TradeAnalytics(window=3_600.0)
+        measure_throughput(short, trades)
+        measure_throughput(long, trades)
+        assert short.trades == long.trades == 2_000
+        assert long.snapshot()["symbols"]["A"]["trades"] == 1_000
+
+
+class TestAnalyticsArguments:
+    def test_disabled_by_default(self):
+        parser = argparse.ArgumentParser()
+        add_analytics_arguments(parser)
+        assert analytics_from_args(parser.parse_args([])) is None
+
+    def test_enabled_by_bars_output(self):
+        parser = argparse.ArgumentParser()
+        add_analytics_arguments(parser)
+        analytics = analytics_from_args(parser.parse_args(["--bars-output", "bars.ndjson", "--bar-interval", "5"]))
+        assert analytics.bar_interval == 5.0
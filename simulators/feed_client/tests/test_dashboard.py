@@ -0,0 +1,116 @@
+import pytest
+
+from feed_client.dashboard import SPARK_CHARS, Dashboard, DashboardState, sparkline
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def trade(seqnum: int, symbol: str = "ETH-USD", price: float = 2500.0) -> dict:
+    return {
+        "seqnum": seqnum,
+        "event": "updated",
+        "channel": "trades",
+        "symbol": symbol,
+        "timestamp": "1970-01-01T00:00:01.000000Z",
+        "side": "buy",
+        "qty": 1.0,
+        "price": price,
+        "trade_id": str(seqnum),
+    }
+
+
+class TestSparkline:
+    def test_empty(self):
+        assert sparkline([]) == ""
+
+    def test_flat(self):
+        assert len(set(sparkline([1.0, 1.0, 1.0]))) == 1
+
+    def test_spans_full_range(self):
+        line = sparkline([1.0, 2.0, 3.0])
+        assert line[0] == SPARK_CHARS[0]
+        assert line[-1] == SPARK_CHARS[-1]
+
+
+class TestDashboardState:
+    def test_tracks_last_price_and_counts(self):
+        state = DashboardState(["ETH-USD", "BTC-USD"], clock=FakeClock())
+        state.observe({"seqnum": 0, "event": "subscribed", "channel": "trades", "symbol": "ETH-USD"}, 1.0)
+        state.observe(trade(1, price=2500.0), 1.0)
+        state.observe(trade(2, price=2501.5), 1.0)
+        assert state.symbols["ETH-USD"].last_price == 2501.5
+        assert state.symbols["ETH-USD"].stats.trades == 2
+        assert state.symbols["BTC-USD"].stats.trades == 0
+        assert state.total.messages == 3
+        assert list(state.events) == ["subscribed ETH-USD"]
+
+    def test_counts_seqnum_gaps(self):
+        state = DashboardState(["ETH-USD"])
+        for seqnum in (0, 1, 4, 5, 9):
+            state.observe(trade(seqnum), 1.0)
+        assert state.gaps == 2
+        assert state.missing == 5
+
+    def test_restart_from_zero_is_not_a_gap(self):
+        state = DashboardState(["ETH-USD"])
+        for seqnum in (0, 1, 2, 0, 1):
+            state.observe(trade(seqnum), 1.0)
+        assert state.gaps == 0
+
+    def test_gap_tracking_can_be_disabled(self):
+        state = DashboardState(["ETH-USD"], track_gaps=False)
+        state.observe(trade(0), 1.0)
+        state.observe(trade(10), 1.0)
+        assert state.gaps == 0
+        assert "not tracked" in "\n".join(state.render())
+
+    def test_relayed_notifications(self):
+        state = DashboardState(["ETH-USD"], track_gaps=False)
+        state.observe({"jsonrpc": "2.0", "method": "trades.update", "params": trade(1, price=10.0)}, 1.0)
+        state.observe({"jsonrpc": "2.0", "result": {"event": "subscribed", "symbol": "ETH-USD"}, "id": "1"}, 1.0)
+        assert state.symbols["ETH-USD"].last_price == 10.0
+        assert list(state.events) == ["subscribed ETH-USD"]
+
+    def test_render(self):
+        clock = FakeClock()
+        state = DashboardState(["ETH-USD", "BTC-USD"], clock=clock)
+        state.set_connection("connected (json)")
+        for seqnum, price in enumerate([1.0, 2.0, 3.0]):
+            state.observe(trade(seqnum, price=price), 1.0)
+            clock.now += 1.0
+            lines = state.render(width=100)
+
+        assert lines[0] == "Connection: connected (json)"
+        assert "Seqnum gaps: 0 (0 missing)" in lines
+        eth = next(line for line in lines if line.startswith("ETH-USD"))
+        assert "3.00" in eth
+        assert eth.endswith(sparkline([1.0, 2.0, 3.0]))
+        btc = next(line for line in lines if line.startswith("BTC-USD"))
+        assert " - " in btc
+
+    def test_render_truncates_to_width(self):
+        state = DashboardState(["ETH-USD"])
+        assert all(len(line) <= 30 for line in state.render(width=30))
+
+    def test_events_are_bounded(self):
+        state = DashboardState([])
+        for index in range(10):
+            state.observe({"event": "error", "message": f"e{index}"}, 1.0)
+        assert list(state.events) == ["error e7", "error e8", "error e9"]
+
+    def test_note_adds_event(self):
+        state = DashboardState(["ETH-USD"])
+        state.note("Outage 1: connection lost")
+        assert "> Outage 1: connection lost" in state.render()
+
+
+class TestDashboard:
+    def test_rejects_non_positive_fps(self):
+        with pytest.raises(ValueError):
+            Dashboard(DashboardState([]), fps=0)
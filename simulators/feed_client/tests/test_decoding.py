@@ -0,0 +1,157 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from feed_client.decode_bench import FRAMES, SAMPLE_TRADE, format_decode_bench, run_decode_bench, unpack_trade
+from feed_client.decoding import (
+    SIDES,
+    TRADE_MESSAGE_TYPE,
+    TRADE_STRUCT,
+    PackedTradeView,
+    TradeView,
+    decode_frame,
+    is_packed_trade,
+    loads,
+    loads_for,
+    orjson,
+)
+from feed_client.latency import latency_ms, timestamp_to_micros, trade_payload
+from feed_client.output import NdjsonWriter
+
+
+class TestLoads:
+    def test_rejects_unknown_backend(self):
+        with pytest.raises(ValueError):
+            loads_for("simplejson")
+
+    def test_json_backend(self):
+        assert loads_for("json")('{"a": 1}') == {"a": 1}
+
+    @pytest.mark.skipif(orjson is None, reason="orjson not installed")
+    def test_orjson_errors_are_json_decode_errors(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_for("orjson")("not json")
+
+    def test_default_backend_parses_bytes_and_text(self):
+        assert loads(b'{"a": [1, 2]}') == loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+class TestTradeView:
+    def test_reads_fields_without_parsing_the_frame(self):
+        view = TradeView(json.dumps(SAMPLE_TRADE))
+        assert view["symbol"] == "ETH-USD"
+        assert view["seqnum"] == 1234
+        assert view["price"] == 11252.4
+        assert view["qty"] == 8.5e-5
+        assert view.get("missing", "default") == "default"
+        assert "trade_id" in view
+        assert "missing" not in view
+        with pytest.raises(KeyError):
+            view["missing"]
+
+    def test_compact_and_spaced_separators(self):
+        frame = '{"a":1,"b" : "x","c":true,"d":null,"e":-2.5e3}'
+        view = TradeView(frame)
+        assert [view["a"], view["b"], view["c"], view["d"], view["e"]] == [1, "x", True, None, -2500.0]
+
+    def test_value_equal_to_a_key_is_skipped(self):
+        view = TradeView('{"event": "symbol", "symbol": "ETH-USD"}')
+        assert view["symbol"] == "ETH-USD"
+
+    def test_escaped_strings(self):
+        view = TradeView(json.dumps({"text": 'say "hi"\n', "after": 1}))
+        assert view["text"] == 'say "hi"\n'
+        assert view["after"] == 1
+
+    def test_nested_notification(self):
+        notification = json.dumps({"jsonrpc": "2.0", "method": "trades.update",
+                                   "params": {**SAMPLE_TRADE, "tags": [1, {"a": "}"}]}})
+        view = TradeView(notification)
+        params = view["params"]
+        assert isinstance(params, TradeView)
+        assert params["tags"] == [1, {"a": "}"}]
+        assert params.to_dict() == {**SAMPLE_TRADE, "tags": [1, {"a": "}"}]}
+        assert trade_payload(view)["symbol"] == "ETH-USD"
+
+    def test_only_top_level_keys_match(self):
+        view = TradeView(json.dumps({"meta": {"symbol": "BTC-USD", "ids": [{"price": 1}]}, "symbol": "ETH-USD"}))
+        assert view["symbol"] == "ETH-USD"
+        assert "price" not in view
+        assert view["meta"]["symbol"] == "BTC-USD"
+
+    def test_nested_view_ignores_keys_after_it_closes(self):
+        view = TradeView(json.dumps({"params": {"symbol": "ETH-USD"}, "id": "7"}))
+        params = view["params"]
+        assert params.get("id") is None
+        assert params["symbol"] == "ETH-USD"
+        assert view["id"] == "7"
+
+    def test_behaves_as_a_mapping(self):
+        view = TradeView(json.dumps(SAMPLE_TRADE).encode())
+        assert view == SAMPLE_TRADE
+        assert dict(view) == SAMPLE_TRADE
+        assert len(view) == len(SAMPLE_TRADE)
+        assert json.loads(json.dumps(view, default=dict)) == SAMPLE_TRADE
+
+
+class TestPackedTradeView:
+    def test_layout_matches_the_simulator(self):
+        path = Path(__file__).parents[2] / "blockchain_api" / "blockchain_api" / "wire_protocol.py"
+        spec = importlib.util.spec_from_file_location("simulator_wire_protocol", path)
+        simulator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(simulator)
+        assert simulator.TRADE_STRUCT.format == TRADE_STRUCT.format
+        assert simulator.TRADE_MESSAGE_TYPE == TRADE_MESSAGE_TYPE
+        assert simulator.SIDES == SIDES
+
+    def test_matches_full_unpack(self):
+        view = PackedTradeView(FRAMES["packed"])
+        assert view == unpack_trade(FRAMES["packed"]) == SAMPLE_TRADE
+        assert view.timestamp_micros == timestamp_to_micros(SAMPLE_TRADE["timestamp"])
+        assert view.get("missing") is None
+        assert "timestamp_micros" not in view
+
+    def test_rejects_other_frames(self):
+        assert not is_packed_trade(b"\x89" + bytes(57))
+        with pytest.raises(ValueError):
+            PackedTradeView(b"{}")
+
+    def test_latency_uses_unformatted_timestamp(self):
+        received_at = timestamp_to_micros(SAMPLE_TRADE["timestamp"]) / 1_000_000 + 0.25
+        assert latency_ms(PackedTradeView(FRAMES["packed"]), received_at) == pytest.approx(250.0, abs=0.01)
+
+
+class TestDecodeFrame:
+    def test_packed_frames_become_views(self):
+        assert isinstance(decode_frame(FRAMES["packed"]), PackedTradeView)
+
+    def test_text_frames_are_parsed_unless_lazy(self):
+        assert type(decode_frame(FRAMES["direct"])) is dict
+        assert isinstance(decode_frame(FRAMES["direct"], lazy=True), TradeView)
+        assert isinstance(decode_frame(FRAMES["relayed"], lazy=True), TradeView)
+
+    def test_non_trades_are_parsed_in_full(self):
+        response = '{"jsonrpc": "2.0", "result": {"event": "subscribed"}, "id": "1"}'
+        assert type(decode_frame(response, lazy=True)) is dict
+        assert decode_frame("[1, 2]", lazy=True) == [1, 2]
+
+    def test_fallback_decoder(self):
+        assert decode_frame(b"\x81\xa1a\x01", fallback=lambda frame: {"decoded": frame}) == {"decoded": b"\x81\xa1a\x01"}
+
+    def test_ndjson_writer_serializes_views(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+        writer = NdjsonWriter(str(path))
+        writer.write(decode_frame(FRAMES["packed"]))
+        writer.close()
+        assert json.loads(path.read_text()) == SAMPLE_TRADE
+
+
+class TestDecodeBench:
+    def test_runs_every_decoder_and_workload(self):
+        results = run_decode_bench(iterations=10, rounds=1)
+        assert {row["frame"] for row in results} == {"direct", "relayed", "packed"}
+        assert all(row["latency_ns"] > 0 for row in results)
+        assert format_decode_bench(results).splitlines()[0].split() == [
+            "frame", "decoder", "bytes", "decode_ns", "latency_ns", "fields_ns"]
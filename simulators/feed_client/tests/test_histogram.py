@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from feed_client.compare import format_comparison
+from feed_client.histogram import LatencyHistogram, format_summary, load_histogram, save_histogram
+
+
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("lowest, highest, precision", [
+        (0, 10, 0.01),
+        (10, 10, 0.01),
+        (0.001, 10, 0),
+        (0.001, 10, 1),
+    ])
+    def test_rejects_invalid_layout(self, lowest, highest, precision):
+        with pytest.raises(ValueError):
+            LatencyHistogram(lowest, highest, precision)
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(0.5) == 0.0
+        assert histogram.summary() == {"count": 0}
+
+    def test_percentiles_within_precision(self):
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(1.0, 1.0) for _ in range(20_000)]
+        histogram = LatencyHistogram(precision=0.01)
+        for sample in samples:
+            histogram.record(sample)
+
+        ordered = sorted(samples)
+        for fraction in (0.5, 0.9, 0.99, 0.999):
+            exact = ordered[int(fraction * len(ordered)) - 1]
+            assert histogram.percentile(fraction) == pytest.approx(exact, rel=0.02)
+        assert histogram.min == ordered[0]
+        assert histogram.max == ordered[-1]
+        assert histogram.summary()["mean"] == pytest.approx(sum(samples) / len(samples))
+
+    def test_memory_is_bounded(self):
+        histogram = LatencyHistogram()
+        buckets = histogram.bucket_count
+        for value in range(100_000):
+            histogram.record(float(value))
+        assert histogram.bucket_count == buckets
+        assert len(histogram.to_dict()["buckets"]) < buckets
+
+    def test_out_of_range_values_are_clamped(self):
+        histogram = LatencyHistogram(lowest=1.0, highest=100.0)
+        histogram.record(-5.0)
+        histogram.record(1000.0)
+        assert histogram.count == 2
+        assert histogram.min == -5.0
+        assert histogram.max == 1000.0
+        assert histogram.percentile(1.0) == 1000.0
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(1.0)
+        b.record(10.0)
+        a.merge(b)
+        assert a.count == 2
+        assert (a.min, a.max) == (1.0, 10.0)
+
+    def test_merge_rejects_different_layouts(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(precision=0.01).merge(LatencyHistogram(precision=0.05))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(5.0)
+        histogram.reset()
+        assert histogram.summary() == {"count": 0}
+        assert histogram.percentile(0.5) == 0.0
+
+    def test_round_trips_through_dict(self):
+        histogram = LatencyHistogram()
+        for value in (0.5, 1.5, 2.5, 40.0):
+            histogram.record(value)
+        restored = LatencyHistogram.from_dict(histogram.to_dict())
+        assert restored.summary() == histogram.summary()
+
+    def test_from_dict_rejects_bad_bucket(self):
+        data = LatencyHistogram().to_dict()
+        data["buckets"] = [[10**9, 1]]
+        with pytest.raises(ValueError):
+            LatencyHistogram.from_dict(data)
+
+
+class TestHistogramFiles:
+    def test_save_and_compare(self, tmp_path):
+        direct, relayed = LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 101):
+            direct.record(float(value))
+            relayed.record(float(value) + 20.0)
+
+        save_histogram(tmp_path / "direct.json", direct, label="direct")
+        save_histogram(tmp_path / "relayed.json", relayed)
+        runs = [load_histogram(tmp_path / "direct.json"), load_histogram(tmp_path / "relayed.json")]
+        assert runs[0][0] == "direct"
+        assert runs[1][0] == str(tmp_path / "relayed.json")
+
+        table = format_comparison(runs)
+        assert table.splitlines()[0].split()[1] == "direct"
+        assert "p99" in table
+        assert "120.000" in table
+
+    def test_format_summary(self):
+        histogram = LatencyHistogram()
+        assert format_summary(histogram.summary()) == "latency_ms: no samples"
+        histogram.record(2.0)
+        assert format_summary(histogram.summary()).startswith("latency_ms: p50=2.000")
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from feed_client.hub_client import HubRpcClient, JsonRpcError, jsonrpc_batch, jsonrpc_request
+from feed_client.reconnect import BackoffPolicy
+
+
+class FakeHub:
+    def __init__(self, respond: bool = True, open_on_start: bool = True):
+        self.respond = respond
+        self.open_on_start = open_on_start
+        self.failing_starts = 0
+        self.starts = 0
+        self.transport = None
+        self.sent: list[str] = []
+        self.handlers = {}
+        self.callbacks = {}
+
+    def on_open(self, callback):
+        self.callbacks["open"] = callback
+
+    def on_close(self, callback):
+        self.callbacks["close"] = callback
+
+    def on(self, event, callback):
+        self.handlers[event] = callback
+
+    def start(self):
+        self.starts += 1
+        if self.failing_starts:
+            self.failing_starts -= 1
+            raise OSError("connection refused")
+        if self.open_on_start:
+            threading.Timer(0.01, self.callbacks["open"]).start()
+
+    def stop(self):
+        self.callbacks["close"]()
+
+    def drop(self):
+        threading.Thread(target=self.callbacks["close"]).start()
+
+    def deliver(self, *items):
+        threading.Thread(target=self.handlers["ReceiveMessage"], args=([*items],)).start()
+
+    def send(self, target, arguments):
+        assert target == "SendMessage"
+        request = json.loads(arguments[0])
+        self.sent.append(request)
+        if not self.respond:
+            return
+        if isinstance(request, list):
+            # Batch responses come back in reverse order, in one array.
+            self.deliver(json.dumps([self.respond_to(item) for item in reversed(request)]))
+        else:
+            self.deliver(json.dumps(self.respond_to(request)))
+
+    @staticmethod
+    def respond_to(request: dict) -> dict:
+        params = request["params"]
+        if params["symbol"] == "BAD":
+            return {"jsonrpc": "2.0", "result": None, "id": request["id"],
+                    "error": {"code": -32602, "message": "Invalid params", "data": "Invalid symbol: BAD"}}
+        return {"jsonrpc": "2.0", "result": {**params, "event": f"{request['method']}d"}, "error": None,
+                "id": request["id"]}
+
+
+class TestJsonRpcBatch:
+    def test_rejects_empty_batch(self):
+        with pytest.raises(ValueError):
+            jsonrpc_batch([])
+
+    def test_rejects_duplicate_ids(self):
+        request = jsonrpc_request("subscribe", {"channel": "trades", "symbol": "ETH-USD"}, "1")
+        with pytest.raises(ValueError):
+            jsonrpc_batch([request, request])
+
+
+class TestHubRpcClient:
+    @pytest.mark.asyncio
+    async def test_start_waits_for_open(self):
+        client = HubRpcClient(FakeHub())
+        await client.start(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_start_times_out_without_open(self):
+        client = HubRpcClient(FakeHub(open_on_start=False))
+        with pytest.raises(ConnectionError):
+            await client.start(timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_ids_are_unique(self):
+        client = HubRpcClient(FakeHub())
+        other = HubRpcClient(FakeHub())
+        ids = {client.next_id() for _ in range(100)} | {other.next_id() for _ in range(100)}
+        assert len(ids) == 200
+
+    @pytest.mark.asyncio
+    async def test_subscribe_resolves_with_result(self):
+        hub = FakeHub()
+        client = HubRpcClient(hub)
+        await client.start()
+        result = await client.subscribe("ETH-USD")
+        assert result == {"channel": "trades", "symbol": "ETH-USD", "event": "subscribed"}
+        assert client.subscriptions == {"ETH-USD": "trades"}
+        assert client.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self):
+        client = HubRpcClient(FakeHub())
+        await client.start()
+        with pytest.raises(JsonRpcError, match="Invalid symbol: BAD") as error:
+            await client.subscribe("BAD")
+        assert error.value.code == -32602
+        assert client.subscriptions == {}
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_are_correlated(self):
+        hub = FakeHub(respond=False)
+        client = HubRpcClient(hub)
+        await client.start()
+        task = asyncio.ensure_future(client.subscribe_all(["ETH-USD", "BAD", "BTC-USD"]))
+        await asyncio.sleep(0.01)
+        assert client.pending == 3
+        # Responses arrive in reverse order, all in one hub message.
+        hub.deliver(*(json.dumps({"jsonrpc": "2.0", "result": request["params"]["symbol"], "error": None,
+                                  "id": request["id"]}) for request in reversed(hub.sent)))
+        assert await asyncio.wait_for(task, 1) == ["ETH-USD", "BAD", "BTC-USD"]
+
+    @pytest.mark.asyncio
+    async def test_request_times_out(self):
+        client = HubRpcClient(FakeHub(respond=False), request_timeout=0.05)
+        await client.start()
+        with pytest.raises(TimeoutError):
+            await client.subscribe("ETH-USD")
+        assert client.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_requests(self):
+        hub = FakeHub(respond=False)
+        client = HubRpcClient(hub)
+        await client.start()
+        task = asyncio.ensure_future(client.subscribe("ETH-USD"))
+        await asyncio.sleep(0.01)
+        await client.stop()
+        with pytest.raises(ConnectionError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_rejects_duplicate_pending_id(self):
+        client = HubRpcClient(FakeHub(respond=False))
+        await client.start()
+        message = json.dumps(jsonrpc_request("subscribe", {"channel": "trades", "symbol": "ETH-USD"}, "same"))
+        client.send(message)
+        with pytest.raises(ValueError):
+            client.send(message)
+
+    @pytest.mark.asyncio
+    async def test_messages_are_forwarded(self):
+        received = []
+        hub = FakeHub()
+        client = HubRpcClient(hub, on_message=received.append)
+        await client.start()
+        await client.subscribe("ETH-USD")
+        notification = json.dumps({"jsonrpc": "2.0", "method": "trades.update", "params": {"tradeId": 1}})
+        hub.deliver(notification)
+        await asyncio.sleep(0.05)
+        assert len(received) == 2
+        assert received[1] == [notification]
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_resubscribes_after_unexpected_close(self):
+        events = []
+        hub = FakeHub()
+        client = HubRpcClient(
+            hub,
+            on_disconnect=lambda: events.append("lost"),
+            on_reconnect=lambda attempts: events.append(attempts),
+            policy=BackoffPolicy(initial_delay=0.01, max_delay=0.02),
+        )
+        await client.start()
+        await client.subscribe_all(["ETH-USD", "BTC-USD"])
+        hub.sent.clear()
+        hub.failing_starts = 2
+
+        hub.drop()
+        for _ in range(100):
+            if len(hub.sent) == 2 and not client.reconnecting:
+                break
+            await asyncio.sleep(0.01)
+        assert events == ["lost", 3]
+        assert client.reconnects == 1
+        assert sorted(request["params"]["symbol"] for request in hub.sent) == ["BTC-USD", "ETH-USD"]
+        assert client.resubscribe_errors == []
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        states = []
+        hub = FakeHub()
+        client = HubRpcClient(hub, on_state=states.append, policy=BackoffPolicy(initial_delay=0.01, max_attempts=2))
+        await client.start()
+        hub.failing_starts = 5
+
+        hub.drop()
+        for _ in range(100):
+            if states and states[-1].startswith("gave up"):
+                break
+            await asyncio.sleep(0.01)
+        assert states[-1] == "gave up after 2 attempt(s): connection refused"
+        assert hub.starts == 3
+        assert not client.reconnecting
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_reconnect(self):
+        hub = FakeHub()
+        client = HubRpcClient(hub, policy=BackoffPolicy(initial_delay=0.01))
+        await client.start()
+        await client.stop()
+        await asyncio.sleep(0.05)
+        assert hub.starts == 1
+        assert not client.reconnecting
+
+    def test_rejects_non_positive_batch_size(self):
+        with pytest.raises(ValueError):
+            HubRpcClient(FakeHub(), batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_batch_responses_are_correlated_per_element(self):
+        hub = FakeHub()
+        client = HubRpcClient(hub)
+        await client.start()
+        results = await client.subscribe_batch(["ETH-USD", "BAD", "BTC-USD"])
+        assert len(hub.sent) == 1
+        assert [request["params"]["symbol"] for request in hub.sent[0]] == ["ETH-USD", "BAD", "BTC-USD"]
+        assert results[0] == {"channel": "trades", "symbol": "ETH-USD", "event": "subscribed"}
+        assert isinstance(results[1], JsonRpcError) and results[1].code == -32602
+        assert results[2]["symbol"] == "BTC-USD"
+        assert client.subscriptions == {"ETH-USD": "trades", "BTC-USD": "trades"}
+        assert client.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_all_splits_into_batches(self):
+        hub = FakeHub()
+        client = HubRpcClient(hub, batch_size=2)
+        await client.start()
+        symbols = ["A", "B", "C", "D", "E"]
+        results = await client.subscribe_all(symbols)
+        assert [len(batch) for batch in hub.sent] == [2, 2, 1]
+        assert [result["symbol"] for result in results] == symbols
+        await client.unsubscribe_all(symbols)
+        assert client.subscriptions == {}
+        assert hub.sent[-1][0]["method"] == "unsubscribe"
+
+    @pytest.mark.asyncio
+    async def test_batch_times_out_as_a_whole(self):
+        client = HubRpcClient(FakeHub(respond=False), request_timeout=0.05, batch_size=10)
+        await client.start()
+        results = await client.subscribe_all(["ETH-USD", "BTC-USD"])
+        assert all(isinstance(result, TimeoutError) for result in results)
+        assert client.subscriptions == {}
+        assert client.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_resubscribes_in_batches(self):
+        hub = FakeHub()
+        client = HubRpcClient(hub, policy=BackoffPolicy(initial_delay=0.01), batch_size=10)
+        await client.start()
+        await client.subscribe_all(["ETH-USD", "BTC-USD"])
+        hub.sent.clear()
+
+        hub.drop()
+        for _ in range(100):
+            if hub.sent and not client.reconnecting:
+                break
+            await asyncio.sleep(0.01)
+        assert len(hub.sent) == 1
+        assert sorted(request["params"]["symbol"] for request in hub.sent[0]) == ["BTC-USD", "ETH-USD"]
+        assert client.resubscribe_errors == []
+
+    @pytest.mark.asyncio
+    async def test_stop_shuts_down_the_socket_first(self):
+        calls = []
+
+        class Socket:
+            def shutdown(self, how):
+                calls.append("shutdown")
+
+        hub = FakeHub()
+        hub.transport = type("Transport", (), {"_client": type("Client", (), {"sock": Socket()})()})()
+        hub.stop = lambda: calls.append("stop")
+        client = HubRpcClient(hub)
+        await client.start()
+        await client.stop()
+        assert calls == ["shutdown", "stop"]
@@ -0,0 +1,44 @@
+import pytest
+
+from feed_client.latency import latency_ms, timestamp_to_micros, trade_payload
+
+
+class TestTimestampToMicros:
+    @pytest.mark.parametrize("timestamp", [
+        "2026-01-02T03:04:05.123456Z",
+        "2026-01-02T03:04:05.1234567+00:00",
+        "2026-01-02T03:04:05.123456+00:00",
+    ])
+    def test_utc_formats(self, timestamp):
+        assert timestamp_to_micros(timestamp) == 1767323045123456
+
+    def test_short_fraction(self):
+        assert timestamp_to_micros("2026-01-02T03:04:05.5Z") == 1767323045500000
+
+    @pytest.mark.parametrize("timestamp", [
+        "2026-01-02T03:04:05Z",
+        "2026-01-02T04:04:05.123456+01:00",
+        "2026-01-02T03:04:05.123456",
+    ])
+    def test_falls_back_to_fromisoformat(self, timestamp):
+        assert timestamp_to_micros(timestamp) // 1_000_000 == 1767323045
+
+
+class TestLatency:
+    def test_direct_trade(self):
+        message = {"event": "updated", "timestamp": "1970-01-01T00:00:01.000000Z"}
+        assert latency_ms(message, 1.25) == pytest.approx(250.0)
+
+    def test_relayed_trade(self):
+        message = {"jsonrpc": "2.0", "method": "trades.update",
+                   "params": {"event": "updated", "timestamp": "1970-01-01T00:00:01.0000000+00:00"}}
+        assert trade_payload(message) is message["params"]
+        assert latency_ms(message, 1.5) == pytest.approx(500.0)
+
+    @pytest.mark.parametrize("message", [
+        {"event": "subscribed", "symbol": "ETH-USD"},
+        {"jsonrpc": "2.0", "result": {"event": "subscribed"}, "id": "1"},
+        {"jsonrpc": "2.0", "method": "connection.lost", "params": {}},
+    ])
+    def test_non_trades_have_no_latency(self, message):
+        assert latency_ms(message, 1.0) is None
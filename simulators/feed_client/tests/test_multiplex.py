@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from feed_client.multiplex import MultiplexedClient, SymbolRouter, assign_symbols
+
+
+async def fake_simulator(ws):
+    seqnum = 0
+    symbols = []
+    try:
+        async for frame in ws:
+            request = json.loads(frame)
+            symbols.append(request["symbol"])
+            await ws.send(json.dumps({"seqnum": seqnum, "event": "subscribed", "channel": "trades",
+                                      "symbol": request["symbol"]}))
+            seqnum += 1
+            for symbol in symbols:
+                await ws.send(json.dumps({"seqnum": seqnum, "event": "updated", "channel": "trades",
+                                          "symbol": symbol, "trade_id": str(seqnum)}))
+                seqnum += 1
+    except websockets.exceptions.ConnectionClosed:
+        pass
+
+
+class TestAssignSymbols:
+    def test_every_connection_gets_all_symbols_by_default(self):
+        assert assign_symbols(["A", "B"], 3) == [["A", "B"], ["A", "B"], ["A", "B"]]
+
+    def test_round_robins_symbols_across_connections(self):
+        assert assign_symbols(["A", "B", "C"], 3, per_connection=1) == [["A"], ["B"], ["C"]]
+        assert assign_symbols(["A", "B", "C"], 2, per_connection=2) == [["A", "B"], ["C", "A"]]
+
+    def test_caps_per_connection_at_symbol_count(self):
+        assert assign_symbols(["A", "B"], 1, per_connection=5) == [["A", "B"]]
+
+    @pytest.mark.parametrize("symbols, connections, per_connection", [
+        ([], 1, None),
+        (["A"], 0, None),
+        (["A"], 1, 0),
+    ])
+    def test_rejects_invalid_arguments(self, symbols, connections, per_connection):
+        with pytest.raises(ValueError):
+            assign_symbols(symbols, connections, per_connection)
+
+
+class TestSymbolRouter:
+    def test_routes_to_symbol_handlers(self):
+        router = SymbolRouter()
+        eth, btc = [], []
+        router.add_handler("ETH-USD", eth.append)
+        router.add_handler("BTC-USD", btc.append)
+        router.route({"symbol": "ETH-USD"})
+        router.route({"symbol": "BTC-USD"})
+        router.route({"symbol": "ETH-USD"})
+        assert len(eth) == 2
+        assert len(btc) == 1
+
+    def test_unhandled_messages_go_to_default(self):
+        default = []
+        router = SymbolRouter(default=default.append)
+        router.add_handler("ETH-USD", lambda message: None)
+        router.route({"symbol": "SOL-USD"})
+        router.route({"event": "error"})
+        assert default == [{"symbol": "SOL-USD"}, {"event": "error"}]
+
+
+class TestMultiplexedClient:
+    @pytest.mark.asyncio
+    async def test_counts_per_connection_and_per_symbol(self):
+        async with websockets.serve(fake_simulator, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            router = SymbolRouter()
+            eth = []
+            router.add_handler("ETH-USD", eth.append)
+            client = MultiplexedClient(
+                f"ws://127.0.0.1:{port}",
+                assign_symbols(["ETH-USD", "BTC-USD", "SOL-USD"], 2, per_connection=2),
+                router=router,
+            )
+            await client.run(duration=0.5)
+
+        assert client.connected == 2
+        assert client.errors == {}
+        # Each subscription yields a "subscribed" event plus one update per symbol subscribed so far.
+        assert [stats.messages for stats in client.connections] == [5, 5]
+        assert client.total.messages == 10
+        assert {symbol: stats.messages for symbol, stats in client.symbols.items()} == {
+            "ETH-USD": 5, "BTC-USD": 2, "SOL-USD": 3,
+        }
+        assert len(eth) == 5
+
+    @pytest.mark.asyncio
+    async def test_records_latency_for_updates_only(self):
+        async with websockets.serve(fake_simulator, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = MultiplexedClient(
+                f"ws://127.0.0.1:{port}",
+                [["ETH-USD"]],
+                latency_ms=lambda message, received_at: 2.0,
+            )
+            await client.run(duration=0.3)
+
+        assert client.total.messages == 2
+        assert client.total.trades == 1
+
+    @pytest.mark.asyncio
+    async def test_records_connection_errors(self):
+        client = MultiplexedClient("ws://localhost:1", [["ETH-USD"]])
+        await asyncio.wait_for(client.run(duration=2.0), timeout=5.0)
+        assert client.connected == 0
+        assert 0 in client.errors
+        assert "conn 0 failed" in MultiplexedClient.format(client.snapshot())
+
+    def test_format_summarises_many_connections(self):
+        client = MultiplexedClient("ws://localhost:1", assign_symbols(["ETH-USD"], 30))
+        text = MultiplexedClient.format(client.snapshot())
+        assert "30 connections: min=0.0" in text
+        assert "conn 0 " not in text
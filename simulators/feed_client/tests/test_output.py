@@ -0,0 +1,37 @@
+import json
+
+from feed_client.output import NdjsonWriter
+
+
+class TestNdjsonWriter:
+    def test_writes_one_record_per_line(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+        with NdjsonWriter(str(path)) as writer:
+            writer.write({"event": "updated", "price": 1.5})
+            writer.write_line('{"event": "subscribed"}')
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [{"event": "updated", "price": 1.5}, {"event": "subscribed"}]
+        assert writer.lines == 2
+
+    def test_buffers_until_flushed(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+        writer = NdjsonWriter(str(path))
+        writer.write({"n": 1})
+        assert path.read_text() == ""
+        writer.flush()
+        assert path.read_text() == '{"n":1}\n'
+        writer.close()
+
+    def test_overwrites_existing_file(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+        path.write_text("old\n")
+        with NdjsonWriter(str(path)) as writer:
+            writer.write({"n": 1})
+        assert path.read_text() == '{"n":1}\n'
+
+    def test_dash_writes_to_stdout(self, capsysbinary):
+        writer = NdjsonWriter("-")
+        writer.write({"n": 1})
+        writer.close()
+        assert capsysbinary.readouterr().out == b'{"n":1}\n'
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import random
+
+import pytest
+import websockets
+
+from feed_client.reconnect import BackoffPolicy, ContinuityTracker, ReconnectingClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def trade(seqnum: int, trade_id: int, symbol: str = "ETH-USD") -> dict:
+    return {"seqnum": seqnum, "event": "updated", "channel": "trades", "symbol": symbol,
+            "timestamp": "2026-01-02T03:04:05.000000Z", "price": 1.0, "trade_id": str(trade_id)}
+
+
+class TestBackoffPolicy:
+    def test_exponential_without_jitter(self):
+        policy = BackoffPolicy(initial_delay=1.0, multiplier=2.0, max_delay=10.0, jitter=0.0)
+        assert policy.schedule(6) == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+    def test_jitter_stays_within_bounds(self):
+        policy = BackoffPolicy(initial_delay=1.0, multiplier=2.0, max_delay=30.0, jitter=0.5)
+        rng = random.Random(3)
+        for attempt in range(5):
+            base = 2.0 ** attempt
+            delays = {policy.delay(attempt, rng) for _ in range(50)}
+            assert all(base * 0.5 <= delay <= base for delay in delays)
+            assert len(delays) > 1
+
+    @pytest.mark.parametrize("kwargs", [
+        {"initial_delay": -1},
+        {"initial_delay": 5, "max_delay": 1},
+        {"multiplier": 0.5},
+        {"jitter": 1.5},
+        {"max_attempts": 0},
+    ])
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            BackoffPolicy(**kwargs)
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("RECONNECT_INITIAL_DELAY", "0.25")
+        monkeypatch.setenv("RECONNECT_MAX_ATTEMPTS", "7")
+        policy = BackoffPolicy.from_env()
+        assert policy.initial_delay == 0.25
+        assert policy.max_attempts == 7
+        assert policy.multiplier == 2.0
+
+
+class TestContinuityTracker:
+    def test_counts_gaps_within_a_connection(self):
+        tracker = ContinuityTracker(FakeClock())
+        for seqnum in (0, 1, 3, 4, 8):
+            tracker.observe(trade(seqnum, seqnum))
+        assert (tracker.gaps, tracker.missing) == (2, 4)
+
+    def test_counts_duplicate_trade_ids(self):
+        tracker = ContinuityTracker(FakeClock())
+        tracker.observe(trade(0, 10))
+        tracker.observe(trade(1, 10))
+        tracker.observe(trade(2, 9))
+        tracker.observe(trade(3, 9, symbol="BTC-USD"))
+        assert tracker.duplicates == 2
+
+    def test_outage_with_continuous_sequence(self):
+        clock = FakeClock()
+        tracker = ContinuityTracker(clock)
+        tracker.observe(trade(0, 1))
+        clock.now += 1.0
+        tracker.connection_lost("closed by server")
+        clock.now += 2.0
+        tracker.connection_restored(attempts=3)
+        clock.now += 0.5
+        report = tracker.observe(trade(6, 7))
+
+        assert report.reason == "closed by server"
+        assert report.attempts == 3
+        assert report.downtime_s == pytest.approx(2.0)
+        assert report.time_to_recover_s == pytest.approx(2.5)
+        assert report.missing == 5
+        assert report.estimated_lost == 5
+        assert report.sequence == "continued"
+        assert tracker.gaps == 0
+        assert not tracker.in_outage
+
+    def test_outage_with_restarted_sequence_estimates_loss_from_rate(self):
+        clock = FakeClock()
+        tracker = ContinuityTracker(clock)
+        for index in range(11):
+            tracker.observe(trade(index, index))
+            clock.now += 0.1
+        tracker.connection_lost("connection lost")
+        clock.now += 1.0
+        tracker.connection_restored()
+        tracker.observe({"seqnum": 0, "event": "subscribed", "symbol": "ETH-USD"})
+        report = tracker.observe(trade(1, 100))
+
+        assert report.sequence == "restarted"
+        assert report.missing == 0
+        assert report.estimated_lost == pytest.approx(10, abs=1)
+        assert tracker.summary()["outages"] == 1
+
+    def test_restore_without_loss_uses_last_message(self):
+        clock = FakeClock()
+        tracker = ContinuityTracker(clock)
+        tracker.observe(trade(0, 1))
+        clock.now += 4.0
+        tracker.connection_restored()
+        report = tracker.observe(trade(1, 2))
+        assert report.downtime_s == pytest.approx(4.0)
+
+    def test_relayed_notifications(self):
+        tracker = ContinuityTracker(FakeClock())
+        tracker.observe({"jsonrpc": "2.0", "method": "trades.update", "params": {**trade(5, 1), "trade_id": None,
+                                                                                 "tradeId": 1}})
+        tracker.observe({"jsonrpc": "2.0", "method": "trades.update", "params": {**trade(7, 2), "trade_id": None,
+                                                                                 "tradeId": 2}})
+        assert tracker.missing == 1
+
+    def test_untracked_sequence_estimates_loss(self):
+        clock = FakeClock()
+        tracker = ContinuityTracker(clock, track_gaps=False)
+        for index in range(5):
+            tracker.observe(trade(index * 3, index))
+            clock.now += 0.5
+        clock.now += 1.0
+        tracker.connection_restored()
+        report = tracker.observe(trade(1000, 10))
+
+        assert tracker.missing == 0
+        assert report.sequence == "not tracked"
+        assert report.estimated_lost == 3
+        assert "3 estimated lost," in report.format()
+
+
+class FlakySimulator:
+    def __init__(self, trades_per_connection: int):
+        self.trades_per_connection = trades_per_connection
+        self.subscriptions: list[list[str]] = []
+
+    async def __call__(self, ws):
+        symbols = []
+        self.subscriptions.append(symbols)
+        seqnum = 0
+        try:
+            async for frame in ws:
+                request = json.loads(frame)
+                if request["action"] != "subscribe":
+                    continue
+                symbols.append(request["symbol"])
+                await ws.send(json.dumps({"seqnum": seqnum, "event": "subscribed", "symbol": request["symbol"]}))
+                seqnum += 1
+                if len(symbols) == 2:
+                    break
+            for index in range(self.trades_per_connection):
+                await ws.send(json.dumps(trade(seqnum, len(self.subscriptions) * 1000 + index)))
+                seqnum += 1
+                await asyncio.sleep(0.005)
+        except websockets.exceptions.ConnectionClosed:
+            return
+        if len(self.subscriptions) < 3:
+            await ws.close(code=1011)
+        else:
+            await asyncio.sleep(10)
+
+
+class TestReconnectingClient:
+    @pytest.mark.asyncio
+    async def test_reconnects_and_resubscribes(self):
+        server_handler = FlakySimulator(trades_per_connection=5)
+        async with websockets.serve(server_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            reports, states, messages = [], [], []
+            client = ReconnectingClient(
+                f"ws://127.0.0.1:{port}",
+                ["ETH-USD", "BTC-USD"],
+                on_message=messages.append,
+                policy=BackoffPolicy(initial_delay=0.01, max_delay=0.05),
+                on_state=states.append,
+                on_outage=reports.append,
+            )
+            runner = asyncio.create_task(client.run())
+            for _ in range(200):
+                if len(reports) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            await client.close()
+            await asyncio.wait_for(runner, timeout=2)
+
+        assert server_handler.subscriptions[:3] == [["BTC-USD", "ETH-USD"]] * 3
+        assert client.connects == 3
+        assert len(reports) == 2
+        assert all(report.sequence == "restarted" for report in reports)
+        assert all(report.time_to_recover_s >= report.downtime_s for report in reports)
+        assert any("closed by server (code 1011)" in state for state in states)
+        assert sum(1 for message in messages if message["event"] == "updated") >= 11
+
+    @pytest.mark.asyncio
+    async def test_drop_pauses_before_reconnecting(self):
+        server_handler = FlakySimulator(trades_per_connection=1000)
+        async with websockets.serve(server_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            reports = []
+            client = ReconnectingClient(f"ws://127.0.0.1:{port}", ["ETH-USD", "BTC-USD"], on_outage=reports.append)
+            runner = asyncio.create_task(client.run())
+            await asyncio.wait_for(client.wait_connected(), timeout=2)
+            await asyncio.sleep(0.05)
+            client.drop(pause=0.2)
+            await asyncio.sleep(0.05)
+            assert not client.connected
+            await asyncio.wait_for(client.wait_connected(), timeout=2)
+            for _ in range(100):
+                if reports:
+                    break
+                await asyncio.sleep(0.01)
+            await client.close()
+            await asyncio.wait_for(runner, timeout=2)
+
+        assert reports[0].reason == "dropped by client"
+        assert reports[0].downtime_s >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        states = []
+        client = ReconnectingClient(
+            "ws://127.0.0.1:1",
+            ["ETH-USD"],
+            policy=BackoffPolicy(initial_delay=0.01, max_delay=0.02, max_attempts=3),
+            on_state=states.append,
+        )
+        with pytest.raises(ConnectionError, match="3 attempt"):
+            await asyncio.wait_for(client.run(), timeout=5)
+        assert len(states) == 2
+        assert client.closed
+        assert await client.wait_connected() is False
+
+    @pytest.mark.asyncio
+    async def test_close_before_connecting(self):
+        client = ReconnectingClient("ws://127.0.0.1:1", ["ETH-USD"], policy=BackoffPolicy(initial_delay=5.0))
+        runner = asyncio.create_task(client.run())
+        await asyncio.sleep(0.05)
+        await client.close()
+        await asyncio.wait_for(runner, timeout=1)
+        assert client.closed
@@ -0,0 +1,179 @@
+import csv
+import sqlite3
+import threading
+
+import pytest
+
+from feed_client import recorder as recorder_module
+from feed_client.recorder import COLUMNS, CsvSink, TradeRecorder, TradeSink, trade_row
+
+
+def trade(seqnum: int, symbol: str = "ETH-USD") -> dict:
+    return {
+        "seqnum": seqnum,
+        "event": "updated",
+        "channel": "trades",
+        "symbol": symbol,
+        "timestamp": "2026-01-02T03:04:05.123456Z",
+        "side": "buy",
+        "qty": 1.5,
+        "price": 2500.0,
+        "trade_id": str(1000 + seqnum),
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTradeRow:
+    def test_direct_trade(self):
+        assert trade_row(trade(1), 9.5) == ("ETH-USD", 1, "2026-01-02T03:04:05.123456Z", "buy", 1.5, 2500.0, "1001", 9.5)
+
+    def test_relayed_trade_uses_camel_case_trade_id(self):
+        message = {"jsonrpc": "2.0", "method": "trades.update", "params": {"symbol": "BTC-USD", "tradeId": 7}}
+        assert trade_row(message, 1.0)[6] == "7"
+
+    def test_missing_trade_id_stays_none(self):
+        message = {"event": "updated", "symbol": "ETH-USD"}
+        assert trade_row(message, 1.0)[6] is None
+
+    def test_ignores_other_messages(self):
+        assert trade_row({"event": "subscribed", "symbol": "ETH-USD"}, 1.0) is None
+
+
+class TestTradeRecorder:
+    def test_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            TradeRecorder(str(tmp_path), format="xml")
+
+    def test_writes_sqlite_in_batches(self, tmp_path):
+        with TradeRecorder(str(tmp_path), format="sqlite", batch_size=100) as recorder:
+            for seqnum in range(250):
+                recorder.record(trade(seqnum))
+            recorder.record({"event": "subscribed", "symbol": "ETH-USD"})
+
+        assert recorder.status()["recorded"] == 250
+        assert recorder.written == 250
+        assert len(recorder.files) == 1
+        with sqlite3.connect(recorder.files[0]) as connection:
+            rows = connection.execute("SELECT seqnum, trade_id FROM trades ORDER BY seqnum").fetchall()
+        assert len(rows) == 250
+        assert rows[0] == (0, "1000")
+
+    def test_flushes_partial_batch_on_interval(self, tmp_path):
+        recorder = TradeRecorder(str(tmp_path), format="csv", batch_size=1000, flush_interval=0.05)
+        try:
+            recorder.record(trade(1))
+            for _ in range(100):
+                if recorder.written:
+                    break
+                threading.Event().wait(0.02)
+            assert recorder.written == 1
+        finally:
+            recorder.close()
+
+    def test_rotates_by_size(self, tmp_path):
+        with TradeRecorder(str(tmp_path), format="csv", batch_size=10, max_bytes=500) as recorder:
+            for seqnum in range(100):
+                recorder.record(trade(seqnum))
+
+        assert len(recorder.files) > 1
+        rows = []
+        for path in recorder.files:
+            with open(path, newline="") as f:
+                reader = csv.reader(f)
+                assert next(reader) == list(COLUMNS)
+                rows.extend(reader)
+        assert [int(row[1]) for row in rows] == list(range(100))
+
+    def test_rotates_by_time(self, tmp_path):
+        clock = FakeClock()
+        recorder = TradeRecorder(str(tmp_path), format="sqlite", batch_size=1, max_seconds=60, clock=clock)
+        try:
+            recorder.record(trade(1))
+            recorder.record(trade(2))
+            for _ in range(100):
+                if recorder.written == 2:
+                    break
+                threading.Event().wait(0.02)
+            clock.now = 61.0
+            recorder.record(trade(3))
+        finally:
+            recorder.close()
+        assert len(recorder.files) == 2
+
+    def test_drops_batches_instead_of_blocking(self, tmp_path, monkeypatch):
+        release = threading.Event()
+
+        class BlockingSink(TradeSink):
+            extension = "blocking"
+
+            def write_batch(self, rows):
+                release.wait()
+
+            def close(self):
+                pass
+
+        monkeypatch.setitem(recorder_module.SINKS, "blocking", BlockingSink)
+        recorder = TradeRecorder(str(tmp_path), format="blocking", batch_size=1, max_pending_batches=2)
+        try:
+            for seqnum in range(20):
+                recorder.record(trade(seqnum))
+            assert recorder.dropped > 0
+        finally:
+            release.set()
+            recorder.close()
+        assert recorder.written + recorder.dropped == 20
+
+    def test_keeps_writing_after_a_failed_batch(self, tmp_path, monkeypatch):
+        written = []
+
+        class FlakySink(TradeSink):
+            extension = "flaky"
+
+            def write_batch(self, rows):
+                if rows[0][1] == 0:
+                    raise OSError("disk full")
+                written.extend(rows)
+
+            def close(self):
+                pass
+
+        monkeypatch.setitem(recorder_module.SINKS, "flaky", FlakySink)
+        with TradeRecorder(str(tmp_path), format="flaky", batch_size=2) as recorder:
+            for seqnum in range(6):
+                recorder.record(trade(seqnum))
+
+        status = recorder.status()
+        assert (status["written"], status["failed"]) == (4, 2)
+        assert status["last_error"] == "OSError: disk full"
+        assert [row[1] for row in written] == [2, 3, 4, 5]
+
+    def test_parquet_requires_pyarrow(self, tmp_path):
+        if recorder_module.pyarrow is not None:
+            pytest.skip("pyarrow is installed")
+        with pytest.raises(ValueError, match="pyarrow"):
+            TradeRecorder(str(tmp_path), format="parquet")
+
+    def test_writes_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        with TradeRecorder(str(tmp_path), format="parquet", batch_size=10) as recorder:
+            for seqnum in range(25):
+                recorder.record(trade(seqnum))
+        table = pq.read_table(recorder.files[0])
+        assert table.num_rows == 25
+        assert table.column_names == list(COLUMNS)
+
+
+class TestCsvSink:
+    def test_size_tracks_buffered_writes(self, tmp_path):
+        sink = CsvSink(str(tmp_path / "trades.csv"))
+        before = sink.size()
+        sink.write_batch([trade_row(trade(1), 1.0)])
+        assert sink.size() > before
+        sink.close()
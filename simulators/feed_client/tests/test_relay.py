@@ -0,0 +1,104 @@
+import pytest
+
+from feed_client.relay import TradeJoiner, parse_args, trade_key
+
+
+class TestTradeKey:
+    def test_reads_direct_and_relayed_field_names(self):
+        assert trade_key({"trade_id": "7"}) == "7"
+        assert trade_key({"tradeId": 7}) == "7"
+        assert trade_key({"seqnum": 1}) is None
+
+
+class TestTradeJoiner:
+    def test_records_added_latency(self):
+        joiner = TradeJoiner(window=5.0)
+        joiner.direct("1", "ETH-USD", at=10.0)
+        joiner.relayed("1", "ETH-USD", at=10.002)
+        joiner.direct("2", "ETH-USD", at=11.0)
+        joiner.relayed("2", "ETH-USD", at=11.004)
+
+        summary = joiner.summary()
+        assert summary["matched"] == 2
+        assert summary["added_ms"]["count"] == 2
+        assert 1.9 < summary["added_ms"]["min"] < 4.1
+        assert joiner.pending == 0
+
+    def test_counts_drops_once_the_symbol_is_live(self):
+        joiner = TradeJoiner(window=1.0)
+        joiner.direct("1", "ETH-USD", at=0.0)
+        joiner.direct("2", "ETH-USD", at=0.5)
+        joiner.relayed("2", "ETH-USD", at=0.6)
+        joiner.direct("3", "ETH-USD", at=1.0)
+        joiner.expire(5.0)
+
+        # Trade 1 predates the relay's first delivery, trade 3 does not.
+        assert joiner.dropped == 1
+        assert joiner.summary()["drop_rate"] == 0.5
+
+    def test_unmatched_relayed_trades(self):
+        joiner = TradeJoiner(window=1.0)
+        joiner.direct("1", "ETH-USD", at=0.0)
+        joiner.relayed("1", "ETH-USD", at=0.1)
+        joiner.relayed("2", "ETH-USD", at=0.2)
+        joiner.expire(2.0)
+        assert joiner.unmatched_relayed == 1
+        assert joiner.pending == 0
+
+    def test_relayed_copy_may_arrive_first(self):
+        joiner = TradeJoiner()
+        joiner.relayed("1", "ETH-USD", at=1.0)
+        joiner.direct("1", "ETH-USD", at=1.001)
+        assert joiner.matched == 1
+        assert joiner.relayed_first == 1
+
+    def test_counts_duplicates(self):
+        joiner = TradeJoiner()
+        joiner.direct("1", "ETH-USD", at=0.0)
+        joiner.direct("1", "ETH-USD", at=0.1)
+        joiner.relayed("1", "ETH-USD", at=0.2)
+        joiner.relayed("1", "ETH-USD", at=0.3)
+        assert (joiner.matched, joiner.duplicates_direct, joiner.duplicates_relayed) == (1, 1, 1)
+
+    def test_counts_reordered_relay_deliveries(self):
+        joiner = TradeJoiner()
+        for trade_id, at in [("1", 0.0), ("2", 0.1), ("3", 0.2)]:
+            joiner.direct(trade_id, "ETH-USD", at=at)
+        joiner.relayed("1", "ETH-USD", at=0.3)
+        joiner.relayed("3", "ETH-USD", at=0.4)
+        joiner.relayed("2", "ETH-USD", at=0.5)
+        assert joiner.reordered == 1
+
+    def test_reordering_is_tracked_per_symbol(self):
+        joiner = TradeJoiner()
+        joiner.direct("1", "ETH-USD", at=0.0)
+        joiner.direct("2", "BTC-USD", at=0.1)
+        joiner.relayed("2", "BTC-USD", at=0.2)
+        joiner.relayed("1", "ETH-USD", at=0.3)
+        assert joiner.reordered == 0
+
+    def test_bounds_pending_trades(self):
+        joiner = TradeJoiner(window=60.0, max_pending=2)
+        for trade_id in "123":
+            joiner.direct(trade_id, "ETH-USD", at=0.0)
+        assert joiner.pending == 2
+        assert joiner.evicted == 1
+        joiner.relayed("1", "ETH-USD", at=0.1)
+        assert joiner.matched == 0
+
+    @pytest.mark.parametrize("kwargs", [{"window": 0}, {"max_pending": 0}])
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            TradeJoiner(**kwargs)
+
+    def test_format(self):
+        joiner = TradeJoiner()
+        assert TradeJoiner.format(joiner.summary()).startswith("Relay overhead: no matched trades")
+        joiner.direct("1", "ETH-USD", at=0.0)
+        joiner.relayed("1", "ETH-USD", at=0.001)
+        assert TradeJoiner.format(joiner.summary()).startswith("Relay overhead: p50=")
+
+
+class TestParseArgs:
+    def test_symbols(self):
+        assert parse_args(["--symbols", "ETH-USD, BTC-USD"]).symbols == ["ETH-USD", "BTC-USD"]
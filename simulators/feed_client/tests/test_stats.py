@@ -0,0 +1,72 @@
+import pytest
+
+from feed_client.stats import RollingStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRollingStats:
+    def test_rejects_non_positive_window(self):
+        with pytest.raises(ValueError):
+            RollingStats(window=0)
+
+    def test_counts_messages_and_trades(self):
+        stats = RollingStats()
+        stats.record()
+        stats.record(latency_ms=1.5)
+        assert stats.messages == 2
+        assert stats.trades == 1
+
+    def test_rate_since_start(self):
+        clock = FakeClock()
+        stats = RollingStats(window=10.0, clock=clock)
+        for _ in range(50):
+            stats.record()
+        clock.now += 2.0
+        assert stats.snapshot()["msgs_per_sec"] == pytest.approx(25.0)
+
+    def test_rate_covers_only_the_window(self):
+        clock = FakeClock()
+        stats = RollingStats(window=2.0, clock=clock)
+        for second in range(5):
+            for _ in range(100 if second < 3 else 10):
+                stats.record()
+            clock.now += 1.0
+            snapshot = stats.snapshot()
+        assert snapshot["msgs_per_sec"] == pytest.approx(10.0)
+
+    def test_latency_percentiles_reset_each_snapshot(self):
+        stats = RollingStats(clock=FakeClock())
+        for latency in range(1, 101):
+            stats.record(latency_ms=float(latency))
+
+        latency = stats.snapshot()["latency_ms"]
+        assert latency["count"] == 100
+        assert latency["p50"] == pytest.approx(50.0, rel=0.01)
+        assert latency["p99"] == pytest.approx(99.0, rel=0.01)
+        assert latency["max"] == 100.0
+        assert stats.snapshot()["latency_ms"] == {"count": 0}
+
+    def test_format(self):
+        clock = FakeClock()
+        stats = RollingStats(clock=clock)
+        stats.record(latency_ms=2.0)
+        clock.now += 1.0
+        line = RollingStats.format(stats.snapshot())
+        assert "1 msgs" in line
+        assert "p50=2.00ms" in line
+
+    def test_histogram_keeps_every_latency(self):
+        stats = RollingStats(clock=FakeClock())
+        stats.record(latency_ms=1.0)
+        stats.snapshot()
+        stats.record(latency_ms=3.0)
+        stats.snapshot()
+        assert stats.histogram.count == 2
+        assert stats.histogram.max == 3.0
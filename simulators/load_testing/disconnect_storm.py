@@ -0,0 +1,331 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from disconnect_controls import DisconnectController, DisconnectRecord, DisconnectScenario, DisconnectStep, ScenarioRunner
+from feed_client import BackoffPolicy, HubRpcClient, ReconnectingClient, build_hub_connection
+
+from . import signalr_load, websocket_load
+from .stats import summarize
+from .websocket_load import LoadTestConfig, parse_symbol_mix
+
+
+TARGETS = ("hub", "websocket")
+DEFAULT_URLS = {"hub": signalr_load.DEFAULT_URL, "websocket": websocket_load.DEFAULT_URL}
+
+
+@dataclass
+class StormConfig:
+    target: str = "hub"
+    url: str = signalr_load.DEFAULT_URL
+    connections: int = 50
+    symbols: dict[str, float] = field(default_factory=lambda: {"ETH-USD": 1.0, "BTC-USD": 1.0})
+    symbols_per_connection: int = 1
+    connect_concurrency: int = 20
+    connect_timeout: float = 10.0
+    settle: float = 30.0
+    batch_size: int | None = None
+    seed: int | None = None
+
+    def __post_init__(self):
+        if self.target not in TARGETS:
+            raise ValueError(f"Unknown target: {self.target}")
+
+    def assign_symbols(self) -> list[list[str]]:
+        return LoadTestConfig(connections=self.connections, symbols=self.symbols,
+                              symbols_per_connection=self.symbols_per_connection, seed=self.seed).assign_symbols()
+
+
+# Disconnects end the connection and reconnects open it again, retrying with
+# the same backoff policy (RECONNECT_* variables) the clients use after an
+# outage, so dropped connections come back the way real clients would.
+class HubStormController(DisconnectController):
+    def __init__(self, client: HubRpcClient, symbols: list[str], policy: BackoffPolicy,
+                 connect_timeout: float = 10.0, rng: random.Random | None = None):
+        super().__init__()
+        self.client = client
+        self.symbols = symbols
+        self.policy = policy
+        self.connect_timeout = connect_timeout
+        self._rng = rng if rng is not None else random.Random()
+
+    async def connect(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self.client.start(self.connect_timeout)
+                break
+            except Exception as e:
+                attempt += 1
+                if self.policy.max_attempts is not None and attempt >= self.policy.max_attempts:
+                    raise ConnectionError(f"Gave up after {attempt} attempt(s): {e}") from e
+                await asyncio.sleep(self.policy.delay(attempt - 1, self._rng))
+        failures = [result for result in await self.client.subscribe_all(self.symbols)
+                    if isinstance(result, BaseException)]
+        if failures:
+            raise failures[0]
+
+    async def on_graceful_disconnect(self):
+        await self.client.unsubscribe_all(self.symbols)
+        await self.client.stop()
+
+    async def on_abrupt_disconnect(self):
+        # signalrcore joins its reader thread when the transport stops.
+        await asyncio.to_thread(self.client.abort)
+
+    async def on_temporary_drop(self, delay_seconds: int):
+        await asyncio.to_thread(self.client.abort)
+
+    async def on_reconnect(self):
+        await self.connect()
+
+    async def close(self) -> None:
+        await self.client.stop()
+
+
+class WebSocketStormController(DisconnectController):
+    def __init__(self, url: str, symbols: list[str], policy: BackoffPolicy, rng: random.Random | None = None):
+        super().__init__()
+        self.url = url
+        self.symbols = symbols
+        self.policy = policy
+        self._rng = rng if rng is not None else random.Random()
+        self.client: ReconnectingClient | None = None
+        self._task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        self.client = ReconnectingClient(self.url, self.symbols, policy=self.policy, rng=self._rng)
+        self._task = asyncio.create_task(self.client.run())
+        if not await self.client.wait_connected():
+            await self._task
+            raise ConnectionError("Connection closed before subscribing")
+
+    async def _finish(self) -> None:
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def on_graceful_disconnect(self):
+        await self.client.close()
+        await self._finish()
+
+    async def on_abrupt_disconnect(self):
+        self.client.abort()
+        await self._finish()
+
+    async def on_temporary_drop(self, delay_seconds: int):
+        self.client.abort()
+        await self._finish()
+
+    async def on_reconnect(self):
+        await self.connect()
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+        await self._finish()
+
+
+def create_controllers(config: StormConfig, connect: Callable[[str], Any] = build_hub_connection) -> list[DisconnectController]:
+    policy = BackoffPolicy.from_env()
+    rng = random.Random(config.seed)
+    controllers: list[DisconnectController] = []
+    for symbols in config.assign_symbols():
+        if config.target == "hub":
+            client = HubRpcClient(connect(f"{config.url}/blockchain"), request_timeout=config.connect_timeout,
+                                  batch_size=config.batch_size)
+            controllers.append(HubStormController(client, symbols, policy, config.connect_timeout,
+                                                  random.Random(rng.random())))
+        else:
+            controllers.append(WebSocketStormController(config.url, symbols, policy, random.Random(rng.random())))
+    return controllers
+
+
+async def open_connection(controller, semaphore: asyncio.Semaphore, timeout: float) -> str | None:
+    async with semaphore:
+        try:
+            await asyncio.wait_for(controller.connect(), timeout)
+        except Exception as e:
+            with contextlib.suppress(Exception):
+                await controller.close()
+            return f"{type(e).__name__}: {e}"
+    return None
+
+
+async def run_disconnect_storm(
+    config: StormConfig,
+    scenario: DisconnectScenario,
+    connect: Callable[[str], Any] = build_hub_connection,
+    on_record: Callable[[DisconnectRecord], None] | None = None,
+) -> dict:
+    controllers = create_controllers(config, connect)
+    semaphore = asyncio.Semaphore(config.connect_concurrency)
+
+    started_at = time.time()
+    started = time.perf_counter()
+    errors = await asyncio.gather(
+        *(open_connection(controller, semaphore, config.connect_timeout) for controller in controllers)
+    )
+    setup_s = time.perf_counter() - started
+    established = [controller for controller, error in zip(controllers, errors) if error is None]
+
+    runner = ScenarioRunner(established, scenario, settle=config.settle, on_record=on_record)
+    records = await runner.run()
+
+    await asyncio.gather(*(controller.close() for controller in established), return_exceptions=True)
+    return build_report(config, scenario, records, [error for error in errors if error is not None],
+                        len(established), runner.skipped, started_at, setup_s)
+
+
+def parse_step(value: str) -> DisconnectStep:
+    try:
+        return DisconnectStep.parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+# Most reconnects that completed within any one second of each other.
+def peak_rate(times: list[float], window: float = 1.0) -> int:
+    ordered = sorted(times)
+    peak = start = 0
+    for end, at in enumerate(ordered):
+        while at - ordered[start] > window:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return peak
+
+
+def summarize_step(index: int, step: DisconnectStep, records: list[DisconnectRecord]) -> dict:
+    reconnected = [record for record in records if record.reconnected]
+    return {
+        "step": index,
+        "at": step.at,
+        "mode": step.mode.name.lower(),
+        "disconnected": len(records),
+        "reconnected": len(reconnected),
+        "failed": sum(record.error is not None for record in records),
+        "disconnect_ms": summarize([record.disconnect_ms for record in records if record.disconnect_ms is not None]),
+        "reconnect_ms": summarize([record.reconnect_ms for record in reconnected]),
+        "down_s": summarize([record.down_s for record in reconnected]),
+        "peak_reconnects_per_sec": peak_rate([record.reconnected_at for record in reconnected]),
+    }
+
+
+def build_report(
+    config: StormConfig,
+    scenario: DisconnectScenario,
+    records: list[DisconnectRecord],
+    connect_errors: list[str],
+    established: int,
+    skipped: int,
+    started_at: float,
+    setup_s: float,
+) -> dict:
+    errors: dict[str, int] = {}
+    for error in connect_errors + [record.error for record in records if record.error is not None]:
+        name = error.partition(":")[0]
+        errors[name] = errors.get(name, 0) + 1
+
+    return {
+        "config": asdict(config),
+        "scenario": scenario.name,
+        "started_at": datetime.fromtimestamp(started_at, timezone.utc).isoformat(),
+        "setup_s": setup_s,
+        "connections": {
+            "attempted": config.connections,
+            "established": established,
+            "failed": len(connect_errors),
+        },
+        "steps": [summarize_step(index, step, [record for record in records if record.step == index])
+                  for index, step in enumerate(scenario.steps)],
+        "skipped": skipped,
+        "records": [record.to_dict() for record in sorted(records, key=lambda r: (r.step, r.at))],
+        "errors": errors,
+    }
+
+
+def print_report(report: dict) -> None:
+    connections = report["connections"]
+    print(f"Connections: {connections['established']}/{connections['attempted']} established in "
+          f"{report['setup_s']:.1f}s, {connections['failed']} failed")
+    for step in report["steps"]:
+        print(f"Step {step['step']} at {step['at']:g}s ({step['mode']}): {step['disconnected']} disconnected, "
+              f"{step['reconnected']} reconnected, {step['failed']} failed, "
+              f"peak {step['peak_reconnects_per_sec']} reconnects/s")
+        for key in ("reconnect_ms", "down_s"):
+            summary = step[key]
+            if summary["count"]:
+                print(f"  {key}: min={summary['min']:.2f} p50={summary['p50']:.2f} p99={summary['p99']:.2f} "
+                      f"max={summary['max']:.2f}")
+    if report["skipped"]:
+        print(f"Skipped: {report['skipped']} disconnect(s) had no connection left to drop")
+    if report["errors"]:
+        print("Errors: " + ", ".join(f"{name}={count}" for name, count in sorted(report["errors"].items())))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run a scripted disconnect scenario against many connections to reproduce reconnect storms")
+    parser.add_argument("--target", choices=TARGETS, default="hub",
+                        help="Connect to the DataServer's BlockchainHub or straight to the simulator's WebSocket")
+    parser.add_argument("--url", help="DataServer base URL (hub) or WebSocket endpoint (websocket)")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--symbols", type=parse_symbol_mix, default="ETH-USD,BTC-USD",
+                        help="Comma-separated symbols with optional weights, e.g. ETH-USD=3,BTC-USD=1")
+    parser.add_argument("--symbols-per-connection", type=int, default=1)
+    parser.add_argument("--scenario", help="JSON disconnect scenario file")
+    parser.add_argument("--step", action="append", type=parse_step, default=[],
+                        help="Disconnect step AT:MODE[:CONNECTIONS[:DELAY]], e.g. 30:abrupt:20%% or 60:temporary:all:5")
+    parser.add_argument("--settle", type=float, default=30.0,
+                        help="Seconds after the last step ends to wait for outstanding reconnects")
+    parser.add_argument("--connect-concurrency", type=int, default=20,
+                        help="Maximum number of connections being opened at once")
+    parser.add_argument("--connect-timeout", type=float, default=10.0)
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Subscribe with JSON-RPC batches of up to this many requests (hub)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+    if bool(args.scenario) == bool(args.step):
+        parser.error("give either --scenario or one or more --step")
+    if args.url is None:
+        args.url = DEFAULT_URLS[args.target]
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.scenario:
+        scenario = DisconnectScenario.load(args.scenario)
+    else:
+        scenario = DisconnectScenario("command-line", args.seed, tuple(sorted(args.step, key=lambda step: step.at)))
+    config = StormConfig(
+        target=args.target,
+        url=args.url.rstrip("/"),
+        connections=args.connections,
+        symbols=args.symbols,
+        symbols_per_connection=args.symbols_per_connection,
+        connect_concurrency=args.connect_concurrency,
+        connect_timeout=args.connect_timeout,
+        settle=args.settle,
+        batch_size=args.batch_size,
+        seed=args.seed,
+    )
+
+    print(f"Running '{scenario.name}' ({len(scenario.steps)} step(s), {scenario.duration:g}s) "
+          f"against {config.connections} {config.target} connection(s) at {config.url}")
+    report = asyncio.run(run_disconnect_storm(config, scenario))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
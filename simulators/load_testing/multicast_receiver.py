@@ -0,0 +1,164 @@
+import argparse
+import json
+import socket
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+from feed_client import LatencyHistogram
+from feed_client.decoding import TRADE_MESSAGE_TYPE, TRADE_STRUCT
+
+
+DEFAULT_GROUP = "239.255.0.1"
+DEFAULT_PORT = 30001
+
+
+class SequenceTracker:
+    def __init__(self):
+        self.expected: int | None = None
+        self.received = 0
+        self.gaps = 0
+        self.missing = 0
+        self.out_of_order = 0
+        self.restarts = 0
+
+    def observe(self, seqnum: int) -> None:
+        self.received += 1
+        if self.expected is None or seqnum == self.expected:
+            self.expected = seqnum + 1
+        elif seqnum > self.expected:
+            self.gaps += 1
+            self.missing += seqnum - self.expected
+            self.expected = seqnum + 1
+        elif seqnum == 0:
+            self.restarts += 1
+            self.expected = 1
+        else:
+            self.out_of_order += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "received": self.received,
+            "gaps": self.gaps,
+            "missing": self.missing,
+            "out_of_order": self.out_of_order,
+            "restarts": self.restarts,
+        }
+
+
+@dataclass
+class ReceiverConfig:
+    group: str = DEFAULT_GROUP
+    port: int = DEFAULT_PORT
+    interface: str = "127.0.0.1"
+    duration: float = 60.0
+    receive_buffer: int | None = None
+
+
+def open_socket(config: ReceiverConfig) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    if config.receive_buffer:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, config.receive_buffer)
+    sock.bind(("", config.port))
+    sock.setsockopt(
+        socket.IPPROTO_IP,
+        socket.IP_ADD_MEMBERSHIP,
+        socket.inet_aton(config.group) + socket.inet_aton(config.interface),
+    )
+    return sock
+
+
+def receive(sock: socket.socket, duration: float) -> tuple[SequenceTracker, LatencyHistogram, dict[str, int], float]:
+    tracker = SequenceTracker()
+    latency = LatencyHistogram()
+    symbols: dict[str, int] = {}
+    buffer = bytearray(2048)
+    unpack = TRADE_STRUCT.unpack_from
+
+    started = time.perf_counter()
+    deadline = started + duration
+    sock.settimeout(0.25)
+    while time.perf_counter() < deadline:
+        try:
+            size = sock.recv_into(buffer)
+        except socket.timeout:
+            continue
+        received_at = time.time()
+        if size != TRADE_STRUCT.size or buffer[0] != TRADE_MESSAGE_TYPE:
+            continue
+
+        _, seqnum, micros, _, _, _, _, symbol = unpack(buffer)
+        tracker.observe(seqnum)
+        latency.record(received_at * 1000.0 - micros / 1000.0)
+        symbols[symbol] = symbols.get(symbol, 0) + 1
+
+    elapsed = time.perf_counter() - started
+    return tracker, latency, {s.rstrip(b"\0").decode(): n for s, n in symbols.items()}, elapsed
+
+
+def run_receiver(config: ReceiverConfig) -> dict:
+    started_at = time.time()
+    sock = open_socket(config)
+    try:
+        tracker, latency, symbols, elapsed = receive(sock, config.duration)
+    finally:
+        sock.close()
+
+    return {
+        "config": asdict(config),
+        "started_at": datetime.fromtimestamp(started_at, timezone.utc).isoformat(),
+        "elapsed_s": elapsed,
+        "sequence": tracker.to_dict(),
+        "latency_ms": latency.summary(),
+        "symbols": symbols,
+        "throughput_msgs_per_sec": tracker.received / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_report(report: dict) -> None:
+    sequence = report["sequence"]
+    print(f"Received: {sequence['received']} ({report['throughput_msgs_per_sec']:.1f}/s), "
+          f"gaps: {sequence['gaps']} ({sequence['missing']} missing), "
+          f"out of order: {sequence['out_of_order']}, restarts: {sequence['restarts']}")
+    summary = report["latency_ms"]
+    if summary["count"] == 0:
+        print("latency_ms: no samples")
+    else:
+        print(f"latency_ms: p50={summary['p50']:.3f} p99={summary['p99']:.3f} "
+              f"p999={summary['p999']:.3f} max={summary['max']:.3f} (n={summary['count']})")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Multicast trade feed receiver for the blockchain API simulator")
+    parser.add_argument("--group", default=DEFAULT_GROUP)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--interface", default="127.0.0.1", help="Address of the interface to join the group on")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to receive for")
+    parser.add_argument("--receive-buffer", type=int, default=None, help="SO_RCVBUF size in bytes")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    config = ReceiverConfig(
+        group=args.group,
+        port=args.port,
+        interface=args.interface,
+        duration=args.duration,
+        receive_buffer=args.receive_buffer,
+    )
+
+    report = run_receiver(config)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import time
+import urllib.request
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from feed_client import (
+    HubRpcClient,
+    LatencyHistogram,
+    build_hub_connection,
+    decode_frame,
+    latency_ms,
+    timestamp_to_micros,
+    trade_payload,
+)
+
+from .stats import summarize
+from .websocket_load import LoadTestConfig, parse_symbol_mix
+
+
+DEFAULT_URL = "http://localhost:5181"
+
+
+@dataclass
+class HubLoadConfig(LoadTestConfig):
+    url: str = DEFAULT_URL
+    connections: int = 50
+    connect_concurrency: int = 20
+    warmup: float = 2.0
+    grace: float = 1.0
+    batch_size: int | None = None
+    feed_admin: str | None = None
+    feed_rate: float | None = None
+
+
+class HubConnectionStats:
+    def __init__(self, index: int, symbols: list[str]):
+        self.index = index
+        self.symbols = symbols
+        self.subscribed: list[str] = []
+        self.connect_ms: float | None = None
+        self.subscribe_ms: float | None = None
+        self.messages = 0
+        self.trades = 0
+        self.latency = LatencyHistogram()
+        self.seen: dict[str, dict[str, int]] = {symbol: {} for symbol in symbols}
+        self.missed = 0
+        self.closed_early = False
+        self.error: str | None = None
+        self.measuring = False
+
+    def on_message(self, message: Any) -> None:
+        received_at = time.time()
+        for item in message if isinstance(message, list) else [message]:
+            if isinstance(item, str):
+                try:
+                    item = decode_frame(item)
+                except json.JSONDecodeError:
+                    continue
+            if isinstance(item, Mapping):
+                self.record(item, received_at)
+
+    # Only trades received inside the measurement window count, which keeps
+    # connection setup and teardown out of the throughput figures.
+    def record(self, message: dict[str, Any], received_at: float) -> None:
+        if not self.measuring:
+            return
+        self.messages += 1
+        trade = trade_payload(message)
+        if trade is None:
+            return
+        self.trades += 1
+        latency = latency_ms(message, received_at)
+        if latency is not None:
+            self.latency.record(latency)
+        seen = self.seen.get(trade.get("symbol"))
+        trade_id = trade.get("tradeId", trade.get("trade_id"))
+        if seen is not None and trade_id is not None and "timestamp" in trade:
+            seen[str(trade_id)] = timestamp_to_micros(trade["timestamp"])
+
+    def disconnected(self) -> None:
+        self.closed_early = True
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            "connection": self.index,
+            "symbols": self.symbols,
+            "subscribed": self.subscribed,
+            "connect_ms": self.connect_ms,
+            "subscribe_ms": self.subscribe_ms,
+            "messages": self.messages,
+            "trades": self.trades,
+            "trades_per_sec": self.trades / elapsed if elapsed > 0 else 0.0,
+            "latency_ms": self.latency.summary(),
+            "missed": self.missed,
+            "closed_early": self.closed_early,
+            "error": self.error,
+        }
+
+
+# The hub sends every trade for a symbol to all of its subscribers, so the
+# trades any subscriber received form the reference for the others. Only
+# trades stamped inside [start_us, end_us] are compared; a trade nobody
+# received cannot be detected this way.
+def count_missed(connections: list[HubConnectionStats], start_us: int, end_us: int) -> dict[str, int]:
+    reference: dict[str, set[str]] = {}
+    for stats in connections:
+        for symbol in stats.subscribed:
+            reference.setdefault(symbol, set()).update(
+                trade_id for trade_id, stamped in stats.seen[symbol].items() if start_us <= stamped <= end_us
+            )
+    for stats in connections:
+        stats.missed = sum(
+            len(reference[symbol] - stats.seen[symbol].keys()) for symbol in stats.subscribed
+        )
+    return {symbol: len(trade_ids) for symbol, trade_ids in sorted(reference.items())}
+
+
+def set_feed_rate(admin_url: str, rate: float) -> None:
+    if rate <= 0:
+        raise ValueError("Feed rate must be positive")
+    interval = 1.0 / rate
+    body = json.dumps({"emission": {"min_interval": interval, "max_interval": interval}}).encode()
+    request = urllib.request.Request(f"{admin_url.rstrip('/')}/admin/config", data=body, method="PATCH",
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        response.read()
+
+
+async def open_hub_connection(
+    stats: HubConnectionStats,
+    config: HubLoadConfig,
+    semaphore: asyncio.Semaphore,
+    connect: Callable[[str], Any],
+) -> HubRpcClient | None:
+    async with semaphore:
+        client = HubRpcClient(
+            connect(f"{config.url}/blockchain"),
+            on_message=stats.on_message,
+            on_disconnect=stats.disconnected,
+            request_timeout=config.connect_timeout,
+            batch_size=config.batch_size,
+        )
+        started = time.perf_counter()
+        try:
+            await client.start(config.connect_timeout)
+        except Exception as e:
+            stats.error = f"{type(e).__name__}: {e}"
+            with contextlib.suppress(Exception):
+                await client.stop()
+            return None
+        stats.connect_ms = (time.perf_counter() - started) * 1000.0
+
+        started = time.perf_counter()
+        results = await client.subscribe_all(stats.symbols)
+        stats.subscribe_ms = (time.perf_counter() - started) * 1000.0
+        stats.subscribed = [symbol for symbol, result in zip(stats.symbols, results)
+                            if not isinstance(result, BaseException)]
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            stats.error = f"{type(failures[0]).__name__}: {failures[0]}"
+        return client
+
+
+async def run_hub_load_test(config: HubLoadConfig, connect: Callable[[str], Any] = build_hub_connection) -> dict:
+    connections = [HubConnectionStats(index, symbols) for index, symbols in enumerate(config.assign_symbols())]
+    semaphore = asyncio.Semaphore(config.connect_concurrency)
+
+    started_at = time.time()
+    started = time.perf_counter()
+    clients = await asyncio.gather(
+        *(open_hub_connection(stats, config, semaphore, connect) for stats in connections)
+    )
+    setup_s = time.perf_counter() - started
+
+    await asyncio.sleep(config.warmup)
+    window_start = time.time()
+    for stats in connections:
+        stats.measuring = True
+    await asyncio.sleep(config.duration)
+    for stats in connections:
+        stats.measuring = False
+    window_end = time.time()
+
+    await asyncio.gather(*(client.stop() for client in clients if client is not None), return_exceptions=True)
+
+    expected = count_missed(connections, int(window_start * 1_000_000),
+                            int((window_end - config.grace) * 1_000_000))
+    return build_report(config, connections, expected, started_at, setup_s)
+
+
+def build_report(
+    config: HubLoadConfig,
+    connections: list[HubConnectionStats],
+    expected: dict[str, int],
+    started_at: float,
+    setup_s: float,
+) -> dict:
+    elapsed = config.duration
+    established = [stats for stats in connections if stats.connect_ms is not None]
+    messages = sum(stats.messages for stats in connections)
+    trades = sum(stats.trades for stats in connections)
+    latency = LatencyHistogram()
+    errors: dict[str, int] = {}
+    for stats in connections:
+        latency.merge(stats.latency)
+        if stats.error is not None:
+            name = stats.error.partition(":")[0]
+            errors[name] = errors.get(name, 0) + 1
+
+    return {
+        "config": asdict(config),
+        "started_at": datetime.fromtimestamp(started_at, timezone.utc).isoformat(),
+        "setup_s": setup_s,
+        "elapsed_s": elapsed,
+        "connections": {
+            "attempted": len(connections),
+            "established": len(established),
+            "failed": len(connections) - len(established),
+            "closed_early": sum(stats.closed_early for stats in connections),
+            "subscribe_errors": sum(len(stats.symbols) - len(stats.subscribed) for stats in established),
+        },
+        "connect_ms": summarize([stats.connect_ms for stats in established]),
+        "subscribe_ms": summarize([stats.subscribe_ms for stats in established]),
+        "latency_ms": latency.summary(),
+        "messages": messages,
+        "trades": trades,
+        "throughput_msgs_per_sec": messages / elapsed if elapsed > 0 else 0.0,
+        "throughput_trades_per_sec": trades / elapsed if elapsed > 0 else 0.0,
+        "per_connection_trades_per_sec": summarize(
+            [stats.trades / elapsed for stats in established] if elapsed > 0 else []
+        ),
+        "expected_trades": expected,
+        "missed": sum(stats.missed for stats in connections),
+        "connections_with_missed": sum(stats.missed > 0 for stats in connections),
+        "per_connection": [stats.summary(elapsed) for stats in connections],
+        "errors": errors,
+    }
+
+
+def print_report(report: dict, worst: int = 5) -> None:
+    connections = report["connections"]
+    print(f"Connections: {connections['established']}/{connections['attempted']} established in "
+          f"{report['setup_s']:.1f}s, {connections['failed']} failed, {connections['closed_early']} closed early, "
+          f"{connections['subscribe_errors']} subscribe error(s)")
+    print(f"Messages: {report['messages']} ({report['throughput_msgs_per_sec']:.1f}/s), "
+          f"trades: {report['trades']} ({report['throughput_trades_per_sec']:.1f}/s)")
+    expected = ", ".join(f"{symbol}={count}" for symbol, count in report["expected_trades"].items())
+    print(f"Trades in window: {expected or 'none'}")
+    print(f"Missed: {report['missed']} across {report['connections_with_missed']} connection(s)")
+    for key in ("connect_ms", "subscribe_ms", "latency_ms", "per_connection_trades_per_sec"):
+        summary = report[key]
+        if summary["count"] == 0:
+            print(f"{key}: no samples")
+            continue
+        print(f"{key}: min={summary['min']:.2f} p50={summary['p50']:.2f} p99={summary['p99']:.2f} "
+              f"max={summary['max']:.2f} (n={summary['count']})")
+
+    lagging = sorted(report["per_connection"], key=lambda entry: (-entry["missed"], entry["trades_per_sec"]))
+    lagging = [entry for entry in lagging[:worst] if entry["missed"] or entry["error"] or entry["closed_early"]]
+    if lagging:
+        print("Worst connections:")
+        for entry in lagging:
+            latency = entry["latency_ms"]
+            p99 = f"{latency['p99']:.2f}ms" if latency["count"] else "-"
+            print(f"  #{entry['connection']:<5} {','.join(entry['symbols']):<20} "
+                  f"{entry['trades_per_sec']:8.1f} trades/s  p99={p99}  missed={entry['missed']}"
+                  + (f"  {entry['error']}" if entry["error"] else "")
+                  + ("  closed early" if entry["closed_early"] else ""))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SignalR fan-out load tester for the DataServer BlockchainHub")
+    parser.add_argument("--url", default=DEFAULT_URL, help="DataServer base URL")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--symbols", type=parse_symbol_mix, default="ETH-USD,BTC-USD",
+                        help="Comma-separated symbols with optional weights, e.g. ETH-USD=3,BTC-USD=1")
+    parser.add_argument("--symbols-per-connection", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to measure for")
+    parser.add_argument("--warmup", type=float, default=2.0,
+                        help="Seconds to wait after every connection has subscribed before measuring")
+    parser.add_argument("--grace", type=float, default=1.0,
+                        help="Trades from the last GRACE seconds of the window are not counted as missed")
+    parser.add_argument("--connect-concurrency", type=int, default=20,
+                        help="Maximum number of connections being opened at once")
+    parser.add_argument("--connect-timeout", type=float, default=10.0)
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Subscribe with JSON-RPC batches of up to this many requests")
+    parser.add_argument("--feed-admin", help="Simulator base URL whose emission rate to set before the run")
+    parser.add_argument("--feed-rate", type=float, help="Trades per second per symbol for --feed-admin")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+    if args.feed_rate is not None and args.feed_admin is None:
+        parser.error("--feed-rate requires --feed-admin")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    config = HubLoadConfig(
+        url=args.url.rstrip("/"),
+        connections=args.connections,
+        symbols=args.symbols,
+        symbols_per_connection=args.symbols_per_connection,
+        duration=args.duration,
+        connect_concurrency=args.connect_concurrency,
+        connect_timeout=args.connect_timeout,
+        seed=args.seed,
+        warmup=args.warmup,
+        grace=args.grace,
+        batch_size=args.batch_size,
+        feed_admin=args.feed_admin,
+        feed_rate=args.feed_rate,
+    )
+
+    if config.feed_rate is not None:
+        set_feed_rate(config.feed_admin, config.feed_rate)
+        print(f"Simulator at {config.feed_admin} emitting {config.feed_rate:g} trades/s per symbol")
+
+    report = asyncio.run(run_hub_load_test(config))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
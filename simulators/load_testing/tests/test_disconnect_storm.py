@@ -0,0 +1,106 @@
+import json
+import threading
+
+import pytest
+
+from disconnect_controls import DisconnectRecord, DisconnectScenario
+from load_testing.disconnect_storm import (
+    StormConfig,
+    build_report,
+    parse_args,
+    peak_rate,
+    run_disconnect_storm,
+)
+
+
+class FakeHub:
+    transport = None
+
+    def __init__(self):
+        self.symbols: set[str] = set()
+        self.callbacks = {}
+        self.starts = 0
+
+    def on_open(self, callback):
+        self.callbacks["open"] = callback
+
+    def on_close(self, callback):
+        self.callbacks["close"] = callback
+
+    def on(self, event, callback):
+        self.callbacks[event] = callback
+
+    def start(self):
+        self.starts += 1
+        threading.Timer(0.01, self.callbacks["open"]).start()
+
+    def stop(self):
+        self.callbacks["close"]()
+
+    def send(self, target, arguments):
+        request = json.loads(arguments[0])
+        if request["method"] == "subscribe":
+            self.symbols.add(request["params"]["symbol"])
+        else:
+            self.symbols.discard(request["params"]["symbol"])
+        response = {"jsonrpc": "2.0", "result": {}, "error": None, "id": request["id"]}
+        self.callbacks["ReceiveMessage"]([json.dumps(response)])
+
+
+class TestParseArgs:
+    def test_url_follows_target(self):
+        assert parse_args(["--step", "30:abrupt:20%"]).url == "http://localhost:5181"
+        assert parse_args(["--target", "websocket", "--step", "30:abrupt"]).url == "ws://localhost:5000/ws"
+
+    @pytest.mark.parametrize("argv", [[], ["--step", "30:sideways"], ["--scenario", "s.json", "--step", "1:abrupt"]])
+    def test_rejects_missing_or_invalid_steps(self, argv):
+        with pytest.raises(SystemExit):
+            parse_args(argv)
+
+
+class TestReport:
+    def test_peak_rate(self):
+        assert peak_rate([]) == 0
+        assert peak_rate([5.0, 0.1, 0.5, 1.05, 1.2, 3.0]) == 3
+
+    def test_summarizes_each_step(self):
+        scenario = DisconnectScenario.from_dict({"name": "blip", "steps": [
+            {"at": 0, "mode": "abrupt"}, {"at": 10, "mode": "temporary", "delay": 2}]})
+        records = [
+            DisconnectRecord(0, 0, "abrupt", 0.0, 1.0, 40.0, 0.05, 0.05),
+            DisconnectRecord(1, 0, "abrupt", 0.0, 1.0, error="ConnectionError: Gave up after 3 attempt(s)"),
+            DisconnectRecord(0, 1, "temporary", 10.0, 1.0, 20.0, 12.03, 2.03),
+        ]
+        report = build_report(StormConfig(connections=3), scenario, records, ["TimeoutError: "], 2, 1, 0.0, 0.5)
+        first, second = report["steps"]
+        assert (first["disconnected"], first["reconnected"], first["failed"]) == (2, 1, 1)
+        assert first["reconnect_ms"]["max"] == 40.0
+        assert second["down_s"]["p50"] == 2.03
+        assert report["connections"] == {"attempted": 3, "established": 2, "failed": 1}
+        assert report["errors"] == {"ConnectionError": 1, "TimeoutError": 1}
+        assert report["records"][1]["reconnected"] is False
+
+
+class TestRunDisconnectStorm:
+    @pytest.mark.asyncio
+    async def test_drops_and_reconnects_hub_connections(self):
+        hubs: list[FakeHub] = []
+
+        def connect(url):
+            assert url == "http://hub/blockchain"
+            hubs.append(FakeHub())
+            return hubs[-1]
+
+        scenario = DisconnectScenario.from_dict({"name": "blip", "seed": 3, "steps": [
+            {"at": 0.05, "mode": "abrupt", "connections": "50%"},
+            {"at": 0.2, "mode": "graceful", "connections": 1},
+        ]})
+        config = StormConfig(url="http://hub", connections=4, symbols={"ETH-USD": 1.0}, settle=5.0)
+        recorded = []
+        report = await run_disconnect_storm(config, scenario, connect=connect, on_record=recorded.append)
+
+        assert report["connections"]["established"] == 4
+        assert [step["reconnected"] for step in report["steps"]] == [2, 1]
+        assert len(recorded) == 3
+        assert sum(hub.starts for hub in hubs) == 4 + 3
+        assert all(hub.symbols == {"ETH-USD"} for hub in hubs)
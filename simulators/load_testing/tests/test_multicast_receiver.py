@@ -0,0 +1,81 @@
+import socket
+import time
+
+import pytest
+
+from feed_client.decoding import TRADE_MESSAGE_TYPE, TRADE_STRUCT
+from load_testing.multicast_receiver import ReceiverConfig, SequenceTracker, open_socket, receive
+
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+def trade_datagram(seqnum: int, symbol: bytes = b"ETH-USD") -> bytes:
+    micros = int(time.time() * 1_000_000)
+    return TRADE_STRUCT.pack(TRADE_MESSAGE_TYPE, seqnum, micros, 100.0, 1.0, seqnum, 0, symbol)
+
+
+class TestSequenceTracker:
+    def test_in_order_sequence_has_no_gaps(self):
+        tracker = SequenceTracker()
+        for seqnum in range(5):
+            tracker.observe(seqnum)
+        assert tracker.to_dict() == {"received": 5, "gaps": 0, "missing": 0, "out_of_order": 0, "restarts": 0}
+
+    def test_first_message_sets_baseline(self):
+        tracker = SequenceTracker()
+        tracker.observe(1000)
+        tracker.observe(1001)
+        assert tracker.gaps == 0
+
+    def test_detects_gaps(self):
+        tracker = SequenceTracker()
+        for seqnum in (0, 1, 4, 5, 9):
+            tracker.observe(seqnum)
+        assert tracker.gaps == 2
+        assert tracker.missing == 5
+
+    def test_counts_late_messages(self):
+        tracker = SequenceTracker()
+        for seqnum in (0, 2, 1, 3):
+            tracker.observe(seqnum)
+        assert tracker.out_of_order == 1
+        assert tracker.missing == 1
+
+    def test_detects_publisher_restart(self):
+        tracker = SequenceTracker()
+        for seqnum in (0, 1, 2, 0, 1):
+            tracker.observe(seqnum)
+        assert tracker.restarts == 1
+        assert tracker.out_of_order == 0
+
+
+class TestReceive:
+    @pytest.fixture
+    def config(self):
+        return ReceiverConfig(port=free_udp_port(), duration=0.3)
+
+    def test_receives_multicast_trades(self, config):
+        receiver = open_socket(config)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 0)
+        sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(config.interface))
+        try:
+            for seqnum in (0, 1, 3):
+                sender.sendto(trade_datagram(seqnum), (config.group, config.port))
+            sender.sendto(b"not a trade", (config.group, config.port))
+            tracker, latency, symbols, elapsed = receive(receiver, config.duration)
+        finally:
+            sender.close()
+            receiver.close()
+
+        assert tracker.received == 3
+        assert tracker.gaps == 1
+        assert tracker.missing == 1
+        assert latency.count == 3
+        assert 0 <= latency.min <= latency.max < 1000
+        assert symbols == {"ETH-USD": 3}
+        assert elapsed >= config.duration
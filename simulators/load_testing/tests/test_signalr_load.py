@@ -0,0 +1,150 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from load_testing.signalr_load import (
+    HubConnectionStats,
+    HubLoadConfig,
+    count_missed,
+    parse_args,
+    run_hub_load_test,
+)
+
+
+def notification(symbol: str, trade_id: int, timestamp: str | None = None) -> str:
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f0+00:00")
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "method": "trades.update",
+        "params": {"seqnum": trade_id, "event": "updated", "channel": "trades", "symbol": symbol,
+                   "timestamp": timestamp, "side": "buy", "qty": 1.0, "price": 100.0, "tradeId": trade_id},
+    })
+
+
+class FakeHub:
+    def __init__(self):
+        self.symbols: set[str] = set()
+        self.callbacks = {}
+
+    def on_open(self, callback):
+        self.callbacks["open"] = callback
+
+    def on_close(self, callback):
+        self.callbacks["close"] = callback
+
+    def on(self, event, callback):
+        self.callbacks[event] = callback
+
+    def start(self):
+        threading.Timer(0.01, self.callbacks["open"]).start()
+
+    def stop(self):
+        self.callbacks["close"]()
+
+    def send(self, target, arguments):
+        request = json.loads(arguments[0])
+        self.symbols.add(request["params"]["symbol"])
+        response = {"jsonrpc": "2.0", "result": {"event": "subscribed"}, "error": None, "id": request["id"]}
+        self.callbacks["ReceiveMessage"]([json.dumps(response)])
+
+    def deliver(self, message: str):
+        self.callbacks["ReceiveMessage"]([message])
+
+
+def stats_with(index: int, symbol: str, seen: dict[str, int]) -> HubConnectionStats:
+    stats = HubConnectionStats(index, [symbol])
+    stats.subscribed = [symbol]
+    stats.seen[symbol] = seen
+    return stats
+
+
+class TestHubConnectionStats:
+    def test_records_only_while_measuring(self):
+        stats = HubConnectionStats(0, ["ETH-USD"])
+        stats.on_message([notification("ETH-USD", 1)])
+        stats.measuring = True
+        stats.on_message([notification("ETH-USD", 2), notification("ETH-USD", 3)])
+        assert stats.trades == 2
+        assert stats.latency.count == 2
+        assert sorted(stats.seen["ETH-USD"]) == ["2", "3"]
+
+    def test_ignores_responses_and_unparseable_frames(self):
+        stats = HubConnectionStats(0, ["ETH-USD"])
+        stats.measuring = True
+        stats.on_message(['{"jsonrpc": "2.0", "result": {}, "error": null, "id": "1"}', "not json"])
+        assert stats.messages == 1
+        assert stats.trades == 0
+
+
+class TestCountMissed:
+    def test_compares_against_other_subscribers(self):
+        full = stats_with(0, "ETH-USD", {"1": 10, "2": 20, "3": 30})
+        partial = stats_with(1, "ETH-USD", {"1": 10, "3": 30})
+        other = stats_with(2, "BTC-USD", {"9": 20})
+        assert count_missed([full, partial, other], 0, 100) == {"BTC-USD": 1, "ETH-USD": 3}
+        assert [full.missed, partial.missed, other.missed] == [0, 1, 0]
+
+    def test_ignores_trades_outside_window(self):
+        full = stats_with(0, "ETH-USD", {"1": 10, "2": 200})
+        late = stats_with(1, "ETH-USD", {"1": 10})
+        count_missed([full, late], 0, 100)
+        assert late.missed == 0
+
+    def test_failed_subscriptions_are_not_expected(self):
+        subscribed = stats_with(0, "ETH-USD", {"1": 10})
+        failed = HubConnectionStats(1, ["ETH-USD"])
+        count_missed([subscribed, failed], 0, 100)
+        assert failed.missed == 0
+
+
+class TestParseArgs:
+    def test_defaults(self):
+        args = parse_args([])
+        assert args.connections == 50
+        assert args.url == "http://localhost:5181"
+
+    def test_feed_rate_requires_admin_url(self):
+        with pytest.raises(SystemExit):
+            parse_args(["--feed-rate", "100"])
+
+
+class TestRunHubLoadTest:
+    @pytest.mark.asyncio
+    async def test_reports_throughput_and_missed_messages(self):
+        hubs: list[FakeHub] = []
+
+        def connect(url):
+            assert url == "http://hub/blockchain"
+            hubs.append(FakeHub())
+            return hubs[-1]
+
+        async def feed():
+            trade_id = 0
+            while True:
+                trade_id += 1
+                for index, hub in enumerate(hubs):
+                    # The first connection misses every third trade.
+                    if "ETH-USD" in hub.symbols and not (index == 0 and trade_id % 3 == 0):
+                        hub.deliver(notification("ETH-USD", trade_id))
+                await asyncio.sleep(0.01)
+
+        config = HubLoadConfig(url="http://hub", connections=3, symbols={"ETH-USD": 1.0}, duration=0.5,
+                               warmup=0.05, grace=0.0)
+        feeder = asyncio.ensure_future(feed())
+        try:
+            report = await run_hub_load_test(config, connect=connect)
+        finally:
+            feeder.cancel()
+
+        assert report["connections"]["established"] == 3
+        assert report["trades"] > 0
+        per_connection = report["per_connection"]
+        assert per_connection[0]["missed"] > 0
+        assert per_connection[1]["missed"] == 0
+        assert per_connection[0]["trades_per_sec"] < per_connection[1]["trades_per_sec"]
+        assert report["connections_with_missed"] == 1
+        assert report["latency_ms"]["count"] == sum(entry["latency_ms"]["count"] for entry in per_connection)
+        assert report["latency_ms"]["count"] == report["trades"]
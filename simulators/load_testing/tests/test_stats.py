@@ -0,0 +1,29 @@
+from load_testing.stats import percentile, summarize
+
+
+class TestPercentile:
+    def test_empty_samples_return_zero(self):
+        assert percentile([], 0.5) == 0.0
+
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 0.50) == 50
+        assert percentile(samples, 0.99) == 99
+        assert percentile(samples, 1.0) == 100
+
+    def test_small_sample_high_percentile_is_max(self):
+        assert percentile([1.0, 2.0, 3.0], 0.999) == 3.0
+
+
+class TestSummarize:
+    def test_empty_summary_has_zero_count(self):
+        assert summarize([]) == {"count": 0}
+
+    def test_summary_fields(self):
+        summary = summarize([3.0, 1.0, 2.0, 4.0])
+        assert summary["count"] == 4
+        assert summary["min"] == 1.0
+        assert summary["max"] == 4.0
+        assert summary["mean"] == 2.5
+        assert summary["p50"] == 2.0
+        assert {"p90", "p99", "p999"} <= set(summary)
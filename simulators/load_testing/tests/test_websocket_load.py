@@ -0,0 +1,149 @@
+import pytest
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import msgpack
+import websockets
+
+from feed_client.decoding import TRADE_STRUCT, TRADE_MESSAGE_TYPE
+from load_testing.websocket_load import (
+    PROTOCOLS,
+    LoadStats,
+    LoadTestConfig,
+    frame_decoder,
+    parse_args,
+    parse_symbol_mix,
+    run_load_test,
+)
+
+
+def trade_update(symbol: str, seqnum: int) -> str:
+    return json.dumps({
+        "seqnum": seqnum,
+        "event": "updated",
+        "channel": "trades",
+        "symbol": symbol,
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "side": "buy",
+        "qty": 1.0,
+        "price": 100.0,
+        "trade_id": str(seqnum),
+    })
+
+
+def encode_trade(message: str, subprotocol: str | None) -> str | bytes:
+    if subprotocol == PROTOCOLS["msgpack"]:
+        return msgpack.packb(json.loads(message))
+    if subprotocol == PROTOCOLS["struct"]:
+        trade = json.loads(message)
+        micros = int(datetime.fromisoformat(trade["timestamp"][:-1] + "+00:00").timestamp() * 1_000_000)
+        return TRADE_STRUCT.pack(TRADE_MESSAGE_TYPE, trade["seqnum"], micros, trade["price"], trade["qty"],
+                                 int(trade["trade_id"]), 0, trade["symbol"].encode())
+    return message
+
+
+async def fake_simulator(ws):
+    seqnum = 0
+    request = json.loads(await ws.recv())
+    await ws.send(json.dumps({"seqnum": seqnum, "event": "subscribed", "channel": "trades", "symbol": request["symbol"]}))
+    try:
+        while True:
+            seqnum += 1
+            await ws.send(encode_trade(trade_update(request["symbol"], seqnum), ws.subprotocol))
+            await asyncio.sleep(0.01)
+    except websockets.exceptions.ConnectionClosed:
+        pass
+
+
+class TestParseSymbolMix:
+    def test_parses_weights(self):
+        assert parse_symbol_mix("ETH-USD=3,BTC-USD=1") == {"ETH-USD": 3.0, "BTC-USD": 1.0}
+
+    def test_defaults_weight_to_one(self):
+        assert parse_symbol_mix("ETH-USD, BTC-USD") == {"ETH-USD": 1.0, "BTC-USD": 1.0}
+
+    def test_rejects_empty_mix(self):
+        with pytest.raises(ValueError):
+            parse_symbol_mix("")
+
+    def test_rejects_non_positive_weight(self):
+        with pytest.raises(ValueError):
+            parse_symbol_mix("ETH-USD=0")
+
+
+class TestLoadTestConfig:
+    def test_assign_symbols_is_repeatable_with_seed(self):
+        config = LoadTestConfig(connections=20, seed=1)
+        assert config.assign_symbols() == LoadTestConfig(connections=20, seed=1).assign_symbols()
+
+    def test_assign_symbols_picks_distinct_symbols(self):
+        config = LoadTestConfig(connections=10, symbols_per_connection=5, seed=2)
+        for symbols in config.assign_symbols():
+            assert sorted(symbols) == ["BTC-USD", "ETH-USD"]
+
+    def test_parse_args_defaults(self):
+        args = parse_args([])
+        assert args.connections == 100
+        assert args.symbols == {"ETH-USD": 1.0, "BTC-USD": 1.0}
+
+
+class TestLoadStats:
+    def test_record_message_tracks_latency_for_trades(self):
+        stats = LoadStats()
+        message = trade_update("ETH-USD", 1)
+        event = stats.record_message(message, datetime.now(timezone.utc).timestamp() + 0.005)
+        assert event == "updated"
+        assert stats.trades == 1
+        assert stats.latency.count == 1
+        assert stats.latency.min >= 5.0
+
+    def test_record_message_counts_rejections(self):
+        stats = LoadStats()
+        stats.record_message(json.dumps({"seqnum": 0, "event": "rejected", "text": "nope"}), 0.0)
+        assert stats.rejected == 1
+        assert stats.latency.count == 0
+
+    @pytest.mark.parametrize("protocol", ["msgpack", "struct"])
+    def test_record_message_decodes_binary_protocols(self, protocol):
+        stats = LoadStats()
+        message = encode_trade(trade_update("ETH-USD", 1), PROTOCOLS[protocol])
+        event = stats.record_message(message, datetime.now(timezone.utc).timestamp(), frame_decoder(PROTOCOLS[protocol]))
+        assert event == "updated"
+        assert stats.latency.count == 1
+
+
+class TestRunLoadTest:
+    @pytest.mark.asyncio
+    async def test_measures_connections_and_latency(self):
+        async with websockets.serve(fake_simulator, "127.0.0.1", 0) as server:
+            port = list(server.sockets)[0].getsockname()[1]
+            config = LoadTestConfig(url=f"ws://127.0.0.1:{port}", connections=5, duration=0.3)
+            report = await run_load_test(config)
+
+        assert report["connections"]["established"] == 5
+        assert report["connections"]["failed"] == 0
+        assert report["time_to_first_trade_ms"]["count"] == 5
+        assert report["latency_ms"]["count"] == report["trades"]
+        assert report["trades"] > 0
+        assert report["throughput_msgs_per_sec"] > 0
+        json.dumps(report)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("protocol", ["msgpack", "struct"])
+    async def test_negotiates_the_protocol(self, protocol):
+        async with websockets.serve(fake_simulator, "127.0.0.1", 0, subprotocols=list(PROTOCOLS.values())[1:]) as server:
+            port = list(server.sockets)[0].getsockname()[1]
+            config = LoadTestConfig(url=f"ws://127.0.0.1:{port}", connections=2, duration=0.3, protocol=protocol)
+            report = await run_load_test(config)
+
+        assert report["errors"] == {}
+        assert report["trades"] > 0
+        assert report["latency_ms"]["count"] == report["trades"]
+
+    @pytest.mark.asyncio
+    async def test_records_failed_connections(self):
+        config = LoadTestConfig(url="ws://127.0.0.1:1", connections=2, duration=0.1, connect_timeout=0.5)
+        report = await run_load_test(config)
+        assert report["connections"]["failed"] == 2
+        assert report["errors"]
@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import websockets
+
+from feed_client import LatencyHistogram, decode_frame, latency_ms
+
+from .stats import summarize
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+DEFAULT_URL = "ws://localhost:5000/ws"
+# Subprotocol offered for each of the simulator's wire protocols.
+PROTOCOLS = {"json": None, "msgpack": "blockchain.msgpack.v1", "struct": "blockchain.struct.v1"}
+
+
+def parse_symbol_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        symbol, _, weight = item.partition("=")
+        mix[symbol.strip()] = float(weight) if weight else 1.0
+
+    if not mix:
+        raise ValueError("Symbol mix must contain at least one symbol")
+    if any(weight <= 0 for weight in mix.values()):
+        raise ValueError("Symbol weights must be positive")
+    return mix
+
+
+@dataclass
+class LoadTestConfig:
+    url: str = DEFAULT_URL
+    connections: int = 100
+    symbols: dict[str, float] = field(default_factory=lambda: {"ETH-USD": 1.0, "BTC-USD": 1.0})
+    symbols_per_connection: int = 1
+    duration: float = 60.0
+    connect_concurrency: int = 100
+    connect_timeout: float = 10.0
+    seed: int | None = None
+    protocol: str = "json"
+
+    def assign_symbols(self) -> list[list[str]]:
+        rng = random.Random(self.seed)
+        names = list(self.symbols)
+        weights = list(self.symbols.values())
+        per_connection = min(self.symbols_per_connection, len(names))
+
+        assignments = []
+        for _ in range(self.connections):
+            chosen: list[str] = []
+            while len(chosen) < per_connection:
+                symbol = rng.choices(names, weights=weights)[0]
+                if symbol not in chosen:
+                    chosen.append(symbol)
+            assignments.append(chosen)
+        return assignments
+
+
+def _unpack_msgpack(frame: str | bytes) -> Any:
+    if isinstance(frame, str):
+        return json.loads(frame)
+    return msgpack.unpackb(frame)
+
+
+# Control messages stay JSON text whatever the protocol. Packed struct trades
+# decode to views, and binary frames on a msgpack connection are unpacked.
+def frame_decoder(subprotocol: str | None) -> Callable[[str | bytes], Any]:
+    if subprotocol != PROTOCOLS["msgpack"]:
+        return decode_frame
+    if msgpack is None:
+        raise RuntimeError("The msgpack package is required for the msgpack wire protocol")
+    return lambda frame: decode_frame(frame, fallback=_unpack_msgpack)
+
+
+# Latency is recorded for every trade, so it goes into a fixed-size histogram
+# rather than a list that grows with the run.
+class LoadStats:
+    def __init__(self):
+        self.connect_ms: list[float] = []
+        self.first_trade_ms: list[float] = []
+        self.latency = LatencyHistogram()
+        self.attempted = 0
+        self.established = 0
+        self.failed = 0
+        self.closed_early = 0
+        self.messages = 0
+        self.trades = 0
+        self.rejected = 0
+        self.errors: dict[str, int] = {}
+
+    def record_error(self, error: Exception) -> None:
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def record_message(
+        self,
+        message: str | bytes,
+        received_at: float,
+        decode: Callable[[str | bytes], Any] = decode_frame,
+    ) -> str | None:
+        self.messages += 1
+        data = decode(message)
+        event = data.get("event")
+        if event == "updated":
+            self.trades += 1
+            latency = latency_ms(data, received_at)
+            if latency is not None:
+                self.latency.record(latency)
+        elif event == "rejected":
+            self.rejected += 1
+        return event
+
+    def report(self, config: LoadTestConfig, started_at: float, elapsed: float) -> dict:
+        return {
+            "config": asdict(config),
+            "started_at": datetime.fromtimestamp(started_at, timezone.utc).isoformat(),
+            "elapsed_s": elapsed,
+            "connections": {
+                "attempted": self.attempted,
+                "established": self.established,
+                "failed": self.failed,
+                "closed_early": self.closed_early,
+            },
+            "connect_ms": summarize(self.connect_ms),
+            "time_to_first_trade_ms": summarize(self.first_trade_ms),
+            "latency_ms": self.latency.summary(),
+            "messages": self.messages,
+            "trades": self.trades,
+            "rejected": self.rejected,
+            "throughput_msgs_per_sec": self.messages / elapsed if elapsed > 0 else 0.0,
+            "throughput_trades_per_sec": self.trades / elapsed if elapsed > 0 else 0.0,
+            "errors": self.errors,
+        }
+
+
+async def run_connection(
+    symbols: list[str],
+    config: LoadTestConfig,
+    stats: LoadStats,
+    semaphore: asyncio.Semaphore,
+    open_connections: set,
+) -> None:
+    stats.attempted += 1
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            subprotocol = PROTOCOLS[config.protocol]
+            ws = await websockets.connect(config.url, open_timeout=config.connect_timeout,
+                                          subprotocols=[subprotocol] if subprotocol else None)
+        except Exception as e:
+            stats.failed += 1
+            stats.record_error(e)
+            return
+        stats.connect_ms.append((time.perf_counter() - started) * 1000.0)
+
+    stats.established += 1
+    open_connections.add(ws)
+    try:
+        decode = frame_decoder(ws.subprotocol)
+        subscribed_at = time.perf_counter()
+        for symbol in symbols:
+            await ws.send(json.dumps({"action": "subscribe", "channel": "trades", "symbol": symbol}))
+
+        waiting_for_first_trade = True
+        async for message in ws:
+            event = stats.record_message(message, time.time(), decode)
+            if waiting_for_first_trade and event == "updated":
+                stats.first_trade_ms.append((time.perf_counter() - subscribed_at) * 1000.0)
+                waiting_for_first_trade = False
+    except Exception as e:
+        stats.record_error(e)
+    finally:
+        if ws in open_connections:
+            open_connections.discard(ws)
+            stats.closed_early += 1
+
+
+async def run_load_test(config: LoadTestConfig) -> dict:
+    stats = LoadStats()
+    semaphore = asyncio.Semaphore(config.connect_concurrency)
+    open_connections: set = set()
+
+    started_at = time.time()
+    started = time.perf_counter()
+    tasks = [
+        asyncio.create_task(run_connection(symbols, config, stats, semaphore, open_connections))
+        for symbols in config.assign_symbols()
+    ]
+
+    await asyncio.sleep(config.duration)
+    elapsed = time.perf_counter() - started
+
+    closing = list(open_connections)
+    open_connections.clear()
+    await asyncio.gather(*(ws.close() for ws in closing), return_exceptions=True)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return stats.report(config, started_at, elapsed)
+
+
+def print_report(report: dict) -> None:
+    connections = report["connections"]
+    print(f"Connections: {connections['established']}/{connections['attempted']} established, "
+          f"{connections['failed']} failed, {connections['closed_early']} closed early")
+    print(f"Messages: {report['messages']} ({report['throughput_msgs_per_sec']:.1f}/s), "
+          f"trades: {report['trades']} ({report['throughput_trades_per_sec']:.1f}/s)")
+    for key in ("connect_ms", "time_to_first_trade_ms", "latency_ms"):
+        summary = report[key]
+        if summary["count"] == 0:
+            print(f"{key}: no samples")
+            continue
+        print(f"{key}: p50={summary['p50']:.2f} p99={summary['p99']:.2f} "
+              f"p999={summary['p999']:.2f} max={summary['max']:.2f} (n={summary['count']})")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="WebSocket load harness for the blockchain API simulator")
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--symbols", type=parse_symbol_mix, default="ETH-USD,BTC-USD",
+                        help="Comma-separated symbols with optional weights, e.g. ETH-USD=3,BTC-USD=1")
+    parser.add_argument("--symbols-per-connection", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to measure for")
+    parser.add_argument("--connect-concurrency", type=int, default=100,
+                        help="Maximum number of handshakes in flight at once")
+    parser.add_argument("--connect-timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--protocol", choices=list(PROTOCOLS), default="json",
+                        help="Wire protocol to negotiate with the simulator")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    config = LoadTestConfig(
+        url=args.url,
+        connections=args.connections,
+        symbols=args.symbols,
+        symbols_per_connection=args.symbols_per_connection,
+        duration=args.duration,
+        connect_concurrency=args.connect_concurrency,
+        connect_timeout=args.connect_timeout,
+        seed=args.seed,
+        protocol=args.protocol,
+    )
+
+    report = asyncio.run(run_load_test(config))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()